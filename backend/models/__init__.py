@@ -1,27 +0,0 @@
-"""
-Models 패키지
-
-API 요청/응답에 사용되는 Pydantic 모델들
-"""
-
-from .stock_models import (
-    ScreenerType,
-    NewsItem,
-    StockBasicInfo,
-    StockDetailInfo,
-    NewsSearchResult,
-    TrendingStockResponse,
-    StockInfoResponse,
-    ErrorResponse,
-)
-
-__all__ = [
-    "ScreenerType",
-    "NewsItem",
-    "StockBasicInfo",
-    "StockDetailInfo",
-    "NewsSearchResult",
-    "TrendingStockResponse",
-    "StockInfoResponse",
-    "ErrorResponse",
-]
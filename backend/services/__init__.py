@@ -1,25 +0,0 @@
-"""
-Services 패키지
-
-백엔드 비즈니스 로직을 담당하는 서비스 모듈들
-"""
-
-from .trending_stock_service import (
-    TrendingStockService,
-    get_trending_stock,
-    get_all_trending_stocks,
-)
-from .news_service import (
-    NewsService,
-    search_stock_news,
-    search_market_news,
-)
-
-__all__ = [
-    "TrendingStockService",
-    "get_trending_stock",
-    "get_all_trending_stocks",
-    "NewsService",
-    "search_stock_news",
-    "search_market_news",
-]
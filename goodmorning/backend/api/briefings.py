@@ -1,11 +1,32 @@
 """
 브리핑 관련 API 라우터
 """
-from fastapi import APIRouter, HTTPException
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Optional
 
-from models.briefing import BriefingResponse, BriefingCreateRequest
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse, Response
 
-router = APIRouter()
+from models.briefing import (
+    BriefingResponse,
+    BriefingCreateRequest,
+    BriefingDetail,
+    BriefingListResponse,
+)
+from services.output_store import get_output_store, KIND_BRIEFING
+from services.segment_store import get_segment_store, build_briefing_documents
+from services.tracing import TracedRoute
+
+router = APIRouter(route_class=TracedRoute)
+
+
+def _get_briefing_record(briefing_id: str) -> dict:
+    """브리핑 레코드 조회 (없으면 404)"""
+    record = get_output_store().get(KIND_BRIEFING, briefing_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="브리핑을 찾을 수 없습니다.")
+    return record
 
 
 @router.post("/", response_model=BriefingResponse)
@@ -22,23 +43,101 @@ async def create_briefing(request: BriefingCreateRequest):
     }
 
 
-@router.get("/")
-async def get_briefings():
+@router.get("/", response_model=BriefingListResponse)
+async def get_briefings(
+    limit: int = Query(20, ge=1, le=100, description="조회할 브리핑 수 (1-100)"),
+    offset: int = Query(0, ge=0, description="건너뛸 브리핑 수"),
+    start_date: Optional[date] = Query(None, description="조회 시작일 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="조회 종료일 (YYYY-MM-DD, 포함)")
+):
     """
-    브리핑 히스토리 조회
+    브리핑 히스토리 조회 (최신순)
+    - 완료된 브리핑의 요약 문서를 세그먼트 파일에서 잘라 그대로 응답합니다.
     """
-    # TODO: 브리핑 히스토리 조회 로직 구현
-    return {
-        "briefings": [],
-        "total": 0
-    }
+    start = datetime.combine(start_date, time.min) if start_date else None
+    end = datetime.combine(end_date + timedelta(days=1), time.min) if end_date else None
+
+    slices, total = get_segment_store(KIND_BRIEFING).summary_slices(
+        start=start, end=end, limit=limit, offset=offset
+    )
+
+    body = b"".join([
+        b'{"briefings":[',
+        b",".join(slices),
+        b'],"total":',
+        str(total).encode("ascii"),
+        b"}",
+    ])
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/{briefing_id}")
+@router.get("/latest", response_model=BriefingDetail)
+async def get_latest_briefing():
+    """
+    최신 브리핑 상세 조회
+    """
+    latest = get_output_store().latest(KIND_BRIEFING)
+    if not latest:
+        raise HTTPException(status_code=404, detail="브리핑을 찾을 수 없습니다.")
+    return _briefing_detail_response(latest["id"])
+
+
+@router.get("/{briefing_id}", response_model=BriefingDetail)
 async def get_briefing_detail(briefing_id: str):
     """
     브리핑 상세 조회
     """
-    # TODO: 브리핑 상세 조회 로직 구현
-    raise HTTPException(status_code=404, detail="브리핑을 찾을 수 없습니다.")
+    return _briefing_detail_response(briefing_id)
+
+
+@router.get("/{briefing_id}/html")
+async def get_briefing_html(briefing_id: str):
+    """
+    브리핑 HTML 버전 조회
+    - 완료된 브리핑은 세그먼트 파일의 바이트 범위를 그대로 응답합니다.
+    """
+    html = get_segment_store(KIND_BRIEFING).html_slice(briefing_id)
+    if html is not None:
+        return Response(content=html, media_type="text/html; charset=utf-8")
+
+    # 생성 중인 브리핑 등 세그먼트에 없는 경우 파일에서 조회
+    record = _get_briefing_record(briefing_id)
+    html_path = record["files"].get("html")
+    if not html_path:
+        raise HTTPException(status_code=404, detail="브리핑 HTML을 찾을 수 없습니다.")
+
+    return FileResponse(html_path, media_type="text/html; charset=utf-8")
+
+
+def _briefing_detail_response(briefing_id: str) -> Response:
+    """
+    브리핑 상세 응답 구성
+
+    완료된 브리핑은 세그먼트 파일의 상세 문서 바이트 범위를 그대로 응답하고,
+    세그먼트에 없는 브리핑은 인덱스와 JSON 파일로 구성합니다.
+    """
+    detail = get_segment_store(KIND_BRIEFING).detail_slice(briefing_id)
+    if detail is not None:
+        return Response(content=detail, media_type="application/json")
+
+    record = _get_briefing_record(briefing_id)
+
+    if record["status"] != "completed":
+        # 생성 중인 브리핑은 JSON이 완성되지 않았으므로 인덱스 정보만 반환
+        _, document = build_briefing_documents(record, {})
+        return Response(
+            content=json.dumps(document, ensure_ascii=False),
+            media_type="application/json"
+        )
+
+    try:
+        with open(record["files"]["json"], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        raise HTTPException(status_code=404, detail="브리핑 파일을 읽을 수 없습니다.")
 
+    _, document = build_briefing_documents(record, data)
+    return Response(
+        content=json.dumps(document, ensure_ascii=False),
+        media_type="application/json"
+    )
@@ -0,0 +1,821 @@
+"""
+시장 데이터 API 라우터 (/api)
+
+화제 종목 대시보드, 종목 검색, 차트, 종목 상세 조회를 제공합니다.
+모든 Yahoo 호출은 /stocks 라우트, 브리핑 파이프라인과 같은 시장 데이터 접근 객체를 거칩니다.
+"""
+import os
+import re
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Path
+
+from models.market import (
+    ScreenerType,
+    ChartInterval,
+    ChartRange,
+    TrendingStockResponse,
+    StockInfoResponse,
+    ChartSeries,
+    ChartBatchResponse,
+    SymbolSearchResponse,
+    ErrorResponse,
+)
+from services.trending_stock_service import TrendingStockService
+from services.news_service import get_news_service
+from services.chart_service import ChartService, DEFAULT_CHART_POINTS
+from services.symbol_index import SymbolIndex
+from services.market_data import get_market_data
+from services.hedged_request import Deadline
+from services.upstream_guard import UpstreamUnavailableError, is_throttled_response
+from services.tracing import TracedRoute, get_trace_exporter, trace_span
+from services.utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+router = APIRouter(route_class=TracedRoute)
+
+# 서비스 초기화 (외부 API 클라이언트는 만들지 않음 - 시작 훅의 사전 준비 또는 첫 요청에서 생성)
+market_data = get_market_data()
+trending_service = TrendingStockService(market_data)
+chart_service = ChartService(market_data=market_data)
+# 종목 검색 인덱스 (파일은 앱 시작 훅에서 load_symbol_index로 로드)
+symbol_index = SymbolIndex()
+negative_cache = market_data.negative_cache
+shared_cache = market_data.cache
+
+# Yahoo 호출이 거절될 때 응답할 화제 종목 목록 (스크리너 타입, 개수 → quotes)
+_trending_list_cache = {}
+
+# 공유 캐시 유지 시간 (초, 정규장 기준) - CACHE_BACKEND 설정 시 워커 간 같은 Yahoo 응답 공유
+# 프리/애프터마켓에는 늘리고, 장이 닫혀 있으면 다음 세션 시작까지 유지 (services.market_calendar)
+STOCK_INFO_CACHE_SECONDS = int(os.getenv("STOCK_INFO_CACHE_SECONDS", "15"))
+TRENDING_LIST_CACHE_SECONDS = int(os.getenv("TRENDING_LIST_CACHE_SECONDS", "60"))
+
+# 차트 일괄 조회 최대 종목 수
+MAX_CHART_SYMBOLS = 20
+
+# 엔드포인트별 Yahoo 조회 마감 시간 (초) - 넘기면 부가 모듈을 건너뛰고 응답
+STOCK_INFO_DEADLINE_SECONDS = int(os.getenv("STOCK_INFO_DEADLINE_MS", "2500")) / 1000
+TRENDING_DEADLINE_SECONDS = int(os.getenv("TRENDING_DEADLINE_MS", "4000")) / 1000
+
+# 종목 상세 정보 조회 모듈 (price는 필수)
+STOCK_DETAIL_MODULES = ("price", "summary_detail", "financial_data")
+
+# 종목 심볼 형식 (대소문자 무관, 예: AAPL, brk-b, BF.B)
+TICKER_PATTERN = r"^[A-Za-z][A-Za-z.\-]{0,9}$"
+
+
+def _upstream_unavailable(e: UpstreamUnavailableError) -> HTTPException:
+    """Yahoo 호출 거절을 503 응답으로 변환"""
+    return HTTPException(
+        status_code=503,
+        detail=f"{e}. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(max(1, int(round(e.retry_after))))}
+    )
+
+
+def load_symbol_index() -> None:
+    """심볼 인덱스 파일 로드 (앱 시작 훅에서 호출)"""
+    global symbol_index
+    symbol_index = SymbolIndex.from_file()
+
+
+def normalize_ticker(ticker: str) -> str:
+    """
+    종목 심볼 정규화 및 최근 조회 실패 여부 확인 (Yahoo 호출 전)
+
+    심볼 인덱스는 일부 스크리너 종목만 담고 있어 검색 제안에만 사용하며,
+    인덱스에 없는 심볼도 Yahoo 조회로 넘깁니다. 최근 Yahoo에서 찾지 못한 심볼
+    (존재하지 않는 종목 캐시)만 바로 거절합니다.
+
+    Args:
+        ticker: 종목 심볼
+
+    Returns:
+        str: 대문자로 정규화된 심볼
+
+    Raises:
+        HTTPException: 최근 조회에서 찾지 못한 심볼 (404)
+    """
+    ticker = ticker.strip().upper()
+    if negative_cache.get(ticker) is not None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목 '{ticker}'를 찾을 수 없습니다."
+        )
+    return ticker
+
+
+@router.get("/health")
+async def health_check():
+    """헬스 체크"""
+    return {
+        "status": "healthy",
+        "services": {
+            "trending_stock": "available",
+            "news": "available" if os.getenv("EXA_API_KEY") else "unavailable (API key required)"
+        },
+        **market_data.stats(),
+        "tracing": get_trace_exporter().stats()
+    }
+
+
+@router.get(
+    "/stocks/trending",
+    response_model=TrendingStockResponse,
+    responses={
+        200: {"description": "화제 종목 조회 성공"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    },
+    summary="화제 종목 조회",
+    description="스크리너 타입별 화제 종목 TOP 1을 조회합니다."
+)
+def get_trending_stock(
+    type: ScreenerType = Query(
+        ScreenerType.MOST_ACTIVES,
+        description="스크리너 타입 (most_actives, day_gainers, day_losers)"
+    ),
+    include_news: bool = Query(
+        True,
+        description="관련 뉴스 포함 여부"
+    ),
+    news_count: int = Query(
+        5,
+        ge=1,
+        le=20,
+        description="뉴스 개수 (1-20)"
+    ),
+    news_hours: int = Query(
+        24,
+        ge=1,
+        le=168,
+        description="뉴스 검색 시간 범위 (시간, 1-168)"
+    )
+):
+    """
+    화제 종목 조회 API
+
+    **스크리너 타입:**
+    - `most_actives`: 거래량 최다 종목
+    - `day_gainers`: 일일 상승률 최고 종목
+    - `day_losers`: 일일 하락률 최고 종목
+
+    **응답:**
+    - 종목 기본 정보 (심볼, 이름, 가격, 변동률 등)
+    - 종목 상세 정보 (price, summary_detail, financial_data)
+    - 관련 뉴스 (선택)
+    """
+    try:
+        logger.info("화제 종목 조회 요청 - 타입: %s", type.value)
+
+        # 화제 종목 조회
+        result = trending_service.get_trending_stock(
+            type.value,
+            deadline=Deadline(TRENDING_DEADLINE_SECONDS)
+        )
+
+        # 에러 체크
+        if result.get("error_code") == "UPSTREAM_UNAVAILABLE":
+            raise _upstream_unavailable(
+                UpstreamUnavailableError("circuit_open", result.get("retry_after", 0.0))
+            )
+        if result.get("error_code") == "DEADLINE_EXCEEDED":
+            raise HTTPException(status_code=504, detail=result["error"])
+        if "error" in result:
+            raise HTTPException(
+                status_code=400,
+                detail=result["error"]
+            )
+
+        # 종목 심볼 확인
+        symbol = result.get("symbol")
+        if not symbol:
+            raise HTTPException(
+                status_code=404,
+                detail="종목을 찾을 수 없습니다."
+            )
+
+        # 화제 종목은 인덱스에 없어도 상세 조회가 가능하도록 추가
+        symbol_index.add_quotes([result.get("basic_info") or {"symbol": symbol}])
+
+        # 뉴스 조회 (선택)
+        news_result = None
+        if include_news:
+            news_service = get_news_service()
+            if news_service:
+                try:
+                    with trace_span("news", symbol=symbol):
+                        news_result = news_service.search_stock_news(
+                            symbol,
+                            hours=news_hours,
+                            num_results=news_count
+                        )
+                except Exception as e:
+                    logger.error("뉴스 조회 중 오류: %s", e)
+                    # 뉴스 조회 실패는 전체 요청을 실패시키지 않음
+                    news_result = None
+
+        # 응답 구성
+        response = TrendingStockResponse(
+            symbol=symbol,
+            screener_type=type.value,
+            basic_info=result.get("basic_info"),
+            detail_info=result.get("detail_info"),
+            news=news_result
+        )
+
+        logger.info("화제 종목 조회 완료 - 종목: %s", symbol)
+        return response
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("화제 종목 조회 중 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get(
+    "/stocks/search",
+    response_model=SymbolSearchResponse,
+    summary="종목 검색",
+    description="로컬 심볼 인덱스에서 심볼/종목명 접두어 및 오타 허용 검색을 합니다 (Yahoo 호출 없음)."
+)
+def search_stocks(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="검색어 (심볼 또는 종목명 일부, 예: aap, apple)"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="최대 결과 수 (1-50)"
+    )
+):
+    """
+    종목 검색 API (타입어헤드)
+
+    **일치 유형 (정렬 순서):**
+    - `exact`: 심볼 일치
+    - `prefix`: 심볼 접두어 일치
+    - `name`: 종목명 단어 접두어 일치
+    - `fuzzy`: 편집 거리 1 이내 (오타 허용)
+    """
+    return SymbolSearchResponse(query=q, results=symbol_index.search(q, limit))
+
+
+@router.get(
+    "/stocks/charts",
+    response_model=ChartBatchResponse,
+    responses={
+        200: {"description": "차트 데이터 조회 성공"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    },
+    summary="여러 종목 차트 데이터 조회",
+    description="여러 종목의 시세 이력을 한 번에 조회하여 다운샘플링한 차트 데이터를 반환합니다."
+)
+def get_stock_charts(
+    symbols: str = Query(
+        ...,
+        description=f"쉼표로 구분한 종목 심볼 (최대 {MAX_CHART_SYMBOLS}개, 예: AAPL,MSFT)"
+    ),
+    interval: ChartInterval = Query(
+        ChartInterval.FIVE_MINUTES,
+        description="시세 간격 (1m, 5m, 15m, 30m, 1h, 1d, 1wk)"
+    ),
+    range_: ChartRange = Query(
+        ChartRange.ONE_DAY,
+        alias="range",
+        description="조회 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 5y)"
+    ),
+    points: int = Query(
+        DEFAULT_CHART_POINTS,
+        ge=10,
+        le=1000,
+        description="최대 포인트 수 (10-1000)"
+    )
+):
+    """
+    여러 종목 차트 데이터 조회 API
+
+    캐시에 없는 종목은 한 번의 history 호출로 함께 조회합니다.
+
+    **응답:**
+    - 요청 순서대로 종목별 열 단위 배열 (timestamps, close, volume)
+    - 조회에 실패한 종목은 빈 배열과 error 메시지
+    """
+    ticker_list = [symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()]
+
+    if not ticker_list:
+        raise HTTPException(status_code=400, detail="종목 심볼을 입력해주세요.")
+    if len(ticker_list) > MAX_CHART_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {MAX_CHART_SYMBOLS}개 종목까지 조회할 수 있습니다."
+        )
+
+    invalid = [symbol for symbol in ticker_list if not re.match(TICKER_PATTERN, symbol)]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"유효하지 않은 종목 심볼: {', '.join(invalid)}"
+        )
+
+    unknown = [symbol for symbol in ticker_list if negative_cache.get(symbol) is not None]
+    if unknown:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목을 찾을 수 없습니다: {', '.join(unknown)}"
+        )
+
+    try:
+        logger.info("차트 데이터 조회 요청 - 종목: %s", ', '.join(ticker_list))
+        charts = chart_service.get_charts(ticker_list, interval.value, range_.value, points)
+        return ChartBatchResponse(charts=charts)
+
+    except Exception as e:
+        logger.error("차트 데이터 조회 중 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get(
+    "/stocks/{ticker}/chart",
+    response_model=ChartSeries,
+    responses={
+        200: {"description": "차트 데이터 조회 성공"},
+        404: {"model": ErrorResponse, "description": "차트 데이터를 찾을 수 없음"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    },
+    summary="종목 차트 데이터 조회",
+    description="종목의 시세 이력을 다운샘플링한 스파크라인/장중 차트 데이터를 조회합니다."
+)
+def get_stock_chart(
+    ticker: str = Path(
+        ...,
+        description="종목 심볼 (대소문자 무관, 예: AAPL, msft, BRK-B)",
+        min_length=1,
+        max_length=10,
+        pattern=TICKER_PATTERN
+    ),
+    interval: ChartInterval = Query(
+        ChartInterval.FIVE_MINUTES,
+        description="시세 간격 (1m, 5m, 15m, 30m, 1h, 1d, 1wk)"
+    ),
+    range_: ChartRange = Query(
+        ChartRange.ONE_DAY,
+        alias="range",
+        description="조회 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 5y)"
+    ),
+    points: int = Query(
+        DEFAULT_CHART_POINTS,
+        ge=10,
+        le=1000,
+        description="최대 포인트 수 (10-1000)"
+    )
+):
+    """
+    종목 차트 데이터 조회 API
+
+    **응답:**
+    - timestamps: UTC epoch 초 배열
+    - close: 종가 배열
+    - volume: 거래량 배열
+    """
+    ticker = normalize_ticker(ticker)
+
+    try:
+        chart = chart_service.get_chart(ticker, interval.value, range_.value, points)
+    except Exception as e:
+        logger.error("차트 데이터 조회 중 오류 (%s): %s", ticker, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+    if chart["error"]:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목 '{ticker}'의 차트 데이터를 찾을 수 없습니다."
+        )
+
+    return ChartSeries(**chart)
+
+
+@router.get(
+    "/stocks/{ticker}",
+    response_model=StockInfoResponse,
+    responses={
+        200: {"description": "종목 상세 정보 조회 성공"},
+        404: {"model": ErrorResponse, "description": "종목을 찾을 수 없음"},
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        504: {"model": ErrorResponse, "description": "마감 시간 안에 가격 정보를 받지 못함"}
+    },
+    summary="종목 상세 정보 조회",
+    description="특정 종목의 상세 정보와 관련 뉴스를 조회합니다."
+)
+def get_stock_info(
+    ticker: str = Path(
+        ...,
+        description="종목 심볼 (대소문자 무관, 예: AAPL, msft, BRK-B)",
+        min_length=1,
+        max_length=10,
+        pattern=TICKER_PATTERN
+    ),
+    include_news: bool = Query(
+        True,
+        description="관련 뉴스 포함 여부"
+    ),
+    news_count: int = Query(
+        10,
+        ge=1,
+        le=20,
+        description="뉴스 개수 (1-20)"
+    ),
+    news_hours: int = Query(
+        48,
+        ge=1,
+        le=168,
+        description="뉴스 검색 시간 범위 (시간, 1-168)"
+    )
+):
+    """
+    종목 상세 정보 조회 API
+
+    **파라미터:**
+    - `ticker`: 종목 심볼 (대소문자 무관, 1-10자, 최근 조회에서 찾지 못한 심볼이면 404)
+    - `include_news`: 뉴스 포함 여부 (기본: true)
+    - `news_count`: 뉴스 개수 (기본: 10)
+    - `news_hours`: 뉴스 검색 시간 범위 (기본: 48시간)
+
+    **응답:**
+    - 종목 기본 정보
+    - 종목 상세 정보 (마감 시간 안에 받지 못한 모듈은 `detail_info.skipped_modules`에 표시)
+    - 관련 뉴스 (선택)
+    """
+    deadline = Deadline(STOCK_INFO_DEADLINE_SECONDS)
+    # 최근 조회에 실패한 심볼은 Yahoo를 다시 호출하지 않음
+    ticker = normalize_ticker(ticker)
+
+    try:
+        logger.info("종목 상세 정보 조회 요청 - 종목: %s", ticker)
+
+        # Yahoo 모듈 조회 (CACHE_BACKEND 설정 시 워커 간 공유, 만료된 키는 한 워커만 갱신)
+        detail = shared_cache.get_or_load(
+            f"stock:{ticker}",
+            lambda: _load_stock_detail(ticker, deadline),
+            market_data.calendar.cache_ttl(STOCK_INFO_CACHE_SECONDS),
+            cacheable=lambda value: value["complete"],
+            wait_seconds=deadline.remaining()
+        )
+        basic_info = detail["basic_info"]
+        detail_info = detail["detail_info"]
+
+        # 뉴스 조회 (선택)
+        news_result = None
+        if include_news:
+            news_service = get_news_service()
+            if news_service:
+                try:
+                    with trace_span("news", symbol=ticker):
+                        news_result = news_service.search_stock_news(
+                            ticker,
+                            hours=news_hours,
+                            num_results=news_count
+                        )
+                except Exception as e:
+                    logger.error("뉴스 조회 중 오류: %s", e)
+                    news_result = None
+
+        # 응답 구성
+        response = StockInfoResponse(
+            symbol=ticker,
+            basic_info=basic_info,
+            detail_info=detail_info,
+            news=news_result
+        )
+
+        logger.info("종목 상세 정보 조회 완료 - 종목: %s", ticker)
+        return response
+
+    except HTTPException:
+        raise
+    except UpstreamUnavailableError as e:
+        logger.warning("종목 상세 정보 조회 거절 (%s): %s", ticker, e)
+        raise _upstream_unavailable(e)
+    except Exception as e:
+        logger.error("종목 상세 정보 조회 중 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+def _load_stock_detail(ticker: str, deadline: Deadline) -> dict:
+    """
+    종목 기본/상세 정보 Yahoo 조회
+
+    Args:
+        ticker: 정규화된 종목 심볼
+        deadline: 응답 마감 시간
+
+    Returns:
+        Dict: basic_info, detail_info, complete (건너뛰거나 실패한 모듈이 없으면 True - 공유 캐시 저장 여부)
+
+    Raises:
+        HTTPException: 존재하지 않는 종목 (404), 가격 정보 마감 초과 (504)
+        UpstreamUnavailableError: Yahoo 호출 거절 / 요청 제한 응답
+    """
+    # Ticker 객체로 종목 정보 조회 (공용 세션 사용)
+    stock = market_data.ticker(ticker)
+
+    # price/summary_detail/financial_data 동시 조회 (모듈별 헤지, 공통 마감 시간)
+    modules, errors, skipped = market_data.executor.run_all(
+        {
+            module_name: (lambda module_name=module_name: market_data.get_module(stock, module_name))
+            for module_name in STOCK_DETAIL_MODULES
+        },
+        deadline
+    )
+
+    # 기본 정보 조회 (price 모듈 사용)
+    if "price" in errors:
+        raise errors["price"]
+    if "price" in skipped:
+        raise HTTPException(
+            status_code=504,
+            detail=f"종목 '{ticker}' 가격 정보를 마감 시간 안에 받지 못했습니다."
+        )
+    price_data = modules["price"]
+
+    # 에러 체크
+    if isinstance(price_data, dict) and ticker in price_data:
+        price_info = price_data[ticker]
+
+        # 요청 제한 응답은 존재하지 않는 종목으로 기록하지 않고 503으로 응답
+        if is_throttled_response(price_info):
+            raise UpstreamUnavailableError("throttled", market_data.guard.breaker.retry_after() or 1.0)
+
+        # 에러 응답 체크 (존재하지 않는 종목으로 기록)
+        if isinstance(price_info, str) or (isinstance(price_info, dict) and "error" in price_info):
+            negative_cache.add(ticker, str(price_info))
+            raise HTTPException(
+                status_code=404,
+                detail=f"종목 '{ticker}'를 찾을 수 없습니다."
+            )
+
+        # 기본 정보 추출
+        basic_info = {
+            "symbol": ticker,
+            "shortName": price_info.get("shortName"),
+            "longName": price_info.get("longName"),
+            "regularMarketPrice": price_info.get("regularMarketPrice"),
+            "regularMarketChange": price_info.get("regularMarketChange"),
+            "regularMarketChangePercent": price_info.get("regularMarketChangePercent"),
+            "regularMarketVolume": price_info.get("regularMarketVolume"),
+            "marketCap": price_info.get("marketCap"),
+        }
+    else:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목 '{ticker}'를 찾을 수 없습니다."
+        )
+
+    # 상세 정보 조회
+    detail_info = {
+        "price": price_info,
+        "summary_detail": _optional_module_value(modules, errors, "summary_detail", ticker),
+        "financial_data": _optional_module_value(modules, errors, "financial_data", ticker),
+        "skipped_modules": skipped,
+    }
+
+    return {
+        "basic_info": basic_info,
+        "detail_info": detail_info,
+        "complete": not skipped and not errors,
+    }
+
+
+@router.get(
+    "/stocks/trending/list",
+    summary="화제 종목 TOP 5 목록 조회",
+    description="가장 활발한 거래량 종목 TOP 5를 조회합니다."
+)
+def get_trending_stocks_list(
+    screener_type: ScreenerType = Query(
+        ScreenerType.MOST_ACTIVES,
+        description="스크리너 타입 (most_actives, day_gainers, day_losers)"
+    ),
+    count: int = Query(
+        5,
+        ge=1,
+        le=25,
+        description="조회할 종목 수 (1-25)"
+    )
+):
+    """
+    화제 종목 TOP N 목록 조회 API
+
+    프론트엔드 대시보드에 표시할 화제 종목 목록을 조회합니다.
+    각 종목의 기본 정보와 순위를 포함합니다.
+    """
+    try:
+        logger.info("화제 종목 목록 조회 요청 - 타입: %s, 개수: %s", screener_type.value, count)
+
+        # 스크리너로 종목 목록 조회
+        cache_key = (screener_type.value, count)
+        try:
+            screener_data = market_data.get_cached_screener(
+                screener_type.value, count, TRENDING_LIST_CACHE_SECONDS
+            )
+        except UpstreamUnavailableError as e:
+            # Yahoo 호출이 거절되면 마지막 성공 목록으로 응답, 없으면 즉시 실패
+            if cache_key not in _trending_list_cache:
+                raise _upstream_unavailable(e)
+            logger.warning("%s - 캐시된 화제 종목 목록으로 응답합니다.", e)
+            screener_data = {screener_type.value: {"quotes": _trending_list_cache[cache_key]}}
+
+        if screener_type.value not in screener_data:
+            raise HTTPException(
+                status_code=404,
+                detail="종목을 찾을 수 없습니다."
+            )
+
+        quotes = screener_data[screener_type.value].get('quotes', [])
+
+        if not quotes:
+            raise HTTPException(
+                status_code=404,
+                detail="종목을 찾을 수 없습니다."
+            )
+
+        _trending_list_cache[cache_key] = quotes
+
+        # 화제 종목은 인덱스에 없어도 상세 조회가 가능하도록 추가
+        symbol_index.add_quotes(quotes)
+
+        # 응답 데이터 구성
+        trending_stocks = []
+        for idx, quote in enumerate(quotes[:count], start=1):
+            stock_data = {
+                "rank": idx,
+                "ticker": quote.get("symbol", ""),
+                "name": quote.get("shortName") or quote.get("longName", ""),
+                "current_price": quote.get("regularMarketPrice", 0),
+                "change_amount": quote.get("regularMarketChange", 0),
+                "change_percent": quote.get("regularMarketChangePercent", 0),
+                "volume": quote.get("regularMarketVolume", 0),
+                "market_cap": quote.get("marketCap", 0),
+                "pe_ratio": quote.get("trailingPE"),
+                "selection_reason": _get_selection_reason(screener_type.value, idx),
+                "confidence": _get_confidence_level(idx),
+                "highlight": _generate_highlight(quote, screener_type.value),
+                "beginner_note": _generate_beginner_note(quote),
+            }
+            trending_stocks.append(stock_data)
+
+        logger.info("화제 종목 목록 조회 완료 - %s개 종목", len(trending_stocks))
+        return trending_stocks
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("화제 종목 목록 조회 중 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+def _optional_module_value(
+    modules: dict,
+    errors: dict,
+    module_name: str,
+    ticker: str
+) -> Optional[dict]:
+    """
+    부가 모듈 조회 결과 추출 (Yahoo 호출이 거절/실패했거나 마감으로 건너뛰었으면 None)
+
+    Args:
+        modules: 모듈 이름 → yahooquery 응답
+        errors: 모듈 이름 → 조회 중 발생한 예외
+        module_name: 모듈 이름
+        ticker: 종목 심볼
+
+    Returns:
+        Dict: 모듈 데이터 또는 None
+    """
+    if module_name in errors:
+        error = errors[module_name]
+        if isinstance(error, UpstreamUnavailableError):
+            logger.warning("모듈 '%s' 조회 생략 (%s): %s", module_name, ticker, error)
+        else:
+            logger.warning("모듈 '%s' 조회 실패 (%s): %s", module_name, ticker, error)
+        return None
+
+    data = modules.get(module_name)
+    value = data.get(ticker) if isinstance(data, dict) else None
+    return value if isinstance(value, dict) else None
+
+
+def _get_selection_reason(screener_type: str, rank: int) -> str:
+    """선정 이유 생성"""
+    if screener_type == "most_actives":
+        if rank == 1:
+            return "거래량 상위 + 주목도 최고"
+        return "거래량 상위"
+    elif screener_type == "day_gainers":
+        return "거래량 상위 + 상승 종목"
+    elif screener_type == "day_losers":
+        return "거래량 상위 + 하락 종목"
+    return "거래량 상위"
+
+
+def _get_confidence_level(rank: int) -> str:
+    """신뢰도 레벨 생성"""
+    if rank == 1:
+        return "HIGH"
+    elif rank <= 3:
+        return "MEDIUM"
+    else:
+        return "LOW"
+
+
+def _generate_highlight(quote: dict, screener_type: str) -> str:
+    """하이라이트 메시지 생성"""
+    change_percent = quote.get("regularMarketChangePercent", 0)
+
+    if screener_type == "day_gainers":
+        return f"📈 {abs(change_percent):.1f}% 상승으로 주목"
+    elif screener_type == "day_losers":
+        return f"📉 {abs(change_percent):.1f}% 하락으로 주목"
+    else:
+        if change_percent > 0:
+            return f"🔥 거래량 증가와 함께 {change_percent:.1f}% 상승"
+        elif change_percent < 0:
+            return f"⚠️ 거래량 증가와 함께 {abs(change_percent):.1f}% 하락"
+        else:
+            return "📊 높은 거래량으로 주목"
+
+
+def _generate_beginner_note(quote: dict) -> str:
+    """초보자 해설 생성"""
+    name = quote.get("shortName") or quote.get("longName", "이 종목")
+    return f"{name}은(는) 현재 시장에서 높은 관심을 받고 있는 종목입니다."
+
+
+@router.get(
+    "/stocks/trending/all",
+    summary="모든 스크리너 화제 종목 조회",
+    description="모든 스크리너 타입의 화제 종목을 한 번에 조회합니다."
+)
+def get_all_trending_stocks(
+    include_news: bool = Query(
+        False,
+        description="관련 뉴스 포함 여부"
+    )
+):
+    """
+    모든 스크리너의 화제 종목 조회 API
+
+    most_actives, day_gainers, day_losers의 TOP 1 종목을 모두 조회합니다.
+    """
+    try:
+        logger.info("모든 스크리너 화제 종목 조회 요청")
+
+        results = trending_service.get_multiple_trending_stocks()
+
+        # 뉴스 조회 (선택)
+        if include_news:
+            news_service = get_news_service()
+            if news_service:
+                for screener_type, result in results.items():
+                    symbol = result.get("symbol")
+                    if symbol:
+                        try:
+                            news_result = news_service.search_stock_news(symbol, hours=24, num_results=3)
+                            result["news"] = news_result
+                        except Exception as e:
+                            logger.error("뉴스 조회 중 오류 (%s): %s", symbol, e)
+
+        logger.info("모든 스크리너 화제 종목 조회 완료")
+        return results
+
+    except Exception as e:
+        logger.error("모든 스크리너 조회 중 오류: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
@@ -1,17 +1,26 @@
 """
 주식 관련 API 라우터
 """
-from fastapi import APIRouter, HTTPException
+import os
 
+from fastapi import APIRouter, HTTPException, Query, Path
+
+from api.market import TICKER_PATTERN, normalize_ticker
+from services.hedged_request import Deadline, DeadlineExceededError
 from services.stock_service import StockService
-from models.stock import TrendingStocksResponse, StockDetailResponse
+from services.tracing import TracedRoute
+from services.upstream_guard import UpstreamUnavailableError
+from models.stock import TrendingStocksResponse, StockDetailResponse, QuoteHistoryResponse
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
 stock_service = StockService()
 
+# 종목 상세 조회 마감 시간 (초) - 넘기면 부가 모듈을 건너뛰고 응답
+STOCK_DETAIL_DEADLINE_SECONDS = int(os.getenv("STOCK_DETAIL_DEADLINE_MS", "2500")) / 1000
+
 
 @router.get("/trending", response_model=TrendingStocksResponse)
-async def get_trending_stocks():
+def get_trending_stocks():
     """
     화제 종목 목록 조회
     - most_actives: 거래량 상위 종목
@@ -24,18 +33,56 @@ async def get_trending_stocks():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{symbol}/history", response_model=QuoteHistoryResponse)
+def get_stock_history(
+    symbol: str,
+    days: int = Query(1, ge=1, le=30, description="조회 기간 (일, 1-30)")
+):
+    """
+    기록된 시세 이력 조회
+    - 화제 종목 조회 때 저장한 시세로 응답하며 Yahoo를 호출하지 않습니다.
+    """
+    try:
+        return stock_service.get_quote_history(symbol.upper(), days)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{symbol}", response_model=StockDetailResponse)
-async def get_stock_detail(symbol: str):
+def get_stock_detail(
+    symbol: str = Path(
+        ...,
+        description="종목 심볼 (대소문자 무관, 예: AAPL, msft, BRK-B)",
+        min_length=1,
+        max_length=10,
+        pattern=TICKER_PATTERN
+    )
+):
     """
     종목 상세 정보 조회
+    - 마감 시간 안에 받지 못한 부가 모듈은 skipped_modules에 표시합니다.
+    - /api/stocks/{ticker}와 같이 최근 조회에서 찾지 못한 심볼은 Yahoo 호출 없이 404로 응답합니다.
     """
+    symbol = normalize_ticker(symbol)
+
     try:
-        data = stock_service.get_stock_detail(symbol.upper())
+        data = stock_service.get_stock_detail(
+            symbol,
+            deadline=Deadline(STOCK_DETAIL_DEADLINE_SECONDS)
+        )
         if not data:
             raise HTTPException(status_code=404, detail=f"종목 {symbol}을(를) 찾을 수 없습니다.")
         return data
     except HTTPException:
         raise
+    except DeadlineExceededError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except UpstreamUnavailableError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, int(round(e.retry_after))))}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,5 @@
+"""
+Benchmarks 패키지
+
+녹화된 yahooquery / Exa 응답을 재생하여 네트워크 없이 서비스와 API 성능을 측정하는 도구
+"""
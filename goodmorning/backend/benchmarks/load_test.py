@@ -0,0 +1,391 @@
+"""
+API 부하 테스트 (asyncio)
+
+mock 업스트림(benchmarks.mock_upstream)을 바라보는 API 서버에 동시 요청을 보내
+엔드포인트별 처리량(RPS)과 지연 시간 분위수(p50/p95/p99), 상태 코드 분포를 측정합니다.
+run.py가 프로세스 안에서 서비스를 직접 호출하는 것과 달리, 실제 HTTP 서버(uvicorn)와
+실제 yahooquery / exa_py 네트워크 경로를 모두 거칩니다.
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.load_test --spawn                           # mock 서버 + API 서버를 띄워서 측정
+    python -m benchmarks.load_test --spawn --suite stocks
+    python -m benchmarks.load_test --spawn --suite all               # /api + /stocks 요청을 섞어서 측정
+    python -m benchmarks.load_test --spawn --mock-args "--throttle-rate 0.05 --error-rate 0.01"
+    python -m benchmarks.load_test --url http://127.0.0.1:8000       # 이미 떠 있는 서버 측정
+
+--url로 직접 띄운 서버를 측정할 때는 서버를 YAHOO_BASE_URL, EXA_BASE_URL 환경 변수로
+mock 서버를 가리키도록 실행해야 합니다. (실제 Yahoo에 부하를 주지 않도록 주의)
+"""
+
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from .mock_upstream import DEFAULT_PORT as DEFAULT_MOCK_PORT
+from .replay import FixtureStore
+from .run import APP_DIR, BENCHMARK_ENV, percentile
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 요청마다 남는 httpx 로그는 출력하지 않음
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+DEFAULT_API_PORT = 8800
+STARTUP_TIMEOUT_SECONDS = 30
+
+# 시나리오 묶음별 요청 구성: (이름, 경로 템플릿, 가중치)
+# {symbol}은 fixtures 종목 중 하나, {symbols}는 앞 5개 종목으로 채움
+ENDPOINT_MIX = {
+    "market": [
+        ("trending", "/api/stocks/trending?type=most_actives", 1),
+        ("trending_list", "/api/stocks/trending/list?type=day_gainers&count=5", 1),
+        ("stock_info", "/api/stocks/{symbol}?include_news=false", 4),
+        ("stock_info_news", "/api/stocks/{symbol}?include_news=true", 1),
+        ("chart", "/api/stocks/{symbol}/chart?interval=5m&range=1d", 2),
+        ("charts_batch", "/api/stocks/charts?symbols={symbols}&interval=1d&range=1y", 1),
+    ],
+    "stocks": [
+        ("trending", "/stocks/trending", 1),
+        ("stock_detail", "/stocks/{symbol}", 4),
+        ("stock_history", "/stocks/{symbol}/history?days=1", 1),
+    ],
+}
+
+# 두 라우트 묶음이 같은 업스트림 호출 한도와 캐시를 나눠 쓰는 상황 측정
+ENDPOINT_MIX["all"] = [
+    (f"{suite}.{name}", path, weight)
+    for suite in ("market", "stocks")
+    for name, path, weight in ENDPOINT_MIX[suite]
+]
+
+HEALTH_PATH = "/health"
+
+
+class LoadRecorder:
+    """요청 결과 기록 (엔드포인트별 지연 시간, 상태 코드)"""
+
+    def __init__(self):
+        """LoadRecorder 초기화"""
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Counter] = {}
+
+    def record(self, name: str, seconds: float, status: str) -> None:
+        """
+        요청 1건 기록
+
+        Args:
+            name: 엔드포인트 이름
+            seconds: 지연 시간 (초)
+            status: 상태 코드 문자열 (연결 실패 등은 예외 이름)
+        """
+        self.latencies.setdefault(name, []).append(seconds)
+        self.statuses.setdefault(name, Counter())[status] += 1
+
+    def summary(self, elapsed: float) -> List[Dict[str, Any]]:
+        """
+        엔드포인트별 + 전체 측정 결과
+
+        Args:
+            elapsed: 측정 시간 (초)
+
+        Returns:
+            List[Dict]: name, requests, errors, statuses, rps, mean_ms, p50_ms, p95_ms, p99_ms, max_ms
+        """
+        groups = [(name, self.latencies[name], self.statuses[name]) for name in self.latencies]
+        total_statuses: Counter = Counter()
+        for statuses in self.statuses.values():
+            total_statuses.update(statuses)
+        groups.append(("total", [value for values in self.latencies.values() for value in values], total_statuses))
+
+        to_ms = lambda seconds: round(seconds * 1000, 3)
+        results = []
+        for name, latencies, statuses in groups:
+            latencies = sorted(latencies)
+            errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+            results.append({
+                "name": name,
+                "requests": len(latencies),
+                "errors": errors,
+                "statuses": dict(sorted(statuses.items())),
+                "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+                "mean_ms": to_ms(sum(latencies) / len(latencies)) if latencies else 0.0,
+                "p50_ms": to_ms(percentile(latencies, 0.50)),
+                "p95_ms": to_ms(percentile(latencies, 0.95)),
+                "p99_ms": to_ms(percentile(latencies, 0.99)),
+                "max_ms": to_ms(latencies[-1]) if latencies else 0.0,
+            })
+        return results
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    mix: List[Tuple[str, str, int]],
+    symbols: List[str],
+    stop_at: float,
+    recorder: Optional[LoadRecorder],
+    rng: random.Random
+) -> None:
+    """종료 시각까지 가중치에 따라 엔드포인트를 골라 요청 (closed-loop, 응답 후 다음 요청)"""
+    names = [item[0] for item in mix]
+    paths = {item[0]: item[1] for item in mix}
+    weights = [item[2] for item in mix]
+
+    while time.monotonic() < stop_at:
+        name = rng.choices(names, weights)[0]
+        path = paths[name].format(symbol=rng.choice(symbols), symbols=",".join(symbols[:5]))
+
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            status = str(response.status_code)
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        if recorder is not None:
+            recorder.record(name, time.perf_counter() - started, status)
+
+
+async def run_load(
+    base_url: str,
+    suite: str,
+    symbols: List[str],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    timeout: float,
+    seed: int
+) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    부하 테스트 실행
+
+    Args:
+        base_url: API 서버 주소
+        suite: 시나리오 묶음 이름 (ENDPOINT_MIX 키)
+        symbols: 요청에 사용할 종목 심볼
+        concurrency: 동시 요청 수 (가상 사용자 수)
+        duration: 측정 시간 (초)
+        warmup: 측정 전 예열 시간 (초, 결과에서 제외)
+        timeout: 요청 타임아웃 (초)
+        seed: 요청 선택 난수 시드
+
+    Returns:
+        Tuple[List[Dict], float]: (엔드포인트별 + 전체 측정 결과, 실제 측정 시간)
+    """
+    mix = ENDPOINT_MIX[suite]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        if warmup > 0:
+            stop_at = time.monotonic() + warmup
+            await asyncio.gather(*(
+                _worker(client, mix, symbols, stop_at, None, random.Random(seed - i - 1))
+                for i in range(concurrency)
+            ))
+
+        recorder = LoadRecorder()
+        started = time.monotonic()
+        stop_at = started + duration
+        await asyncio.gather(*(
+            _worker(client, mix, symbols, stop_at, recorder, random.Random(seed + i))
+            for i in range(concurrency)
+        ))
+        elapsed = time.monotonic() - started
+
+    return recorder.summary(elapsed), elapsed
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float = STARTUP_TIMEOUT_SECONDS) -> None:
+    """
+    서버 응답 대기
+
+    Raises:
+        RuntimeError: 프로세스가 종료되었거나 제한 시간 안에 응답하지 않은 경우
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버 프로세스가 종료되었습니다 (종료 코드 {process.returncode}): {url}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{timeout:.0f}초 안에 서버가 응답하지 않았습니다: {url}")
+
+
+def spawn_servers(
+    mock_port: int,
+    api_port: int,
+    workers: int,
+    mock_args: str,
+    log_path: Path
+) -> List[subprocess.Popen]:
+    """
+    mock 업스트림 서버와 mock 서버를 바라보는 API 서버 실행
+
+    Args:
+        mock_port: mock 업스트림 포트
+        api_port: API 서버 포트
+        workers: API 서버 uvicorn 워커 수
+        mock_args: mock_upstream 추가 인자 (예: "--throttle-rate 0.05")
+        log_path: 두 서버의 출력을 기록할 파일
+
+    Returns:
+        List[subprocess.Popen]: 실행한 프로세스 (mock, API 순서)
+
+    Raises:
+        RuntimeError: 서버가 제한 시간 안에 준비되지 않은 경우
+    """
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    processes = []
+    log_file = open(log_path, 'w', encoding='utf-8')
+
+    try:
+        mock = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.mock_upstream", "--port", str(mock_port), *shlex.split(mock_args)],
+            cwd=APP_DIR,
+            stdout=log_file,
+            stderr=subprocess.STDOUT
+        )
+        processes.append(mock)
+        _wait_until_ready(f"{mock_url}/__mock__/stats", mock)
+
+        # 실제 업스트림 대신 mock 서버 사용 (API 키도 mock 값으로 고정해 실제 Exa 호출을 막음)
+        env = {**BENCHMARK_ENV, **os.environ}
+        env.update({"YAHOO_BASE_URL": mock_url, "EXA_BASE_URL": mock_url, "EXA_API_KEY": "mock"})
+
+        api = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "main:app",
+                "--host", "127.0.0.1", "--port", str(api_port),
+                "--workers", str(workers), "--log-level", "warning",
+            ],
+            cwd=APP_DIR,
+            env=env,
+            stdout=log_file,
+            stderr=subprocess.STDOUT
+        )
+        processes.append(api)
+        _wait_until_ready(f"http://127.0.0.1:{api_port}{HEALTH_PATH}", api)
+    except Exception:
+        stop_servers(processes)
+        raise
+    finally:
+        # 자식 프로세스가 파일을 이어서 사용하므로 부모 쪽 핸들만 닫음
+        log_file.close()
+
+    logger.info(
+        "서버 준비 완료 - mock %s, API http://127.0.0.1:%s (워커 %s개), 서버 로그: %s",
+        mock_url, api_port, workers, log_path
+    )
+    return processes
+
+
+def stop_servers(processes: List[subprocess.Popen]) -> None:
+    """실행한 서버 종료 (API 서버부터)"""
+    for process in reversed(processes):
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """결과 표 출력"""
+    header = f"{'endpoint':<18}{'requests':>10}{'RPS':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'err':>6}  statuses"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        statuses = " ".join(f"{status}:{count}" for status, count in result["statuses"].items())
+        print(
+            f"{result['name']:<18}{result['requests']:>10}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}"
+            f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['max_ms']:>10.2f}{result['errors']:>6}  {statuses}"
+        )
+
+
+def main():
+    """부하 테스트 CLI"""
+    from services.utils import LoggerFactory
+
+    LoggerFactory.configure()
+
+    parser = argparse.ArgumentParser(description="mock 업스트림 기반 API 부하 테스트")
+    parser.add_argument("--suite", choices=list(ENDPOINT_MIX), default="market")
+    parser.add_argument("--url", default=None, help="측정할 API 서버 주소 (--spawn 사용 시 무시)")
+    parser.add_argument("--spawn", action="store_true", help="mock 서버와 API 서버를 직접 실행")
+    parser.add_argument("--mock-port", type=int, default=DEFAULT_MOCK_PORT)
+    parser.add_argument("--api-port", type=int, default=DEFAULT_API_PORT)
+    parser.add_argument("--workers", type=int, default=1, help="API 서버 uvicorn 워커 수 (--spawn)")
+    parser.add_argument("--mock-args", default="", help="mock_upstream 추가 인자 (--spawn)")
+    parser.add_argument(
+        "--server-log", type=Path, default=Path(tempfile.gettempdir()) / "load_test_servers.log",
+        help="실행한 서버의 출력 파일 (--spawn)"
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="예열 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    if not args.spawn and not args.url:
+        parser.error("--url 또는 --spawn 중 하나가 필요합니다.")
+
+    processes = []
+    try:
+        if args.spawn:
+            processes = spawn_servers(
+                args.mock_port, args.api_port, args.workers, args.mock_args, args.server_log
+            )
+        base_url = f"http://127.0.0.1:{args.api_port}" if args.spawn else args.url
+
+        logger.info("부하 테스트 시작 - %s, 동시 요청 %s, %.0f초", base_url, args.concurrency, args.duration)
+        results, elapsed = asyncio.run(run_load(
+            base_url, args.suite, FixtureStore().symbols, args.concurrency,
+            args.duration, args.warmup, args.timeout, args.seed
+        ))
+    except Exception as e:
+        logger.error("부하 테스트 실패: %s", e)
+        exit(1)
+    finally:
+        stop_servers(processes)
+
+    print_results(results)
+
+    if args.json:
+        report = {
+            "suite": args.suite,
+            "base_url": base_url,
+            "config": {
+                "concurrency": args.concurrency,
+                "duration": round(elapsed, 2),
+                "workers": args.workers if args.spawn else None,
+                "mock_args": args.mock_args if args.spawn else None,
+            },
+            "results": results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    total = results[-1]
+    exit(0 if total["requests"] > total["errors"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+로깅 오버헤드 벤치마크
+
+요청 하나가 남기는 로그(종목 상세 조회 경로와 같은 INFO 5줄 + 걸러지는 DEBUG 1줄)를
+여러 스레드에서 반복 호출하여, 요청 처리 스레드가 로그 호출에 쓰는 시간을 설정별로 비교합니다.
+
+- sync_fstring: 기존 방식 (f-string 메시지 + basicConfig 동기 StreamHandler)
+- sync_lazy: 지연 포맷(%-스타일 인자)만 적용
+- async_lazy: LoggerFactory 큐 핸들러 (포맷/출력은 별도 스레드)
+- async_json: 큐 핸들러 + JSON 형식
+- async_sampled: 큐 핸들러 + 로거별 표본 추출 (--sample-rate)
+
+출력 대상은 임시 파일이며, --sink-latency-us로 쓰기마다 지연을 넣어
+컨테이너 로그 드라이버나 파이프가 밀릴 때의 stderr를 흉내 낼 수 있습니다.
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.logging_bench
+    python -m benchmarks.logging_bench --sink-latency-us 200 --threads 8
+"""
+
+from typing import Dict, Any, Callable, List
+import argparse
+import json
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from services.utils import LoggerFactory, TEXT_DATE_FORMAT, TEXT_LOG_FORMAT
+
+from .run import percentile
+
+BENCH_LOGGER = "services.bench"
+
+
+class SlowSink:
+    """쓰기마다 지정한 시간만큼 지연되는 출력 스트림"""
+
+    def __init__(self, path: Path, latency_seconds: float = 0.0):
+        """
+        SlowSink 초기화
+
+        Args:
+            path: 실제로 기록할 파일
+            latency_seconds: 쓰기 한 번당 지연 시간 (초)
+        """
+        self._file = open(path, 'w', encoding='utf-8')
+        self.latency_seconds = latency_seconds
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        self.writes += 1
+        return self._file.write(text)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _request_fstring(logger: logging.Logger, symbol: str, index: int) -> None:
+    logger.info(f"종목 상세 정보 조회 요청 - 종목: {symbol}")
+    logger.debug(f"요청 파라미터 - 종목: {symbol}, 번호: {index}")
+    for module in ("price", "summary_detail", "financial_data"):
+        logger.info(f"종목 모듈 조회 ({symbol}): {module}, 소요 {index % 97 * 1.37:.2f}ms")
+    logger.info(f"종목 상세 정보 조회 완료 - 종목: {symbol}")
+
+
+def _request_lazy(logger: logging.Logger, symbol: str, index: int) -> None:
+    logger.info("종목 상세 정보 조회 요청 - 종목: %s", symbol)
+    logger.debug("요청 파라미터 - 종목: %s, 번호: %s", symbol, index)
+    for module in ("price", "summary_detail", "financial_data"):
+        logger.info("종목 모듈 조회 (%s): %s, 소요 %.2fms", symbol, module, index % 97 * 1.37)
+    logger.info("종목 상세 정보 조회 완료 - 종목: %s", symbol)
+
+
+def _configure_basic(sink: SlowSink) -> None:
+    """기존 basicConfig와 같은 동기 StreamHandler 설정"""
+    LoggerFactory.shutdown()
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT, TEXT_DATE_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def run_scenario(
+    name: str,
+    configure: Callable[[SlowSink], None],
+    emit: Callable[[logging.Logger, str, int], None],
+    sink: SlowSink,
+    requests: int,
+    threads: int
+) -> Dict[str, Any]:
+    """
+    설정 하나로 요청 로그를 반복 호출하고 요청당 로그 호출 시간 측정
+
+    Args:
+        name: 시나리오 이름
+        configure: 로깅 설정 함수
+        emit: 요청 하나의 로그 호출 함수
+        sink: 출력 스트림
+        requests: 스레드당 요청 수
+        threads: 동시에 로그를 남기는 스레드 수
+
+    Returns:
+        Dict: 요청당 평균/p50/p99 (µs), 출력 완료까지 걸린 시간 (ms), 기록된 줄 수
+    """
+    configure(sink)
+    logger = logging.getLogger(BENCH_LOGGER)
+    durations: List[float] = []
+    lock = threading.Lock()
+
+    def worker(offset: int) -> None:
+        local = []
+        for index in range(requests):
+            started = time.perf_counter()
+            emit(logger, "AAPL", offset + index)
+            local.append(time.perf_counter() - started)
+        with lock:
+            durations.extend(local)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i * requests,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    emitted = time.perf_counter() - started
+
+    # 큐에 남은 로그가 모두 출력될 때까지 대기
+    LoggerFactory.shutdown()
+    sink.flush()
+    drained = time.perf_counter() - started
+
+    durations.sort()
+    return {
+        "name": name,
+        "requests": len(durations),
+        "mean_us": sum(durations) / len(durations) * 1e6,
+        "p50_us": percentile(durations, 0.50) * 1e6,
+        "p99_us": percentile(durations, 0.99) * 1e6,
+        "emit_ms": emitted * 1000,
+        "drain_ms": drained * 1000,
+        "lines": sink.writes,
+    }
+
+
+def main():
+    """로깅 벤치마크 CLI"""
+    parser = argparse.ArgumentParser(description="요청당 로깅 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000, help="스레드당 요청 수")
+    parser.add_argument("--threads", type=int, default=4, help="동시에 로그를 남기는 스레드 수")
+    parser.add_argument("--sink-latency-us", type=float, default=0.0, help="출력 쓰기 한 번당 지연 (µs)")
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="async_sampled 시나리오의 INFO 표본 비율")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    latency = args.sink_latency_us / 1e6
+    scenarios = [
+        ("sync_fstring", _configure_basic, _request_fstring),
+        ("sync_lazy", _configure_basic, _request_lazy),
+        ("async_lazy", lambda sink: LoggerFactory.configure("INFO", "text", True, {}, sink), _request_lazy),
+        ("async_json", lambda sink: LoggerFactory.configure("INFO", "json", True, {}, sink), _request_lazy),
+        (
+            "async_sampled",
+            lambda sink: LoggerFactory.configure("INFO", "text", True, {BENCH_LOGGER: args.sample_rate}, sink),
+            _request_lazy
+        ),
+    ]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, configure, emit in scenarios:
+            sink = SlowSink(Path(tmp) / f"{name}.log", latency)
+            try:
+                results.append(run_scenario(name, configure, emit, sink, args.requests, args.threads))
+            finally:
+                sink.close()
+
+    # 벤치마크 출력이 임시 파일로 향하지 않도록 기본 설정으로 복구
+    LoggerFactory.configure()
+
+    baseline = results[0]["mean_us"]
+    header = f"{'scenario':<16}{'mean µs':>10}{'p50 µs':>10}{'p99 µs':>10}{'emit ms':>10}{'drain ms':>10}{'lines':>9}  vs base"
+    print(f"요청 {results[0]['requests']}건 ({args.threads}스레드), 출력 지연 {args.sink_latency_us:.0f}µs/줄")
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        change = (result["mean_us"] - baseline) / baseline * 100
+        print(
+            f"{result['name']:<16}{result['mean_us']:>10.1f}{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}"
+            f"{result['emit_ms']:>10.0f}{result['drain_ms']:>10.0f}{result['lines']:>9}  {change:+.1f}%"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"config": vars(args) | {"json": str(args.json)}, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
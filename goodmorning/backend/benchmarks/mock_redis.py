@@ -0,0 +1,217 @@
+"""
+공유 캐시 검증용 Redis 대체(mock) 서버
+
+services.shared_cache.RedisCacheBackend가 사용하는 명령만 구현한 RESP2 서버입니다.
+실제 Redis 없이 redis 저장소의 잠금/만료 동작을 확인할 때 사용합니다. (단일 프로세스, 메모리 보관)
+
+지원 명령: PING, GET, SET (EX, PX, NX, XX), DEL, EXISTS, PTTL, AUTH, SELECT, FLUSHALL, DBSIZE
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.mock_redis --port 6390
+    CACHE_BACKEND=redis CACHE_REDIS_URL=redis://127.0.0.1:6390/0 uvicorn main:app --workers 4
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+import argparse
+import asyncio
+import logging
+import threading
+import time
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 6390
+
+
+class RedisStore:
+    """만료 시각을 가진 키-값 저장소 (조회 시 만료 확인)"""
+
+    def __init__(self):
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.commands = 0
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry[0]
+
+    def execute(self, args: List[bytes]) -> Any:
+        """
+        명령 하나 실행
+
+        Args:
+            args: 명령과 인자
+
+        Returns:
+            Any: 응답 값 (str → simple string, bytes/None → bulk string, int, Exception → 에러)
+        """
+        self.commands += 1
+        name = args[0].upper()
+
+        if name == b"PING":
+            return "PONG"
+        if name in (b"AUTH", b"SELECT"):
+            return "OK"
+        if name == b"GET":
+            return self._get(args[1])
+        if name == b"SET":
+            return self._set(args[1], args[2], [arg.upper() for arg in args[3:]])
+        if name == b"DEL":
+            deleted = [key for key in args[1:] if self._get(key) is not None]
+            for key in deleted:
+                del self._data[key]
+            return len(deleted)
+        if name == b"EXISTS":
+            return sum(1 for key in args[1:] if self._get(key) is not None)
+        if name == b"PTTL":
+            if self._get(args[1]) is None:
+                return -2
+            expires_at = self._data[args[1]][1]
+            return -1 if expires_at is None else int((expires_at - time.monotonic()) * 1000)
+        if name == b"FLUSHALL":
+            self._data.clear()
+            return "OK"
+        if name == b"DBSIZE":
+            return len(self._data)
+        return ValueError(f"ERR unknown command '{name.decode('utf-8', 'replace')}'")
+
+    def _set(self, key: bytes, value: bytes, options: List[bytes]) -> Any:
+        expires_at = None
+        index = 0
+        only_new = only_existing = False
+        try:
+            while index < len(options):
+                option = options[index]
+                if option in (b"EX", b"PX"):
+                    amount = int(options[index + 1])
+                    expires_at = time.monotonic() + (amount if option == b"EX" else amount / 1000)
+                    index += 2
+                    continue
+                if option == b"NX":
+                    only_new = True
+                elif option == b"XX":
+                    only_existing = True
+                else:
+                    return ValueError("ERR syntax error")
+                index += 1
+        except (IndexError, ValueError):
+            return ValueError("ERR syntax error")
+
+        exists = self._get(key) is not None
+        if (only_new and exists) or (only_existing and not exists):
+            return None
+        self._data[key] = (value, expires_at)
+        return "OK"
+
+
+def encode_reply(value: Any) -> bytes:
+    """응답 값을 RESP2 형식으로 변환"""
+    if isinstance(value, Exception):
+        return b"-%s\r\n" % str(value).encode("utf-8")
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode("utf-8")
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+async def read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    """RESP 배열 명령 하나 읽기 (연결 종료 시 None)"""
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # 인라인 명령 (redis-cli 없이 nc 등으로 확인할 때)
+        return line.strip().split()
+    args = []
+    for _ in range(int(line[1:-2])):
+        header = await reader.readline()
+        length = int(header[1:-2])
+        data = await reader.readexactly(length + 2)
+        args.append(data[:-2])
+    return args
+
+
+async def serve(host: str, port: int, store: RedisStore, ready: Optional[threading.Event] = None) -> None:
+    """
+    서버 실행 (취소될 때까지)
+
+    Args:
+        host: 바인드 주소
+        port: 포트
+        store: 저장소
+        ready: 수신 대기 시작 시 설정할 이벤트
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                args = await read_command(reader)
+                if args is None:
+                    break
+                if not args:
+                    continue
+                writer.write(encode_reply(store.execute(args)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def start_in_thread(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> RedisStore:
+    """
+    백그라운드 스레드에서 서버 시작 (벤치마크/테스트용, 수신 대기까지 기다림)
+
+    Args:
+        host: 바인드 주소
+        port: 포트
+
+    Returns:
+        RedisStore: 서버 저장소 (명령 수 확인용)
+    """
+    store = RedisStore()
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=lambda: asyncio.run(serve(host, port, store, ready)), name="mock-redis", daemon=True
+    )
+    thread.start()
+    if not ready.wait(5):
+        raise RuntimeError(f"mock Redis 서버를 시작하지 못했습니다: {host}:{port}")
+    return store
+
+
+def main():
+    """mock Redis 서버 CLI"""
+    from services.utils import LoggerFactory
+
+    LoggerFactory.configure()
+
+    parser = argparse.ArgumentParser(description="공유 캐시 검증용 Redis mock 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    logger.info("mock Redis 시작 - redis://%s:%s/0", args.host, args.port)
+    try:
+        asyncio.run(serve(args.host, args.port, RedisStore()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
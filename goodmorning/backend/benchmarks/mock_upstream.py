@@ -0,0 +1,379 @@
+"""
+부하 테스트용 Yahoo / Exa 대체(mock) 서버
+
+실제 Yahoo에 부하를 주면 IP가 차단되므로, yahooquery와 exa_py가 호출하는 엔드포인트를
+녹화된 응답(fixtures/*.json)으로 흉내 내는 로컬 HTTP 서버를 띄웁니다.
+서비스는 환경 변수로 이 서버를 바라보게 합니다.
+
+    YAHOO_BASE_URL=http://127.0.0.1:8900   (services.yahoo_session: *.yahoo.com 요청 주소 변경)
+    EXA_BASE_URL=http://127.0.0.1:8900     (services.news_service: Exa 클라이언트 base_url)
+
+흉내 내는 엔드포인트:
+- GET  /                                      쿠키 설정 페이지 (finance.yahoo.com)
+- GET  /v1/test/getcrumb                      crumb 발급
+- GET  /v1/finance/screener/predefined/saved  스크리너 (scrIds, count)
+- GET  /v10/finance/quoteSummary/{symbol}     종목 모듈 (modules)
+- GET  /v8/finance/chart/{symbol}             시세 이력 (range, interval) - replay.synthetic_history
+- POST /search                                Exa 검색
+- GET  /__mock__/stats                        경로/상태 코드별 응답 수
+
+데이터 엔드포인트(스크리너, quoteSummary, chart, Exa 검색)에는 지연 시간 분포와
+에러(500, 텍스트 본문), 요청 제한(429, Yahoo 에러 형식 JSON + Retry-After) 응답을 확률적으로 주입합니다.
+(쿠키/crumb 준비 단계에는 주입하지 않음)
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.mock_upstream --port 8900
+    python -m benchmarks.mock_upstream --latency-dist lognormal --yahoo-latency-ms 120 --sigma 0.8
+    python -m benchmarks.mock_upstream --error-rate 0.02 --throttle-rate 0.05 --retry-after 2
+"""
+
+from collections import Counter
+from typing import Dict, Any, Optional
+import argparse
+import asyncio
+import logging
+import math
+import random
+import threading
+
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from yahooquery.constants import SCREENERS
+
+from .replay import FixtureStore, synthetic_history
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8900
+MOCK_CRUMB = "mockcrumb"
+
+LATENCY_DISTRIBUTIONS = ("fixed", "normal", "lognormal")
+
+
+class LatencyDistribution:
+    """
+    주입 지연 시간 분포
+
+    - fixed: 항상 median_ms
+    - normal: 평균 median_ms, 표준편차 jitter_ms (0 이상으로 절단)
+    - lognormal: 중앙값 median_ms, 형태 sigma (긴 꼬리, 실제 업스트림 응답에 가까움)
+    """
+
+    def __init__(
+        self,
+        kind: str = "lognormal",
+        median_ms: float = 80.0,
+        jitter_ms: float = 20.0,
+        sigma: float = 0.5,
+        seed: Optional[int] = None
+    ):
+        """
+        LatencyDistribution 초기화
+
+        Args:
+            kind: 분포 종류 (fixed, normal, lognormal)
+            median_ms: 중앙값 (밀리초)
+            jitter_ms: normal 분포 표준편차 (밀리초)
+            sigma: lognormal 분포 형태 값 (클수록 꼬리가 김)
+            seed: 난수 시드 (재현용)
+
+        Raises:
+            ValueError: 지원하지 않는 분포 종류
+        """
+        if kind not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 시간 분포입니다: {kind} ({', '.join(LATENCY_DISTRIBUTIONS)})")
+
+        self.kind = kind
+        self.median_ms = median_ms
+        self.jitter_ms = jitter_ms
+        self.sigma = sigma
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """지연 시간 1회 추출 (초)"""
+        with self._lock:
+            if self.kind == "normal":
+                value = self._random.gauss(self.median_ms, self.jitter_ms)
+            elif self.kind == "lognormal":
+                value = self.median_ms * math.exp(self._random.gauss(0.0, self.sigma))
+            else:
+                value = self.median_ms
+        return max(0.0, value) / 1000
+
+    def describe(self) -> str:
+        """분포 설명 문자열"""
+        if self.kind == "normal":
+            return f"normal({self.median_ms:.0f}±{self.jitter_ms:.0f}ms)"
+        if self.kind == "lognormal":
+            return f"lognormal(median {self.median_ms:.0f}ms, sigma {self.sigma})"
+        return f"fixed({self.median_ms:.0f}ms)"
+
+
+class FaultInjector:
+    """확률적 에러(500) / 요청 제한(429) 응답 주입"""
+
+    def __init__(
+        self,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: Optional[int] = None
+    ):
+        """
+        FaultInjector 초기화
+
+        Args:
+            error_rate: 500 응답 비율 (0~1)
+            throttle_rate: 429 응답 비율 (0~1)
+            retry_after: 429 응답의 Retry-After 값 (초)
+            seed: 난수 시드 (재현용)
+        """
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pick(self) -> Optional[int]:
+        """
+        이번 요청에 주입할 상태 코드
+
+        Returns:
+            int: 429 또는 500 (정상 응답이면 None)
+        """
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+
+def _yahoo_error(response_field: str, status_code: int, description: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    """Yahoo 에러 응답 형식 ({response_field: {result: null, error: {...}}})"""
+    return JSONResponse(
+        {response_field: {"result": None, "error": {"code": description, "description": description}}},
+        status_code=status_code,
+        headers=headers
+    )
+
+
+def _chart_result(symbol: str, last_price: float, period: str, interval: str) -> Dict[str, Any]:
+    """yahooquery history가 해석하는 chart 응답 항목"""
+    timestamps, close, volume = synthetic_history(symbol, last_price, period, interval)
+    close = [round(float(value), 4) for value in close]
+    return {
+        "meta": {
+            "symbol": symbol,
+            "currency": "USD",
+            "exchangeTimezoneName": "America/New_York",
+            "gmtoffset": -14400,
+            "regularMarketTime": None,
+            "dataGranularity": interval,
+            "range": period,
+        },
+        "timestamp": [int(value) for value in timestamps],
+        "indicators": {
+            "quote": [{
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": [int(value) for value in volume],
+            }],
+        },
+    }
+
+
+def create_app(
+    yahoo_latency: LatencyDistribution,
+    exa_latency: LatencyDistribution,
+    faults: FaultInjector,
+    store: Optional[FixtureStore] = None
+) -> FastAPI:
+    """
+    mock 업스트림 앱 생성
+
+    Args:
+        yahoo_latency: Yahoo 데이터 엔드포인트 지연 시간 분포
+        exa_latency: Exa 검색 지연 시간 분포
+        faults: 에러/요청 제한 주입기 (Yahoo, Exa 공통)
+        store: 응답 데이터 (기본값: fixtures 디렉토리)
+
+    Returns:
+        FastAPI: mock 업스트림 앱
+    """
+    store = store or FixtureStore()
+    screener_names = {SCREENERS[name]["id"]: name for name in SCREENERS}
+    counters: Counter = Counter()
+
+    app = FastAPI(title="Mock Yahoo/Exa upstream", docs_url=None, redoc_url=None)
+
+    @app.middleware("http")
+    async def count_responses(request: Request, call_next):
+        response = await call_next(request)
+        route = request.scope.get("route")
+        counters[(getattr(route, "path", request.url.path), response.status_code)] += 1
+        return response
+
+    async def inject(latency: LatencyDistribution, response_field: Optional[str]) -> Optional[Response]:
+        """지연 시간 대기 후 주입할 에러 응답 반환 (정상이면 None)"""
+        await asyncio.sleep(latency.sample())
+        status_code = faults.pick()
+        if status_code is None:
+            return None
+
+        if status_code == 429:
+            headers = {"Retry-After": str(faults.retry_after)}
+            if response_field is None:
+                return JSONResponse({"error": "Too Many Requests"}, status_code=429, headers=headers)
+            return _yahoo_error(response_field, 429, "Too Many Requests", headers)
+
+        # 500은 Yahoo 엣지 서버 에러 페이지처럼 JSON이 아닌 본문으로 응답
+        return PlainTextResponse("Internal Server Error", status_code=500)
+
+    @app.get("/", response_class=PlainTextResponse)
+    async def setup_page():
+        return "<html><body>mock finance.yahoo.com</body></html>"
+
+    @app.get("/v1/test/getcrumb", response_class=PlainTextResponse)
+    async def crumb():
+        return MOCK_CRUMB
+
+    @app.get("/v1/finance/screener/predefined/saved")
+    async def screener(scrIds: str, count: int = 25):
+        fault = await inject(yahoo_latency, "finance")
+        if fault is not None:
+            return fault
+
+        name = screener_names.get(scrIds)
+        if name is None:
+            return _yahoo_error("finance", 404, f"Screener not found: {scrIds}")
+
+        return {
+            "finance": {
+                "result": [{
+                    "id": scrIds,
+                    "title": SCREENERS[name]["title"],
+                    "count": min(count, len(store.screeners.get(name, []))),
+                    "quotes": store.screeners.get(name, [])[:count],
+                }],
+                "error": None,
+            }
+        }
+
+    @app.get("/v10/finance/quoteSummary/{symbol}")
+    async def quote_summary(symbol: str, modules: str = ""):
+        fault = await inject(yahoo_latency, "quoteSummary")
+        if fault is not None:
+            return fault
+
+        data = store.modules.get(symbol.upper())
+        if data is None:
+            return _yahoo_error("quoteSummary", 404, f"Quote not found for ticker symbol: {symbol.upper()}")
+
+        result = {module: data[module] for module in modules.split(",") if module in data}
+        if not result:
+            return _yahoo_error("quoteSummary", 404, f"No fundamentals data found for any of the summaryTypes={modules}")
+
+        return {"quoteSummary": {"result": [result], "error": None}}
+
+    @app.get("/v8/finance/chart/{symbol}")
+    async def chart(symbol: str, interval: str = "1d", range_: str = Query("1mo", alias="range")):
+        fault = await inject(yahoo_latency, "chart")
+        if fault is not None:
+            return fault
+
+        data = store.modules.get(symbol.upper())
+        if data is None:
+            return _yahoo_error("chart", 404, "No data found, symbol may be delisted")
+
+        last_price = data["price"]["regularMarketPrice"]
+        return {"chart": {"result": [_chart_result(symbol, last_price, range_, interval)], "error": None}}
+
+    @app.post("/search")
+    async def exa_search(request: Request):
+        fault = await inject(exa_latency, None)
+        if fault is not None:
+            return fault
+
+        body = await request.json()
+        results = [
+            {
+                "id": item["url"],
+                "url": item["url"],
+                "title": item.get("title"),
+                "publishedDate": item.get("published_date"),
+                "author": item.get("author"),
+            }
+            for item in store.news[:body.get("numResults", 10)]
+        ]
+        return {"requestId": "mock", "results": results, "resolvedSearchType": "neural"}
+
+    @app.get("/__mock__/stats")
+    async def stats():
+        return {
+            "responses": [
+                {"path": path, "status": status, "count": count}
+                for (path, status), count in sorted(counters.items())
+            ],
+            "yahoo_latency": yahoo_latency.describe(),
+            "exa_latency": exa_latency.describe(),
+            "error_rate": faults.error_rate,
+            "throttle_rate": faults.throttle_rate,
+        }
+
+    return app
+
+
+def main():
+    """mock 업스트림 서버 CLI"""
+    from services.utils import LoggerFactory
+
+    LoggerFactory.configure()
+
+    parser = argparse.ArgumentParser(description="부하 테스트용 Yahoo / Exa mock 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--yahoo-latency-ms", type=float, default=80.0, help="Yahoo 지연 시간 중앙값")
+    parser.add_argument("--exa-latency-ms", type=float, default=300.0, help="Exa 지연 시간 중앙값")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="normal 분포 표준편차")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal 분포 형태 값")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    yahoo_latency = LatencyDistribution(args.latency_dist, args.yahoo_latency_ms, args.jitter_ms, args.sigma, args.seed)
+    exa_latency = LatencyDistribution(args.latency_dist, args.exa_latency_ms, args.jitter_ms, args.sigma, args.seed)
+    faults = FaultInjector(args.error_rate, args.throttle_rate, args.retry_after, args.seed)
+
+    logger.info(
+        "mock 업스트림 시작 - http://%s:%s, Yahoo %s, Exa %s, 에러 %.1f%%, 429 %.1f%%",
+        args.host, args.port, yahoo_latency.describe(), exa_latency.describe(),
+        args.error_rate * 100, args.throttle_rate * 100
+    )
+
+    try:
+        uvicorn.run(
+            create_app(yahoo_latency, exa_latency, faults),
+            host=args.host,
+            port=args.port,
+            log_level="error"
+        )
+        exit(0)
+    except Exception as e:
+        logger.error("mock 업스트림 실행 실패: %s", e)
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
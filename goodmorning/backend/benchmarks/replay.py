@@ -0,0 +1,370 @@
+"""
+yahooquery / Exa 응답 재생(replay) 모듈
+
+저장된 응답(fixtures/*.json)을 yahooquery Screener/Ticker, Exa 클라이언트와 같은 인터페이스로 돌려주고,
+호출마다 지연 시간(평균 + 지터)을 주입하여 네트워크 없이 서비스/엔드포인트 성능을 측정합니다.
+
+- 재생 객체는 services.yahoo_session(모든 yahooquery 객체 생성 지점)과 services.news_service의
+  Exa를 교체하여 주입하므로 /api, /stocks 라우트와 브리핑 파이프라인에 같은 방식으로 적용됩니다.
+- fixtures는 `python -m benchmarks.replay --record` 로 실제 응답을 다시 녹화할 수 있습니다.
+  (네트워크, EXA_API_KEY 필요)
+"""
+
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional, Tuple, Union
+import argparse
+import importlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# yahooquery Ticker 속성 이름 → quoteSummary 모듈 이름
+TICKER_MODULES = {
+    "price": "price",
+    "summary_detail": "summaryDetail",
+    "financial_data": "financialData",
+    "asset_profile": "assetProfile",
+}
+
+# history 간격 → 포인트 간격 (초), 기간 → 길이 (초)
+HISTORY_SHAPES = {
+    "1m": 60, "5m": 300, "15m": 900, "30m": 1800, "1h": 3600, "1d": 86400, "1wk": 604800,
+}
+HISTORY_RANGES = {
+    "1d": 86400, "5d": 5 * 86400, "1mo": 30 * 86400, "3mo": 91 * 86400,
+    "6mo": 182 * 86400, "1y": 365 * 86400, "5y": 5 * 365 * 86400,
+}
+
+
+def synthetic_history(
+    symbol: str,
+    last_price: float,
+    period: str,
+    interval: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    현재가 기준 결정적 랜덤 워크 시세 이력 (종목별 시드 고정, 마지막 종가 = 현재가)
+
+    Args:
+        symbol: 종목 심볼 (시드)
+        last_price: 마지막 종가
+        period: 조회 기간 (1d, 5d, 1mo, ...)
+        interval: 시세 간격 (1m, 5m, ..., 1d, 1wk)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (UTC epoch 초, 종가, 거래량)
+    """
+    step = HISTORY_SHAPES.get(interval, 86400)
+    count = max(2, min(2000, HISTORY_RANGES.get(period, 30 * 86400) // step))
+    end = int(time.time()) // step * step
+
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    walk = np.cumsum(rng.normal(0, 0.004, count))
+    close = last_price * np.exp(walk - walk[-1])
+    timestamps = end - step * np.arange(count)[::-1]
+    return timestamps, close, rng.integers(1_000, 1_000_000, count)
+
+
+class LatencyModel:
+    """주입 지연 시간 모델 (정규분포, 0 이상으로 절단)"""
+
+    def __init__(self, mean_ms: float = 0.0, jitter_ms: float = 0.0, seed: Optional[int] = None):
+        """
+        LatencyModel 초기화
+
+        Args:
+            mean_ms: 평균 지연 시간 (밀리초)
+            jitter_ms: 지연 시간 표준편차 (밀리초)
+            seed: 난수 시드 (재현용)
+        """
+        self.mean_ms = mean_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """지연 시간 1회 추출 (초)"""
+        if self.mean_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+        with self._lock:
+            value = self._random.gauss(self.mean_ms, self.jitter_ms) if self.jitter_ms > 0 else self.mean_ms
+        return max(0.0, value) / 1000
+
+    def sleep(self) -> None:
+        """추출한 지연 시간만큼 대기"""
+        delay = self.sample()
+        if delay:
+            time.sleep(delay)
+
+
+class FixtureStore:
+    """녹화된 yahooquery / Exa 응답"""
+
+    def __init__(self, root: Path = FIXTURES_DIR):
+        """
+        FixtureStore 초기화
+
+        Args:
+            root: fixtures 디렉토리 (yahoo.json, exa.json)
+        """
+        with open(root / "yahoo.json", 'r', encoding='utf-8') as f:
+            yahoo = json.load(f)
+        with open(root / "exa.json", 'r', encoding='utf-8') as f:
+            exa = json.load(f)
+
+        self.screeners: Dict[str, List[Dict[str, Any]]] = yahoo["screeners"]
+        self.modules: Dict[str, Dict[str, Any]] = yahoo["modules"]
+        self.news: List[Dict[str, Any]] = exa["results"]
+
+    @property
+    def symbols(self) -> List[str]:
+        """모듈 응답이 있는 종목 심볼"""
+        return list(self.modules)
+
+
+class ReplayTicker:
+    """녹화된 응답을 돌려주는 yahooquery Ticker"""
+
+    def __init__(
+        self,
+        symbols: Union[str, List[str]],
+        store: FixtureStore,
+        latency: LatencyModel,
+        **kwargs
+    ):
+        self.symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        self._store = store
+        self._latency = latency
+
+    def _module(self, symbol: str, module: str) -> Any:
+        data = self._store.modules.get(symbol.upper())
+        if data is None:
+            return f"Quote not found for ticker symbol: {symbol.upper()}"
+        return data.get(module)
+
+    def _property(self, module: str) -> Dict[str, Any]:
+        self._latency.sleep()
+        result = {}
+        for symbol in self.symbols:
+            value = self._module(symbol, module)
+            result[symbol] = value if value is not None else f"No fundamentals data found for symbol: {symbol}"
+        return result
+
+    @property
+    def price(self) -> Dict[str, Any]:
+        return self._property("price")
+
+    @property
+    def summary_detail(self) -> Dict[str, Any]:
+        return self._property("summaryDetail")
+
+    @property
+    def financial_data(self) -> Dict[str, Any]:
+        return self._property("financialData")
+
+    @property
+    def asset_profile(self) -> Dict[str, Any]:
+        return self._property("assetProfile")
+
+    def get_modules(self, modules: Union[str, List[str]]) -> Dict[str, Any]:
+        self._latency.sleep()
+        modules = [modules] if isinstance(modules, str) else modules
+        result = {}
+        for symbol in self.symbols:
+            data = self._store.modules.get(symbol.upper())
+            if data is None:
+                result[symbol] = f"Quote not found for ticker symbol: {symbol.upper()}"
+                continue
+            result[symbol] = {module: data[module] for module in modules if module in data}
+            # yahooquery와 같이 모듈을 하나만 요청하면 모듈 이름 없이 본문만 반환
+            if len(modules) == 1:
+                result[symbol] = result[symbol].get(modules[0], f"No fundamentals data found for symbol: {symbol}")
+        return result
+
+    def history(self, period: str = "1mo", interval: str = "1d", **kwargs) -> Union[pd.DataFrame, Dict[str, str]]:
+        """녹화된 현재가 기준 합성 시세 이력 (synthetic_history)"""
+        self._latency.sleep()
+
+        frames = []
+        for symbol in self.symbols:
+            data = self._store.modules.get(symbol.upper())
+            if data is None:
+                continue
+            timestamps, close, volume = synthetic_history(
+                symbol, data["price"]["regularMarketPrice"], period, interval
+            )
+            index = pd.MultiIndex.from_arrays(
+                [[symbol] * len(timestamps), pd.to_datetime(timestamps, unit="s", utc=True)],
+                names=["symbol", "date"]
+            )
+            frames.append(pd.DataFrame({"close": close, "volume": volume}, index=index))
+
+        if not frames:
+            return {symbol: "No data found, symbol may be delisted" for symbol in self.symbols}
+        return pd.concat(frames)
+
+
+class ReplayScreener:
+    """녹화된 응답을 돌려주는 yahooquery Screener"""
+
+    def __init__(self, store: FixtureStore, latency: LatencyModel, **kwargs):
+        self._store = store
+        self._latency = latency
+        self.available_screeners = list(store.screeners)
+
+    def get_screeners(self, screen_ids: Union[str, List[str]], count: int = 25) -> Dict[str, Any]:
+        self._latency.sleep()
+        screen_ids = [screen_ids] if isinstance(screen_ids, str) else screen_ids
+        return {
+            screen_id: {"quotes": self._store.screeners.get(screen_id, [])[:count]}
+            for screen_id in screen_ids
+        }
+
+
+class ReplayExa:
+    """녹화된 응답을 돌려주는 Exa 클라이언트"""
+
+    def __init__(self, store: FixtureStore, latency: LatencyModel, **kwargs):
+        self._store = store
+        self._latency = latency
+
+    def search(self, query: str, num_results: int = 10, **kwargs) -> SimpleNamespace:
+        self._latency.sleep()
+        results = [SimpleNamespace(**item) for item in self._store.news[:num_results]]
+        return SimpleNamespace(results=results)
+
+
+def install_replay(
+    yahoo_latency: LatencyModel,
+    exa_latency: LatencyModel,
+    store: Optional[FixtureStore] = None
+) -> FixtureStore:
+    """
+    현재 프로세스의 services 패키지에 재생 객체 주입
+
+    services.yahoo_session의 Ticker/Screener와 세션 준비, services.news_service의 Exa를 교체합니다.
+    서비스 인스턴스를 만들기 전에 호출해야 합니다.
+
+    Args:
+        yahoo_latency: yahooquery 호출 지연 시간 모델
+        exa_latency: Exa 호출 지연 시간 모델
+        store: 재생할 응답 (기본값: fixtures 디렉토리)
+
+    Returns:
+        FixtureStore: 주입한 응답 저장소
+    """
+    store = store or FixtureStore()
+
+    yahoo_session = importlib.import_module("services.yahoo_session")
+    yahoo_session.Ticker = lambda symbols, **kwargs: ReplayTicker(symbols, store, yahoo_latency, **kwargs)
+    yahoo_session.Screener = lambda **kwargs: ReplayScreener(store, yahoo_latency, **kwargs)
+    # 세션 준비(쿠키/crumb)는 네트워크 호출이므로 빈 세션으로 대체
+    yahoo_session.YahooSessionProvider._create_session = lambda self: yahoo_session.yahoo_session_class()()
+
+    news_service = importlib.import_module("services.news_service")
+    news_service.Exa = lambda **kwargs: ReplayExa(store, exa_latency, **kwargs)
+    os.environ.setdefault("EXA_API_KEY", "replay")
+
+    logger.info(
+        "재생 모드 - 종목 %s개, Yahoo 지연 %.0f±%.0fms, Exa 지연 %.0f±%.0fms",
+        len(store.symbols),
+        yahoo_latency.mean_ms, yahoo_latency.jitter_ms,
+        exa_latency.mean_ms, exa_latency.jitter_ms
+    )
+    return store
+
+
+def record_fixtures(
+    symbols: List[str],
+    screeners: List[str],
+    root: Path = FIXTURES_DIR,
+    count: int = 25
+) -> None:
+    """
+    실제 yahooquery / Exa 응답을 녹화하여 fixtures 갱신 (네트워크 필요)
+
+    Args:
+        symbols: 모듈 응답을 녹화할 종목 심볼
+        screeners: 녹화할 스크리너 이름
+        root: fixtures 디렉토리
+        count: 스크리너별 종목 수
+    """
+    from yahooquery import Screener, Ticker
+
+    screener_data = Screener().get_screeners(screeners, count)
+    recorded_screeners = {
+        name: screener_data.get(name, {}).get("quotes", []) if isinstance(screener_data.get(name), dict) else []
+        for name in screeners
+    }
+
+    module_data = Ticker(symbols).get_modules(list(TICKER_MODULES.values()))
+    recorded_modules = {
+        symbol: data for symbol, data in module_data.items() if isinstance(data, dict)
+    }
+
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / "yahoo.json", 'w', encoding='utf-8') as f:
+        json.dump({"screeners": recorded_screeners, "modules": recorded_modules}, f, ensure_ascii=False, indent=1, default=str)
+    logger.info("Yahoo 응답 녹화 완료 - 스크리너 %s개, 종목 %s개", len(recorded_screeners), len(recorded_modules))
+
+    api_key = os.getenv("EXA_API_KEY")
+    if not api_key:
+        logger.warning("EXA_API_KEY가 없어 Exa 응답은 녹화하지 않습니다.")
+        return
+
+    from exa_py import Exa
+
+    search = Exa(api_key=api_key).search(f"{symbols[0]} stock news", num_results=10, type="auto", category="news")
+    results = [
+        {
+            "title": getattr(result, "title", None),
+            "url": getattr(result, "url", None),
+            "published_date": getattr(result, "published_date", None),
+            "author": getattr(result, "author", None),
+        }
+        for result in getattr(search, "results", None) or []
+    ]
+    with open(root / "exa.json", 'w', encoding='utf-8') as f:
+        json.dump({"results": results}, f, ensure_ascii=False, indent=1)
+    logger.info("Exa 응답 녹화 완료 - 뉴스 %s개", len(results))
+
+
+def main():
+    """fixtures 녹화 CLI"""
+    from services.utils import LoggerFactory
+
+    LoggerFactory.configure()
+
+    parser = argparse.ArgumentParser(description="벤치마크용 yahooquery / Exa 응답 녹화")
+    parser.add_argument("--record", action="store_true", help="실제 응답을 녹화하여 fixtures 갱신")
+    parser.add_argument("--symbols", default="AAPL,MSFT,NVDA,TSLA,AMZN,AMD,PLTR,F,INTC,SOFI")
+    parser.add_argument("--screeners", default="most_actives,day_gainers,day_losers")
+    args = parser.parse_args()
+
+    if not args.record:
+        store = FixtureStore()
+        print(f"fixtures: 종목 {len(store.symbols)}개, 스크리너 {list(store.screeners)}, 뉴스 {len(store.news)}개")
+        exit(0)
+
+    try:
+        record_fixtures(args.symbols.split(","), args.screeners.split(","))
+        exit(0)
+    except Exception as e:
+        logger.error("녹화 실패: %s", e)
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+오프라인 벤치마크 실행기
+
+녹화된 yahooquery / Exa 응답(benchmarks.replay)에 지연 시간을 주입한 상태로
+서비스 메서드와 FastAPI 엔드포인트를 반복 호출하여 처리량(RPS)과 지연 시간 분위수를 측정하고,
+저장된 기준값(baselines/{suite}.json)과 비교합니다.
+
+시나리오 묶음:
+    - market: TrendingStockService, NewsService + /api 엔드포인트
+    - stocks: StockService + /stocks 엔드포인트
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.run                                  # market 시나리오 측정 + 기준값 비교
+    python -m benchmarks.run --suite stocks                   # stocks 시나리오 측정
+    python -m benchmarks.run --yahoo-latency-ms 120 --jitter-ms 40 --concurrency 8
+    python -m benchmarks.run --save-baseline                  # 현재 결과를 기준값으로 저장
+
+기준값 대비 p95가 (1 + tolerance)배를 넘거나 RPS가 (1 - tolerance)배 아래로 떨어진
+시나리오가 있으면 종료 코드 1로 끝납니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent.parent
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# 벤치마크에서는 속도 제한이 측정 대상을 가리지 않도록 충분히 크게 설정하고,
+# 캐시 유지 시간이 측정 시각(장중/장 마감)에 따라 달라지지 않도록 시장 시간 기반 TTL은 끔
+BENCHMARK_ENV = {
+    "YAHOO_RATE_LIMIT_PER_SECOND": "100000",
+    "YAHOO_RATE_LIMIT_BURST": "100000",
+    "MARKET_CALENDAR_TTL": "off",
+}
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values: List[float], quantile: float) -> float:
+    """정렬된 값의 분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(quantile * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(
+    name: str,
+    func: Callable[[int], Any],
+    iterations: int,
+    concurrency: int,
+    warmup: int
+) -> Dict[str, Any]:
+    """
+    시나리오 반복 실행 및 측정
+
+    Args:
+        name: 시나리오 이름
+        func: 호출 함수 (반복 번호를 받아 한 번 실행, 실패 시 예외)
+        iterations: 측정 호출 수
+        concurrency: 동시 호출 수
+        warmup: 측정 전 예열 호출 수
+
+    Returns:
+        Dict: name, iterations, errors, rps, mean_ms, p50_ms, p95_ms, p99_ms, max_ms
+    """
+    for i in range(warmup):
+        func(i)
+
+    latencies: List[float] = []
+    errors = 0
+
+    def timed(i: int) -> Optional[float]:
+        started = time.perf_counter()
+        try:
+            func(i)
+        except Exception as e:
+            logger.debug("%s 호출 실패: %s", name, e)
+            return None
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency in pool.map(timed, range(iterations)):
+            if latency is None:
+                errors += 1
+            else:
+                latencies.append(latency)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    to_ms = lambda seconds: round(seconds * 1000, 3)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "errors": errors,
+        "rps": round(iterations / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": to_ms(sum(latencies) / len(latencies)) if latencies else 0.0,
+        "p50_ms": to_ms(percentile(latencies, 0.50)),
+        "p95_ms": to_ms(percentile(latencies, 0.95)),
+        "p99_ms": to_ms(percentile(latencies, 0.99)),
+        "max_ms": to_ms(latencies[-1]) if latencies else 0.0,
+    }
+
+
+def _expect_ok(response) -> None:
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+
+def market_scenarios(symbols: List[str]) -> Dict[str, Callable[[int], Any]]:
+    """market 시나리오 (서비스 메서드 + /api 엔드포인트)"""
+    from fastapi.testclient import TestClient
+
+    import main
+    from services.news_service import NewsService
+    from services.trending_stock_service import TrendingStockService
+
+    client = TestClient(main.app)
+    trending_service = TrendingStockService()
+    news_service = NewsService()
+    chart_symbols = ",".join(symbols[:5])
+
+    def get(path: str) -> Callable[[int], Any]:
+        return lambda i: _expect_ok(client.get(path.format(symbol=symbols[i % len(symbols)])))
+
+    return {
+        "service.trending_stock": lambda i: trending_service.get_trending_stock("most_actives"),
+        "service.stock_news": lambda i: news_service.search_stock_news(symbols[i % len(symbols)]),
+        "service.market_news": lambda i: news_service.search_market_news("stock market today"),
+        "api.trending": get("/api/stocks/trending?type=most_actives&include_news=true"),
+        "api.trending_list": get("/api/stocks/trending/list?type=day_gainers&count=5"),
+        "api.stock_info": get("/api/stocks/{symbol}?include_news=false"),
+        "api.stock_info_news": get("/api/stocks/{symbol}?include_news=true"),
+        "api.chart": get("/api/stocks/{symbol}/chart?interval=5m&range=1d"),
+        "api.charts_batch": get(f"/api/stocks/charts?symbols={chart_symbols}&interval=1d&range=1y"),
+    }
+
+
+def stocks_scenarios(symbols: List[str]) -> Dict[str, Callable[[int], Any]]:
+    """stocks 시나리오 (StockService + /stocks 엔드포인트, 출력은 임시 디렉토리 사용)"""
+    from fastapi.testclient import TestClient
+
+    import main
+    from api import stocks
+    from services.module_cache import TieredModuleCache
+    from services.news_service import NewsService
+    from services.quote_history import QuoteHistoryStore
+    from services.stock_service import StockService
+
+    output_dir = Path(tempfile.mkdtemp(prefix="benchmark-"))
+    stock_service = StockService(
+        history=QuoteHistoryStore(output_dir / "quotes"),
+        module_cache=TieredModuleCache(root=output_dir / "modules")
+    )
+    stocks.stock_service = stock_service
+    client = TestClient(main.app)
+    news_service = NewsService()
+
+    def get(path: str) -> Callable[[int], Any]:
+        return lambda i: _expect_ok(client.get(path.format(symbol=symbols[i % len(symbols)])))
+
+    return {
+        "service.trending_stocks": lambda i: stock_service.get_trending_stocks(),
+        "service.stock_detail": lambda i: stock_service.get_stock_detail(symbols[i % len(symbols)]),
+        "service.stock_news": lambda i: news_service.search_stock_news(symbols[i % len(symbols)]),
+        "api.trending": get("/stocks/trending"),
+        "api.stock_detail": get("/stocks/{symbol}"),
+        "api.stock_history": get("/stocks/{symbol}/history?days=1"),
+    }
+
+
+SUITES = {"market": market_scenarios, "stocks": stocks_scenarios}
+
+
+def compare_with_baseline(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float
+) -> List[str]:
+    """
+    기준값 비교
+
+    Args:
+        results: 측정 결과
+        baseline: 시나리오 이름 → 기준 측정 결과
+        tolerance: 허용 오차 비율 (0.2 = 20%)
+
+    Returns:
+        List[str]: 성능이 떨어진 시나리오 설명
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result["name"])
+        if not base:
+            continue
+        if base["p95_ms"] and result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result['name']}: p95 {base['p95_ms']}ms → {result['p95_ms']}ms")
+        if base["rps"] and result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{result['name']}: RPS {base['rps']} → {result['rps']}")
+    return regressions
+
+
+def print_results(results: List[Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> None:
+    """결과 표 출력 (기준값이 있으면 p95 변화율 포함)"""
+    header = f"{'scenario':<26}{'RPS':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'err':>6}{'p95 vs base':>14}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        base = baseline.get(result["name"])
+        delta = ""
+        if base and base["p95_ms"]:
+            delta = f"{(result['p95_ms'] / base['p95_ms'] - 1) * 100:+.1f}%"
+        print(
+            f"{result['name']:<26}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['max_ms']:>10.2f}{result['errors']:>6}{delta:>14}"
+        )
+
+
+def main():
+    """벤치마크 CLI"""
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 (녹화된 Yahoo/Exa 응답 재생)")
+    parser.add_argument("--suite", choices=list(SUITES), default="market")
+    parser.add_argument("--only", default="", help="실행할 시나리오 이름 (쉼표 구분, 접두어 허용)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--yahoo-latency-ms", type=float, default=80.0)
+    parser.add_argument("--exa-latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=Path, default=None, help="기준값 파일 (기본값: baselines/{suite}.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준값 대비 허용 오차 비율")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    for key, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(key, value)
+
+    sys.path.insert(0, str(APP_DIR))
+
+    # services 모듈은 import 시 환경 변수를 읽으므로 BENCHMARK_ENV 적용 후 import
+    from services.utils import LoggerFactory
+    from benchmarks.replay import LatencyModel, install_replay
+
+    LoggerFactory.configure()
+
+    store = install_replay(
+        LatencyModel(args.yahoo_latency_ms, args.jitter_ms, args.seed),
+        LatencyModel(args.exa_latency_ms, args.jitter_ms, args.seed + 1)
+    )
+
+    scenarios = SUITES[args.suite](store.symbols)
+
+    # 측정 중 서비스 INFO 로그는 출력하지 않음
+    logging.disable(logging.INFO)
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    results = []
+    for name, func in scenarios.items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        results.append(run_scenario(name, func, args.iterations, args.concurrency, args.warmup))
+
+    logging.disable(logging.NOTSET)
+
+    baseline_path = args.baseline or BASELINE_DIR / f"{args.suite}.json"
+    config = {
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+        "yahoo_latency_ms": args.yahoo_latency_ms,
+        "exa_latency_ms": args.exa_latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "seed": args.seed,
+    }
+
+    baseline = {}
+    if baseline_path.exists():
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        baseline = {item["name"]: item for item in stored["results"]}
+        if stored.get("config") != config:
+            logger.warning("기준값과 측정 설정이 다릅니다 - 기준값: %s", stored.get('config'))
+
+    print_results(results, baseline)
+
+    report = {"suite": args.suite, "config": config, "results": results}
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info("기준값 저장: %s", baseline_path)
+        exit(0)
+
+    if not baseline:
+        logger.info("기준값이 없습니다 (%s). --save-baseline 으로 저장하세요.", baseline_path)
+        exit(0)
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print("\n기준값 대비 성능 저하:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        exit(1)
+
+    print(f"\n기준값 대비 성능 저하 없음 (허용 오차 {args.tolerance:.0%})")
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
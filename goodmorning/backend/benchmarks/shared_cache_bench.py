@@ -0,0 +1,219 @@
+"""
+워커 간 공유 캐시 벤치마크
+
+여러 워커 프로세스가 같은 키 집합을 반복 조회할 때, 저장소별로 업스트림(loader) 호출 수와
+한 키에 대한 동시 갱신 수를 측정합니다. loader는 업스트림 지연을 흉내 내어 sleep합니다.
+
+- none: 캐시 없음 (요청마다 업스트림 호출)
+- memory: 워커별 캐시 (워커 수만큼 중복 갱신)
+- sqlite: WAL SQLite 파일 공유 (임시 디렉토리)
+- redis: Redis 호환 서버 공유 (--redis-url 미지정 시 benchmarks.mock_redis를 띄워 사용)
+
+sqlite / redis에서 한 키를 동시에 갱신한 워커가 2개 이상이면 종료 코드 1로 끝납니다.
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.shared_cache_bench
+    python -m benchmarks.shared_cache_bench --workers 8 --keys 20 --ttl 0.5 --loader-ms 100
+    python -m benchmarks.shared_cache_bench --backends sqlite,redis --redis-url redis://127.0.0.1:6379/15
+"""
+
+from typing import Dict, Any, List
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from services.shared_cache import CACHE_BACKENDS, MemoryCacheBackend, RedisCacheBackend, SQLiteCacheBackend, SharedCache
+
+from .mock_redis import DEFAULT_HOST, start_in_thread
+from .run import percentile
+
+# 키 하나를 동시에 갱신해도 되는 최대 워커 수 (워커 간 공유 저장소)
+SHARED_BACKENDS = ("sqlite", "redis")
+
+
+def _create_backend(name: str, sqlite_path: str, redis_url: str):
+    if name == "none":
+        return None
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "sqlite":
+        return SQLiteCacheBackend(sqlite_path)
+    return RedisCacheBackend(redis_url)
+
+
+def _worker(
+    name: str,
+    config: Dict[str, Any],
+    start_at: float,
+    calls,
+    in_flight,
+    max_in_flight,
+    results
+) -> None:
+    """
+    워커 프로세스: start_at부터 duration 동안 임의 키를 get_or_load로 조회
+
+    Args:
+        name: 저장소 이름
+        config: 벤치마크 설정 (keys, duration, ttl, loader_ms, sqlite_path, redis_url, namespace)
+        start_at: 모든 워커가 함께 시작할 시각 (time.time 기준)
+        calls: 키별 loader 호출 수 (공유 배열)
+        in_flight: 키별 진행 중인 loader 수 (공유 배열)
+        max_in_flight: 키별 최대 동시 loader 수 (공유 배열)
+        results: 워커별 지연 시간 목록을 넣을 큐
+    """
+    cache = SharedCache(
+        _create_backend(name, config["sqlite_path"], config["redis_url"]),
+        namespace=config["namespace"],
+        stale_seconds=config["ttl"] * 4,
+        lock_seconds=max(1.0, config["loader_ms"] / 1000 * 10),
+        wait_seconds=config["loader_ms"] / 1000 * 5,
+        poll_seconds=0.005
+    )
+    rng = random.Random(os.getpid())
+
+    def loader(index: int) -> Dict[str, Any]:
+        with in_flight.get_lock():
+            in_flight[index] += 1
+            calls[index] += 1
+            max_in_flight[index] = max(max_in_flight[index], in_flight[index])
+        try:
+            time.sleep(config["loader_ms"] / 1000)
+            return {"key": index, "loaded_at": time.time()}
+        finally:
+            with in_flight.get_lock():
+                in_flight[index] -= 1
+
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = time.monotonic() + config["duration"]
+    latencies: List[float] = []
+    while time.monotonic() < deadline:
+        index = rng.randrange(config["keys"])
+        started = time.perf_counter()
+        cache.get_or_load(f"bench:{index}", lambda: loader(index), config["ttl"])
+        latencies.append(time.perf_counter() - started)
+        time.sleep(config["think_ms"] / 1000)
+
+    if cache.backend is not None:
+        cache.backend.close()
+    results.put(latencies)
+
+
+def run_backend(name: str, config: Dict[str, Any], workers: int) -> Dict[str, Any]:
+    """
+    저장소 하나로 워커 프로세스들을 실행하고 결과 집계
+
+    Args:
+        name: 저장소 이름
+        config: 벤치마크 설정
+        workers: 워커 프로세스 수
+
+    Returns:
+        Dict: 요청 수, loader 호출 수, 키당 최대 동시 갱신 수, 지연 시간 분위수 (ms)
+    """
+    context = multiprocessing.get_context("fork")
+    keys = config["keys"]
+    calls = context.Array("i", keys)
+    in_flight = context.Array("i", keys)
+    max_in_flight = context.Array("i", keys)
+    results = context.Queue()
+
+    start_at = time.time() + 0.5
+    processes = [
+        context.Process(target=_worker, args=(name, config, start_at, calls, in_flight, max_in_flight, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    latencies = sorted(value for _ in processes for value in results.get())
+    for process in processes:
+        process.join()
+
+    # 키마다 ttl 구간당 1회가 이상적인 갱신 수 (첫 적재 포함)
+    ideal = keys * (int(config["duration"] / config["ttl"]) + 1)
+    return {
+        "backend": name,
+        "requests": len(latencies),
+        "loader_calls": sum(calls),
+        "ideal_calls": ideal,
+        "max_concurrent_loads": max(max_in_flight),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    """공유 캐시 벤치마크 CLI"""
+    parser = argparse.ArgumentParser(description="워커 간 공유 캐시의 업스트림 호출 수 / 중복 갱신 측정")
+    parser.add_argument("--backends", default=",".join(CACHE_BACKENDS), help="쉼표 구분 저장소 목록")
+    parser.add_argument("--workers", type=int, default=4, help="워커 프로세스 수")
+    parser.add_argument("--keys", type=int, default=10, help="조회할 키 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="측정 시간 (초)")
+    parser.add_argument("--ttl", type=float, default=1.0, help="캐시 유지 시간 (초)")
+    parser.add_argument("--loader-ms", type=float, default=80.0, help="업스트림 호출 지연 (ms)")
+    parser.add_argument("--think-ms", type=float, default=2.0, help="워커의 요청 간 간격 (ms)")
+    parser.add_argument("--redis-url", default=None, help="Redis 호환 서버 (미지정 시 mock Redis 실행)")
+    parser.add_argument("--redis-port", type=int, default=6391, help="mock Redis 포트")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    backends = [name.strip() for name in args.backends.split(",") if name.strip()]
+    unknown = set(backends) - set(CACHE_BACKENDS)
+    if unknown:
+        parser.error(f"알 수 없는 저장소: {', '.join(sorted(unknown))}")
+
+    redis_url = args.redis_url
+    if "redis" in backends and redis_url is None:
+        start_in_thread(DEFAULT_HOST, args.redis_port)
+        redis_url = f"redis://{DEFAULT_HOST}:{args.redis_port}/0"
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in backends:
+            config = {
+                "keys": args.keys,
+                "duration": args.duration,
+                "ttl": args.ttl,
+                "loader_ms": args.loader_ms,
+                "think_ms": args.think_ms,
+                "sqlite_path": os.path.join(tmp, "shared-cache.sqlite3"),
+                "redis_url": redis_url,
+                # 실행마다 다른 접두어를 써서 이전 결과가 남아 있는 저장소에서도 빈 캐시로 시작
+                "namespace": f"bench-{os.getpid()}-{name}",
+            }
+            results.append(run_backend(name, config, args.workers))
+
+    header = f"{'backend':<10}{'requests':>10}{'loads':>8}{'ideal':>8}{'max dup':>9}{'p50 ms':>9}{'p99 ms':>9}"
+    print(f"워커 {args.workers}개, 키 {args.keys}개, ttl {args.ttl}s, loader {args.loader_ms:.0f}ms, {args.duration}s")
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['backend']:<10}{result['requests']:>10}{result['loader_calls']:>8}{result['ideal_calls']:>8}"
+            f"{result['max_concurrent_loads']:>9}{result['p50_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+        )
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"config": vars(args) | {"json": str(args.json)}, "results": results}, f, ensure_ascii=False, indent=2)
+
+    duplicated = [
+        result["backend"] for result in results
+        if result["backend"] in SHARED_BACKENDS and result["max_concurrent_loads"] > 1
+    ]
+    if duplicated:
+        print(f"\n한 키를 여러 워커가 동시에 갱신한 저장소: {', '.join(duplicated)}")
+        exit(1)
+
+    print("\n공유 저장소에서 키마다 한 워커만 갱신함")
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+기동 시간 벤치마크
+
+새 파이썬 프로세스에서 `import main`과 앱 시작 훅(lifespan)을 실행하여
+워커 기동(서버리스 콜드 스타트)에 걸리는 시간을 측정하고,
+`python -X importtime` 결과로 모듈별 import 시간을 보고합니다.
+
+- import main: 모듈 import + 서비스 객체 생성
+- startup: lifespan 시작 구간 (STARTUP_PREWARM=off 기준, 외부 API 호출 없음)
+- process: 인터프리터 시작부터 종료까지 전체 시간
+
+기동 시 불러오지 않아야 하는 무거운 모듈(DEFERRED_MODULES)이 import되었으면 종료 코드 1로 끝납니다.
+
+사용법 (goodmorning/backend 디렉토리에서 실행):
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --repeat 5 --top 30
+"""
+
+from typing import Dict, Any, List, Tuple
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .run import APP_DIR
+
+# 첫 사용 시점까지 import를 미루는 모듈 (기동 시 로드되면 회귀)
+DEFERRED_MODULES = (
+    "yahooquery",
+    "pandas",
+    "numpy",
+    "curl_cffi",
+    "exa_py",
+    "openai",
+    "google.generativeai",
+)
+
+# 예외 (시세 이력 / 브리핑 세그먼트 저장소가 numpy 배열 형식을 모듈 상수로 사용)
+ALLOWED_AT_STARTUP = ("numpy",)
+
+# 측정용 자식 프로세스 스크립트 (마지막 줄에 결과 JSON 출력)
+PROBE = f"""
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def _startup():
+    async with main.app.router.lifespan_context(main.app):
+        return time.perf_counter()
+
+ready = asyncio.run(_startup())
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "modules": len(sys.modules),
+    "deferred_loaded": [name for name in {DEFERRED_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    -X importtime 출력 파싱
+
+    Args:
+        stderr: 자식 프로세스 표준 에러 출력
+
+    Returns:
+        List[Tuple[str, int, int]]: (모듈 이름, 자체 시간 µs, 누적 시간 µs)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            entries.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return entries
+
+
+def run_probe(app_dir: Path = APP_DIR) -> Dict[str, Any]:
+    """
+    새 프로세스에서 기동 1회 측정
+
+    Args:
+        app_dir: main.py가 있는 디렉토리
+
+    Returns:
+        Dict: import_ms, startup_ms, process_ms, modules, deferred_loaded, imports
+    """
+    env = {**os.environ, "STARTUP_PREWARM": "off", "LOG_LEVEL": "WARNING", "PYTHONDONTWRITEBYTECODE": "1"}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=app_dir, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+
+    if completed.returncode != 0 or not completed.stdout.strip():
+        tail = "\n".join(line for line in completed.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"기동 측정 실패 (종료 코드 {completed.returncode}):\n{tail[-2000:]}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_ms"] = elapsed * 1000
+    result["imports"] = parse_importtime(completed.stderr)
+    return result
+
+
+def summarize_imports(runs: List[Dict[str, Any]], top: int) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    반복 측정의 모듈별 import 시간 중앙값
+
+    Args:
+        runs: run_probe 결과 목록
+        top: 반환할 모듈 / 패키지 수
+
+    Returns:
+        Dict: modules (누적 시간 상위 모듈), packages (최상위 패키지별 자체 시간 합계 상위)
+    """
+    cumulative: Dict[str, List[int]] = {}
+    self_time: Dict[str, List[int]] = {}
+    packages: Dict[str, List[int]] = {}
+
+    for run in runs:
+        totals: Dict[str, int] = {}
+        for name, self_us, cumulative_us in run["imports"]:
+            cumulative.setdefault(name, []).append(cumulative_us)
+            self_time.setdefault(name, []).append(self_us)
+            package = name.split(".", 1)[0]
+            totals[package] = totals.get(package, 0) + self_us
+        for package, total in totals.items():
+            packages.setdefault(package, []).append(total)
+
+    modules = sorted(
+        (
+            {
+                "module": name,
+                "cumulative_ms": statistics.median(values) / 1000,
+                "self_ms": statistics.median(self_time[name]) / 1000,
+            }
+            for name, values in cumulative.items()
+        ),
+        key=lambda item: item["cumulative_ms"],
+        reverse=True
+    )
+    package_totals = sorted(
+        ({"package": name, "self_ms": statistics.median(values) / 1000} for name, values in packages.items()),
+        key=lambda item: item["self_ms"],
+        reverse=True
+    )
+    return {"modules": modules[:top], "packages": package_totals[:top]}
+
+
+def main():
+    """기동 시간 벤치마크 CLI"""
+    parser = argparse.ArgumentParser(description="워커 기동 시간 및 모듈별 import 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 모듈 / 패키지 수")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    runs = [run_probe() for _ in range(args.repeat)]
+    summary = summarize_imports(runs, args.top)
+
+    timings = {
+        key: statistics.median(run[key] for run in runs)
+        for key in ("import_ms", "startup_ms", "process_ms", "modules")
+    }
+    deferred_loaded = sorted(
+        {name for run in runs for name in run["deferred_loaded"]} - set(ALLOWED_AT_STARTUP)
+    )
+
+    print(f"기동 시간 (중앙값, {args.repeat}회)")
+    print(f"  import main   {timings['import_ms']:>9.1f} ms")
+    print(f"  startup       {timings['startup_ms']:>9.1f} ms")
+    print(f"  process       {timings['process_ms']:>9.1f} ms")
+    print(f"  modules       {timings['modules']:>9.0f}")
+
+    print(f"\n{'module':<48}{'cumulative ms':>15}{'self ms':>10}")
+    print("-" * 73)
+    for item in summary["modules"]:
+        print(f"{item['module'][:47]:<48}{item['cumulative_ms']:>15.1f}{item['self_ms']:>10.1f}")
+
+    print(f"\n{'package':<48}{'self ms':>15}")
+    print("-" * 63)
+    for item in summary["packages"]:
+        print(f"{item['package'][:47]:<48}{item['self_ms']:>15.1f}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"repeat": args.repeat, **timings, "deferred_loaded": deferred_loaded, **summary},
+                f, ensure_ascii=False, indent=2
+            )
+
+    if deferred_loaded:
+        print(f"\n기동 시 import된 지연 로드 대상 모듈: {', '.join(deferred_loaded)}")
+        exit(1)
+
+    print("\n지연 로드 대상 모듈이 기동 시 import되지 않음")
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,71 @@
 """
 굿모닝 월가 - FastAPI 백엔드
 """
-from fastapi import FastAPI
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from api import stocks, briefings, market
+from services.market_data import get_market_data
+from services.metrics import CONTENT_TYPE, REGISTRY, MetricsMiddleware, cache_samples, counter_samples
+from services.news_service import get_news_service
+from services.pipeline import latest_run_samples
+from services.profiler import (
+    ADMIN_TOKEN,
+    PROFILE_INTERVAL_MS,
+    PROFILE_MAX_SECONDS,
+    ProfilerBusyError,
+    RequestProfilingMiddleware,
+    get_request_profile,
+    profile_for,
+    verify_admin_token,
+)
+from services.tracing import TracingMiddleware, get_trace_exporter
+from services.utils import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
+# 앱 시작 시 외부 API 클라이언트(Yahoo 세션, Exa) 사전 준비 방식 (background, blocking, off)
+STARTUP_PREWARM = os.getenv("STARTUP_PREWARM", "background").lower()
+
+
+def prewarm_clients() -> None:
+    """Yahoo 세션(쿠키/crumb)과 Exa 클라이언트 준비 (curl_cffi / yahooquery / exa_py import 포함)"""
+    started = time.perf_counter()
+    yahoo_ready = get_market_data().warm()
+    news_ready = get_news_service() is not None
+    logger.info(
+        "외부 API 클라이언트 사전 준비 완료 (%.0fms) - Yahoo 세션: %s, Exa: %s",
+        (time.perf_counter() - started) * 1000,
+        "ready" if yahoo_ready else "failed",
+        "ready" if news_ready else "unavailable"
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 훅 - 심볼 인덱스 로드, STARTUP_PREWARM 설정에 따라 외부 API 클라이언트 사전 준비"""
+    await run_in_threadpool(market.load_symbol_index)
+
+    if STARTUP_PREWARM == "blocking":
+        await run_in_threadpool(prewarm_clients)
+    elif STARTUP_PREWARM == "background":
+        threading.Thread(target=prewarm_clients, name="startup-prewarm", daemon=True).start()
+    yield
 
-from api import stocks, briefings
 
 app = FastAPI(
     title="굿모닝 월가 API",
     description="미국주식 데일리 브리핑 서비스 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 - 프론트엔드에서 접근 허용
@@ -26,9 +82,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 시간 / 처리 중 요청 수 측정
+app.add_middleware(MetricsMiddleware)
+
+# 요청별 span 기록 (Server-Timing 헤더, JSON 로그 / OTLP 내보내기)
+app.add_middleware(TracingMiddleware)
+
+# X-Profile 헤더가 있는 종목 상세 요청 하나를 샘플링 (관리자 토큰 필요)
+app.add_middleware(RequestProfilingMiddleware, paths=(r"^/stocks/[^/]+$", r"^/api/stocks/[^/]+$"))
+
 # 라우터 등록
 app.include_router(stocks.router, prefix="/stocks", tags=["Stocks"])
 app.include_router(briefings.router, prefix="/briefings", tags=["Briefings"])
+app.include_router(market.router, prefix="/api", tags=["Market"])
+
+# /metrics로 내보낼 서비스별 누적 횟수
+GUARD_COUNTER_KEYS = (
+    "requests", "calls", "successes", "failures", "rejected_circuit_open", "rejected_rate_limited"
+)
+HEDGING_COUNTER_KEYS = ("requests", "hedged", "hedge_wins", "deadline_skipped", "dropped")
+SESSION_COUNTER_KEYS = ("sessions_created", "warm_failures", "objects_created")
+SHARED_CACHE_COUNTER_KEYS = ("stale_hits", "refreshes", "lock_waits", "lock_timeouts", "backend_errors")
+MARKET_SESSIONS = ("pre", "regular", "post", "closed")
+
+
+def _collect_service_metrics():
+    """/metrics 조회 시점에 서비스 stats()와 마지막 파이프라인 실행 기록을 메트릭 항목으로 변환"""
+    upstream = get_market_data().stats()
+    negative = upstream["negative_cache"]
+    guard = upstream["upstream"]
+    shared = upstream["shared_cache"]
+    modules = stocks.stock_service.module_cache.stats()
+    chart = market.chart_service.stats()
+
+    yield from cache_samples("negative", negative["hits"], negative["misses"])
+    yield from cache_samples("module_memory", modules["memory_hits"], modules["disk_hits"] + modules["misses"])
+    yield from cache_samples("module", modules["memory_hits"] + modules["disk_hits"], modules["misses"])
+    yield from cache_samples("chart", chart["hits"], chart["misses"])
+    yield from cache_samples("shared", shared["hits"], shared["misses"])
+    yield ("cache_entries", "gauge", "캐시 항목 수", {"cache": "negative"}, negative["entries"])
+    yield ("cache_entries", "gauge", "캐시 항목 수", {"cache": "chart"}, chart["entries"])
+    yield from counter_samples("upstream_guard_events", "Yahoo 호출 보호기 이벤트 수", "event", guard, GUARD_COUNTER_KEYS)
+    yield (
+        "upstream_circuit_open", "gauge", "Yahoo 서킷 브레이커 열림 여부 (half_open은 0.5)", {},
+        {"closed": 0.0, "half_open": 0.5}.get(guard["breaker_state"], 1.0)
+    )
+    yield from counter_samples(
+        "hedged_request_events", "헤지 요청 이벤트 수", "event", upstream["hedging"], HEDGING_COUNTER_KEYS
+    )
+    yield from counter_samples(
+        "yahoo_session_events", "Yahoo 세션 이벤트 수", "event", upstream["yahoo_session"], SESSION_COUNTER_KEYS
+    )
+    yield from counter_samples("shared_cache_events", "공유 캐시 이벤트 수", "event", shared, SHARED_CACHE_COUNTER_KEYS)
+    for session in MARKET_SESSIONS:
+        yield (
+            "market_session", "gauge", "현재 미국 시장 세션 (해당 세션이면 1)", {"session": session},
+            1.0 if upstream["market"]["session"] == session else 0.0
+        )
+    yield from latest_run_samples()
+
+
+REGISTRY.register_collector(_collect_service_metrics)
 
 
 @app.get("/")
@@ -45,6 +159,62 @@ async def health_check():
     """상세 헬스 체크"""
     return {
         "status": "healthy",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        **get_market_data().stats(),
+        "tracing": get_trace_exporter().stats()
     }
 
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 형식 메트릭"""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+def _require_admin(token: Optional[str]) -> None:
+    """
+    관리자 토큰 확인
+
+    Raises:
+        HTTPException: ADMIN_TOKEN 미설정 (404), 토큰 불일치 (403)
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not verify_admin_token(token):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
+
+
+@app.get("/admin/profile", include_in_schema=False)
+def profile_worker(
+    seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS, description="프로파일링 시간 (초)"),
+    interval_ms: float = Query(PROFILE_INTERVAL_MS, ge=1, le=1000, description="샘플링 간격 (밀리초)"),
+    idle: bool = Query(False, description="대기 중인 스레드 스택 포함 여부"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """요청을 받은 워커 프로세스를 지정한 시간 동안 샘플링하여 collapsed-stack 파일로 반환"""
+    _require_admin(x_admin_token)
+
+    try:
+        profiler = profile_for(seconds, interval_ms / 1000, include_idle=idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    filename = f"profile-{os.getpid()}-{int(time.time())}.folded"
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(profiler.samples),
+        }
+    )
+
+
+@app.get("/admin/profile/{profile_id}", include_in_schema=False)
+def get_profile(profile_id: str, x_admin_token: Optional[str] = Header(None)):
+    """X-Profile 요청 헤더로 기록한 요청 단위 프로파일 조회 (collapsed-stack)"""
+    _require_admin(x_admin_token)
+
+    collapsed = get_request_profile(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail=f"프로파일 '{profile_id}'를 찾을 수 없습니다.")
+    return PlainTextResponse(collapsed)
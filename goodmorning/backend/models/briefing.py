@@ -35,7 +35,22 @@ class BriefingDetail(BaseModel):
     created_at: str
     title: str
     subtitle: Optional[str] = None
+    status: str = "completed"
     stocks: List[BriefingStock]
     market_summary: Optional[str] = None
     text_version: Optional[str] = None
 
+
+class BriefingSummary(BaseModel):
+    """브리핑 히스토리 항목"""
+    id: str
+    created_at: str
+    title: str
+    status: str
+    symbols: List[str] = []
+
+
+class BriefingListResponse(BaseModel):
+    """브리핑 히스토리 응답"""
+    briefings: List[BriefingSummary]
+    total: int
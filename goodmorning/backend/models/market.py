@@ -16,6 +16,28 @@ class ScreenerType(str, Enum):
     DAY_LOSERS = "day_losers"
 
 
+class ChartInterval(str, Enum):
+    """차트 시세 간격"""
+    ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    FIFTEEN_MINUTES = "15m"
+    THIRTY_MINUTES = "30m"
+    ONE_HOUR = "1h"
+    ONE_DAY = "1d"
+    ONE_WEEK = "1wk"
+
+
+class ChartRange(str, Enum):
+    """차트 조회 기간"""
+    ONE_DAY = "1d"
+    FIVE_DAYS = "5d"
+    ONE_MONTH = "1mo"
+    THREE_MONTHS = "3mo"
+    SIX_MONTHS = "6mo"
+    ONE_YEAR = "1y"
+    FIVE_YEARS = "5y"
+
+
 class NewsItem(BaseModel):
     """뉴스 아이템"""
     title: Optional[str] = Field(None, description="뉴스 제목")
@@ -65,6 +87,7 @@ class StockDetailInfo(BaseModel):
     price: Optional[Dict[str, Any]] = Field(None, description="가격 정보")
     summary_detail: Optional[Dict[str, Any]] = Field(None, description="요약 정보")
     financial_data: Optional[Dict[str, Any]] = Field(None, description="재무 데이터")
+    skipped_modules: List[str] = Field(default_factory=list, description="마감 시간 초과로 건너뛴 모듈")
 
 
 class NewsSearchResult(BaseModel):
@@ -119,6 +142,70 @@ class StockInfoResponse(BaseModel):
     error: Optional[str] = Field(None, description="에러 메시지")
 
 
+class ChartSeries(BaseModel):
+    """종목 차트 데이터 (열 단위 배열)"""
+    symbol: str = Field(..., description="종목 심볼")
+    interval: str = Field(..., description="시세 간격")
+    range: str = Field(..., description="조회 기간")
+    points: int = Field(..., description="포인트 수")
+    timestamps: List[int] = Field(default_factory=list, description="시각 배열 (UTC epoch 초)")
+    close: List[float] = Field(default_factory=list, description="종가 배열")
+    volume: List[int] = Field(default_factory=list, description="거래량 배열")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "symbol": "AAPL",
+                "interval": "5m",
+                "range": "1d",
+                "points": 3,
+                "timestamps": [1766154600, 1766156400, 1766178000],
+                "close": [150.12, 151.3, 150.25],
+                "volume": [1203400, 803100, 2450000],
+                "error": None
+            }
+        }
+
+
+class ChartBatchResponse(BaseModel):
+    """여러 종목 차트 데이터 응답"""
+    charts: List[ChartSeries] = Field(default_factory=list, description="요청 순서대로 종목별 차트 데이터")
+
+
+class SymbolSearchItem(BaseModel):
+    """종목 검색 결과 항목"""
+    symbol: str = Field(..., description="종목 심볼")
+    short_name: Optional[str] = Field(None, description="종목 단축명")
+    long_name: Optional[str] = Field(None, description="종목 전체명")
+    sector: Optional[str] = Field(None, description="섹터")
+    industry: Optional[str] = Field(None, description="업종")
+    match_type: str = Field(..., description="일치 유형 (exact, prefix, name, fuzzy)")
+
+
+class SymbolSearchResponse(BaseModel):
+    """종목 검색 응답"""
+    query: str = Field(..., description="검색어")
+    results: List[SymbolSearchItem] = Field(default_factory=list, description="검색 결과 (일치 유형 순)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "app",
+                "results": [
+                    {
+                        "symbol": "AAPL",
+                        "short_name": "Apple Inc.",
+                        "long_name": "Apple Inc.",
+                        "sector": "Technology",
+                        "industry": "Consumer Electronics",
+                        "match_type": "name"
+                    }
+                ]
+            }
+        }
+
+
 class ErrorResponse(BaseModel):
     """에러 응답"""
     detail: str = Field(..., description="에러 상세 메시지")
@@ -39,5 +39,22 @@ class TrendingStocksResponse(BaseModel):
 
 class StockDetailResponse(StockDetail):
     """종목 상세 응답"""
-    pass
+    skipped_modules: List[str] = []  # 마감 시간 초과로 건너뛴 모듈
 
+
+class QuoteSeries(BaseModel):
+    """열 단위 시세 이력"""
+    ts: List[int]
+    price: List[float]
+    change_percent: List[float]
+    volume: List[int]
+    market_cap: List[int]
+
+
+class QuoteHistoryResponse(BaseModel):
+    """시세 이력 응답"""
+    symbol: str
+    series: QuoteSeries
+    count: int
+    relative_volume: Optional[float] = None
+    trending_days: int = 0
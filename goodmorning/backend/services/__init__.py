@@ -12,9 +12,78 @@ from .trending_stock_service import (
 )
 from .news_service import (
     NewsService,
+    get_news_service,
     search_stock_news,
     search_market_news,
 )
+from .market_data import (
+    MarketDataClient,
+    get_market_data,
+)
+from .market_calendar import (
+    MarketCalendar,
+    get_market_calendar,
+    nyse_holidays,
+    nyse_early_closes,
+    to_eastern,
+    to_kst,
+)
+from .chart_service import (
+    ChartService,
+    lttb_indices,
+)
+from .symbol_index import (
+    SymbolIndex,
+    build_symbol_index_file,
+)
+from .negative_cache import (
+    NegativeCache,
+    BloomFilter,
+)
+from .upstream_guard import (
+    UpstreamGuard,
+    UpstreamUnavailableError,
+    get_upstream_guard,
+)
+from .hedged_request import (
+    Deadline,
+    DeadlineExceededError,
+    HedgedExecutor,
+    get_hedged_executor,
+)
+from .yahoo_session import (
+    YahooSessionProvider,
+    get_session_provider,
+    yahoo_ticker,
+    yahoo_screener,
+)
+from .shared_cache import (
+    CacheBackend,
+    CacheBackendError,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    RedisCacheBackend,
+    SharedCache,
+    create_cache_backend,
+    get_shared_cache,
+)
+from .metrics import (
+    MetricsRegistry,
+    MetricsMiddleware,
+    REGISTRY,
+)
+from .tracing import (
+    TracedRoute,
+    TracingMiddleware,
+    TraceExporter,
+    trace_span,
+    get_trace_exporter,
+)
+from .profiler import (
+    SamplingProfiler,
+    RequestProfilingMiddleware,
+    profile_for,
+)
 from .utils import (
     StockConstants,
     LoggerFactory,
@@ -29,11 +98,58 @@ __all__ = [
     "StockService",
     "TrendingStockService",
     "NewsService",
+    "ChartService",
+    "SymbolIndex",
     # 편의 함수
     "get_trending_stock",
     "get_all_trending_stocks",
+    "get_news_service",
     "search_stock_news",
     "search_market_news",
+    "lttb_indices",
+    "build_symbol_index_file",
+    # 시장 데이터 접근 계층
+    "MarketDataClient",
+    "get_market_data",
+    "MarketCalendar",
+    "get_market_calendar",
+    "nyse_holidays",
+    "nyse_early_closes",
+    "to_eastern",
+    "to_kst",
+    "NegativeCache",
+    "BloomFilter",
+    "UpstreamGuard",
+    "UpstreamUnavailableError",
+    "get_upstream_guard",
+    "Deadline",
+    "DeadlineExceededError",
+    "HedgedExecutor",
+    "get_hedged_executor",
+    "YahooSessionProvider",
+    "get_session_provider",
+    "yahoo_ticker",
+    "yahoo_screener",
+    "CacheBackend",
+    "CacheBackendError",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "RedisCacheBackend",
+    "SharedCache",
+    "create_cache_backend",
+    "get_shared_cache",
+    # 관측
+    "MetricsRegistry",
+    "MetricsMiddleware",
+    "REGISTRY",
+    "TracedRoute",
+    "TracingMiddleware",
+    "TraceExporter",
+    "trace_span",
+    "get_trace_exporter",
+    "SamplingProfiler",
+    "RequestProfilingMiddleware",
+    "profile_for",
     # 유틸리티
     "StockConstants",
     "LoggerFactory",
@@ -0,0 +1,206 @@
+"""
+단계 결과 캐시 서비스
+
+스크리닝/뉴스/브리핑 등 각 단계의 결과를 입력 내용 해시로 저장하여,
+입력이 이전 실행과 같으면 다시 계산하지 않고 이전 결과를 재사용합니다.
+실행마다 어떤 단계를 재사용/재계산했는지 매니페스트로 기록합니다.
+
+저장 구조:
+    output/artifacts/{stage}/{input_hash}.json
+    output/manifests/manifest_{run}_{YYYYmmdd_HHMMSS}.json
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "output"
+ARTIFACT_DIR = OUTPUT_DIR / "artifacts"
+MANIFEST_DIR = OUTPUT_DIR / "manifests"
+
+# 매니페스트 단계 상태
+ARTIFACT_REUSED = "reused"
+ARTIFACT_RECOMPUTED = "recomputed"
+
+
+def compute_content_hash(value: Any) -> str:
+    """
+    JSON 직렬화 기준 내용 해시 계산
+
+    dict 키 순서와 무관하게 같은 내용이면 같은 해시를 반환합니다.
+
+    Args:
+        value: JSON 직렬화 가능한 값
+
+    Returns:
+        str: SHA-256 16진수 해시
+    """
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def touch_files(paths: List[str]) -> bool:
+    """
+    재사용하는 산출물 파일의 수정 시각 갱신
+
+    최신 파일을 수정 시각으로 찾는 기존 로더가 재사용된 산출물을 최신으로 인식하도록 합니다.
+
+    Args:
+        paths: 파일 경로 리스트
+
+    Returns:
+        bool: 모든 파일이 존재하여 갱신했으면 True
+    """
+    if not all(path and Path(path).exists() for path in paths):
+        return False
+
+    for path in paths:
+        os.utime(path, None)
+    return True
+
+
+class StageArtifactCache:
+    """입력 내용 해시 기반 단계 결과 저장소"""
+
+    def __init__(self, root: Path = ARTIFACT_DIR):
+        """
+        StageArtifactCache 초기화
+
+        Args:
+            root: 단계 결과 저장 디렉토리
+        """
+        self.root = root
+
+    def _path(self, stage: str, input_hash: str) -> Path:
+        return self.root / stage / f"{input_hash}.json"
+
+    def get(self, stage: str, input_hash: str) -> Optional[Any]:
+        """
+        단계 결과 조회
+
+        Args:
+            stage: 단계 이름
+            input_hash: 입력 내용 해시
+
+        Returns:
+            저장된 단계 결과 또는 None
+        """
+        path = self._path(stage, input_hash)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("output")
+        except (OSError, ValueError) as e:
+            logger.warning("단계 결과를 읽을 수 없습니다 (%s/%s): %s", stage, input_hash[:12], e)
+            return None
+
+    def put(self, stage: str, input_hash: str, output: Any) -> Path:
+        """
+        단계 결과 저장
+
+        Args:
+            stage: 단계 이름
+            input_hash: 입력 내용 해시
+            output: JSON 직렬화 가능한 단계 결과
+
+        Returns:
+            Path: 저장된 파일 경로
+        """
+        path = self._path(stage, input_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    "stage": stage,
+                    "input_hash": input_hash,
+                    "created_at": datetime.now().isoformat(),
+                    "output": output,
+                },
+                f,
+                ensure_ascii=False,
+                default=str
+            )
+        tmp_path.replace(path)
+
+        return path
+
+
+class RunManifest:
+    """실행별 단계 재사용/재계산 기록"""
+
+    def __init__(self, run_name: str, manifest_dir: Path = MANIFEST_DIR):
+        """
+        RunManifest 초기화
+
+        Args:
+            run_name: 실행 이름 (예: "screening", "briefing", "pipeline")
+            manifest_dir: 매니페스트 저장 디렉토리
+        """
+        self.run_name = run_name
+        self.manifest_dir = manifest_dir
+        self.created_at = datetime.now()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self,
+        stage: str,
+        status: str,
+        input_hash: Optional[str] = None,
+        artifacts: Optional[List[str]] = None
+    ) -> None:
+        """
+        단계 처리 결과 기록
+
+        Args:
+            stage: 단계 이름
+            status: reused 또는 recomputed
+            input_hash: 입력 내용 해시
+            artifacts: 관련 산출물 파일 경로 리스트
+        """
+        self.stages[stage] = {
+            "status": status,
+            "input_hash": input_hash,
+            "artifacts": artifacts or [],
+        }
+
+    def save(self) -> str:
+        """
+        매니페스트 저장
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = self.created_at.strftime("%Y%m%d_%H%M%S")
+        path = self.manifest_dir / f"manifest_{self.run_name}_{timestamp}.json"
+
+        reused = [name for name, stage in self.stages.items() if stage["status"] == ARTIFACT_REUSED]
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    "run": self.run_name,
+                    "timestamp": self.created_at.isoformat(),
+                    "reused": reused,
+                    "recomputed": [name for name in self.stages if name not in reused],
+                    "stages": self.stages,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2
+            )
+
+        logger.info("실행 매니페스트 저장 완료: %s (재사용 %s개)", path, len(reused))
+        return str(path)
@@ -5,19 +5,56 @@
 GitHub Actions 워크플로우에서 실행됩니다.
 """
 
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Iterator, TextIO
 import google.generativeai as genai
 
-from .news_service import search_stock_news, search_market_news
+from .artifact_cache import (
+    StageArtifactCache,
+    RunManifest,
+    compute_content_hash,
+    touch_files,
+    ARTIFACT_REUSED,
+    ARTIFACT_RECOMPUTED,
+)
+from .news_service import get_news_service
+from .output_store import (
+    get_output_store,
+    KIND_BRIEFING,
+    KIND_SCREENING,
+    STATUS_IN_PROGRESS,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+)
+from .screener_service import normalize_screening_stocks
+from .segment_store import get_segment_store, append_artifact
 from .utils import LoggerFactory
 
 # 로깅 설정
 logger = LoggerFactory.get_logger(__name__)
 
+# 브리핑 생성에 사용하는 Gemini 모델
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'
+
+# 브리핑 생성 모드
+# - single: 전체 종목을 하나의 프롬프트로 생성
+# - sectioned: 종목별 섹션과 시장 요약을 각각 동시에 생성
+BRIEFING_MODES = ("single", "sectioned")
+
+# 섹션 단위 생성 설정
+SECTION_TIMEOUT_SECONDS = 60
+LLM_CACHE_DIR = Path(__file__).parent.parent / "output" / "cache" / "llm"
+
+BRIEFING_DISCLAIMER = (
+    "※ 본 정보는 투자 권유가 아니며, 모든 투자 결정은 본인 책임입니다."
+)
+
 
 def configure_gemini():
     """Gemini API 설정"""
@@ -36,77 +73,103 @@ def load_latest_screening() -> Optional[Dict[str, Any]]:
     Returns:
         Dict: 스크리닝 결과 또는 None
     """
-    output_dir = Path(__file__).parent.parent / "output"
-
-    if not output_dir.exists():
-        logger.warning("output 디렉토리가 존재하지 않습니다.")
-        return None
-
-    # screening_*.json 파일 찾기
-    screening_files = list(output_dir.glob("screening_*.json"))
+    latest = get_output_store().latest(KIND_SCREENING)
 
-    if not screening_files:
+    if not latest:
         logger.warning("스크리닝 결과 파일을 찾을 수 없습니다.")
         return None
 
-    # 가장 최근 파일 선택
-    latest_file = max(screening_files, key=lambda f: f.stat().st_mtime)
-    logger.info(f"스크리닝 결과 로드: {latest_file}")
+    latest_file = latest["files"]["json"]
+    logger.info("스크리닝 결과 로드: %s", latest_file)
 
     with open(latest_file, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
-def collect_news_for_stocks(stocks: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+def _collect_stock_news(news_service: Any, stock: Dict[str, Any]) -> List[Dict]:
     """
-    각 종목에 대한 뉴스 수집
+    단일 종목 뉴스 수집 (collect_news_for_stocks 작업 단위)
 
     Args:
-        stocks: 종목 리스트
+        news_service: NewsService 인스턴스
+        stock: 종목 정보
 
     Returns:
-        Dict: {symbol: [news_items]}
+        List[Dict]: 뉴스 리스트 (실패 시 빈 리스트)
     """
-    logger.info(f"{len(stocks)}개 종목에 대한 뉴스 수집 시작")
+    symbol = stock["symbol"]
+    logger.info("뉴스 검색 중: %s - %s", symbol, stock['name'])
 
-    news_data = {}
-    for stock in stocks[:5]:  # 상위 5개 종목만
-        symbol = stock["symbol"]
-        name = stock["name"]
+    try:
+        # 종목별 뉴스 검색 (최대 5개)
+        news_result = news_service.search_stock_news(symbol, num_results=5)
+        news_items = news_result.get("news", [])
 
-        logger.info(f"뉴스 검색 중: {symbol} - {name}")
+        logger.info("%s: %s개 뉴스 수집 완료", symbol, len(news_items))
+        return news_items
 
-        try:
-            # 종목별 뉴스 검색 (최대 5개)
-            news_items = search_stock_news(symbol, max_results=5)
-            news_data[symbol] = news_items
+    except Exception as e:
+        logger.error("%s 뉴스 수집 실패: %s", symbol, e)
+        return []
+
+
+def collect_news_for_stocks(
+    stocks: List[Dict[str, Any]],
+    max_workers: int = 5
+) -> Dict[str, List[Dict]]:
+    """
+    각 종목에 대한 뉴스 수집
 
-            logger.info(f"{symbol}: {len(news_items)}개 뉴스 수집 완료")
+    종목별 뉴스 검색은 서로 독립적이므로 하나의 NewsService를 공유하여
+    동시에 실행합니다.
 
-        except Exception as e:
-            logger.error(f"{symbol} 뉴스 수집 실패: {e}")
-            news_data[symbol] = []
+    Args:
+        stocks: 종목 리스트
+        max_workers: 동시 검색 수 (기본값: 5)
+
+    Returns:
+        Dict: {symbol: [news_items]}
+    """
+    logger.info("%s개 종목에 대한 뉴스 수집 시작", len(stocks))
+
+    top_stocks = stocks[:5]  # 상위 5개 종목만
+
+    # API 라우트와 같은 프로세스 공용 NewsService 사용 (공유 캐시 포함)
+    news_service = get_news_service()
+    if news_service is None:
+        logger.error("NewsService를 사용할 수 없어 뉴스 없이 진행합니다.")
+        return {stock["symbol"]: [] for stock in top_stocks}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="briefing-news"
+    ) as executor:
+        results = executor.map(
+            lambda stock: _collect_stock_news(news_service, stock),
+            top_stocks
+        )
+        news_data = {
+            stock["symbol"]: news_items
+            for stock, news_items in zip(top_stocks, results)
+        }
 
     return news_data
 
 
-def generate_briefing_with_gemini(
+def build_briefing_prompt(
     stocks: List[Dict[str, Any]],
     news_data: Dict[str, List[Dict]]
 ) -> str:
     """
-    Gemini API를 사용하여 브리핑 생성
+    브리핑 생성용 프롬프트 구성
 
     Args:
         stocks: 종목 리스트
         news_data: 뉴스 데이터
 
     Returns:
-        str: 생성된 브리핑 텍스트
+        str: Gemini에 전달할 프롬프트
     """
-    logger.info("Gemini API로 브리핑 생성 시작")
-
-    # 프롬프트 구성
     prompt = f"""
 당신은 미국 주식 시장 전문 애널리스트입니다.
 한국 투자자를 위한 아침 브리핑을 작성해주세요.
@@ -143,9 +206,30 @@ def generate_briefing_with_gemini(
 **중요**: 본 정보는 투자 권유가 아니며, 모든 투자 결정은 본인 책임임을 명시해주세요.
 """
 
+    return prompt
+
+
+def generate_briefing_with_gemini(
+    stocks: List[Dict[str, Any]],
+    news_data: Dict[str, List[Dict]]
+) -> str:
+    """
+    Gemini API를 사용하여 브리핑 생성
+
+    Args:
+        stocks: 종목 리스트
+        news_data: 뉴스 데이터
+
+    Returns:
+        str: 생성된 브리핑 텍스트
+    """
+    logger.info("Gemini API로 브리핑 생성 시작")
+
+    prompt = build_briefing_prompt(stocks, news_data)
+
     try:
         # Gemini 모델 생성
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = genai.GenerativeModel(GEMINI_MODEL_NAME)
 
         # 브리핑 생성
         response = model.generate_content(prompt)
@@ -155,25 +239,329 @@ def generate_briefing_with_gemini(
         return briefing_text
 
     except Exception as e:
-        logger.error(f"Gemini API 호출 실패: {e}", exc_info=True)
+        logger.error("Gemini API 호출 실패: %s", e, exc_info=True)
         raise
 
 
-def generate_html_briefing(
-    briefing_text: str,
+def stream_briefing_with_gemini(
     stocks: List[Dict[str, Any]],
-    timestamp: str
+    news_data: Dict[str, List[Dict]]
+) -> Iterator[str]:
+    """
+    Gemini 스트리밍 응답으로 브리핑을 청크 단위로 생성
+
+    전체 응답을 기다리지 않고 도착하는 순서대로 텍스트 청크를 반환합니다.
+
+    Args:
+        stocks: 종목 리스트
+        news_data: 뉴스 데이터
+
+    Yields:
+        str: 브리핑 텍스트 청크
+    """
+    logger.info("Gemini API로 브리핑 스트리밍 생성 시작")
+
+    prompt = build_briefing_prompt(stocks, news_data)
+
+    try:
+        model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+        response = model.generate_content(prompt, stream=True)
+
+        chunk_count = 0
+        for chunk in response:
+            text = getattr(chunk, "text", "")
+            if text:
+                chunk_count += 1
+                yield text
+
+        logger.info("브리핑 스트리밍 생성 완료 - %s개 청크", chunk_count)
+
+    except Exception as e:
+        logger.error("Gemini API 스트리밍 호출 실패: %s", e, exc_info=True)
+        raise
+
+
+def build_stock_section_prompt(
+    index: int,
+    stock: Dict[str, Any],
+    news_items: List[Dict]
 ) -> str:
     """
-    HTML 형식의 브리핑 생성
+    종목 1개에 대한 브리핑 섹션 프롬프트 구성
+
+    Args:
+        index: 종목 순번 (1부터 시작)
+        stock: 종목 정보
+        news_items: 종목 관련 뉴스 리스트
+
+    Returns:
+        str: 섹션 생성용 프롬프트
+    """
+    prompt = f"""
+당신은 미국 주식 시장 전문 애널리스트입니다.
+한국 투자자를 위한 아침 브리핑 중 한 종목에 대한 섹션을 작성해주세요.
+
+## 종목 정보
+{index}. **{stock["symbol"]}** ({stock["name"]})
+   - 현재가: ${stock.get("price", 0):.2f}
+   - 변동률: {stock.get("change_percent", 0):+.2f}%
+"""
+
+    if news_items:
+        prompt += "   - 주요 뉴스:\n"
+        for news in news_items[:3]:
+            prompt += f"     * {news.get('title', 'N/A')}\n"
+
+    prompt += f"""
+## 요청사항
+1. 첫 줄은 "{index}. {stock["symbol"]} ({stock["name"]})" 형식의 제목으로 시작해주세요
+2. 이 종목이 왜 화제가 되고 있는지, 투자자가 주목할 포인트를 설명해주세요
+3. 친근하고 이해하기 쉬운 한국어로 80-120단어로 작성해주세요
+4. 면책 문구는 따로 추가하므로 작성하지 마세요
+"""
+
+    return prompt
+
+
+def build_market_summary_prompt(stocks: List[Dict[str, Any]]) -> str:
+    """
+    시장 분위기 요약 프롬프트 구성
+
+    Args:
+        stocks: 종목 리스트
+
+    Returns:
+        str: 시장 요약 생성용 프롬프트
+    """
+    lines = [
+        f"- {stock['symbol']} ({stock['name']}): {stock.get('change_percent', 0):+.2f}%"
+        for stock in stocks[:5]
+    ]
+
+    return f"""
+당신은 미국 주식 시장 전문 애널리스트입니다.
+아래 화제 종목의 움직임을 바탕으로 오늘의 시장 분위기를 요약해주세요.
+
+{chr(10).join(lines)}
+
+## 요청사항
+1. "시장 요약" 제목으로 시작해주세요
+2. 친근하고 이해하기 쉬운 한국어로 60-100단어로 작성해주세요
+3. 면책 문구는 따로 추가하므로 작성하지 마세요
+"""
+
+
+_llm_cache_lock = threading.Lock()
+_llm_memory_cache: Dict[str, str] = {}
+
+
+def generate_text_cached(prompt: str, cache_dir: Path = LLM_CACHE_DIR) -> str:
+    """
+    프롬프트 해시 기준으로 캐싱되는 Gemini 텍스트 생성
+
+    같은 프롬프트는 메모리 캐시 → 디스크 캐시 순으로 조회하고,
+    캐시에 없을 때만 Gemini API를 호출합니다.
+
+    Args:
+        prompt: 프롬프트
+        cache_dir: 디스크 캐시 디렉토리
+
+    Returns:
+        str: 생성된 텍스트
+    """
+    key = hashlib.sha256(
+        f"{GEMINI_MODEL_NAME}\n{prompt}".encode('utf-8')
+    ).hexdigest()
+
+    with _llm_cache_lock:
+        if key in _llm_memory_cache:
+            return _llm_memory_cache[key]
+
+    cache_path = cache_dir / f"{key}.txt"
+    if cache_path.exists():
+        text = cache_path.read_text(encoding='utf-8')
+        logger.info("LLM 캐시 적중: %s", key[:12])
+    else:
+        model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+        text = model.generate_content(prompt).text
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(text, encoding='utf-8')
+
+    with _llm_cache_lock:
+        _llm_memory_cache[key] = text
+
+    return text
+
+
+def build_fallback_section(
+    index: int,
+    stock: Dict[str, Any],
+    news_items: List[Dict]
+) -> str:
+    """
+    LLM 생성 실패 시 사용할 템플릿 기반 종목 섹션
+
+    Args:
+        index: 종목 순번 (1부터 시작)
+        stock: 종목 정보
+        news_items: 종목 관련 뉴스 리스트
+
+    Returns:
+        str: 템플릿 섹션 텍스트
+    """
+    change_pct = stock.get("change_percent", 0)
+    direction = "상승" if change_pct > 0 else "하락" if change_pct < 0 else "보합"
+
+    section = (
+        f"{index}. {stock['symbol']} ({stock['name']})\n"
+        f"현재가 ${stock.get('price', 0):.2f}, 전일 대비 {change_pct:+.2f}% {direction}했습니다.\n"
+    )
+
+    if news_items:
+        section += "관련 뉴스:\n"
+        for news in news_items[:3]:
+            section += f"  * {news.get('title', 'N/A')}\n"
+
+    return section
+
+
+def build_fallback_market_summary(stocks: List[Dict[str, Any]]) -> str:
+    """
+    LLM 생성 실패 시 사용할 템플릿 기반 시장 요약
+
+    Args:
+        stocks: 종목 리스트
+
+    Returns:
+        str: 템플릿 시장 요약 텍스트
+    """
+    top_stocks = stocks[:5]
+    gainers = sum(1 for stock in top_stocks if stock.get("change_percent", 0) > 0)
+
+    return (
+        "시장 요약\n"
+        f"오늘의 화제 종목 {len(top_stocks)}개 중 {gainers}개가 상승, "
+        f"{len(top_stocks) - gainers}개가 하락 또는 보합으로 마감했습니다.\n"
+    )
+
+
+def stream_sectioned_briefing(
+    stocks: List[Dict[str, Any]],
+    news_data: Dict[str, List[Dict]],
+    max_workers: Optional[int] = None,
+    timeout: float = SECTION_TIMEOUT_SECONDS
+) -> Iterator[str]:
+    """
+    종목별 섹션과 시장 요약을 동시에 생성하여 순서대로 반환
+
+    각 종목 섹션과 시장 요약은 개별 LLM 호출(캐시 적용)로 동시에 생성되며,
+    전체 소요 시간은 가장 느린 섹션 하나와 비슷합니다.
+    섹션은 완료되는 대로 원래 순서를 지켜 반환되며, 실패한 섹션과
+    전체 제한 시간 안에 끝나지 않은 섹션은 템플릿 섹션으로 대체됩니다.
+
+    Args:
+        stocks: 종목 리스트
+        news_data: 뉴스 데이터
+        max_workers: 동시 호출 수 (기본값: 섹션 수)
+        timeout: 전체 섹션 대기 제한 시간 (초)
+
+    Yields:
+        str: 순서대로 정렬된 브리핑 섹션 텍스트
+    """
+    top_stocks = stocks[:5]
+    logger.info("섹션 단위 브리핑 생성 시작 - %s개 종목 + 시장 요약", len(top_stocks))
+
+    section_count = len(top_stocks) + 1
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or section_count,
+        thread_name_prefix="briefing-section"
+    )
+
+    try:
+        # 종목 섹션 → 시장 요약 순서로 제출
+        tasks = []
+        for i, stock in enumerate(top_stocks, 1):
+            news_items = news_data.get(stock["symbol"], [])
+            prompt = build_stock_section_prompt(i, stock, news_items)
+            future = executor.submit(generate_text_cached, prompt)
+            tasks.append((stock["symbol"], future, build_fallback_section(i, stock, news_items)))
+
+        future = executor.submit(generate_text_cached, build_market_summary_prompt(top_stocks))
+        tasks.append(("시장 요약", future, build_fallback_market_summary(top_stocks)))
+
+        # 전체 섹션에 하나의 제한 시간을 적용하고, 완료되는 대로 앞 순서부터 내보냄
+        sections: Dict[int, str] = {}
+        fallback_count = 0
+        next_index = 0
+        positions = {future: position for position, (_, future, _) in enumerate(tasks)}
+
+        try:
+            for future in as_completed(positions, timeout=timeout):
+                position = positions[future]
+                name, _, fallback = tasks[position]
+                try:
+                    sections[position] = future.result()
+                except Exception as e:
+                    logger.warning("섹션 생성 실패 (%s): %s - 템플릿으로 대체", name, e)
+                    sections[position] = fallback
+                    fallback_count += 1
+
+                while next_index in sections:
+                    yield sections.pop(next_index).strip() + "\n\n"
+                    next_index += 1
+
+        except FutureTimeoutError:
+            for position in range(next_index, section_count):
+                name, _, fallback = tasks[position]
+                if position not in sections:
+                    logger.warning("섹션 생성 시간 초과 (%s) - 템플릿으로 대체", name)
+                    sections[position] = fallback
+                    fallback_count += 1
+                yield sections.pop(position).strip() + "\n\n"
+
+        yield BRIEFING_DISCLAIMER + "\n"
+
+        logger.info("섹션 단위 브리핑 생성 완료 - %s개 섹션, 대체 %s개", section_count, fallback_count)
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def generate_sectioned_briefing(
+    stocks: List[Dict[str, Any]],
+    news_data: Dict[str, List[Dict]],
+    max_workers: Optional[int] = None
+) -> str:
+    """
+    종목별 섹션 동시 생성 방식으로 전체 브리핑 텍스트 생성
+
+    Args:
+        stocks: 종목 리스트
+        news_data: 뉴스 데이터
+        max_workers: 동시 호출 수 (기본값: 섹션 수)
+
+    Returns:
+        str: 생성된 브리핑 텍스트
+    """
+    return "".join(stream_sectioned_briefing(stocks, news_data, max_workers))
+
+
+def render_html_header(
+    stocks: List[Dict[str, Any]],
+    timestamp: str,
+    chart_srcs: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    HTML 브리핑의 본문 이전 부분(헤더, 종목 리스트) 렌더링
 
     Args:
-        briefing_text: 브리핑 텍스트
         stocks: 종목 리스트
         timestamp: 생성 시각
+        chart_srcs: 심볼 → 스파크라인 이미지 src (예: 이메일용 "cid:..."), 선택
 
     Returns:
-        str: HTML 브리핑
+        str: 브리핑 본문 직전까지의 HTML
     """
     # 간단한 HTML 템플릿
     html = f"""
@@ -230,20 +618,39 @@ def generate_html_briefing(
 """
 
     # 종목 리스트 추가
+    chart_srcs = chart_srcs or {}
     for stock in stocks[:5]:
         change_class = "positive" if stock.get("change_percent", 0) > 0 else "negative"
+        chart_html = ""
+        symbol = stock['symbol']
+        if symbol in chart_srcs:
+            chart_html = (
+                f'\n        <img src="{chart_srcs[symbol]}" width="120" height="36" '
+                f'alt="{symbol} 차트" style="display: block;">'
+            )
         html += f"""
     <div class="stock-item">
         <h3>{stock['symbol']} - {stock['name']}</h3>
         <p>현재가: ${stock.get('price', 0):.2f}
-        <span class="{change_class}">({stock.get('change_percent', 0):+.2f}%)</span></p>
+        <span class="{change_class}">({stock.get('change_percent', 0):+.2f}%)</span></p>{chart_html}
     </div>
 """
 
-    # 브리핑 내용 추가
-    html += f"""
+    html += """
     <h2>📰 브리핑</h2>
-    <div class="briefing">{briefing_text}</div>
+    <div class="briefing">"""
+
+    return html
+
+
+def render_html_footer() -> str:
+    """
+    HTML 브리핑의 본문 이후 부분(푸터) 렌더링
+
+    Returns:
+        str: 브리핑 본문 이후의 HTML
+    """
+    return """</div>
 
     <div class="footer">
         <p>본 정보는 투자 권유가 아닙니다. 투자 결정은 본인 판단에 따라 신중히 하세요.</p>
@@ -253,55 +660,335 @@ def generate_html_briefing(
 </html>
 """
 
-    return html
 
-
-def save_briefing(
+def generate_html_briefing(
     briefing_text: str,
-    html_content: str,
+    stocks: List[Dict[str, Any]],
+    timestamp: str,
+    chart_srcs: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    HTML 형식의 브리핑 생성
+
+    Args:
+        briefing_text: 브리핑 텍스트
+        stocks: 종목 리스트
+        timestamp: 생성 시각
+        chart_srcs: 심볼 → 스파크라인 이미지 src, 선택
+
+    Returns:
+        str: HTML 브리핑
+    """
+    return render_html_header(stocks, timestamp, chart_srcs) + briefing_text + render_html_footer()
+
+
+class StreamingBriefingWriter:
+    """
+    브리핑 청크를 JSON/HTML 파일에 도착 순서대로 기록하는 작성기
+
+    HTML은 헤더 → 본문 청크 → 푸터 순서로, JSON은 briefing 문자열 필드를
+    청크 단위로 이어 붙이는 방식으로 기록합니다. 전체 본문을 메모리에
+    모으지 않으며, 매 청크마다 flush하여 진행 중인 브리핑도 읽을 수 있습니다.
+
+    Example:
+        >>> with StreamingBriefingWriter(stocks, output_dir) as writer:
+        ...     for chunk in stream_briefing_with_gemini(stocks, news_data):
+        ...         writer.write(chunk)
+    """
+
+    def __init__(
+        self,
+        stocks: List[Dict[str, Any]],
+        output_dir: Path,
+        timestamp: Optional[datetime] = None
+    ):
+        """
+        StreamingBriefingWriter 초기화
+
+        Args:
+            stocks: 종목 리스트
+            output_dir: 출력 디렉토리 경로
+            timestamp: 생성 시각 (기본값: 현재 시각)
+        """
+        self.stocks = stocks
+        self.created_at = timestamp or datetime.now()
+        self.briefing_id = self.created_at.strftime("%Y%m%d_%H%M%S")
+        self.json_path = output_dir / f"briefing_{self.briefing_id}.json"
+        self.html_path = output_dir / f"briefing_{self.briefing_id}.html"
+        self.chunk_count = 0
+        self.char_count = 0
+        self._json_file: Optional[TextIO] = None
+        self._html_file: Optional[TextIO] = None
+
+    def open(self) -> "StreamingBriefingWriter":
+        """출력 파일을 열고 본문 이전 부분 기록"""
+        self._json_file = open(self.json_path, 'w', encoding='utf-8')
+        self._html_file = open(self.html_path, 'w', encoding='utf-8')
+
+        label = self.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        self._html_file.write(render_html_header(self.stocks, label))
+        self._html_file.flush()
+
+        # briefing 필드 값 직전까지 JSON 기록 (기존 save_briefing과 같은 키 구성)
+        self._json_file.write('{\n')
+        self._json_file.write(
+            f'  "timestamp": {json.dumps(self.created_at.isoformat())},\n'
+        )
+        self._json_file.write(
+            f'  "stocks": {json.dumps(self.stocks, ensure_ascii=False)},\n'
+        )
+        self._json_file.write('  "briefing": "')
+        self._json_file.flush()
+
+        logger.info("스트리밍 브리핑 기록 시작: %s", self.html_path)
+        return self
+
+    def write(self, chunk: str) -> None:
+        """
+        브리핑 텍스트 청크 기록
+
+        Args:
+            chunk: 브리핑 텍스트 청크
+        """
+        # JSON 문자열 이스케이프 후 양쪽 따옴표 제거
+        self._json_file.write(json.dumps(chunk, ensure_ascii=False)[1:-1])
+        self._html_file.write(chunk)
+        self._json_file.flush()
+        self._html_file.flush()
+
+        self.chunk_count += 1
+        self.char_count += len(chunk)
+
+    def close(self, success: bool = True, error: Optional[str] = None) -> None:
+        """
+        본문 이후 부분을 기록하고 파일 닫기
+
+        Args:
+            success: 생성 성공 여부
+            error: 에러 메시지 (실패 시)
+        """
+        if self._json_file is None:
+            return
+
+        self._json_file.write('",\n')
+        if error:
+            self._json_file.write(
+                f'  "error": {json.dumps(error, ensure_ascii=False)},\n'
+            )
+        self._json_file.write(f'  "success": {json.dumps(success)}\n}}\n')
+        self._html_file.write(render_html_footer())
+
+        self._json_file.close()
+        self._html_file.close()
+        self._json_file = None
+        self._html_file = None
+
+        logger.info(
+            "스트리밍 브리핑 기록 완료 - %s개 청크, %s자 (성공: %s)",
+            self.chunk_count, self.char_count, success
+        )
+
+    def __enter__(self) -> "StreamingBriefingWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close(success=True)
+        else:
+            self.close(success=False, error=str(exc_value))
+
+
+def briefing_artifact_id(path: str) -> str:
+    """
+    브리핑 파일 경로에서 브리핑 ID 추출
+
+    Args:
+        path: briefing_{YYYYmmdd_HHMMSS}.json/.html 경로
+
+    Returns:
+        str: 브리핑 ID (YYYYmmdd_HHMMSS)
+    """
+    return Path(path).stem[len("briefing_"):]
+
+
+def register_briefing(
+    json_path: str,
+    html_path: str,
+    stocks: List[Dict[str, Any]],
+    status: str = STATUS_COMPLETED
+) -> str:
+    """
+    저장된 브리핑을 산출물 인덱스에 등록
+
+    완료된 브리핑만 최신 브리핑으로 지정되고 세그먼트 저장소에 추가됩니다.
+
+    Args:
+        json_path: JSON 브리핑 경로
+        html_path: HTML 브리핑 경로
+        stocks: 종목 리스트
+        status: 브리핑 상태 (in_progress, completed)
+
+    Returns:
+        str: 브리핑 ID
+    """
+    briefing_id = briefing_artifact_id(json_path)
+    created_at = datetime.strptime(briefing_id, "%Y%m%d_%H%M%S")
+
+    record = get_output_store().put(
+        KIND_BRIEFING,
+        briefing_id,
+        {"json": json_path, "html": html_path},
+        created_at=created_at,
+        status=status,
+        meta={
+            "title": f"굿모닝 월가 - {created_at.strftime('%Y-%m-%d')} 데일리 브리핑",
+            "symbols": [stock["symbol"] for stock in stocks[:5]],
+        },
+        set_latest=status == STATUS_COMPLETED
+    )
+
+    # 완료된 브리핑은 API 읽기 경로용 세그먼트에도 추가
+    if status == STATUS_COMPLETED:
+        append_artifact(get_segment_store(KIND_BRIEFING), record)
+
+    return briefing_id
+
+
+def save_briefing_stream(
+    chunks: Iterable[str],
     stocks: List[Dict[str, Any]],
     output_dir: Path
 ) -> tuple[str, str]:
     """
-    브리핑 결과 저장
+    스트리밍 브리핑 청크를 받는 즉시 JSON/HTML 파일로 저장
+
+    생성 중에는 in_progress 상태로 인덱스에 등록되어 진행 중인 브리핑도 조회할 수 있습니다.
+
+    Args:
+        chunks: 브리핑 텍스트 청크 이터러블
+        stocks: 종목 리스트
+        output_dir: 출력 디렉토리 경로
 
     Returns:
         tuple: (json_path, html_path)
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    writer = StreamingBriefingWriter(stocks, output_dir)
+    json_path, html_path = str(writer.json_path), str(writer.html_path)
 
-    # JSON 저장
+    try:
+        with writer:
+            register_briefing(json_path, html_path, stocks, status=STATUS_IN_PROGRESS)
+            for chunk in chunks:
+                writer.write(chunk)
+    except Exception:
+        get_output_store().update_status(KIND_BRIEFING, writer.briefing_id, STATUS_FAILED)
+        raise
+
+    register_briefing(json_path, html_path, stocks)
+
+    logger.info("JSON 브리핑 저장 완료: %s", json_path)
+    logger.info("HTML 브리핑 저장 완료: %s", html_path)
+
+    return json_path, html_path
+
+
+def render_briefing_json(
+    briefing_text: str,
+    stocks: List[Dict[str, Any]],
+    created_at: Optional[datetime] = None
+) -> str:
+    """
+    JSON 형식의 브리핑 생성
+
+    Args:
+        briefing_text: 브리핑 텍스트
+        stocks: 종목 리스트
+        created_at: 생성 시각 (기본값: 현재 시각)
+
+    Returns:
+        str: JSON 브리핑
+    """
     json_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": (created_at or datetime.now()).isoformat(),
         "briefing": briefing_text,
         "stocks": stocks,
         "success": True
     }
 
-    json_filename = f"briefing_{timestamp}.json"
-    json_path = output_dir / json_filename
+    return json.dumps(json_data, ensure_ascii=False, indent=2)
+
+
+def write_briefing_files(
+    json_content: str,
+    html_content: str,
+    output_dir: Path,
+    briefing_id: Optional[str] = None
+) -> tuple[str, str]:
+    """
+    렌더링된 JSON/HTML 브리핑을 파일로 저장
+
+    Args:
+        json_content: JSON 브리핑
+        html_content: HTML 브리핑
+        output_dir: 출력 디렉토리 경로
+        briefing_id: 브리핑 ID (기본값: 현재 시각 YYYYmmdd_HHMMSS)
+
+    Returns:
+        tuple: (json_path, html_path)
+    """
+    briefing_id = briefing_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # JSON 저장
+    json_path = output_dir / f"briefing_{briefing_id}.json"
 
     with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+        f.write(json_content)
 
-    logger.info(f"JSON 브리핑 저장 완료: {json_path}")
+    logger.info("JSON 브리핑 저장 완료: %s", json_path)
 
     # HTML 저장
-    html_filename = f"briefing_{timestamp}.html"
-    html_path = output_dir / html_filename
+    html_path = output_dir / f"briefing_{briefing_id}.html"
 
     with open(html_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
-    logger.info(f"HTML 브리핑 저장 완료: {html_path}")
+    logger.info("HTML 브리핑 저장 완료: %s", html_path)
 
     return str(json_path), str(html_path)
 
 
-def run_briefing_generation() -> Dict[str, Any]:
+def save_briefing(
+    briefing_text: str,
+    html_content: str,
+    stocks: List[Dict[str, Any]],
+    output_dir: Path
+) -> tuple[str, str]:
+    """
+    브리핑 결과 저장
+
+    Returns:
+        tuple: (json_path, html_path)
+    """
+    json_content = render_briefing_json(briefing_text, stocks)
+    json_path, html_path = write_briefing_files(json_content, html_content, output_dir)
+    register_briefing(json_path, html_path, stocks)
+
+    return json_path, html_path
+
+
+def run_briefing_generation(
+    stream: bool = True,
+    mode: Optional[str] = None
+) -> Dict[str, Any]:
     """
     브리핑 생성 실행
 
+    Args:
+        stream: 스트리밍 생성 사용 여부 (기본값: True)
+            True이면 Gemini 응답 청크를 받는 즉시 JSON/HTML 파일에 기록합니다.
+        mode: 생성 모드 (single, sectioned, 기본값: 환경 변수 BRIEFING_MODE 또는 single)
+            sectioned이면 종목별 섹션을 동시에 생성하고 실패한 섹션은 템플릿으로 대체합니다.
+
     Returns:
         Dict: 생성 결과
     """
@@ -309,49 +996,112 @@ def run_briefing_generation() -> Dict[str, Any]:
     logger.info("브리핑 생성 시작")
     logger.info("=" * 60)
 
-    try:
-        # Gemini API 설정
-        configure_gemini()
+    mode = mode or os.getenv("BRIEFING_MODE", "single")
+    if mode not in BRIEFING_MODES:
+        raise ValueError(
+            f"유효하지 않은 브리핑 모드: {mode}. "
+            f"사용 가능한 모드: {', '.join(BRIEFING_MODES)}"
+        )
 
+    try:
         # 최근 스크리닝 결과 로드
         screening_data = load_latest_screening()
         if not screening_data or not screening_data.get("success"):
             raise ValueError("유효한 스크리닝 결과를 찾을 수 없습니다.")
 
-        stocks = screening_data.get("stocks", [])
+        stocks = normalize_screening_stocks(screening_data.get("stocks", []))
         if not stocks:
             raise ValueError("화제 종목이 없습니다.")
 
-        logger.info(f"{len(stocks)}개 화제 종목 발견")
-
-        # 뉴스 수집
-        news_data = collect_news_for_stocks(stocks)
+        logger.info("%s개 화제 종목 발견", len(stocks))
+
+        cache = StageArtifactCache()
+        manifest = RunManifest("briefing")
+
+        # 종목 내용이 이전 실행과 같으면 뉴스 수집/브리핑 생성 없이 이전 산출물 재사용
+        briefing_hash = compute_content_hash({"mode": mode, "stocks": stocks[:5]})
+        cached = cache.get("briefing", briefing_hash)
+        if cached and touch_files([cached["json_path"], cached["html_path"]]):
+            logger.info("스크리닝 결과 변경 없음 - 이전 브리핑 재사용")
+            get_output_store().set_latest(KIND_BRIEFING, briefing_artifact_id(cached["json_path"]))
+            manifest.record("news", ARTIFACT_REUSED, briefing_hash)
+            manifest.record(
+                "briefing", ARTIFACT_REUSED, briefing_hash,
+                [cached["json_path"], cached["html_path"]]
+            )
+            manifest_path = manifest.save()
+
+            return {
+                "success": True,
+                "mode": mode,
+                "reused": True,
+                "json_path": cached["json_path"],
+                "html_path": cached["html_path"],
+                "manifest_path": manifest_path,
+                "timestamp": datetime.now().isoformat()
+            }
 
-        # 브리핑 생성
-        briefing_text = generate_briefing_with_gemini(stocks, news_data)
+        # Gemini API 설정
+        configure_gemini()
 
-        # HTML 생성
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        html_content = generate_html_briefing(briefing_text, stocks, timestamp)
+        # 뉴스 수집 (같은 날 같은 종목 구성이면 이전 수집 결과 재사용)
+        news_hash = compute_content_hash({
+            "symbols": [stock["symbol"] for stock in stocks[:5]],
+            "date": datetime.now().strftime("%Y-%m-%d"),
+        })
+        news_data = cache.get("news", news_hash)
+        if news_data is not None:
+            logger.info("뉴스 수집 결과 재사용")
+            manifest.record("news", ARTIFACT_REUSED, news_hash)
+        else:
+            news_data = collect_news_for_stocks(stocks)
+            cache.put("news", news_hash, news_data)
+            manifest.record("news", ARTIFACT_RECOMPUTED, news_hash)
 
-        # 결과 저장
+        # 결과 저장 디렉토리
         output_dir = Path(__file__).parent.parent / "output"
         output_dir.mkdir(exist_ok=True)
 
-        json_path, html_path = save_briefing(
-            briefing_text, html_content, stocks, output_dir
-        )
+        if stream:
+            # 브리핑 스트리밍 생성 및 저장
+            if mode == "sectioned":
+                chunks = stream_sectioned_briefing(stocks, news_data)
+            else:
+                chunks = stream_briefing_with_gemini(stocks, news_data)
+            json_path, html_path = save_briefing_stream(chunks, stocks, output_dir)
+        else:
+            # 브리핑 생성
+            if mode == "sectioned":
+                briefing_text = generate_sectioned_briefing(stocks, news_data)
+            else:
+                briefing_text = generate_briefing_with_gemini(stocks, news_data)
+
+            # HTML 생성
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            html_content = generate_html_briefing(briefing_text, stocks, timestamp)
+
+            # 결과 저장
+            json_path, html_path = save_briefing(
+                briefing_text, html_content, stocks, output_dir
+            )
+
+        cache.put("briefing", briefing_hash, {"json_path": json_path, "html_path": html_path})
+        manifest.record("briefing", ARTIFACT_RECOMPUTED, briefing_hash, [json_path, html_path])
+        manifest_path = manifest.save()
 
         logger.info("=" * 60)
         logger.info("브리핑 생성 완료")
-        logger.info(f"JSON: {json_path}")
-        logger.info(f"HTML: {html_path}")
+        logger.info("JSON: %s", json_path)
+        logger.info("HTML: %s", html_path)
         logger.info("=" * 60)
 
         return {
             "success": True,
+            "mode": mode,
+            "reused": False,
             "json_path": json_path,
             "html_path": html_path,
+            "manifest_path": manifest_path,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -374,7 +1124,7 @@ def main():
             exit(1)
 
     except Exception as e:
-        logger.error(f"프로그램 실행 중 오류 발생: {e}")
+        logger.error("프로그램 실행 중 오류 발생: %s", e)
         exit(1)
 
 
@@ -0,0 +1,262 @@
+"""
+차트 이미지 렌더링 서비스
+
+이메일 클라이언트는 프론트엔드 차트 컴포넌트를 실행할 수 없으므로,
+화제 종목의 스파크라인을 서버에서 작은 PNG 이미지로 렌더링합니다.
+이미지는 (심볼, 데이터 해시) 기준으로 캐시하여 같은 데이터를 다시 그리지 않으며,
+이메일에는 CID 첨부로 한 번만 포함되어 모든 수신자에게 재사용됩니다.
+
+저장 구조:
+    output/cache/charts/{symbol}_{data_hash[:16]}.png
+"""
+
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from .artifact_cache import compute_content_hash
+from .market_data import get_market_data
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+CHART_CACHE_DIR = Path(__file__).parent.parent / "output" / "cache" / "charts"
+
+# 스파크라인 크기 (2배 해상도로 렌더링하고 HTML에서는 절반 크기로 표시)
+SPARKLINE_WIDTH = 240
+SPARKLINE_HEIGHT = 72
+SPARKLINE_LINE_WIDTH = 3
+
+# 색상 (HTML 브리핑의 positive/negative 색상과 동일)
+COLOR_POSITIVE = (0x00, 0xD2, 0x6A)
+COLOR_NEGATIVE = (0xFF, 0x47, 0x57)
+COLOR_BASELINE = (0x88, 0x88, 0x88)
+
+
+def encode_png(rgba: np.ndarray) -> bytes:
+    """
+    RGBA 픽셀 배열을 PNG 바이트로 인코딩
+
+    Args:
+        rgba: (height, width, 4) uint8 배열
+
+    Returns:
+        bytes: PNG 파일 바이트
+    """
+    height, width, _ = rgba.shape
+
+    # 각 행 앞에 필터 타입 0(None) 바이트 추가
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = rgba.reshape(height, -1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def render_sparkline_png(
+    values: List[float],
+    width: int = SPARKLINE_WIDTH,
+    height: int = SPARKLINE_HEIGHT,
+    line_width: int = SPARKLINE_LINE_WIDTH
+) -> bytes:
+    """
+    스파크라인 PNG 렌더링 (투명 배경)
+
+    시작가 대비 마지막 값이 같거나 높으면 초록색, 낮으면 빨간색으로 그리고
+    시작가 위치에 점선 기준선을 표시합니다.
+
+    Args:
+        values: 가격 리스트 (시간순)
+        width: 이미지 너비 (px)
+        height: 이미지 높이 (px)
+        line_width: 선 두께 (px)
+
+    Returns:
+        bytes: PNG 파일 바이트
+
+    Raises:
+        ValueError: 유효한 값이 2개 미만인 경우
+    """
+    prices = np.asarray(values, dtype=np.float64)
+    prices = prices[np.isfinite(prices)]
+    if len(prices) < 2:
+        raise ValueError("스파크라인을 그릴 데이터가 부족합니다.")
+
+    # 열마다 한 값이 되도록 보간
+    ys = np.interp(np.linspace(0, len(prices) - 1, width), np.arange(len(prices)), prices)
+
+    low, high = ys.min(), ys.max()
+    span = (high - low) or 1.0
+    pad = line_width
+    rows = np.round((high - ys) / span * (height - 1 - 2 * pad) + pad).astype(np.int64)
+
+    image = np.zeros((height, width, 4), dtype=np.uint8)
+
+    # 시작가 기준선 (4px 간격 점선)
+    baseline_row = int(np.round((high - prices[0]) / span * (height - 1 - 2 * pad) + pad))
+    image[baseline_row, ::4] = (*COLOR_BASELINE, 160)
+
+    # 열마다 이전 열의 y와 현재 열의 y 사이를 세로로 채워 선을 연결
+    previous = np.concatenate(([rows[0]], rows[:-1]))
+    top = np.minimum(previous, rows) - (line_width - 1) // 2
+    bottom = np.maximum(previous, rows) + line_width // 2
+    grid = np.arange(height)[:, None]
+    mask = (grid >= top[None, :]) & (grid <= bottom[None, :])
+
+    color = COLOR_POSITIVE if prices[-1] >= prices[0] else COLOR_NEGATIVE
+    image[mask] = (*color, 255)
+
+    return encode_png(image)
+
+
+def sparkline_cid(symbol: str, data_hash: str) -> str:
+    """
+    스파크라인 이미지의 Content-ID (같은 데이터면 같은 값)
+
+    Args:
+        symbol: 종목 심볼
+        data_hash: 데이터 해시
+
+    Returns:
+        str: Content-ID (꺾쇠 괄호 제외)
+    """
+    return f"spark-{symbol.lower()}-{data_hash[:12]}@goodmorning"
+
+
+def fetch_sparkline_series(
+    symbols: List[str],
+    period: str = "1d",
+    interval: str = "5m"
+) -> Dict[str, List[float]]:
+    """
+    여러 종목의 종가 이력을 한 번의 history 호출로 조회
+
+    Args:
+        symbols: 종목 심볼 리스트
+        period: 조회 기간
+        interval: 시세 간격
+
+    Returns:
+        Dict[str, List[float]]: 심볼 → 종가 리스트 (조회 실패 종목은 제외)
+    """
+    if not symbols:
+        return {}
+
+    try:
+        history = get_market_data().history(symbols, period, interval)
+    except Exception as e:
+        logger.warning("스파크라인 이력 조회 실패: %s", e)
+        return {}
+
+    # 모든 종목이 실패하면 dict(심볼 → 에러 메시지)가 반환됨
+    if isinstance(history, dict) or getattr(history, "empty", True):
+        logger.warning("스파크라인 이력이 없습니다: %s", ', '.join(symbols))
+        return {}
+
+    series = {}
+    for symbol in history.index.get_level_values(0).unique():
+        closes = history.xs(symbol, level=0)["close"].dropna()
+        if len(closes) >= 2:
+            series[str(symbol).upper()] = [round(float(value), 4) for value in closes.sort_index()]
+
+    return series
+
+
+class ChartImageCache:
+    """(심볼, 데이터 해시) 기준 차트 이미지 캐시"""
+
+    def __init__(self, root: Path = CHART_CACHE_DIR):
+        """
+        ChartImageCache 초기화
+
+        Args:
+            root: 이미지 저장 디렉토리
+        """
+        self.root = root
+
+    def path_for(self, symbol: str, data_hash: str) -> Path:
+        return self.root / f"{symbol.upper()}_{data_hash[:16]}.png"
+
+    def get_or_render(self, symbol: str, values: List[float]) -> Tuple[Path, str, bool]:
+        """
+        캐시된 이미지 조회, 없으면 렌더링 후 저장
+
+        Args:
+            symbol: 종목 심볼
+            values: 가격 리스트
+
+        Returns:
+            Tuple[Path, str, bool]: (이미지 경로, 데이터 해시, 캐시 적중 여부)
+        """
+        data_hash = compute_content_hash({
+            "symbol": symbol.upper(),
+            "values": values,
+            "size": [SPARKLINE_WIDTH, SPARKLINE_HEIGHT, SPARKLINE_LINE_WIDTH],
+        })
+        path = self.path_for(symbol, data_hash)
+        if path.exists():
+            return path, data_hash, True
+
+        png = render_sparkline_png(values)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(png)
+        tmp_path.replace(path)
+
+        return path, data_hash, False
+
+
+def build_sparkline_images(
+    symbols: List[str],
+    cache: Optional[ChartImageCache] = None,
+    max_workers: int = 4
+) -> Dict[str, Dict[str, Any]]:
+    """
+    종목별 스파크라인 이미지 생성 (이력 일괄 조회 후 작업 풀에서 렌더링)
+
+    차트는 부가 정보이므로 조회/렌더링에 실패한 종목은 결과에서 제외합니다.
+
+    Args:
+        symbols: 종목 심볼 리스트
+        cache: 차트 이미지 캐시 (기본값: output/cache/charts)
+        max_workers: 동시 렌더링 수
+
+    Returns:
+        Dict[str, Dict]: 심볼 → {"cid": Content-ID, "path": 이미지 경로}
+    """
+    cache = cache or ChartImageCache()
+    series = fetch_sparkline_series(symbols)
+    if not series:
+        return {}
+
+    def render(symbol: str) -> Optional[Tuple[str, Dict[str, Any], bool]]:
+        try:
+            path, data_hash, hit = cache.get_or_render(symbol, series[symbol])
+        except Exception as e:
+            logger.warning("스파크라인 렌더링 실패 (%s): %s", symbol, e)
+            return None
+        return symbol, {"cid": sparkline_cid(symbol, data_hash), "path": str(path)}, hit
+
+    ordered = [symbol.upper() for symbol in symbols if symbol.upper() in series]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chart") as executor:
+        rendered = [result for result in executor.map(render, ordered) if result]
+
+    hits = sum(1 for _, _, hit in rendered if hit)
+    logger.info("스파크라인 이미지 %s개 준비 완료 (캐시 적중 %s개)", len(rendered), hits)
+
+    return {symbol: info for symbol, info, _ in rendered}
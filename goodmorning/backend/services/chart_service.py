@@ -0,0 +1,318 @@
+"""
+차트 데이터 서비스
+
+yahooquery Ticker.history를 여러 종목에 대해 한 번에 호출하여 시세 이력을 조회하고,
+LTTB 방식 다운샘플링으로 요청한 포인트 수까지 줄여 스파크라인/장중 차트 데이터를 제공합니다.
+조회 결과는 (심볼, 간격, 기간) 단위로 캐시하여 같은 차트를 반복 조회할 때 재호출하지 않습니다.
+정규장 시세만 사용하므로 정규장이 닫혀 있는 동안 조회한 차트는 다음 정규장 시작까지 유지합니다.
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+import threading
+import time
+
+from .market_data import MarketDataClient, get_market_data
+from .upstream_guard import UpstreamUnavailableError
+from .utils import LoggerFactory
+
+# numpy / pandas는 import 비용이 커서 차트를 처음 조회할 때 로드
+if TYPE_CHECKING:
+    import numpy as np
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 기본 다운샘플링 포인트 수
+DEFAULT_CHART_POINTS = 100
+
+# 간격별 캐시 유지 시간 (초, 정규장 기준) - 장중 간격은 짧게, 일/주 간격은 길게
+CHART_CACHE_TTL = {
+    "1m": 30,
+    "5m": 60,
+    "15m": 120,
+    "30m": 300,
+    "1h": 300,
+    "1d": 3600,
+    "1wk": 3600,
+}
+
+
+def lttb_indices(x: "np.ndarray", y: "np.ndarray", threshold: int) -> "np.ndarray":
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 방식 다운샘플링 인덱스 계산
+
+    첫/마지막 포인트는 유지하고 나머지 포인트를 (threshold - 2)개 버킷으로 나눈 뒤,
+    버킷마다 이전/다음 버킷 평균점과 이루는 삼각형 넓이가 가장 큰 포인트를 선택합니다.
+    원래 LTTB는 이전 버킷에서 "선택된" 포인트를 기준으로 삼아 순차적으로 계산하지만,
+    여기서는 이전 버킷 평균점을 기준으로 삼아 모든 버킷을 한 번에 벡터 연산으로 계산합니다.
+
+    Args:
+        x: 시각 배열 (오름차순)
+        y: 값 배열
+        threshold: 결과 포인트 수
+
+    Returns:
+        np.ndarray: 선택된 포인트 인덱스 (오름차순)
+    """
+    import numpy as np
+
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+
+    # 내부 포인트(1 ~ n-2)를 threshold-2개 버킷으로 분할 (버킷 크기 >= 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+
+    mean_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+
+    # 버킷별 기준점: A = 이전 버킷 평균 (첫 버킷은 첫 포인트), C = 다음 버킷 평균 (마지막 버킷은 마지막 포인트)
+    a_x = np.concatenate(([x[0]], mean_x[:-1]))
+    a_y = np.concatenate(([y[0]], mean_y[:-1]))
+    c_x = np.concatenate((mean_x[1:], [x[-1]]))
+    c_y = np.concatenate((mean_y[1:], [y[-1]]))
+
+    bucket = np.repeat(np.arange(len(counts)), counts)
+    px = x[1:n - 1]
+    py = y[1:n - 1]
+
+    area = np.abs(
+        (a_x[bucket] - c_x[bucket]) * (py - a_y[bucket])
+        - (a_x[bucket] - px) * (c_y[bucket] - a_y[bucket])
+    )
+
+    # 버킷별 넓이 최대 포인트 (버킷, 넓이 순 정렬 후 버킷의 마지막 위치)
+    order = np.lexsort((area, bucket))
+    last_in_bucket = np.append(np.flatnonzero(np.diff(bucket[order])), len(order) - 1)
+    selected = np.sort(order[last_in_bucket]) + 1
+
+    return np.concatenate(([0], selected, [n - 1]))
+
+
+def _to_epoch_seconds(index) -> "np.ndarray":
+    """history 인덱스(date/datetime 혼재 가능)를 UTC epoch 초 배열로 변환"""
+    import numpy as np
+    import pandas as pd
+
+    stamps = [pd.Timestamp(value) for value in index]
+    return np.array(
+        [int((s.tz_localize("UTC") if s.tzinfo is None else s).timestamp()) for s in stamps],
+        dtype=np.int64
+    )
+
+
+class ChartService:
+    """종목 차트 데이터 조회 서비스"""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+        market_data: Optional[MarketDataClient] = None
+    ):
+        """
+        ChartService 초기화
+
+        Args:
+            ttl_seconds: 간격별 캐시 유지 시간 (기본값: CHART_CACHE_TTL)
+            market_data: 시장 데이터 접근 객체 (기본값: 프로세스 공용 객체)
+        """
+        self.ttl_seconds = ttl_seconds or CHART_CACHE_TTL
+        self.market_data = market_data or get_market_data()
+        self._cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, "np.ndarray"]]] = {}
+        self._counters = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def get_charts(
+        self,
+        symbols: List[str],
+        interval: str = "5m",
+        range_: str = "1d",
+        points: int = DEFAULT_CHART_POINTS
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 종목 차트 데이터 조회
+
+        캐시에 없는 종목만 모아 history를 한 번 호출합니다.
+
+        Args:
+            symbols: 종목 심볼 리스트
+            interval: 시세 간격 (1m, 5m, 15m, 30m, 1h, 1d, 1wk)
+            range_: 조회 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 5y)
+            points: 다운샘플링 후 최대 포인트 수
+
+        Returns:
+            List[Dict]: 요청 순서대로 종목별 차트 데이터
+                - symbol, interval, range, points
+                - timestamps: UTC epoch 초 배열
+                - close: 종가 배열
+                - volume: 거래량 배열
+                - error: 에러 메시지 (조회 실패 시)
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+        series: Dict[str, Dict[str, "np.ndarray"]] = {}
+        missing = []
+        now = time.monotonic()
+
+        with self._lock:
+            for symbol in symbols:
+                cached = self._cache.get((symbol, interval, range_))
+                if cached and cached[0] > now:
+                    series[symbol] = cached[1]
+                else:
+                    missing.append(symbol)
+            self._counters["hits"] += len(series)
+            self._counters["misses"] += len(missing)
+
+        errors: Dict[str, str] = {}
+        if missing:
+            fetched, errors = self._fetch_history(missing, interval, range_)
+            ttl = self.market_data.calendar.cache_ttl(self.ttl_seconds.get(interval, 60), extended_hours=False)
+            expires_at = time.monotonic() + ttl
+            with self._lock:
+                for symbol, data in fetched.items():
+                    self._cache[(symbol, interval, range_)] = (expires_at, data)
+
+                # 조회에 실패한 종목은 만료된 캐시라도 있으면 사용
+                for symbol in missing:
+                    cached = self._cache.get((symbol, interval, range_))
+                    if symbol not in fetched and cached:
+                        logger.warning("만료된 차트 캐시로 응답합니다: %s", symbol)
+                        fetched[symbol] = cached[1]
+            series.update(fetched)
+
+        results = []
+        for symbol in symbols:
+            if symbol not in series:
+                results.append({
+                    "symbol": symbol,
+                    "interval": interval,
+                    "range": range_,
+                    "points": 0,
+                    "timestamps": [],
+                    "close": [],
+                    "volume": [],
+                    "error": errors.get(symbol, "차트 데이터를 찾을 수 없습니다."),
+                })
+                continue
+
+            results.append(self._downsample(symbol, series[symbol], interval, range_, points))
+
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: entries, hits, misses (종목 단위)
+        """
+        with self._lock:
+            return {"entries": len(self._cache), **self._counters}
+
+    def get_chart(
+        self,
+        symbol: str,
+        interval: str = "5m",
+        range_: str = "1d",
+        points: int = DEFAULT_CHART_POINTS
+    ) -> Dict[str, Any]:
+        """
+        단일 종목 차트 데이터 조회
+
+        Args:
+            symbol: 종목 심볼
+            interval: 시세 간격
+            range_: 조회 기간
+            points: 다운샘플링 후 최대 포인트 수
+
+        Returns:
+            Dict: 차트 데이터 (get_charts 항목 형식)
+        """
+        return self.get_charts([symbol], interval, range_, points)[0]
+
+    def _fetch_history(
+        self,
+        symbols: List[str],
+        interval: str,
+        range_: str
+    ) -> Tuple[Dict[str, Dict[str, "np.ndarray"]], Dict[str, str]]:
+        """
+        history 일괄 조회 후 종목별 배열로 분리
+
+        Args:
+            symbols: 종목 심볼 리스트
+            interval: 시세 간격
+            range_: 조회 기간
+
+        Returns:
+            Tuple[Dict, Dict]: (종목별 timestamps/close/volume 배열, 종목별 에러 메시지)
+        """
+        import numpy as np
+        import pandas as pd
+
+        logger.info("차트 이력 조회 - 종목: %s, 간격: %s, 기간: %s", ', '.join(symbols), interval, range_)
+
+        try:
+            history = self.market_data.history(symbols, range_, interval)
+        except UpstreamUnavailableError as e:
+            logger.warning("차트 이력 조회 거절: %s", e)
+            return {}, {symbol: str(e) for symbol in symbols}
+        except Exception as e:
+            logger.error("차트 이력 조회 실패: %s", e)
+            return {}, {symbol: str(e) for symbol in symbols}
+
+        # 모든 종목이 실패하면 dict(심볼 → 에러 메시지)가 반환됨
+        if isinstance(history, dict):
+            return {}, {symbol: str(message) for symbol, message in history.items()}
+
+        if not isinstance(history, pd.DataFrame) or history.empty:
+            return {}, {}
+
+        results = {}
+        for symbol in history.index.get_level_values(0).unique():
+            frame = history.xs(symbol, level=0)
+            frame = frame.dropna(subset=["close"])
+            if frame.empty:
+                continue
+
+            timestamps = _to_epoch_seconds(frame.index)
+            order = np.argsort(timestamps, kind="stable")
+            volume = frame["volume"] if "volume" in frame else pd.Series(0, index=frame.index)
+
+            results[str(symbol).upper()] = {
+                "timestamps": timestamps[order],
+                "close": frame["close"].to_numpy(dtype=np.float64)[order],
+                "volume": volume.fillna(0).to_numpy(dtype=np.int64)[order],
+            }
+
+        return results, {}
+
+    def _downsample(
+        self,
+        symbol: str,
+        data: Dict[str, "np.ndarray"],
+        interval: str,
+        range_: str,
+        points: int
+    ) -> Dict[str, Any]:
+        """종가 기준 LTTB 다운샘플링 후 응답 형식으로 변환"""
+        import numpy as np
+
+        indices = lttb_indices(data["timestamps"], data["close"], points)
+
+        return {
+            "symbol": symbol,
+            "interval": interval,
+            "range": range_,
+            "points": int(len(indices)),
+            "timestamps": data["timestamps"][indices].tolist(),
+            "close": np.round(data["close"][indices], 4).tolist(),
+            "volume": data["volume"][indices].tolist(),
+            "error": None,
+        }
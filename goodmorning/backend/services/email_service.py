@@ -8,11 +8,12 @@ GitHub Actions 워크플로우에서 실행됩니다.
 import os
 import smtplib
 from datetime import datetime
+from email.mime.image import MIMEImage
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from .output_store import get_output_store, KIND_BRIEFING
 from .utils import LoggerFactory
 
 # 로깅 설정
@@ -54,9 +55,9 @@ class EmailConfig:
             )
 
         logger.info("이메일 설정 로드 완료")
-        logger.info(f"SMTP 서버: {self.host}:{self.port}")
-        logger.info(f"발신자: {self.from_email}")
-        logger.info(f"수신자: {len(self.to_emails)}명")
+        logger.info("SMTP 서버: %s:%s", self.host, self.port)
+        logger.info("발신자: %s", self.from_email)
+        logger.info("수신자: %s명", len(self.to_emails))
 
 
 def load_latest_briefing() -> Optional[str]:
@@ -66,32 +67,45 @@ def load_latest_briefing() -> Optional[str]:
     Returns:
         str: HTML 브리핑 내용 또는 None
     """
-    output_dir = Path(__file__).parent.parent / "output"
+    latest = get_output_store().latest(KIND_BRIEFING)
 
-    if not output_dir.exists():
-        logger.warning("output 디렉토리가 존재하지 않습니다.")
-        return None
-
-    # briefing_*.html 파일 찾기
-    briefing_files = list(output_dir.glob("briefing_*.html"))
-
-    if not briefing_files:
+    if not latest or "html" not in latest["files"]:
         logger.warning("브리핑 HTML 파일을 찾을 수 없습니다.")
         return None
 
-    # 가장 최근 파일 선택
-    latest_file = max(briefing_files, key=lambda f: f.stat().st_mtime)
-    logger.info(f"브리핑 파일 로드: {latest_file}")
+    latest_file = latest["files"]["html"]
+    logger.info("브리핑 파일 로드: %s", latest_file)
 
     with open(latest_file, 'r', encoding='utf-8') as f:
         return f.read()
 
 
+def load_inline_images(images: Dict[str, str]) -> Dict[str, bytes]:
+    """
+    CID 첨부용 이미지 파일 로드 (읽을 수 없는 파일은 제외)
+
+    Args:
+        images: Content-ID → PNG 파일 경로
+
+    Returns:
+        Dict[str, bytes]: Content-ID → PNG 바이트
+    """
+    loaded = {}
+    for cid, path in images.items():
+        try:
+            with open(path, 'rb') as f:
+                loaded[cid] = f.read()
+        except OSError as e:
+            logger.warning("첨부 이미지를 읽을 수 없습니다 (%s): %s", path, e)
+    return loaded
+
+
 def create_email_message(
     html_content: str,
     from_email: str,
     to_email: str,
-    subject: str
+    subject: str,
+    inline_images: Optional[Dict[str, bytes]] = None
 ) -> MIMEMultipart:
     """
     이메일 메시지 생성
@@ -101,34 +115,54 @@ def create_email_message(
         from_email: 발신자
         to_email: 수신자
         subject: 제목
+        inline_images: Content-ID → PNG 바이트 (HTML에서 "cid:..."로 참조), 선택
 
     Returns:
         MIMEMultipart: 이메일 메시지
     """
-    msg = MIMEMultipart('alternative')
+    # HTML 파트 추가
+    html_part = MIMEText(html_content, 'html', 'utf-8')
+
+    if inline_images:
+        # multipart/related: HTML 본문 + CID로 참조하는 인라인 이미지
+        msg = MIMEMultipart('related')
+        alternative = MIMEMultipart('alternative')
+        alternative.attach(html_part)
+        msg.attach(alternative)
+
+        for cid, data in inline_images.items():
+            image_part = MIMEImage(data, 'png')
+            image_part.add_header('Content-ID', f'<{cid}>')
+            image_part.add_header('Content-Disposition', 'inline', filename=f"{cid.split('@')[0]}.png")
+            msg.attach(image_part)
+    else:
+        msg = MIMEMultipart('alternative')
+        msg.attach(html_part)
+
     msg['Subject'] = subject
     msg['From'] = from_email
     msg['To'] = to_email
 
-    # HTML 파트 추가
-    html_part = MIMEText(html_content, 'html', 'utf-8')
-    msg.attach(html_part)
-
     return msg
 
 
 def send_email(
     config: EmailConfig,
     html_content: str,
-    subject: str
+    subject: str,
+    inline_images: Optional[Dict[str, bytes]] = None
 ) -> Dict[str, Any]:
     """
     이메일 발송
 
+    메시지(HTML 본문과 인라인 이미지 인코딩 포함)는 한 번만 만들고,
+    수신자마다 To 헤더만 바꿔 발송합니다.
+
     Args:
         config: 이메일 설정
         html_content: HTML 본문
         subject: 제목
+        inline_images: Content-ID → PNG 바이트, 선택
 
     Returns:
         Dict: 발송 결과
@@ -143,7 +177,7 @@ def send_email(
 
     try:
         # SMTP 서버 연결
-        logger.info(f"SMTP 서버 연결 중: {config.host}:{config.port}")
+        logger.info("SMTP 서버 연결 중: %s:%s", config.host, config.port)
 
         with smtplib.SMTP(config.host, config.port) as server:
             server.ehlo()
@@ -158,32 +192,35 @@ def send_email(
             server.login(config.user, config.password)
             logger.info("로그인 성공")
 
+            # 메시지 생성 (모든 수신자 공용)
+            msg = create_email_message(
+                html_content,
+                config.from_email,
+                config.to_emails[0],
+                subject,
+                inline_images
+            )
+
             # 각 수신자에게 발송
             for to_email in config.to_emails:
                 try:
-                    logger.info(f"이메일 발송 중: {to_email}")
+                    logger.info("이메일 발송 중: %s", to_email)
 
-                    # 메시지 생성
-                    msg = create_email_message(
-                        html_content,
-                        config.from_email,
-                        to_email,
-                        subject
-                    )
+                    msg.replace_header('To', to_email)
 
                     # 발송
                     server.send_message(msg)
                     sent_count += 1
 
-                    logger.info(f"✓ 발송 성공: {to_email}")
+                    logger.info("✓ 발송 성공: %s", to_email)
 
                 except Exception as e:
                     failed_count += 1
                     failed_emails.append(to_email)
-                    logger.error(f"✗ 발송 실패 ({to_email}): {e}")
+                    logger.error("✗ 발송 실패 (%s): %s", to_email, e)
 
         logger.info("=" * 60)
-        logger.info(f"이메일 발송 완료: 성공 {sent_count}건, 실패 {failed_count}건")
+        logger.info("이메일 발송 완료: 성공 %s건, 실패 %s건", sent_count, failed_count)
         logger.info("=" * 60)
 
         return {
@@ -207,10 +244,17 @@ def send_email(
         }
 
 
-def run_email_delivery() -> Dict[str, Any]:
+def run_email_delivery(
+    html_content: Optional[str] = None,
+    images: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
     """
     이메일 발송 실행
 
+    Args:
+        html_content: 발송할 HTML 브리핑 (기본값: output/의 최근 브리핑)
+        images: Content-ID → 인라인 이미지(PNG) 경로, 선택
+
     Returns:
         Dict: 발송 결과
     """
@@ -219,7 +263,8 @@ def run_email_delivery() -> Dict[str, Any]:
         config = EmailConfig()
 
         # 최근 브리핑 로드
-        html_content = load_latest_briefing()
+        if html_content is None:
+            html_content = load_latest_briefing()
         if not html_content:
             raise ValueError("브리핑 파일을 찾을 수 없습니다.")
 
@@ -227,8 +272,11 @@ def run_email_delivery() -> Dict[str, Any]:
         today = datetime.now().strftime("%Y-%m-%d")
         subject = f"🌅 굿모닝 월가 - {today} 데일리 브리핑"
 
+        # 인라인 이미지는 한 번만 로드하여 모든 수신자에게 재사용
+        inline_images = load_inline_images(images) if images else None
+
         # 이메일 발송
-        result = send_email(config, html_content, subject)
+        result = send_email(config, html_content, subject, inline_images)
 
         return result
 
@@ -254,7 +302,7 @@ def main():
             exit(1)
 
     except Exception as e:
-        logger.error(f"프로그램 실행 중 오류 발생: {e}")
+        logger.error("프로그램 실행 중 오류 발생: %s", e)
         print(f"✗ 오류: {e}")
         exit(1)
 
@@ -0,0 +1,360 @@
+"""
+마감 시간 기반 헤지(hedged) 업스트림 요청
+
+종목 상세 응답 시간의 꼬리(tail)는 가끔 몇 초씩 걸리는 Yahoo 응답이 좌우합니다.
+요청마다 마감 시간(Deadline)을 두고 각 모듈 조회를 다음과 같이 실행합니다.
+
+- 헤지: 첫 요청이 해당 모듈의 최근 p95 지연 시간 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+  먼저 끝난 응답을 사용 (느린 응답 한 건이 전체 응답을 붙잡지 않도록 함)
+- 마감: 마감 시간까지 끝나지 않은 모듈은 기다리지 않고 건너뛴 모듈(skipped)로 보고,
+  대기열에서 마감 이후에 시작되는 작업은 실행하지 않음
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from .tracing import trace_span
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 기본 설정 (환경 변수로 조정)
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "1") == "1"
+HEDGE_QUANTILE = float(os.getenv("HEDGE_QUANTILE", "0.95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_DEFAULT_DELAY_SECONDS = int(os.getenv("HEDGE_DEFAULT_DELAY_MS", "800")) / 1000
+HEDGE_MIN_DELAY_SECONDS = int(os.getenv("HEDGE_MIN_DELAY_MS", "50")) / 1000
+HEDGE_MAX_WORKERS = int(os.getenv("HEDGE_MAX_WORKERS", "16"))
+DEFAULT_DEADLINE_SECONDS = int(os.getenv("UPSTREAM_DEFAULT_DEADLINE_MS", "30000")) / 1000
+
+LATENCY_WINDOW = 256
+
+# 마감 이후 시작되어 실행하지 않은 작업 표시
+_DROPPED = object()
+
+
+class DeadlineExceededError(Exception):
+    """마감 시간 안에 업스트림 응답을 받지 못함"""
+
+    def __init__(self, key: str):
+        """
+        DeadlineExceededError 초기화
+
+        Args:
+            key: 마감을 넘긴 요청 이름 (모듈 이름 등)
+        """
+        self.key = key
+        super().__init__(f"'{key}' 조회가 마감 시간 안에 끝나지 않았습니다")
+
+
+class Deadline:
+    """요청 단위 마감 시간"""
+
+    def __init__(self, seconds: float = DEFAULT_DEADLINE_SECONDS):
+        """
+        Deadline 초기화
+
+        Args:
+            seconds: 지금부터 마감까지 시간 (초)
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """마감까지 남은 시간 (초, 지났으면 0)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """마감 여부"""
+        return time.monotonic() >= self.expires_at
+
+
+class LatencyTracker:
+    """요청 이름별 최근 지연 시간 분위수 추적"""
+
+    def __init__(
+        self,
+        quantile: float = HEDGE_QUANTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        default_delay: float = HEDGE_DEFAULT_DELAY_SECONDS,
+        min_delay: float = HEDGE_MIN_DELAY_SECONDS,
+        window: int = LATENCY_WINDOW
+    ):
+        """
+        LatencyTracker 초기화
+
+        Args:
+            quantile: 헤지 기준 분위수 (기본값: 0.95)
+            min_samples: 분위수를 사용하기 위한 최소 표본 수 (부족하면 default_delay 사용)
+            default_delay: 표본이 부족할 때 헤지 대기 시간 (초)
+            min_delay: 헤지 대기 시간 하한 (초)
+            window: 요청 이름별 보관하는 최근 표본 수
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """
+        지연 시간 기록
+
+        Args:
+            key: 요청 이름
+            seconds: 지연 시간 (초)
+        """
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, key: str, quantile: float) -> Optional[float]:
+        """
+        지연 시간 분위수
+
+        Args:
+            key: 요청 이름
+            quantile: 분위수 (0~1)
+
+        Returns:
+            float: 분위수 지연 시간 (초) 또는 None (표본 부족)
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(quantile * len(samples)))]
+
+    def hedge_delay(self, key: str) -> float:
+        """
+        두 번째 요청을 보내기까지 기다릴 시간
+
+        Args:
+            key: 요청 이름
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        delay = self.percentile(key, self.quantile)
+        if delay is None:
+            delay = self.default_delay
+        return max(self.min_delay, delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        요청 이름별 지연 시간 통계
+
+        Returns:
+            Dict: 요청 이름 → 표본 수, p50/p95 (ms), 현재 헤지 대기 시간 (ms)
+        """
+        with self._lock:
+            keys = list(self._samples)
+
+        result = {}
+        for key in keys:
+            p50 = self.percentile(key, 0.5)
+            p95 = self.percentile(key, 0.95)
+            result[key] = {
+                "samples": len(self._samples[key]),
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "hedge_delay_ms": round(self.hedge_delay(key) * 1000, 1),
+            }
+        return result
+
+
+class HedgedExecutor:
+    """마감 시간 기반 헤지 요청 실행기"""
+
+    def __init__(
+        self,
+        tracker: Optional[LatencyTracker] = None,
+        max_workers: int = HEDGE_MAX_WORKERS,
+        enabled: bool = HEDGE_ENABLED
+    ):
+        """
+        HedgedExecutor 초기화
+
+        Args:
+            tracker: 지연 시간 추적기 (기본값: 환경 변수 설정)
+            max_workers: 업스트림 호출 스레드 수
+            enabled: 헤지 요청 사용 여부 (False면 마감 시간만 적용)
+        """
+        self.tracker = tracker or LatencyTracker()
+        self.enabled = enabled
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged")
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "deadline_skipped": 0,
+            "dropped": 0,
+        }
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def _attempt(self, key: str, func: Callable[[], Any], deadline: Deadline) -> Any:
+        # 대기열에 있는 동안 마감이 지났으면 호출하지 않음
+        if deadline.expired:
+            self._count("dropped")
+            return _DROPPED
+
+        started = time.monotonic()
+        with trace_span(key):
+            result = func()
+        self.tracker.record(key, time.monotonic() - started)
+        return result
+
+    def _submit(self, key: str, func: Callable[[], Any], deadline: Deadline) -> Future:
+        # 요청 추적 span이 헤지 실행기 스레드에서도 이어지도록 호출 컨텍스트를 복사
+        return self._pool.submit(contextvars.copy_context().run, self._attempt, key, func, deadline)
+
+    def run_all(
+        self,
+        calls: Dict[str, Callable[[], Any]],
+        deadline: Deadline
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception], List[str]]:
+        """
+        여러 요청을 동시에 실행 (요청별 헤지, 공통 마감 시간)
+
+        요청이 예외로 끝나면 헤지하지 않고 바로 실패로 기록합니다.
+        (호출 실패는 업스트림 보호기가 처리하며, 헤지는 느린 응답에만 사용)
+
+        Args:
+            calls: 요청 이름 → 인자 없는 호출 함수
+            deadline: 마감 시간
+
+        Returns:
+            Tuple[Dict, Dict, List]: (요청 이름별 결과, 요청 이름별 예외, 마감으로 건너뛴 요청 이름)
+        """
+        self._count("requests", len(calls))
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+
+        if deadline.expired:
+            self._count("deadline_skipped", len(calls))
+            return results, errors, list(calls)
+
+        attempts: Dict[str, List[Future]] = {}
+        owners: Dict[Future, str] = {}
+        hedge_at: Dict[str, float] = {}
+        now = time.monotonic()
+
+        for key, func in calls.items():
+            future = self._submit(key, func, deadline)
+            attempts[key] = [future]
+            owners[future] = key
+            hedge_at[key] = now + self.tracker.hedge_delay(key) if self.enabled else float("inf")
+
+        pending = set(owners)
+        unresolved = set(calls)
+
+        while unresolved and not deadline.expired:
+            next_hedge = min((hedge_at[key] for key in unresolved), default=float("inf"))
+            timeout = min(deadline.remaining(), max(0.0, next_hedge - time.monotonic()))
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = owners[future]
+                if key not in unresolved:
+                    continue
+
+                error = future.exception()
+                if error is None and future.result() is not _DROPPED:
+                    results[key] = future.result()
+                    unresolved.discard(key)
+                    if future is not attempts[key][0]:
+                        self._count("hedge_wins")
+                elif error is not None and all(attempt.done() for attempt in attempts[key]):
+                    errors[key] = error
+                    unresolved.discard(key)
+
+            # p95 안에 끝나지 않은 요청은 한 번 더 보냄
+            now = time.monotonic()
+            for key in unresolved:
+                if hedge_at[key] <= now and not deadline.expired:
+                    hedge_at[key] = float("inf")
+                    if attempts[key][0].done():
+                        continue
+                    future = self._submit(key, calls[key], deadline)
+                    attempts[key].append(future)
+                    owners[future] = key
+                    pending.add(future)
+                    self._count("hedged")
+                    logger.info("헤지 요청 전송: %s (%.0fms 초과)", key, self.tracker.hedge_delay(key) * 1000)
+
+        skipped = [key for key in calls if key in unresolved]
+        if skipped:
+            self._count("deadline_skipped", len(skipped))
+            logger.warning("마감 시간(%.1f초) 초과로 건너뜀: %s", deadline.seconds, ', '.join(skipped))
+
+        return results, errors, skipped
+
+    def call(self, key: str, func: Callable[[], Any], deadline: Deadline) -> Any:
+        """
+        단일 요청 실행 (헤지, 마감 시간 적용)
+
+        Args:
+            key: 요청 이름 (지연 시간 통계 단위)
+            func: 인자 없는 호출 함수
+            deadline: 마감 시간
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            DeadlineExceededError: 마감 시간 안에 응답을 받지 못한 경우
+            Exception: 함수가 발생시킨 예외
+        """
+        results, errors, _ = self.run_all({key: func}, deadline)
+        if key in results:
+            return results[key]
+        if key in errors:
+            raise errors[key]
+        raise DeadlineExceededError(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        헤지/마감 통계
+
+        Returns:
+            Dict: 요청/헤지/헤지 승리/마감 건너뜀/실행 취소 횟수, 요청 이름별 지연 시간
+        """
+        with self._lock:
+            counters = dict(self._counters)
+
+        return {
+            **counters,
+            "hedge_rate": round(counters["hedged"] / counters["requests"], 4) if counters["requests"] else 0.0,
+            "latency": self.tracker.stats(),
+        }
+
+
+_default_executor: Optional[HedgedExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_hedged_executor() -> HedgedExecutor:
+    """
+    프로세스 공용 헤지 요청 실행기 반환
+
+    Returns:
+        HedgedExecutor: 공용 실행기
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = HedgedExecutor()
+        return _default_executor
@@ -0,0 +1,491 @@
+"""
+미국 주식시장 캘린더
+
+NYSE 휴장일, 조기 폐장일, 프리/애프터마켓 시간과 미국 동부(ET) / 한국(KST) 시간 변환을
+외부 API나 시간대 데이터베이스 없이 계산합니다. 시장이 닫혀 있는 동안에는 Yahoo 응답이 바뀌지 않으므로
+캐시 유지 시간을 다음 세션 시작까지 늘리고, 새 거래 세션이 없는 날에는 브리핑 작업을 건너뜁니다.
+
+세션 (ET 기준):
+    - pre: 04:00 ~ 09:30
+    - regular: 09:30 ~ 16:00 (조기 폐장일 13:00)
+    - post: 16:00 ~ 20:00 (조기 폐장일 17:00)
+    - closed: 그 외 시간, 주말, 휴장일
+
+휴장일 규칙 (NYSE Rule 7.2):
+    - 고정일 휴일이 토요일이면 전 금요일, 일요일이면 다음 월요일에 휴장
+    - 단, 새해 첫날이 토요일이면 대체 휴장 없음 (전년도 12월 31일은 정상 개장)
+    - 임시 휴장(국가 애도일 등)은 MARKET_EXTRA_HOLIDAYS로 추가
+
+서머타임: 3월 둘째 일요일 02:00 ~ 11월 첫째 일요일 02:00 (EDT, UTC-4), 그 외 EST (UTC-5)
+"""
+
+import argparse
+import functools
+import os
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+KST = timezone(timedelta(hours=9), "KST")
+EST = timezone(timedelta(hours=-5), "EST")
+EDT = timezone(timedelta(hours=-4), "EDT")
+
+# 세션 이름
+SESSION_PRE = "pre"
+SESSION_REGULAR = "regular"
+SESSION_POST = "post"
+SESSION_CLOSED = "closed"
+
+# 세션 경계 (ET 벽시계 시각)
+PRE_MARKET_OPEN = dt_time(4, 0)
+REGULAR_OPEN = dt_time(9, 30)
+REGULAR_CLOSE = dt_time(16, 0)
+EARLY_CLOSE = dt_time(13, 0)
+POST_MARKET_CLOSE = dt_time(20, 0)
+EARLY_POST_MARKET_CLOSE = dt_time(17, 0)
+
+# 시장 시간 기반 캐시 유지 시간 (off이면 설정된 TTL을 그대로 사용)
+MARKET_CALENDAR_TTL = os.getenv("MARKET_CALENDAR_TTL", "on").lower() != "off"
+# 프리/애프터마켓 동안 TTL 배수 (시간외 가격은 정규장보다 느리게 바뀜)
+MARKET_EXTENDED_TTL_MULTIPLIER = float(os.getenv("MARKET_EXTENDED_TTL_MULTIPLIER", "4"))
+# 장이 닫혀 있을 때 최대 유지 시간 (초) - 다음 세션 시작과 이 값 중 빠른 시점에 만료
+MARKET_CLOSED_TTL_MAX_SECONDS = int(os.getenv("MARKET_CLOSED_TTL_MAX_SECONDS", str(12 * 3600)))
+# 임시 휴장일 (쉼표 구분, YYYY-MM-DD)
+MARKET_EXTRA_HOLIDAYS = os.getenv("MARKET_EXTRA_HOLIDAYS", "")
+
+# 이전/다음 거래일 탐색 최대 일수 (주말 + 연휴)
+MAX_SEARCH_DAYS = 10
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """월의 n번째 요일 (weekday: 월요일 0 ~ 일요일 6)"""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """월의 마지막 요일 (12월 제외)"""
+    last = date(year, month + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian 알고리즘)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    day = (h + l - 7 * m + 33 * month + 19) % 32
+    return date(year, month, day)
+
+
+def _observed(day: date) -> date:
+    """고정일 휴일의 실제 휴장일 (토요일 → 금요일, 일요일 → 월요일)"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@functools.lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> Dict[date, str]:
+    """
+    NYSE 정기 휴장일
+
+    Args:
+        year: 연도
+
+    Returns:
+        Dict[date, str]: 휴장일 → 휴일 이름
+    """
+    holidays = {}
+
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+
+    holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_last_weekday(year, 5, 0)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+    return holidays
+
+
+@functools.lru_cache(maxsize=None)
+def nyse_early_closes(year: int) -> Dict[date, str]:
+    """
+    NYSE 조기 폐장일 (정규장 13:00 마감)
+
+    독립기념일 전날, 추수감사절 다음 날, 크리스마스 이브 중 평일이면서 휴장일이 아닌 날입니다.
+
+    Args:
+        year: 연도
+
+    Returns:
+        Dict[date, str]: 조기 폐장일 → 사유
+    """
+    holidays = nyse_holidays(year)
+    candidates = {
+        date(year, 7, 3): "Independence Day Eve",
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1): "Day after Thanksgiving",
+        date(year, 12, 24): "Christmas Eve",
+    }
+    return {day: name for day, name in candidates.items() if day.weekday() < 5 and day not in holidays}
+
+
+def _is_dst_date(day: date) -> bool:
+    """ET 날짜의 서머타임 적용 여부 (02:00 이후 기준)"""
+    return _nth_weekday(day.year, 3, 6, 2) <= day < _nth_weekday(day.year, 11, 6, 1)
+
+
+def to_eastern(when: datetime) -> datetime:
+    """
+    미국 동부 시간으로 변환 (naive datetime은 시스템 로컬 시간으로 간주)
+
+    Args:
+        when: 변환할 시각
+
+    Returns:
+        datetime: EST 또는 EDT 시각
+    """
+    utc = when.astimezone(timezone.utc)
+    dst_start = datetime.combine(_nth_weekday(utc.year, 3, 6, 2), dt_time(7), tzinfo=timezone.utc)
+    dst_end = datetime.combine(_nth_weekday(utc.year, 11, 6, 1), dt_time(6), tzinfo=timezone.utc)
+    return utc.astimezone(EDT if dst_start <= utc < dst_end else EST)
+
+
+def to_kst(when: datetime) -> datetime:
+    """
+    한국 시간으로 변환 (naive datetime은 시스템 로컬 시간으로 간주)
+
+    Args:
+        when: 변환할 시각
+
+    Returns:
+        datetime: KST 시각
+    """
+    return when.astimezone(KST)
+
+
+def eastern_datetime(day: date, wall_time: dt_time) -> datetime:
+    """
+    ET 날짜와 벽시계 시각으로 시각 생성 (서머타임 전환 시각인 02:00 ~ 03:00은 지원하지 않음)
+
+    Args:
+        day: ET 날짜
+        wall_time: ET 벽시계 시각
+
+    Returns:
+        datetime: EST 또는 EDT 시각
+    """
+    return datetime.combine(day, wall_time, tzinfo=EDT if _is_dst_date(day) else EST)
+
+
+@functools.lru_cache(maxsize=1024)
+def _session_bounds(day: date, early_close: bool) -> Tuple[float, float, float, float]:
+    """거래일 세션 경계 epoch 초 (프리마켓 시작, 정규장 시작, 정규장 마감, 애프터마켓 마감)"""
+    return (
+        eastern_datetime(day, PRE_MARKET_OPEN).timestamp(),
+        eastern_datetime(day, REGULAR_OPEN).timestamp(),
+        eastern_datetime(day, EARLY_CLOSE if early_close else REGULAR_CLOSE).timestamp(),
+        eastern_datetime(day, EARLY_POST_MARKET_CLOSE if early_close else POST_MARKET_CLOSE).timestamp(),
+    )
+
+
+def _parse_dates(value: str) -> set:
+    """쉼표 구분 YYYY-MM-DD 목록 파싱 (잘못된 항목은 경고 후 무시)"""
+    days = set()
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            days.add(date.fromisoformat(item))
+        except ValueError:
+            logger.warning("MARKET_EXTRA_HOLIDAYS 항목을 무시합니다: %s", item)
+    return days
+
+
+class MarketCalendar:
+    """NYSE 거래 일정 계산 (휴장일, 조기 폐장일, 프리/애프터마켓)"""
+
+    def __init__(
+        self,
+        extra_holidays: Optional[Iterable[date]] = None,
+        ttl_enabled: bool = MARKET_CALENDAR_TTL,
+        extended_ttl_multiplier: float = MARKET_EXTENDED_TTL_MULTIPLIER,
+        closed_ttl_max_seconds: int = MARKET_CLOSED_TTL_MAX_SECONDS
+    ):
+        """
+        MarketCalendar 초기화
+
+        Args:
+            extra_holidays: 임시 휴장일 (기본값: MARKET_EXTRA_HOLIDAYS)
+            ttl_enabled: 시장 시간 기반 캐시 유지 시간 사용 여부 (False이면 설정된 TTL 그대로)
+            extended_ttl_multiplier: 프리/애프터마켓 동안 TTL 배수
+            closed_ttl_max_seconds: 장이 닫혀 있을 때 최대 유지 시간 (초)
+        """
+        self.extra_holidays = (
+            set(extra_holidays) if extra_holidays is not None else _parse_dates(MARKET_EXTRA_HOLIDAYS)
+        )
+        self.ttl_enabled = ttl_enabled
+        self.extended_ttl_multiplier = extended_ttl_multiplier
+        self.closed_ttl_max_seconds = closed_ttl_max_seconds
+
+    def holiday_name(self, day: date) -> Optional[str]:
+        """
+        휴장일 이름
+
+        Args:
+            day: ET 날짜
+
+        Returns:
+            str: 휴일 이름 (휴장일이 아니면 None, 주말은 None)
+        """
+        if day in self.extra_holidays:
+            return "Unscheduled closure"
+        return nyse_holidays(day.year).get(day)
+
+    def is_trading_day(self, day: date) -> bool:
+        """ET 날짜의 거래일 여부 (주말, 휴장일 제외)"""
+        return day.weekday() < 5 and self.holiday_name(day) is None
+
+    def is_half_day(self, day: date) -> bool:
+        """ET 날짜의 조기 폐장 여부"""
+        return day in nyse_early_closes(day.year) and self.is_trading_day(day)
+
+    def trading_hours(self, day: date) -> Optional[Dict[str, datetime]]:
+        """
+        거래일 세션 시각
+
+        Args:
+            day: ET 날짜
+
+        Returns:
+            Dict: pre_open, open, close, post_close (ET 시각, 거래일이 아니면 None)
+        """
+        if not self.is_trading_day(day):
+            return None
+        early = self.is_half_day(day)
+        return {
+            "pre_open": eastern_datetime(day, PRE_MARKET_OPEN),
+            "open": eastern_datetime(day, REGULAR_OPEN),
+            "close": eastern_datetime(day, EARLY_CLOSE if early else REGULAR_CLOSE),
+            "post_close": eastern_datetime(day, EARLY_POST_MARKET_CLOSE if early else POST_MARKET_CLOSE),
+        }
+
+    def _session_at(self, timestamp: float, extended_hours: bool = True) -> Tuple[str, float]:
+        """
+        시각의 세션과 다음 세션 경계
+
+        Args:
+            timestamp: epoch 초
+            extended_hours: False이면 프리/애프터마켓을 장 마감으로 취급
+
+        Returns:
+            Tuple[str, float]: (세션 이름, 다음 세션 경계 epoch 초)
+        """
+        day = to_eastern(datetime.fromtimestamp(timestamp, timezone.utc)).date()
+
+        if self.is_trading_day(day):
+            pre_open, open_, close, post_close = _session_bounds(day, self.is_half_day(day))
+            if extended_hours:
+                boundaries = (
+                    (pre_open, SESSION_PRE), (open_, SESSION_REGULAR),
+                    (close, SESSION_POST), (post_close, SESSION_CLOSED),
+                )
+            else:
+                boundaries = ((open_, SESSION_REGULAR), (close, SESSION_CLOSED))
+
+            session = SESSION_CLOSED
+            for boundary, next_session in boundaries:
+                if timestamp < boundary:
+                    return session, boundary
+                session = next_session
+
+        # 오늘 세션이 끝났거나 거래일이 아님 - 다음 거래일 첫 세션까지 닫힘
+        for offset in range(1, MAX_SEARCH_DAYS + 1):
+            next_day = day + timedelta(days=offset)
+            if self.is_trading_day(next_day):
+                bounds = _session_bounds(next_day, self.is_half_day(next_day))
+                return SESSION_CLOSED, bounds[0] if extended_hours else bounds[1]
+        return SESSION_CLOSED, timestamp + self.closed_ttl_max_seconds
+
+    def session_at(self, when: Optional[datetime] = None, extended_hours: bool = True) -> str:
+        """
+        시각의 세션 이름
+
+        Args:
+            when: 확인할 시각 (기본값: 현재)
+            extended_hours: False이면 프리/애프터마켓을 closed로 취급
+
+        Returns:
+            str: pre, regular, post, closed
+        """
+        timestamp = when.timestamp() if when is not None else time.time()
+        return self._session_at(timestamp, extended_hours)[0]
+
+    def expires_at(self, fetched_at: float, base_seconds: float, extended_hours: bool = True) -> float:
+        """
+        조회 시각 기준 캐시 만료 시각
+
+        - 정규장: 조회 시각 + base_seconds
+        - 프리/애프터마켓: base_seconds × MARKET_EXTENDED_TTL_MULTIPLIER (다음 세션 경계 이전까지)
+        - 장 마감: 다음 세션 시작까지 (최대 MARKET_CLOSED_TTL_MAX_SECONDS)
+        어느 경우든 base_seconds보다 짧아지지 않습니다.
+
+        Args:
+            fetched_at: 조회 시각 (epoch 초)
+            base_seconds: 정규장 기준 유지 시간 (초)
+            extended_hours: 시간외 거래에도 바뀌는 데이터인지 여부
+                (가격 모듈은 True, 스크리너 순위와 정규장 차트는 False)
+
+        Returns:
+            float: 만료 시각 (epoch 초)
+        """
+        base_expiry = fetched_at + base_seconds
+        if not self.ttl_enabled:
+            return base_expiry
+
+        session, boundary = self._session_at(fetched_at, extended_hours)
+        if session == SESSION_REGULAR:
+            return base_expiry
+        if session == SESSION_CLOSED:
+            window = self.closed_ttl_max_seconds
+        else:
+            window = base_seconds * self.extended_ttl_multiplier
+        return max(base_expiry, min(fetched_at + window, boundary))
+
+    def cache_ttl(self, base_seconds: float, extended_hours: bool = True) -> float:
+        """
+        지금 저장할 캐시의 유지 시간
+
+        Args:
+            base_seconds: 정규장 기준 유지 시간 (초)
+            extended_hours: 시간외 거래에도 바뀌는 데이터인지 여부
+
+        Returns:
+            float: 유지 시간 (초, base_seconds 이상)
+        """
+        now = time.time()
+        return self.expires_at(now, base_seconds, extended_hours) - now
+
+    def last_close(self, when: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        가장 최근 정규장 마감 시각
+
+        Args:
+            when: 기준 시각 (기본값: 현재)
+
+        Returns:
+            datetime: ET 마감 시각 (탐색 범위 안에 없으면 None)
+        """
+        now = when or datetime.now(timezone.utc)
+        day = to_eastern(now).date()
+        for offset in range(MAX_SEARCH_DAYS + 1):
+            hours = self.trading_hours(day - timedelta(days=offset))
+            if hours and hours["close"] <= now:
+                return hours["close"]
+        return None
+
+    def next_open(self, when: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        다음 정규장 시작 시각
+
+        Args:
+            when: 기준 시각 (기본값: 현재)
+
+        Returns:
+            datetime: ET 시작 시각 (탐색 범위 안에 없으면 None)
+        """
+        now = when or datetime.now(timezone.utc)
+        day = to_eastern(now).date()
+        for offset in range(MAX_SEARCH_DAYS + 1):
+            hours = self.trading_hours(day + timedelta(days=offset))
+            if hours and hours["open"] > now:
+                return hours["open"]
+        return None
+
+    def status(self, when: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        현재 시장 상태 (헬스 체크용)
+
+        Args:
+            when: 기준 시각 (기본값: 현재)
+
+        Returns:
+            Dict: session, eastern_time, kst_time, trading_day, half_day, holiday, next_change, ttl_enabled
+        """
+        now = when or datetime.now(timezone.utc)
+        day = to_eastern(now).date()
+        session, boundary = self._session_at(now.timestamp())
+        return {
+            "session": session,
+            "eastern_time": to_eastern(now).isoformat(timespec="seconds"),
+            "kst_time": to_kst(now).isoformat(timespec="seconds"),
+            "trading_day": self.is_trading_day(day),
+            "half_day": self.is_half_day(day),
+            "holiday": self.holiday_name(day),
+            "next_change": to_eastern(datetime.fromtimestamp(boundary, timezone.utc)).isoformat(timespec="seconds"),
+            "ttl_enabled": self.ttl_enabled,
+        }
+
+
+_default_calendar: Optional[MarketCalendar] = None
+_default_calendar_lock = threading.Lock()
+
+
+def get_market_calendar() -> MarketCalendar:
+    """
+    프로세스 공용 시장 캘린더 반환 (환경 변수 설정 사용)
+
+    Returns:
+        MarketCalendar: 공용 캘린더
+    """
+    global _default_calendar
+    with _default_calendar_lock:
+        if _default_calendar is None:
+            _default_calendar = MarketCalendar()
+        return _default_calendar
+
+
+def main():
+    """현재 시장 상태와 연도별 휴장일 / 조기 폐장일 출력"""
+    parser = argparse.ArgumentParser(description="NYSE 시장 캘린더")
+    parser.add_argument("--year", type=int, default=None, help="휴장일을 출력할 연도 (기본값: 올해)")
+    args = parser.parse_args()
+
+    calendar = get_market_calendar()
+    for key, value in calendar.status().items():
+        print(f"{key:<14}{value}")
+
+    year = args.year or to_eastern(datetime.now(timezone.utc)).year
+    print(f"\n{year} 휴장일")
+    extra = {day: calendar.holiday_name(day) for day in calendar.extra_holidays if day.year == year}
+    for day, name in sorted({**nyse_holidays(year), **extra}.items()):
+        print(f"  {day.isoformat()} ({day.strftime('%a')})  {name}")
+    print(f"\n{year} 조기 폐장일 (13:00 ET)")
+    for day, name in sorted(nyse_early_closes(year).items()):
+        print(f"  {day.isoformat()} ({day.strftime('%a')})  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+시장 데이터 접근 계층
+
+/api 라우트(화제 종목 대시보드, 차트, 검색), /stocks 라우트, 아침 브리핑 파이프라인이 모두
+이 객체를 통해 Yahoo를 호출합니다. 프로세스마다 아래 구성 요소를 하나씩만 두므로
+라우트 묶음이 늘어나도 업스트림 호출 한도와 캐시를 나눠 쓰지 않습니다.
+
+구성 요소:
+    - session: 공용 Yahoo 세션 (쿠키/crumb, 연결 풀)
+    - guard: 속도 제한 + 서킷 브레이커
+    - executor: 마감 시간 기반 헤지 요청 실행기
+    - negative_cache: 존재하지 않는 종목 캐시
+    - cache: 워커 간 공유 캐시 (CACHE_BACKEND=none이면 사용 안 함)
+    - calendar: 시장 캘린더 (장이 닫혀 있는 동안 캐시 유지 시간 연장)
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
+import os
+import threading
+
+from .hedged_request import HedgedExecutor, get_hedged_executor
+from .market_calendar import MarketCalendar, get_market_calendar
+from .negative_cache import NegativeCache
+from .shared_cache import SharedCache, get_shared_cache
+from .upstream_guard import UpstreamGuard, get_upstream_guard
+from .yahoo_session import YahooSessionProvider, get_session_provider
+from .utils import LoggerFactory
+
+if TYPE_CHECKING:
+    from yahooquery import Screener, Ticker
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 스크리너 결과 공유 캐시 유지 시간 (초, 정규장 기준)
+SCREENER_CACHE_SECONDS = int(os.getenv("SCREENER_CACHE_SECONDS", "60"))
+
+
+class MarketDataClient:
+    """Yahoo 조회 단일 진입점 (모든 호출은 속도 제한/서킷 브레이커를 거침)"""
+
+    def __init__(
+        self,
+        session: Optional[YahooSessionProvider] = None,
+        guard: Optional[UpstreamGuard] = None,
+        executor: Optional[HedgedExecutor] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        cache: Optional[SharedCache] = None,
+        calendar: Optional[MarketCalendar] = None
+    ):
+        """
+        MarketDataClient 초기화 (외부 API 호출 없음)
+
+        Args:
+            session: Yahoo 세션 제공자 (기본값: 프로세스 공용 제공자)
+            guard: 업스트림 호출 보호기 (기본값: 프로세스 공용 보호기)
+            executor: 헤지 요청 실행기 (기본값: 프로세스 공용 실행기)
+            negative_cache: 존재하지 않는 종목 캐시 (기본값: 환경 변수 설정)
+            cache: 워커 간 공유 캐시 (기본값: 프로세스 공용 캐시)
+            calendar: 시장 캘린더 (기본값: 프로세스 공용 캘린더)
+        """
+        self.session = session or get_session_provider()
+        self.guard = guard or get_upstream_guard()
+        self.executor = executor or get_hedged_executor()
+        self.negative_cache = negative_cache or NegativeCache()
+        self.cache = cache or get_shared_cache()
+        self.calendar = calendar or get_market_calendar()
+        # Screener는 생성 시 Yahoo 세션(쿠키/crumb)을 준비하므로 처음 사용할 때 생성
+        self._screener: Optional["Screener"] = None
+        self._screener_lock = threading.Lock()
+
+    @property
+    def screener(self) -> "Screener":
+        """공용 세션을 사용하는 Screener (처음 접근할 때 생성, 모든 서비스가 공유)"""
+        if self._screener is None:
+            with self._screener_lock:
+                if self._screener is None:
+                    self._screener = self.session.screener()
+        return self._screener
+
+    def ticker(self, symbols: Union[str, List[str]], **kwargs) -> "Ticker":
+        """
+        공용 세션을 사용하는 Ticker 생성 (속성 조회는 get_module로 보호)
+
+        Args:
+            symbols: 종목 심볼 또는 심볼 리스트
+            **kwargs: Ticker 추가 인자
+
+        Returns:
+            Ticker: yahooquery Ticker
+        """
+        return self.session.ticker(symbols, **kwargs)
+
+    def get_screeners(self, screener_types: Union[str, List[str]], count: int = 25) -> Any:
+        """
+        스크리너 조회
+
+        Args:
+            screener_types: 스크리너 타입 또는 타입 리스트
+            count: 스크리너당 종목 수
+
+        Returns:
+            Dict: 스크리너 타입 → 결과 (조회 실패 시 값이 에러 문자열)
+
+        Raises:
+            UpstreamUnavailableError: 속도 제한 또는 서킷 브레이커로 거절된 경우
+        """
+        return self.guard.call(self.screener.get_screeners, screener_types, count)
+
+    def get_cached_screener(
+        self,
+        screener_type: str,
+        count: int = 25,
+        ttl_seconds: float = SCREENER_CACHE_SECONDS
+    ) -> Any:
+        """
+        스크리너 하나 조회 (공유 캐시 사용, 장이 닫혀 있으면 다음 정규장 시작까지 유지)
+
+        Args:
+            screener_type: 스크리너 타입
+            count: 종목 수
+            ttl_seconds: 정규장 기준 유지 시간 (초)
+
+        Returns:
+            Dict: 스크리너 타입 → 결과 (조회 실패 시 값이 에러 문자열, 저장하지 않음)
+
+        Raises:
+            UpstreamUnavailableError: 속도 제한 또는 서킷 브레이커로 거절된 경우
+        """
+        return self.cache.get_or_load(
+            f"screener:{screener_type}:{count}",
+            lambda: self.get_screeners([screener_type], count),
+            self.calendar.cache_ttl(ttl_seconds, extended_hours=False),
+            cacheable=lambda data: isinstance(data, dict) and isinstance(data.get(screener_type), dict)
+        )
+
+    def get_module(self, ticker: "Ticker", module_name: str) -> Any:
+        """
+        Ticker 모듈 속성 조회 (price, summary_detail, financial_data 등)
+
+        Args:
+            ticker: ticker()로 만든 Ticker
+            module_name: Ticker 속성 이름
+
+        Returns:
+            Dict: 심볼 → 모듈 데이터 (조회 실패 시 값이 에러 문자열)
+
+        Raises:
+            UpstreamUnavailableError: 속도 제한 또는 서킷 브레이커로 거절된 경우
+        """
+        return self.guard.call(getattr, ticker, module_name)
+
+    def get_modules(self, symbol: str, modules: List[str]) -> Any:
+        """
+        quoteSummary 여러 모듈 한 번에 조회
+
+        Args:
+            symbol: 종목 심볼
+            modules: Yahoo 모듈 이름 리스트 (price, summaryDetail, assetProfile 등)
+
+        Returns:
+            Dict: 심볼 → 모듈 이름 → 데이터 (조회 실패 시 값이 에러 문자열)
+
+        Raises:
+            UpstreamUnavailableError: 속도 제한 또는 서킷 브레이커로 거절된 경우
+        """
+        return self.guard.call(lambda: self.ticker(symbol).get_modules(modules))
+
+    def history(self, symbols: Union[str, List[str]], period: str, interval: str) -> Any:
+        """
+        시세 이력 일괄 조회
+
+        Args:
+            symbols: 종목 심볼 또는 심볼 리스트
+            period: 조회 기간 (1d, 5d, 1mo 등)
+            interval: 시세 간격 (5m, 1d 등)
+
+        Returns:
+            DataFrame 또는 Dict: (심볼, 날짜) 인덱스 DataFrame, 모두 실패하면 심볼 → 에러 메시지
+
+        Raises:
+            UpstreamUnavailableError: 속도 제한 또는 서킷 브레이커로 거절된 경우
+        """
+        return self.guard.call(lambda: self.ticker(symbols).history(period=period, interval=interval))
+
+    def warm(self) -> bool:
+        """
+        Yahoo 세션 미리 준비 (앱 시작 시 호출)
+
+        Returns:
+            bool: 준비 성공 여부
+        """
+        return self.session.warm()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        구성 요소별 상태
+
+        Returns:
+            Dict: upstream, yahoo_session, hedging, negative_cache, shared_cache, market
+        """
+        return {
+            "upstream": self.guard.stats(),
+            "yahoo_session": self.session.stats(),
+            "hedging": self.executor.stats(),
+            "negative_cache": self.negative_cache.stats(),
+            "shared_cache": self.cache.stats(),
+            "market": self.calendar.status(),
+        }
+
+
+_default_client: Optional[MarketDataClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_market_data() -> MarketDataClient:
+    """
+    프로세스 공용 시장 데이터 접근 객체 반환 (모든 라우트와 서비스가 공유)
+
+    Returns:
+        MarketDataClient: 공용 접근 객체
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = MarketDataClient()
+        return _default_client
@@ -0,0 +1,418 @@
+"""
+Prometheus 형식 메트릭 서비스
+
+외부 패키지 없이 Counter / Gauge / Histogram을 제공하고 /metrics 엔드포인트용
+Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 운영 중에도 켜 둘 수 있도록 호출 비용을 줄였습니다.
+
+- 라벨 조합마다 자식(child) 객체를 한 번만 만들고, 자주 쓰는 조합은 모듈 로드 시 미리 바인딩
+- Histogram.observe는 고정 버킷에서 bisect로 위치를 찾아 카운터만 증가
+- 캐시 적중률처럼 이미 stats()로 집계하는 값은 호출 경로를 건드리지 않고
+  /metrics 조회 시점에 수집기(collector)로 읽음
+"""
+
+from bisect import bisect_left
+from typing import Dict, Any, Callable, Iterable, List, Tuple
+import threading
+import time
+
+# Prometheus 텍스트 형식 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 수집기 반환 항목: (메트릭 이름, 타입, 설명, 라벨, 값)
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _CounterChild:
+    """라벨 조합 하나의 누적 카운터"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def samples(self, name: str, labels: Dict[str, str]) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(f"{name}_total", labels, self._value)]
+
+
+class _GaugeChild:
+    """라벨 조합 하나의 현재 값"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def samples(self, name: str, labels: Dict[str, str]) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(name, labels, self._value)]
+
+
+class _HistogramChild:
+    """라벨 조합 하나의 히스토그램 (버킷별 개수, 합계)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        # 마지막 칸은 +Inf 버킷
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self, name: str, labels: Dict[str, str]) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        result = []
+        cumulative = 0
+        for bound, count in zip(self._buckets + (float("inf"),), counts):
+            cumulative += count
+            result.append((f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+        result.append((f"{name}_sum", labels, total))
+        result.append((f"{name}_count", labels, cumulative))
+        return result
+
+
+class Metric:
+    """라벨 이름이 고정된 메트릭 (라벨 값 조합별 자식 보관)"""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """
+        Metric 초기화
+
+        Args:
+            name: 메트릭 이름
+            kind: 타입 (counter, gauge, histogram)
+            help_text: 설명
+            label_names: 라벨 이름
+            buckets: 히스토그램 버킷 상한 (오름차순, 초)
+        """
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        if self.kind == "counter":
+            return _CounterChild()
+        if self.kind == "gauge":
+            return _GaugeChild()
+        return _HistogramChild(self.buckets)
+
+    def labels(self, *values: str):
+        """
+        라벨 값 조합의 자식 반환 (없으면 생성, 반복 호출 경로에서는 미리 받아 두고 사용)
+
+        Args:
+            *values: label_names 순서의 라벨 값
+
+        Returns:
+            자식 메트릭 (inc / dec / set / observe)
+
+        Raises:
+            ValueError: 라벨 값 개수가 라벨 이름 개수와 다른 경우
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+
+        if len(values) != len(self.label_names):
+            raise ValueError(f"{self.name}: 라벨 {len(self.label_names)}개가 필요합니다 ({', '.join(self.label_names)})")
+
+        with self._lock:
+            return self._children.setdefault(values, self._new_child())
+
+    def collect(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """모든 자식의 (이름, 라벨, 값) 목록"""
+        with self._lock:
+            children = list(self._children.items())
+
+        samples = []
+        for values, child in children:
+            samples.extend(child.samples(self.name, dict(zip(self.label_names, values))))
+        return samples
+
+
+class MetricsRegistry:
+    """메트릭과 수집기 모음"""
+
+    def __init__(self):
+        """MetricsRegistry 초기화"""
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> Metric:
+        """카운터 등록 (내보낼 때 이름 뒤에 _total을 붙임)"""
+        return self._register(Metric(name, "counter", help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> Metric:
+        """게이지 등록"""
+        return self._register(Metric(name, "gauge", help_text, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Metric:
+        """히스토그램 등록"""
+        return self._register(Metric(name, "histogram", help_text, label_names, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        /metrics 조회 시점에 호출할 수집기 등록
+
+        Args:
+            collector: (메트릭 이름, 타입, 설명, 라벨, 값) 항목을 반환하는 함수
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식으로 내보내기
+
+        Returns:
+            str: /metrics 응답 본문
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        families: Dict[str, Tuple[str, str, List[Tuple[str, Dict[str, str], float]]]] = {}
+        for metric in metrics:
+            families[metric.name] = (metric.kind, metric.help_text, metric.collect())
+
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                # 수집기 하나가 실패해도 나머지 메트릭은 내보냄
+                samples = [("metrics_collector_errors", "gauge", "수집기 실패", {"error": type(e).__name__}, 1.0)]
+            for name, kind, help_text, labels, value in samples:
+                sample_name = f"{name}_total" if kind == "counter" else name
+                families.setdefault(name, (kind, help_text, []))[2].append((sample_name, labels, value))
+
+        lines = []
+        for name, (kind, help_text, samples) in families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """라우트별 요청 지연 시간 / 처리 중 요청 수 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        """
+        MetricsMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 앱
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # 경로 템플릿(/api/stocks/{ticker})을 라벨로 사용하여 라벨 조합 수를 제한
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], route_template(scope), status_label(status[0])
+            ).observe(time.perf_counter() - started)
+
+
+def route_template(scope) -> str:
+    """
+    요청이 매칭된 라우트의 전체 경로 템플릿 (예: /api/stocks/{ticker})
+
+    include_router로 포함한 라우터의 라우트는 scope["route"].path가 라우터 기준 상대 경로
+    (/{ticker})이므로, 요청 경로 중 라우트 템플릿이 매칭하지 않은 앞부분을 prefix로 붙입니다.
+    라우트가 전체 경로를 가지고 있으면 prefix는 빈 문자열입니다.
+
+    Args:
+        scope: ASGI scope (라우팅 이후)
+
+    Returns:
+        str: 경로 템플릿 (매칭된 라우트가 없으면 unmatched)
+    """
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return "unmatched"
+
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is None or path_regex.match(path):
+        return path_format
+
+    # 라우트 정규식이 나머지 경로와 맞는 가장 짧은 prefix 탐색
+    position = path.find("/", 1)
+    while position != -1:
+        if path_regex.match(path[position:]):
+            return path[:position] + path_format
+        position = path.find("/", position + 1)
+    return path_format
+
+
+STATUS_LABELS = {code: str(code) for code in range(100, 600)}
+
+
+def status_label(code: int) -> str:
+    """HTTP 상태 코드를 라벨 문자열로 변환 (범위 밖이면 other)"""
+    return STATUS_LABELS.get(code, "other")
+
+
+def cache_samples(cache: str, hits: float, misses: float) -> List[Sample]:
+    """
+    캐시 적중/미적중 수와 적중률 항목
+
+    Args:
+        cache: 캐시 이름 (라벨)
+        hits: 적중 수
+        misses: 미적중 수
+
+    Returns:
+        List[Sample]: cache_requests, cache_hit_ratio 항목
+    """
+    total = hits + misses
+    return [
+        ("cache_requests", "counter", "캐시 조회 수", {"cache": cache, "result": "hit"}, hits),
+        ("cache_requests", "counter", "캐시 조회 수", {"cache": cache, "result": "miss"}, misses),
+        ("cache_hit_ratio", "gauge", "캐시 적중률 (프로세스 시작 이후)", {"cache": cache}, hits / total if total else 0.0),
+    ]
+
+
+def counter_samples(name: str, help_text: str, label: str, stats: Dict[str, Any], keys: Iterable[str]) -> List[Sample]:
+    """
+    stats()의 누적 횟수를 라벨 하나로 구분한 카운터 항목으로 변환
+
+    Args:
+        name: 메트릭 이름
+        help_text: 설명
+        label: 키를 담을 라벨 이름
+        stats: stats() 결과
+        keys: 내보낼 누적 횟수 키
+
+    Returns:
+        List[Sample]: 카운터 항목
+    """
+    return [(name, "counter", help_text, {label: key}, stats[key]) for key in keys if key in stats]
+
+
+def timed_call(ok, error, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    함수 호출 시간을 성공/실패 히스토그램 자식에 기록
+
+    Args:
+        ok: 성공 시 기록할 히스토그램 자식
+        error: 예외 발생 시 기록할 히스토그램 자식
+        func: 호출 함수
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+    """
+    started = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    except Exception:
+        error.observe(time.perf_counter() - started)
+        raise
+    ok.observe(time.perf_counter() - started)
+    return result
+
+
+# 프로세스 공용 레지스트리와 메트릭
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "라우트별 요청 처리 시간 (초)", ("method", "route", "status")
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge("http_requests_in_flight", "처리 중인 요청 수").labels()
+UPSTREAM_REQUEST_SECONDS = REGISTRY.histogram(
+    "upstream_request_duration_seconds",
+    "업스트림 호출 시간 (초, Yahoo는 quoteSummary 모듈 단위)",
+    ("upstream", "operation", "status")
+)
+JOB_STAGE_SECONDS = REGISTRY.histogram(
+    "job_stage_duration_seconds",
+    "브리핑/이메일 작업 단계별 소요 시간 (초)",
+    ("job", "stage", "status"),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+)
@@ -0,0 +1,245 @@
+"""
+종목 모듈 계층형 캐시
+
+Yahoo 종목 모듈은 바뀌는 주기가 크게 다릅니다. 섹터/업종/기업 설명(asset_profile)은
+분기에 한 번 바뀔까 말까 하지만 응답에서 가장 큰 부분이고, 가격(price)은 몇 초 단위로 바뀝니다.
+모듈별 TTL을 두고 느리게 바뀌는 모듈은 디스크에 며칠 보관하여,
+상세 조회 시 만료된 모듈만 Yahoo에서 다시 가져오도록 합니다.
+TTL은 정규장 기준이며, 장이 닫혀 있는 동안 조회한 모듈은 다음 세션 시작까지 유지합니다.
+
+계층:
+    - 메모리 (모든 모듈, 최대 크기 제한 LRU)
+    - 디스크 (DISK_MODULES만): output/cache/modules/{module}/{symbol}.json
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .market_calendar import MarketCalendar, get_market_calendar
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+MODULE_CACHE_DIR = Path(__file__).parent.parent / "output" / "cache" / "modules"
+
+# 모듈별 유지 시간 (초, 정규장 기준)
+MODULE_TTL_SECONDS = {
+    "price": int(os.getenv("PRICE_TTL_SECONDS", "15")),
+    "summary_static": int(os.getenv("SUMMARY_STATIC_TTL_SECONDS", str(24 * 3600))),
+    "asset_profile": int(os.getenv("PROFILE_TTL_SECONDS", str(7 * 24 * 3600))),
+}
+
+# 디스크에 보관하는 (느리게 바뀌는) 모듈
+DISK_MODULES = {"summary_static", "asset_profile"}
+
+# summary_detail 중 하루 단위 이하로 바뀌는 필드 (시가총액/PER 등 가격 연동 필드 제외)
+SUMMARY_STATIC_FIELDS = [
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+    "fiftyDayAverage",
+    "twoHundredDayAverage",
+    "averageVolume",
+    "averageVolume10days",
+    "beta",
+    "dividendRate",
+    "dividendYield",
+    "exDividendDate",
+    "payoutRatio",
+    "fiveYearAvgDividendYield",
+    "currency",
+]
+
+MEMORY_MAX_ENTRIES = 2048
+
+
+def split_summary_detail(
+    summary: Dict[str, Any],
+    price_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    summary_detail에서 느리게 바뀌는 부분만 추출
+
+    PER은 가격에 따라 계속 바뀌므로 저장하지 않고, 대신 현재가/PER로 역산한
+    주당순이익(trailingEps)을 저장하여 조회 시 최신 가격으로 PER을 다시 계산합니다.
+
+    Args:
+        summary: summary_detail 모듈 데이터
+        price_data: 같은 시점의 price 모듈 데이터 (trailingEps 계산용, 선택)
+
+    Returns:
+        Dict: 정적 필드 + trailingEps
+    """
+    static = {field: summary[field] for field in SUMMARY_STATIC_FIELDS if field in summary}
+
+    price = (price_data or {}).get("regularMarketPrice")
+    trailing_pe = summary.get("trailingPE")
+    if isinstance(price, (int, float)) and isinstance(trailing_pe, (int, float)) and trailing_pe:
+        static["trailingEps"] = price / trailing_pe
+
+    return static
+
+
+def merge_summary_detail(
+    static: Dict[str, Any],
+    price_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    정적 summary 필드와 최신 price로 summary_detail 형식 재구성
+
+    Args:
+        static: split_summary_detail 결과
+        price_data: 최신 price 모듈 데이터
+
+    Returns:
+        Dict: summary_detail 형식 (marketCap, trailingPE 포함)
+    """
+    summary = {key: value for key, value in static.items() if key != "trailingEps"}
+    summary["marketCap"] = price_data.get("marketCap")
+
+    price = price_data.get("regularMarketPrice")
+    eps = static.get("trailingEps")
+    if isinstance(price, (int, float)) and isinstance(eps, (int, float)) and eps > 0:
+        summary["trailingPE"] = price / eps
+
+    return summary
+
+
+class TieredModuleCache:
+    """모듈별 TTL 메모리/디스크 계층형 캐시"""
+
+    def __init__(
+        self,
+        root: Path = MODULE_CACHE_DIR,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+        max_entries: int = MEMORY_MAX_ENTRIES,
+        calendar: Optional[MarketCalendar] = None
+    ):
+        """
+        TieredModuleCache 초기화
+
+        Args:
+            root: 디스크 계층 저장 디렉토리
+            ttl_seconds: 모듈별 유지 시간 (기본값: MODULE_TTL_SECONDS)
+            max_entries: 메모리 계층 최대 항목 수
+            calendar: 시장 캘린더 (기본값: 프로세스 공용 캘린더)
+        """
+        self.root = root
+        self.ttl_seconds = ttl_seconds or MODULE_TTL_SECONDS
+        self.max_entries = max_entries
+        self.calendar = calendar or get_market_calendar()
+        self._memory: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def _path(self, symbol: str, module: str) -> Path:
+        return self.root / module / f"{symbol.upper()}.json"
+
+    def _is_fresh(self, module: str, fetched_at: float) -> bool:
+        now = time.time()
+        ttl = self.ttl_seconds.get(module, 0)
+        # 기본 TTL 안이면 캘린더 계산 없이 바로 판단
+        return now - fetched_at < ttl or now < self.calendar.expires_at(fetched_at, ttl)
+
+    def get(self, symbol: str, module: str) -> Optional[Dict[str, Any]]:
+        """
+        만료되지 않은 모듈 데이터 조회 (메모리 → 디스크 순, 디스크 적중 시 메모리로 승격)
+
+        Args:
+            symbol: 종목 심볼
+            module: 모듈 이름
+
+        Returns:
+            Dict: 모듈 데이터 또는 None (없거나 만료)
+        """
+        key = (symbol.upper(), module)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(module, entry[0]):
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+        data = self._read_disk(symbol, module)
+        with self._lock:
+            self._counters["disk_hits" if data is not None else "misses"] += 1
+        return data
+
+    def _read_disk(self, symbol: str, module: str) -> Optional[Dict[str, Any]]:
+        if module not in DISK_MODULES:
+            return None
+
+        try:
+            with open(self._path(symbol, module), 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self._is_fresh(module, stored.get("fetched_at", 0)):
+            return None
+
+        self._remember((symbol.upper(), module), stored["fetched_at"], stored["data"])
+        return stored["data"]
+
+    def put(self, symbol: str, module: str, data: Dict[str, Any]) -> None:
+        """
+        모듈 데이터 저장 (디스크 계층 모듈은 파일에도 기록)
+
+        Args:
+            symbol: 종목 심볼
+            module: 모듈 이름
+            data: 모듈 데이터
+        """
+        fetched_at = time.time()
+        self._remember((symbol.upper(), module), fetched_at, data)
+
+        if module not in DISK_MODULES:
+            return
+
+        path = self._path(symbol, module)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"fetched_at": fetched_at, "data": data}, f, ensure_ascii=False, default=str)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("모듈 캐시 저장 실패 (%s/%s): %s", module, symbol, e)
+
+    def _remember(self, key: tuple, fetched_at: float, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = (fetched_at, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: memory_entries, memory_hits, disk_hits, misses
+        """
+        with self._lock:
+            return {"memory_entries": len(self._memory), **self._counters}
+
+    def get_many(self, symbol: str, modules: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 모듈 조회 (만료된 모듈은 None)
+
+        Args:
+            symbol: 종목 심볼
+            modules: 모듈 이름 리스트
+
+        Returns:
+            Dict: 모듈 이름 → 데이터 또는 None
+        """
+        return {module: self.get(symbol, module) for module in modules}
@@ -0,0 +1,210 @@
+"""
+부정 결과(존재하지 않는 종목) 캐시
+
+잘못된/상장 폐지된 심볼로 Yahoo를 조회하면 에러 문자열이 돌아오고 404로 끝나지만,
+같은 심볼을 다시 요청하면 매번 왕복 비용을 다시 치릅니다. 심볼 스캔 봇이 있으면
+이 비용이 커지므로, 조회 실패한 심볼을 짧은 TTL 동안 기억하여 바로 거절합니다.
+
+구성:
+    - TTL + 최대 크기 제한 LRU 사전 (정확한 부정 결과, 실패 사유 포함)
+    - 블룸 필터 (선택, NEGATIVE_CACHE_BLOOM=1)
+        · 사전 조회 전 사전 검사: 필터에 없으면 사전을 찾지 않고 바로 통과
+        · 필터에 있어도 TTL 안의 항목이 없으면 통과 (오탐이나 만료로 정상 심볼을 거절하지 않음)
+        · 필터는 주기적으로(기본 24시간) 초기화되어 만료된 심볼을 비움
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 기본 설정 (환경 변수로 조정)
+NEGATIVE_CACHE_TTL_SECONDS = int(os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "300"))
+NEGATIVE_CACHE_MAX_SIZE = int(os.getenv("NEGATIVE_CACHE_MAX_SIZE", "1024"))
+NEGATIVE_CACHE_BLOOM = os.getenv("NEGATIVE_CACHE_BLOOM", "0") == "1"
+BLOOM_CAPACITY = int(os.getenv("NEGATIVE_CACHE_BLOOM_CAPACITY", "100000"))
+BLOOM_ERROR_RATE = float(os.getenv("NEGATIVE_CACHE_BLOOM_ERROR_RATE", "0.001"))
+BLOOM_RESET_SECONDS = int(os.getenv("NEGATIVE_CACHE_BLOOM_RESET_SECONDS", str(24 * 3600)))
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (이중 해싱)"""
+
+    def __init__(self, capacity: int = BLOOM_CAPACITY, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        BloomFilter 초기화
+
+        Args:
+            capacity: 예상 최대 원소 수
+            error_rate: capacity만큼 추가했을 때의 목표 오탐률
+        """
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+
+class NegativeCache:
+    """존재하지 않는 종목 심볼 캐시 (TTL + 최대 크기 LRU, 선택적 블룸 필터)"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = NEGATIVE_CACHE_TTL_SECONDS,
+        max_size: int = NEGATIVE_CACHE_MAX_SIZE,
+        use_bloom: bool = NEGATIVE_CACHE_BLOOM,
+        bloom_reset_seconds: int = BLOOM_RESET_SECONDS
+    ):
+        """
+        NegativeCache 초기화
+
+        Args:
+            ttl_seconds: 부정 결과 유지 시간 (초)
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            use_bloom: 블룸 필터 사전 검사 사용 여부
+            bloom_reset_seconds: 블룸 필터 초기화 주기 (초)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.bloom = BloomFilter() if use_bloom else None
+        self.bloom_reset_seconds = bloom_reset_seconds
+        self._bloom_reset_at = time.monotonic() + bloom_reset_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "lookups": 0,
+            "hits": 0,
+            "bloom_false_positives": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def get(self, symbol: str) -> Optional[str]:
+        """
+        부정 결과 조회
+
+        Args:
+            symbol: 종목 심볼
+
+        Returns:
+            str: 실패 사유 (부정 결과가 있으면) 또는 None (Yahoo 조회 필요)
+        """
+        key = symbol.strip().upper()
+        now = time.monotonic()
+
+        with self._lock:
+            self._counters["lookups"] += 1
+
+            if self.bloom is not None:
+                if now >= self._bloom_reset_at:
+                    # 초기화 후에도 LRU에 남은 유효 항목은 다시 추가하여 사전 검사와 일치시킴
+                    self.bloom.clear()
+                    for entry_key, (expires_at, _) in self._entries.items():
+                        if expires_at > now:
+                            self.bloom.add(entry_key)
+                    self._bloom_reset_at = now + self.bloom_reset_seconds
+                # 블룸 필터에 없으면 부정 결과가 확실히 없음
+                if key not in self.bloom:
+                    self._counters["misses"] += 1
+                    return None
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, reason = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return reason
+                del self._entries[key]
+                self._counters["expirations"] += 1
+
+            if self.bloom is not None:
+                # 필터 오탐 또는 만료/밀려난 심볼은 부정 결과가 아님
+                self._counters["bloom_false_positives"] += 1
+
+            self._counters["misses"] += 1
+            return None
+
+    def add(self, symbol: str, reason: str) -> None:
+        """
+        부정 결과 저장
+
+        Args:
+            symbol: 종목 심볼
+            reason: 실패 사유 (Yahoo 에러 메시지 등)
+        """
+        key = symbol.strip().upper()
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, reason)
+            self._entries.move_to_end(key)
+            self._counters["stores"] += 1
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+            if self.bloom is not None:
+                self.bloom.add(key)
+
+        logger.info("부정 결과 캐시 저장: %s (%s초)", key, self.ttl_seconds)
+
+    def discard(self, symbol: str) -> None:
+        """
+        부정 결과 삭제 (블룸 필터에서는 삭제되지 않음)
+
+        Args:
+            symbol: 종목 심볼
+        """
+        with self._lock:
+            self._entries.pop(symbol.strip().upper(), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: 조회/적중/저장/제거 횟수, 절약한 Yahoo 호출 수, 현재 항목 수 등
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+            bloom_count = self.bloom.count if self.bloom is not None else None
+
+        return {
+            **counters,
+            "saved_upstream_calls": counters["hits"],
+            "hit_rate": round(counters["hits"] / counters["lookups"], 4) if counters["lookups"] else 0.0,
+            "entries": entries,
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "bloom_enabled": self.bloom is not None,
+            "bloom_entries": bloom_count,
+        }
@@ -5,14 +5,16 @@ Exa API를 사용하여 주식 관련 뉴스를 검색하는 서비스
 """
 
 from typing import Dict, Any, List, Optional
+import importlib.util
 import os
+import threading
 
-try:
-    from exa_py import Exa
-    EXA_AVAILABLE = True
-except ImportError:
-    EXA_AVAILABLE = False
+# exa_py는 import 비용(openai 클라이언트 포함)이 커서 설치 여부만 확인하고 NewsService 생성 시 로드
+EXA_AVAILABLE = importlib.util.find_spec("exa_py") is not None
 
+from .metrics import UPSTREAM_REQUEST_SECONDS, timed_call
+from .shared_cache import SharedCache, get_shared_cache
+from .tracing import SPAN_KIND_CLIENT, trace_span
 from .utils import (
     LoggerFactory,
     StockConstants,
@@ -28,16 +30,45 @@ logger = LoggerFactory.get_logger(__name__)
 if not EXA_AVAILABLE:
     logger.warning("exa_py 패키지가 설치되지 않았습니다. pip install exa-py를 실행하세요.")
 
+# Exa 대신 요청을 보낼 서버 (예: http://127.0.0.1:8900, 비어 있으면 실제 Exa API 사용)
+EXA_BASE_URL = os.getenv("EXA_BASE_URL", "").rstrip("/")
+
+# Exa 검색 호출 시간 메트릭 (성공/실패)
+_EXA_SEARCH_OK = UPSTREAM_REQUEST_SECONDS.labels("exa", "search", "ok")
+_EXA_SEARCH_ERROR = UPSTREAM_REQUEST_SECONDS.labels("exa", "search", "error")
+
+# 공유 캐시 유지 시간 (초) - CACHE_BACKEND 설정 시 워커 간 같은 검색 결과 공유
+NEWS_CACHE_SECONDS = int(os.getenv("NEWS_CACHE_SECONDS", "300"))
+
+
+def _exa_class():
+    """
+    exa_py Exa 클래스 반환 (처음 사용할 때 import)
+
+    모듈 속성 Exa로 이미 지정된 값이 있으면 그대로 사용합니다. (벤치마크 재생 모드의 교체 지점)
+    """
+    value = globals().get("Exa")
+    if value is None:
+        from exa_py import Exa as value
+        globals()["Exa"] = value
+    return value
+
+
+def _is_successful_search(result: Dict[str, Any]) -> bool:
+    """에러 응답은 공유 캐시에 저장하지 않음"""
+    return "error" not in result
+
 
 class NewsService:
     """Exa API를 사용한 주식 뉴스 검색 서비스"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[SharedCache] = None):
         """
         NewsService 초기화
 
         Args:
             api_key: Exa API 키 (기본값: 환경 변수 EXA_API_KEY)
+            cache: 워커 간 공유 캐시 (기본값: 프로세스 공용 캐시, CACHE_BACKEND=none이면 사용 안 함)
 
         Raises:
             ImportError: exa_py 패키지가 설치되지 않은 경우
@@ -56,8 +87,14 @@ class NewsService:
                 "환경 변수 EXA_API_KEY를 설정하거나 api_key 파라미터를 전달하세요."
             )
 
-        # Exa 클라이언트 초기화
-        self.exa = Exa(api_key=self.api_key)
+        # Exa 클라이언트 초기화 (EXA_BASE_URL이 있으면 대체 서버 사용)
+        exa_class = _exa_class()
+        if EXA_BASE_URL:
+            self.exa = exa_class(api_key=self.api_key, base_url=EXA_BASE_URL)
+        else:
+            self.exa = exa_class(api_key=self.api_key)
+
+        self.cache = cache or get_shared_cache()
 
     def search_stock_news(
         self,
@@ -87,6 +124,15 @@ class NewsService:
             >>> result = service.search_stock_news("AAPL", hours=24, num_results=5)
             >>> print(result['news'][0]['title'])
         """
+        return self.cache.get_or_load(
+            f"news:{ticker.upper()}:{hours}:{num_results}",
+            lambda: self._search_stock_news(ticker, hours, num_results),
+            NEWS_CACHE_SECONDS,
+            cacheable=_is_successful_search
+        )
+
+    def _search_stock_news(self, ticker: str, hours: int, num_results: int) -> Dict[str, Any]:
+        """Exa 종목 뉴스 검색 (search_stock_news 참고)"""
         try:
             # 검색 쿼리 생성
             query = f"{ticker} stock news"
@@ -95,9 +141,8 @@ class NewsService:
             date_range = DateRangeBuilder.build_date_range(hours)
 
             logger.info(
-                f"뉴스 검색 시작 - 종목: {ticker}, "
-                f"기간: {date_range['start_date']} ~ {date_range['end_date']}, "
-                f"결과 수: {num_results}"
+                "뉴스 검색 시작 - 종목: %s, 기간: %s ~ %s, 결과 수: %s",
+                ticker, date_range['start_date'], date_range['end_date'], num_results
             )
 
             # Exa API로 뉴스 검색
@@ -110,7 +155,7 @@ class NewsService:
             # 결과 추출
             news_list = NewsDataFormatter.format_news_list(search_results)
 
-            logger.info(f"뉴스 검색 완료 - {len(news_list)}개 뉴스 발견")
+            logger.info("뉴스 검색 완료 - %s개 뉴스 발견", len(news_list))
 
             return {
                 "ticker": ticker,
@@ -121,7 +166,7 @@ class NewsService:
             }
 
         except Exception as e:
-            logger.error(f"뉴스 검색 중 오류 발생 ({ticker}): {e}", exc_info=True)
+            logger.error("뉴스 검색 중 오류 발생 (%s): %s", ticker, e, exc_info=True)
             return ErrorResponseBuilder.build_news_error_response(
                 query=f"{ticker} stock news",
                 error_message=f"뉴스 검색 중 오류가 발생했습니다: {str(e)}",
@@ -152,7 +197,7 @@ class NewsService:
                 result = self.search_stock_news(ticker, hours, num_results_per_ticker)
                 results[ticker] = result
             except Exception as e:
-                logger.error(f"종목 '{ticker}' 뉴스 검색 중 오류: {e}", exc_info=True)
+                logger.error("종목 '%s' 뉴스 검색 중 오류: %s", ticker, e, exc_info=True)
                 results[ticker] = ErrorResponseBuilder.build_news_error_response(
                     query=f"{ticker} stock news",
                     error_message=str(e),
@@ -180,11 +225,27 @@ class NewsService:
         Returns:
             Dict: 뉴스 검색 결과
         """
+        domains = ",".join(include_domains or [])
+        return self.cache.get_or_load(
+            f"news:market:{query}:{hours}:{num_results}:{domains}",
+            lambda: self._search_market_news(query, hours, num_results, include_domains),
+            NEWS_CACHE_SECONDS,
+            cacheable=_is_successful_search
+        )
+
+    def _search_market_news(
+        self,
+        query: str,
+        hours: int,
+        num_results: int,
+        include_domains: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Exa 시장 뉴스 검색 (search_market_news 참고)"""
         try:
             # 검색 기간 계산
             date_range = DateRangeBuilder.build_date_range(hours)
 
-            logger.info(f"시장 뉴스 검색 시작 - 쿼리: {query}")
+            logger.info("시장 뉴스 검색 시작 - 쿼리: %s", query)
 
             # Exa API로 뉴스 검색
             search_results = self._execute_search(
@@ -197,7 +258,7 @@ class NewsService:
             # 결과 추출
             news_list = NewsDataFormatter.format_news_list(search_results)
 
-            logger.info(f"시장 뉴스 검색 완료 - {len(news_list)}개 뉴스 발견")
+            logger.info("시장 뉴스 검색 완료 - %s개 뉴스 발견", len(news_list))
 
             return {
                 "query": query,
@@ -207,7 +268,7 @@ class NewsService:
             }
 
         except Exception as e:
-            logger.error(f"시장 뉴스 검색 중 오류 발생: {e}", exc_info=True)
+            logger.error("시장 뉴스 검색 중 오류 발생: %s", e, exc_info=True)
             return ErrorResponseBuilder.build_news_error_response(
                 query=query,
                 error_message=f"뉴스 검색 중 오류가 발생했습니다: {str(e)}"
@@ -245,7 +306,33 @@ class NewsService:
         if include_domains:
             search_params["include_domains"] = include_domains
 
-        return self.exa.search(**search_params)
+        with trace_span("exa", SPAN_KIND_CLIENT, operation="search"):
+            return timed_call(_EXA_SEARCH_OK, _EXA_SEARCH_ERROR, self.exa.search, **search_params)
+
+
+# API 키가 필요하므로 처음 요청할 때 초기화 (성공하면 프로세스에서 재사용)
+_default_service: Optional[NewsService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_news_service() -> Optional[NewsService]:
+    """
+    프로세스 공용 NewsService 반환 (모든 라우트와 브리핑 작업이 공유)
+
+    Returns:
+        NewsService: 공용 서비스 (exa_py 미설치 또는 API 키가 없으면 None)
+    """
+    global _default_service
+    if _default_service is not None:
+        return _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            try:
+                _default_service = NewsService()
+            except (ImportError, ValueError) as e:
+                logger.warning("NewsService를 초기화할 수 없습니다: %s", e)
+        return _default_service
 
 
 # 편의 함수
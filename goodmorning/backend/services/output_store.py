@@ -0,0 +1,504 @@
+"""
+산출물 인덱스 저장소
+
+output/ 디렉토리의 스크리닝/브리핑 산출물을 SQLite 인덱스로 관리합니다.
+파일 본문(JSON, HTML)은 기존과 같이 output/에 저장하고, 인덱스에는
+종류별 ID, 생성 시각, 파일 경로, 메타데이터만 기록합니다.
+
+- 최신 산출물 조회: latest 테이블에서 키 하나로 조회 (디렉토리 glob/stat 불필요)
+- ID 조회, 날짜 범위 조회: (kind, created_at) 인덱스 사용
+- 보존 정책: 보존 기간이 지난 산출물의 인덱스와 파일을 함께 삭제
+
+Usage:
+    python -m services.output_store --compact [--retention-days 90]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "output"
+INDEX_FILENAME = "index.sqlite3"
+SEGMENT_DIRNAME = "segments"
+
+# 산출물 종류
+KIND_SCREENING = "screening"
+KIND_BRIEFING = "briefing"
+
+# 산출물 상태
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# 기본 보존 기간 (일)
+DEFAULT_RETENTION_DAYS = int(os.getenv("OUTPUT_RETENTION_DAYS", "90"))
+
+# 빈 페이지 비율이 이 값 이상일 때만 VACUUM (전체 파일을 다시 쓰므로 매번 실행하지 않음)
+VACUUM_FREELIST_RATIO = float(os.getenv("OUTPUT_VACUUM_FREELIST_RATIO", "0.25"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    files TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind_created
+    ON artifacts (kind, created_at);
+CREATE TABLE IF NOT EXISTS latest (
+    kind TEXT PRIMARY KEY,
+    id TEXT NOT NULL
+);
+"""
+
+
+class OutputStore:
+    """SQLite 인덱스 기반 산출물 저장소"""
+
+    def __init__(self, root: Path = OUTPUT_DIR):
+        """
+        OutputStore 초기화
+
+        Args:
+            root: 산출물 디렉토리 (인덱스 파일도 이 디렉토리에 생성)
+        """
+        self.root = root
+        self.db_path = root / INDEX_FILENAME
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """인덱스 DB 연결 (스레드별 단기 연결)"""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.root.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.db_path)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _relative(self, path: str) -> str:
+        """산출물 경로를 root 기준 상대 경로로 변환"""
+        try:
+            return str(Path(path).resolve().relative_to(self.root.resolve()))
+        except ValueError:
+            return str(path)
+
+    def _to_record(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        """인덱스 행을 산출물 레코드로 변환 (파일 경로는 절대 경로)"""
+        if row is None:
+            return None
+
+        files = {
+            name: str(self.root / relative)
+            for name, relative in json.loads(row["files"]).items()
+        }
+        return {
+            "kind": row["kind"],
+            "id": row["id"],
+            "created_at": row["created_at"],
+            "status": row["status"],
+            "files": files,
+            "meta": json.loads(row["meta"]),
+        }
+
+    def put(
+        self,
+        kind: str,
+        artifact_id: str,
+        files: Dict[str, str],
+        created_at: Optional[datetime] = None,
+        status: str = STATUS_COMPLETED,
+        meta: Optional[Dict[str, Any]] = None,
+        set_latest: bool = True
+    ) -> Dict[str, Any]:
+        """
+        산출물 등록 (같은 ID가 있으면 갱신)
+
+        Args:
+            kind: 산출물 종류 (screening, briefing)
+            artifact_id: 산출물 ID (예: "20251212_070000")
+            files: 파일 종류 → 경로 (예: {"json": ".../briefing_x.json"})
+            created_at: 생성 시각 (기본값: 현재 시각)
+            status: 산출물 상태 (in_progress, completed, failed)
+            meta: 메타데이터
+            set_latest: 최신 산출물로 지정할지 여부
+
+        Returns:
+            Dict: 등록된 산출물 레코드
+        """
+        created_at = created_at or datetime.now()
+        relative_files = {name: self._relative(path) for name, path in files.items()}
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts (kind, id, created_at, status, files, meta) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    artifact_id,
+                    created_at.isoformat(),
+                    status,
+                    json.dumps(relative_files, ensure_ascii=False),
+                    json.dumps(meta or {}, ensure_ascii=False, default=str),
+                )
+            )
+            if set_latest:
+                conn.execute(
+                    "INSERT OR REPLACE INTO latest (kind, id) VALUES (?, ?)",
+                    (kind, artifact_id)
+                )
+
+        return self.get(kind, artifact_id)
+
+    def update_status(self, kind: str, artifact_id: str, status: str) -> None:
+        """
+        산출물 상태 갱신
+
+        Args:
+            kind: 산출물 종류
+            artifact_id: 산출물 ID
+            status: 변경할 상태
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE artifacts SET status = ? WHERE kind = ? AND id = ?",
+                (status, kind, artifact_id)
+            )
+
+    def set_latest(self, kind: str, artifact_id: str) -> None:
+        """
+        기존 산출물을 최신 산출물로 지정 (재사용 시)
+
+        Args:
+            kind: 산출물 종류
+            artifact_id: 산출물 ID
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO latest (kind, id) VALUES (?, ?)",
+                (kind, artifact_id)
+            )
+
+    def get(self, kind: str, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """
+        ID로 산출물 조회
+
+        Args:
+            kind: 산출물 종류
+            artifact_id: 산출물 ID
+
+        Returns:
+            Dict: 산출물 레코드 또는 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM artifacts WHERE kind = ? AND id = ?",
+                (kind, artifact_id)
+            ).fetchone()
+
+        return self._to_record(row)
+
+    def latest(self, kind: str) -> Optional[Dict[str, Any]]:
+        """
+        최신 산출물 조회
+
+        Args:
+            kind: 산출물 종류
+
+        Returns:
+            Dict: 산출물 레코드 또는 None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT a.* FROM latest l "
+                "JOIN artifacts a ON a.kind = l.kind AND a.id = l.id "
+                "WHERE l.kind = ?",
+                (kind,)
+            ).fetchone()
+
+        return self._to_record(row)
+
+    def list(
+        self,
+        kind: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        날짜 범위로 산출물 조회 (최신순)
+
+        Args:
+            kind: 산출물 종류
+            start: 시작 시각 (포함)
+            end: 종료 시각 (미포함)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            List[Dict]: 산출물 레코드 리스트
+        """
+        query, params = self._range_query("SELECT *", kind, start, end)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._to_record(row) for row in rows]
+
+    def count(
+        self,
+        kind: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> int:
+        """
+        날짜 범위 내 산출물 개수
+
+        Args:
+            kind: 산출물 종류
+            start: 시작 시각 (포함)
+            end: 종료 시각 (미포함)
+
+        Returns:
+            int: 산출물 개수
+        """
+        query, params = self._range_query("SELECT COUNT(*)", kind, start, end)
+
+        with self._connect() as conn:
+            return conn.execute(query, params).fetchone()[0]
+
+    @staticmethod
+    def _range_query(
+        select: str,
+        kind: str,
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> tuple[str, List[Any]]:
+        """날짜 범위 조회 쿼리 구성"""
+        query = f"{select} FROM artifacts WHERE kind = ?"
+        params: List[Any] = [kind]
+
+        if start is not None:
+            query += " AND created_at >= ?"
+            params.append(start.isoformat())
+        if end is not None:
+            query += " AND created_at < ?"
+            params.append(end.isoformat())
+
+        return query, params
+
+    def compact(
+        self,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        delete_files: bool = True
+    ) -> Dict[str, int]:
+        """
+        보존 정책 적용
+
+        보존 기간이 지난 산출물과 파일이 사라진 산출물을 인덱스에서 제거하고,
+        보존 기간이 지난 산출물 파일을 삭제합니다. 종류별 최신 산출물은 유지합니다.
+        세그먼트 파일은 인덱스에 남은 산출물만 남도록 다시 씁니다.
+        인덱스 DB는 빈 페이지 비율이 VACUUM_FREELIST_RATIO 이상일 때만 VACUUM합니다.
+
+        Args:
+            retention_days: 보존 기간 (일)
+            delete_files: 산출물 파일 삭제 여부
+
+        Returns:
+            Dict: expired(보존 기간 초과), missing(파일 없음),
+                segment_records(세그먼트에서 제거된 레코드) 개수, vacuumed(VACUUM 실행 여부)
+        """
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        expired, missing = 0, 0
+
+        with self._connect() as conn:
+            latest_ids = {
+                (row["kind"], row["id"])
+                for row in conn.execute("SELECT kind, id FROM latest").fetchall()
+            }
+            rows = conn.execute("SELECT * FROM artifacts").fetchall()
+
+            for row in rows:
+                if (row["kind"], row["id"]) in latest_ids:
+                    continue
+
+                record = self._to_record(row)
+                file_paths = [Path(path) for path in record["files"].values()]
+
+                if row["created_at"] < cutoff:
+                    if delete_files:
+                        for path in file_paths:
+                            path.unlink(missing_ok=True)
+                    expired += 1
+                elif all(path.exists() for path in file_paths):
+                    continue
+                else:
+                    missing += 1
+
+                conn.execute(
+                    "DELETE FROM artifacts WHERE kind = ? AND id = ?",
+                    (row["kind"], row["id"])
+                )
+
+            kept_ids = {
+                kind: [
+                    row["id"]
+                    for row in conn.execute(
+                        "SELECT id FROM artifacts WHERE kind = ?", (kind,)
+                    ).fetchall()
+                ]
+                for kind in (KIND_SCREENING, KIND_BRIEFING)
+            }
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            pages = conn.execute("PRAGMA page_count").fetchone()[0]
+            vacuumed = pages > 0 and freelist / pages >= VACUUM_FREELIST_RATIO
+            if vacuumed:
+                conn.execute("VACUUM")
+
+        # 세그먼트 파일도 인덱스에 남은 산출물만 유지 (/briefings는 세그먼트에서 조회)
+        from .segment_store import SegmentStore
+
+        segment_records = sum(
+            SegmentStore(kind, self.root / SEGMENT_DIRNAME).compact(ids)
+            for kind, ids in kept_ids.items()
+        )
+
+        logger.info(
+            "산출물 정리 완료 - 보존 기간(%d일) 초과 %d개, 파일 없음 %d개, "
+            "세그먼트 레코드 %d개 제거 (VACUUM: %s)",
+            retention_days, expired, missing, segment_records, vacuumed
+        )
+        return {
+            "expired": expired,
+            "missing": missing,
+            "segment_records": segment_records,
+            "vacuumed": int(vacuumed),
+        }
+
+    def index_existing_files(self) -> int:
+        """
+        인덱스에 없는 기존 산출물 파일 등록 (인덱스 도입 이전 파일 이관용)
+
+        Returns:
+            int: 새로 등록한 산출물 개수
+        """
+        added = 0
+        latest_by_kind: Dict[str, tuple[str, str]] = {}
+
+        with self._connect() as conn:
+            known = {
+                (row["kind"], row["id"])
+                for row in conn.execute("SELECT kind, id FROM artifacts").fetchall()
+            }
+
+        for kind in (KIND_SCREENING, KIND_BRIEFING):
+            for json_path in sorted(self.root.glob(f"{kind}_*.json")):
+                artifact_id = json_path.stem[len(kind) + 1:]
+                try:
+                    created_at = datetime.strptime(artifact_id, "%Y%m%d_%H%M%S")
+                except ValueError:
+                    continue
+
+                created_iso = created_at.isoformat()
+                if kind not in latest_by_kind or created_iso > latest_by_kind[kind][0]:
+                    latest_by_kind[kind] = (created_iso, artifact_id)
+
+                if (kind, artifact_id) in known:
+                    continue
+
+                files = {"json": str(json_path)}
+                html_path = json_path.with_suffix(".html")
+                if html_path.exists():
+                    files["html"] = str(html_path)
+
+                self.put(kind, artifact_id, files, created_at=created_at, set_latest=False)
+                added += 1
+
+        for kind, (_, artifact_id) in latest_by_kind.items():
+            if self.latest(kind) is None:
+                self.set_latest(kind, artifact_id)
+
+        if added:
+            logger.info("기존 산출물 %s개를 인덱스에 등록했습니다.", added)
+        return added
+
+
+_default_store: Optional[OutputStore] = None
+
+
+def get_output_store() -> OutputStore:
+    """
+    기본 산출물 저장소 (output/) 반환
+
+    인덱스가 비어 있으면 인덱스 도입 이전의 산출물 파일을 한 번 등록합니다.
+
+    Returns:
+        OutputStore: 기본 산출물 저장소
+    """
+    global _default_store
+    if _default_store is None:
+        store = OutputStore()
+        if store.count(KIND_SCREENING) == 0 and store.count(KIND_BRIEFING) == 0:
+            store.index_existing_files()
+        _default_store = store
+    return _default_store
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="굿모닝 월가 산출물 인덱스 관리")
+    parser.add_argument("--compact", action="store_true", help="보존 정책 적용")
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=DEFAULT_RETENTION_DAYS,
+        help=f"보존 기간 (일, 기본값: {DEFAULT_RETENTION_DAYS})"
+    )
+    args = parser.parse_args()
+
+    store = get_output_store()
+    if args.compact:
+        store.compact(retention_days=args.retention_days)
+
+    for kind in (KIND_SCREENING, KIND_BRIEFING):
+        latest = store.latest(kind)
+        logger.info("%s: %s개, 최신: %s", kind, store.count(kind), latest['id'] if latest else '없음')
+
+
+if __name__ == "__main__":
+    main()
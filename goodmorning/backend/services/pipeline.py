@@ -0,0 +1,608 @@
+"""
+모닝 파이프라인 실행 서비스
+
+스크리닝 → 뉴스 수집 → 브리핑 스트리밍 생성/저장 → 이메일 발송을
+하나의 의존성 그래프(DAG)로 구성하여 한 프로세스에서 실행합니다.
+단계 간 데이터는 output/ 파일 대신 메모리로 전달되며, 서로 독립적인 단계는
+동시에 실행됩니다. 입력이 이전 실행과 같은 단계는 이전 결과를 재사용합니다.
+
+GitHub Actions 워크플로우에서 실행됩니다. 마지막 정규장 마감 후 BRIEFING_MAX_SESSION_AGE_HOURS가
+지났으면(주말, 휴장일 다음 날 아침) 새 시장 데이터가 없으므로 실행하지 않습니다.
+
+Usage:
+    python -m services.pipeline [--email] [--mode sectioned] [--force] [--ignore-calendar]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Iterable, Iterator
+
+from .artifact_cache import (
+    StageArtifactCache,
+    RunManifest,
+    compute_content_hash,
+    touch_files,
+    ARTIFACT_REUSED,
+    ARTIFACT_RECOMPUTED,
+)
+from .market_calendar import MarketCalendar, get_market_calendar, to_kst
+from .metrics import JOB_STAGE_SECONDS, Sample
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 파이프라인 실행 기록 저장 위치
+PIPELINE_DIR = Path(__file__).parent.parent / "output" / "pipeline"
+
+# 마지막 정규장 마감 후 브리핑을 만들 수 있는 시간 (시간)
+# 평일 아침 7시(KST) 실행은 마감 1~2시간 뒤, 일/월요일 아침은 금요일 마감 26시간 이상 뒤
+BRIEFING_MAX_SESSION_AGE_HOURS = float(os.getenv("BRIEFING_MAX_SESSION_AGE_HOURS", "20"))
+
+# 단계 실행 상태
+STAGE_COMPLETED = "completed"
+STAGE_REUSED = "reused"
+STAGE_FAILED = "failed"
+STAGE_BLOCKED = "blocked"
+
+
+class PipelineStage:
+    """파이프라인 단계 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Optional[List[str]] = None,
+        cache_key: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ):
+        """
+        PipelineStage 초기화
+
+        Args:
+            name: 단계 이름
+            func: 단계 함수 (의존 단계 이름 → 결과 dict를 받아 결과 반환)
+            depends_on: 의존 단계 이름 리스트
+            cache_key: 재사용 판단용 입력 키 생성 함수 (선택)
+                지정하면 같은 키로 이전에 계산한 결과가 있을 때 단계를 건너뛰고 재사용합니다.
+                이 경우 단계 결과는 JSON으로 직렬화 가능해야 합니다.
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = depends_on or []
+        self.cache_key = cache_key
+
+
+class StageResult:
+    """파이프라인 단계 실행 결과"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status: Optional[str] = None
+        self.output: Any = None
+        self.input_hash: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.duration_seconds: float = 0.0
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """실행 기록용 dict 변환"""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "input_hash": self.input_hash,
+            "error": self.error,
+        }
+
+
+class PipelineRunner:
+    """의존성 그래프 기반 파이프라인 실행기"""
+
+    def __init__(
+        self,
+        report_dir: Path = PIPELINE_DIR,
+        max_workers: int = 4,
+        force: bool = False,
+        cache: Optional[StageArtifactCache] = None
+    ):
+        """
+        PipelineRunner 초기화
+
+        Args:
+            report_dir: 실행 기록 저장 디렉토리
+            max_workers: 동시에 실행할 최대 단계 수
+            force: True이면 입력이 같아도 모든 단계를 다시 실행
+            cache: 입력 해시 기반 단계 결과 캐시 (기본값: output/artifacts)
+        """
+        self.report_dir = report_dir
+        self.max_workers = max_workers
+        self.force = force
+        self.cache = cache or StageArtifactCache()
+        self.stages: Dict[str, PipelineStage] = {}
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        depends_on: Optional[List[str]] = None,
+        cache_key: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> "PipelineRunner":
+        """
+        단계 추가
+
+        Args:
+            name: 단계 이름
+            func: 단계 함수
+            depends_on: 의존 단계 이름 리스트
+            cache_key: 재사용 판단용 입력 키 생성 함수 (선택)
+
+        Returns:
+            PipelineRunner: 체이닝용 self
+
+        Raises:
+            ValueError: 이미 등록된 단계 이름인 경우
+        """
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+
+        self.stages[name] = PipelineStage(name, func, depends_on, cache_key)
+        return self
+
+    def _validate(self) -> None:
+        """
+        의존성 그래프 검증 (미등록 의존 단계, 순환 의존성)
+
+        Raises:
+            ValueError: 그래프가 올바르지 않은 경우
+        """
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.depends_on if dep not in self.stages]
+            if unknown:
+                raise ValueError(
+                    f"단계 '{stage.name}'의 의존 단계를 찾을 수 없습니다: {', '.join(unknown)}"
+                )
+
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성이 있습니다: {name}")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _run_stage(self, stage: PipelineStage, inputs: Dict[str, Any]) -> Any:
+        """작업 스레드에서 단계 함수 실행"""
+        logger.info("[%s] 단계 시작", stage.name)
+        return stage.func(inputs)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        파이프라인 실행
+
+        의존 단계가 모두 끝난 단계부터 동시에 실행합니다.
+        실패한 단계에 의존하는 단계는 실행하지 않습니다(blocked).
+
+        Returns:
+            Dict: 실행 결과
+                - success: 모든 단계 성공 여부
+                - outputs: 단계 이름 → 결과
+                - stages: 단계별 상태 및 소요 시간
+                - total_seconds: 전체 소요 시간
+        """
+        self._validate()
+
+        manifest = RunManifest("pipeline")
+        results = {name: StageResult(name) for name in self.stages}
+        pending = set(self.stages)
+        running = {}
+        run_started = time.perf_counter()
+
+        logger.info("=" * 60)
+        logger.info("파이프라인 실행 시작 - %s개 단계", len(self.stages))
+        logger.info("=" * 60)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="pipeline"
+        ) as executor:
+            while pending or running:
+                # 실행 가능한 단계 제출
+                for name in sorted(pending):
+                    stage = self.stages[name]
+                    dep_statuses = [results[dep].status for dep in stage.depends_on]
+
+                    if any(status in (STAGE_FAILED, STAGE_BLOCKED) for status in dep_statuses):
+                        results[name].status = STAGE_BLOCKED
+                        pending.discard(name)
+                        logger.warning("[%s] 의존 단계 실패로 실행하지 않습니다.", name)
+                        continue
+
+                    if not all(status in (STAGE_COMPLETED, STAGE_REUSED) for status in dep_statuses):
+                        continue
+
+                    pending.discard(name)
+                    inputs = {dep: results[dep].output for dep in stage.depends_on}
+                    result = results[name]
+                    result.started_at = time.perf_counter()
+
+                    if stage.cache_key is not None:
+                        result.input_hash = compute_content_hash(stage.cache_key(inputs))
+                        previous = None if self.force else self.cache.get(name, result.input_hash)
+                        if previous is not None:
+                            result.status = STAGE_REUSED
+                            result.output = previous
+                            manifest.record(name, ARTIFACT_REUSED, result.input_hash)
+                            logger.info("[%s] 입력 변경 없음 - 이전 결과 재사용", name)
+                            continue
+
+                    running[executor.submit(self._run_stage, stage, inputs)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = results[name]
+                    result.duration_seconds = time.perf_counter() - result.started_at
+
+                    try:
+                        result.output = future.result()
+                        result.status = STAGE_COMPLETED
+                        logger.info("[%s] 단계 완료 (%.2f초)", name, result.duration_seconds)
+                        JOB_STAGE_SECONDS.labels("pipeline", name, STAGE_COMPLETED).observe(result.duration_seconds)
+
+                        if result.input_hash is not None:
+                            self.cache.put(name, result.input_hash, result.output)
+                        manifest.record(name, ARTIFACT_RECOMPUTED, result.input_hash)
+
+                    except Exception as e:
+                        result.status = STAGE_FAILED
+                        result.error = str(e)
+                        logger.error("[%s] 단계 실패: %s", name, e, exc_info=True)
+                        JOB_STAGE_SECONDS.labels("pipeline", name, STAGE_FAILED).observe(result.duration_seconds)
+
+        total_seconds = time.perf_counter() - run_started
+        success = all(result.status in (STAGE_COMPLETED, STAGE_REUSED) for result in results.values())
+        JOB_STAGE_SECONDS.labels(
+            "pipeline", "total", STAGE_COMPLETED if success else STAGE_FAILED
+        ).observe(total_seconds)
+
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "success": success,
+            "total_seconds": round(total_seconds, 3),
+            "stages": [results[name].to_dict() for name in self.stages],
+            "manifest_path": manifest.save(),
+        }
+        report_path = self._save_report(report)
+
+        logger.info("=" * 60)
+        logger.info("파이프라인 실행 완료 - 성공: %s, 소요 시간: %.2f초", success, total_seconds)
+        for stage_report in report["stages"]:
+            logger.info(
+                "  %s: %s (%.2f초)",
+                stage_report['name'], stage_report['status'], stage_report['duration_seconds']
+            )
+        logger.info("실행 기록: %s", report_path)
+        logger.info("=" * 60)
+
+        report["outputs"] = {name: result.output for name, result in results.items()}
+        return report
+
+    def _save_report(self, report: Dict[str, Any]) -> str:
+        """단계별 소요 시간 실행 기록 저장"""
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_path = self.report_dir / f"run_{timestamp}.json"
+
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        return str(report_path)
+
+
+def latest_run_samples(report_dir: Path = PIPELINE_DIR) -> List[Sample]:
+    """
+    가장 최근 파이프라인 실행 기록을 메트릭 항목으로 변환
+
+    파이프라인은 API 서버와 다른 프로세스(GitHub Actions, CLI)에서 실행되므로
+    API 서버의 /metrics는 실행 기록 파일에서 마지막 실행 결과를 읽습니다.
+
+    Args:
+        report_dir: 실행 기록 디렉토리
+
+    Returns:
+        List[Sample]: 마지막 실행 시각/성공 여부/전체 및 단계별 소요 시간 (기록이 없으면 빈 리스트)
+    """
+    reports = sorted(report_dir.glob("run_*.json"))
+    if not reports:
+        return []
+
+    with open(reports[-1], 'r', encoding='utf-8') as f:
+        report = json.load(f)
+
+    labels = {"job": "pipeline"}
+    samples: List[Sample] = [
+        ("job_last_run_timestamp_seconds", "gauge", "마지막 작업 실행 완료 시각 (epoch 초)", labels,
+         reports[-1].stat().st_mtime),
+        ("job_last_run_success", "gauge", "마지막 작업 실행 성공 여부", labels, 1.0 if report.get("success") else 0.0),
+        ("job_last_run_duration_seconds", "gauge", "마지막 작업 전체 소요 시간 (초)", labels,
+         report.get("total_seconds", 0.0)),
+    ]
+    for stage in report.get("stages", []):
+        samples.append((
+            "job_last_stage_duration_seconds", "gauge", "마지막 작업의 단계별 소요 시간 (초)",
+            {**labels, "stage": stage["name"], "status": stage.get("status") or "pending"},
+            stage.get("duration_seconds", 0.0)
+        ))
+    return samples
+
+
+def build_morning_pipeline(
+    send_email: bool = False,
+    mode: Optional[str] = None,
+    force: bool = False
+) -> PipelineRunner:
+    """
+    모닝 브리핑 파이프라인 구성
+
+    screening → news → briefing → save → email
+
+    briefing 단계는 Gemini 응답 청크를 받는 즉시 JSON/HTML 파일에 기록합니다(스트리밍 경로).
+    save 단계는 브리핑 결과를 재사용한 경우 기존 파일을 최신 브리핑으로 지정하고,
+    파일이 없으면 저장된 본문으로 다시 렌더링합니다.
+
+    이메일 발송 시에는 screening → charts(스파크라인 이미지) → render_email →
+    email 경로가 추가되어, 차트 이미지를 CID 첨부로 참조하는 이메일용 HTML을 만듭니다.
+
+    Args:
+        send_email: 이메일 발송 단계 포함 여부
+        mode: 브리핑 생성 모드 (single, sectioned, 기본값: 환경 변수 BRIEFING_MODE)
+        force: True이면 입력이 같아도 모든 단계를 다시 실행
+
+    Returns:
+        PipelineRunner: 구성된 파이프라인
+    """
+    # 무거운 의존성(yahooquery, exa_py, google.generativeai)은 파이프라인 구성 시점에 로드
+    from . import briefing_service
+    from .screener_service import run_screening
+
+    mode = mode or os.getenv("BRIEFING_MODE", "single")
+    output_dir = Path(__file__).parent.parent / "output"
+
+    def screening(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        result = run_screening()
+        stocks = briefing_service.normalize_screening_stocks(result.get("stocks", []))
+        if not stocks:
+            raise ValueError("화제 종목이 없습니다.")
+        return stocks
+
+    def news(inputs: Dict[str, Any]) -> Dict[str, List[Dict]]:
+        return briefing_service.collect_news_for_stocks(inputs["screening"])
+
+    def briefing(inputs: Dict[str, Any]) -> Dict[str, str]:
+        briefing_service.configure_gemini()
+        stocks, news_data = inputs["screening"], inputs["news"]
+
+        if mode == "sectioned":
+            chunks = briefing_service.stream_sectioned_briefing(stocks, news_data)
+        else:
+            chunks = briefing_service.stream_briefing_with_gemini(stocks, news_data)
+
+        # 청크를 받는 즉시 JSON/HTML 파일에 기록하고, 이메일 렌더링용 본문만 모아 둠
+        output_dir.mkdir(exist_ok=True)
+        received: List[str] = []
+
+        def tee(source: Iterable[str]) -> Iterator[str]:
+            for chunk in source:
+                received.append(chunk)
+                yield chunk
+
+        json_path, html_path = briefing_service.save_briefing_stream(tee(chunks), stocks, output_dir)
+        created_at = datetime.strptime(briefing_service.briefing_artifact_id(json_path), "%Y%m%d_%H%M%S")
+
+        return {
+            "text": "".join(received),
+            "created_at": created_at.isoformat(),
+            "json_path": json_path,
+            "html_path": html_path,
+        }
+
+    def save(inputs: Dict[str, Any]) -> Dict[str, str]:
+        result = inputs["briefing"]
+        paths = [result.get("json_path"), result.get("html_path")]
+
+        # 재사용한 브리핑 파일이 남아 있으면 최신 브리핑으로만 다시 지정
+        if touch_files(paths):
+            briefing_service.get_output_store().set_latest(
+                briefing_service.KIND_BRIEFING,
+                briefing_service.briefing_artifact_id(result["json_path"])
+            )
+            return {"json_path": result["json_path"], "html_path": result["html_path"]}
+
+        # 파일이 없으면(새 실행 환경에서 캐시만 복원된 경우) 저장된 본문으로 다시 렌더링
+        output_dir.mkdir(exist_ok=True)
+        created_at = datetime.fromisoformat(result["created_at"])
+        json_path, html_path = briefing_service.write_briefing_files(
+            briefing_service.render_briefing_json(result["text"], inputs["screening"], created_at),
+            briefing_service.generate_html_briefing(
+                result["text"], inputs["screening"], created_at.strftime("%Y-%m-%d %H:%M:%S")
+            ),
+            output_dir,
+            created_at.strftime("%Y%m%d_%H%M%S")
+        )
+        briefing_service.register_briefing(json_path, html_path, inputs["screening"])
+        return {"json_path": json_path, "html_path": html_path}
+
+    def charts(inputs: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        from .chart_renderer import build_sparkline_images
+
+        # 차트는 부가 정보이므로 실패해도 이메일 발송은 계속
+        try:
+            return build_sparkline_images([stock["symbol"] for stock in inputs["screening"][:5]])
+        except Exception as e:
+            logger.warning("스파크라인 이미지 생성 실패: %s", e)
+            return {}
+
+    def render_email(inputs: Dict[str, Any]) -> str:
+        created_at = datetime.fromisoformat(inputs["briefing"]["created_at"])
+        return briefing_service.generate_html_briefing(
+            inputs["briefing"]["text"],
+            inputs["screening"],
+            created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            chart_srcs={symbol: f"cid:{info['cid']}" for symbol, info in inputs["charts"].items()}
+        )
+
+    def email(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        from .email_service import run_email_delivery
+
+        result = run_email_delivery(
+            inputs["render_email"],
+            images={info["cid"]: info["path"] for info in inputs["charts"].values()}
+        )
+        if not result["success"]:
+            raise RuntimeError(f"이메일 발송 실패: {result.get('error', result.get('failed_emails'))}")
+        return result
+
+    runner = PipelineRunner(force=force)
+    runner.add_stage("screening", screening)
+    runner.add_stage(
+        "news", news,
+        depends_on=["screening"],
+        cache_key=lambda inputs: {
+            "symbols": [stock["symbol"] for stock in inputs["screening"][:5]],
+            "date": datetime.now().strftime("%Y-%m-%d"),
+        }
+    )
+    runner.add_stage(
+        "briefing", briefing,
+        depends_on=["screening", "news"],
+        cache_key=lambda inputs: {
+            "mode": mode,
+            "stocks": inputs["screening"][:5],
+            "news": inputs["news"],
+        }
+    )
+    runner.add_stage("save", save, depends_on=["screening", "briefing"])
+
+    if send_email:
+        runner.add_stage("charts", charts, depends_on=["screening"])
+        runner.add_stage("render_email", render_email, depends_on=["screening", "briefing", "charts"])
+        runner.add_stage(
+            "email", email,
+            depends_on=["render_email", "charts", "save"],
+            cache_key=lambda inputs: compute_content_hash(inputs["render_email"])
+        )
+
+    return runner
+
+
+def has_new_session(
+    calendar: Optional[MarketCalendar] = None,
+    now: Optional[datetime] = None,
+    max_age_hours: float = BRIEFING_MAX_SESSION_AGE_HOURS
+) -> bool:
+    """
+    브리핑할 새 거래 세션이 있는지 확인 (마지막 정규장 마감이 max_age_hours 이내)
+
+    Args:
+        calendar: 시장 캘린더 (기본값: 프로세스 공용 캘린더)
+        now: 기준 시각 (기본값: 현재)
+        max_age_hours: 마감 후 허용 시간
+
+    Returns:
+        bool: 새 세션 여부
+    """
+    calendar = calendar or get_market_calendar()
+    now = now or datetime.now(timezone.utc)
+    last_close = calendar.last_close(now)
+    if last_close is None:
+        return False
+
+    age_hours = (now - last_close).total_seconds() / 3600
+    logger.info(
+        "마지막 정규장 마감: %s (KST %s, %.1f시간 전)",
+        last_close.isoformat(), to_kst(last_close).strftime("%Y-%m-%d %H:%M"), age_hours
+    )
+    return age_hours <= max_age_hours
+
+
+def run_morning_pipeline(
+    send_email: bool = False,
+    mode: Optional[str] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    모닝 브리핑 파이프라인 실행
+
+    Args:
+        send_email: 이메일 발송 단계 포함 여부
+        mode: 브리핑 생성 모드 (single, sectioned)
+        force: True이면 입력이 같아도 모든 단계를 다시 실행
+
+    Returns:
+        Dict: 파이프라인 실행 결과
+    """
+    from .output_store import get_output_store
+
+    runner = build_morning_pipeline(send_email=send_email, mode=mode, force=force)
+    result = runner.run()
+
+    # 보존 기간이 지난 산출물 정리
+    try:
+        get_output_store().compact()
+    except Exception as e:
+        logger.warning("산출물 정리 실패: %s", e)
+
+    return result
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="굿모닝 월가 모닝 파이프라인")
+    parser.add_argument("--email", action="store_true", help="이메일 발송 단계 포함")
+    parser.add_argument("--mode", choices=["single", "sectioned"], help="브리핑 생성 모드")
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 모든 단계 재실행")
+    parser.add_argument("--ignore-calendar", action="store_true", help="휴장일/주말에도 실행")
+    args = parser.parse_args()
+
+    if not args.ignore_calendar and not has_new_session():
+        logger.info("새 거래 세션이 없어 브리핑을 건너뜁니다 (주말 또는 휴장일)")
+        exit(0)
+
+    try:
+        result = run_morning_pipeline(
+            send_email=args.email,
+            mode=args.mode,
+            force=args.force
+        )
+
+        if result["success"]:
+            logger.info("프로그램 정상 종료")
+            exit(0)
+        else:
+            logger.error("프로그램 비정상 종료")
+            exit(1)
+
+    except Exception as e:
+        logger.error("프로그램 실행 중 오류 발생: %s", e)
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
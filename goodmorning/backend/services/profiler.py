@@ -0,0 +1,294 @@
+"""
+샘플링 프로파일러 서비스
+
+운영 중인 워커에서 CPU 사용이 튀는 구간을 찾기 위해, 별도 스레드가 일정 간격으로
+모든 스레드의 파이썬 스택(sys._current_frames)을 읽어 같은 스택끼리 개수를 셉니다.
+대상 코드를 계측하지 않으므로 켜 둔 동안의 비용은 샘플링 스레드 하나의 스택 읽기뿐입니다.
+
+결과는 flamegraph.pl / speedscope / inferno에서 바로 읽을 수 있는 collapsed-stack 형식입니다.
+(한 줄에 "스레드;바깥 함수;...;안쪽 함수 샘플 수")
+
+- 관리자 엔드포인트: 지정한 시간 동안 워커 전체를 샘플링
+- 요청 단위: X-Profile 요청 헤더가 있는 요청 하나를 처리하는 동안 샘플링하고
+  X-Profile-Id 응답 헤더의 ID로 결과를 조회
+"""
+
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import List, Optional, Pattern, Tuple
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 관리자 토큰 (비어 있으면 프로파일링 엔드포인트와 요청 헤더 모두 비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# 샘플링 간격 (밀리초) 및 최대 프로파일링 시간 (초)
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "10"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
+# 요청 단위 프로파일 보관 개수
+REQUEST_PROFILE_KEEP = 20
+
+# 스택 최대 깊이
+MAX_STACK_DEPTH = 128
+
+# 대기 중인 스레드로 보는 마지막 프레임 (파일 이름, 함수 이름) - 기본적으로 결과에서 제외
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+}
+
+_THREAD_NAME_SUFFIX = re.compile(r"[_-]\d+$")
+
+
+class ProfilerBusyError(Exception):
+    """다른 프로파일링이 이미 실행 중인 경우"""
+
+
+def verify_admin_token(token: Optional[str], admin_token: str = ADMIN_TOKEN) -> bool:
+    """
+    관리자 토큰 확인 (설정된 토큰이 없으면 항상 거절)
+
+    Args:
+        token: 요청에 담긴 토큰
+        admin_token: 설정된 관리자 토큰
+
+    Returns:
+        bool: 일치 여부
+    """
+    if not admin_token or not token:
+        return False
+    return hmac.compare_digest(token.encode("utf-8"), admin_token.encode("utf-8"))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """모든 스레드의 스택을 주기적으로 읽어 collapsed-stack으로 집계하는 프로파일러"""
+
+    def __init__(
+        self,
+        interval_seconds: float = PROFILE_INTERVAL_MS / 1000,
+        include_idle: bool = False,
+        exclude_thread_ids: Tuple[int, ...] = ()
+    ):
+        """
+        SamplingProfiler 초기화
+
+        Args:
+            interval_seconds: 샘플링 간격 (초)
+            include_idle: 대기 중인 스레드(락/큐/셀렉터 대기) 스택도 포함할지 여부
+            exclude_thread_ids: 샘플링하지 않을 스레드 ID (예: 프로파일링 종료를 기다리는 스레드)
+        """
+        self.interval_seconds = interval_seconds
+        self.include_idle = include_idle
+        self.exclude_thread_ids = set(exclude_thread_ids)
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self.duration_seconds = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration_seconds = time.perf_counter() - self._started_at
+        return self
+
+    def _run(self) -> None:
+        excluded = self.exclude_thread_ids | {threading.get_ident()}
+        while not self._stop.wait(self.interval_seconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in excluded:
+                    continue
+                stack = self._collapse(frame, names.get(thread_id, "unknown"))
+                if stack is not None:
+                    self._stacks[stack] += 1
+            self.samples += 1
+
+    def _collapse(self, frame, thread_name: str) -> Optional[str]:
+        leaf = (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+        if not self.include_idle and leaf in IDLE_FRAMES:
+            return None
+
+        labels = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        labels.append(_THREAD_NAME_SUFFIX.sub("", thread_name))
+        labels.reverse()
+        return ";".join(label.replace(";", ":") for label in labels)
+
+    def collapsed(self) -> str:
+        """
+        collapsed-stack 형식 결과
+
+        Returns:
+            str: 샘플 수 내림차순 "스택 샘플 수" 줄 목록
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def top_functions(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        자체 샘플(스택 맨 안쪽 함수) 기준 상위 함수
+
+        Args:
+            limit: 반환 개수
+
+        Returns:
+            List[Tuple[str, int]]: (함수, 샘플 수)
+        """
+        leaves: Counter = Counter()
+        for stack, count in self._stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+_profile_lock = threading.Lock()
+_request_profiles: "OrderedDict[str, str]" = OrderedDict()
+_request_profiles_lock = threading.Lock()
+
+
+def profile_for(
+    seconds: float,
+    interval_seconds: float = PROFILE_INTERVAL_MS / 1000,
+    include_idle: bool = False
+) -> SamplingProfiler:
+    """
+    현재 프로세스를 지정한 시간 동안 샘플링 (호출 스레드는 끝날 때까지 대기)
+
+    Args:
+        seconds: 프로파일링 시간 (최대 PROFILE_MAX_SECONDS)
+        interval_seconds: 샘플링 간격 (초)
+        include_idle: 대기 중인 스레드 스택 포함 여부
+
+    Returns:
+        SamplingProfiler: 종료된 프로파일러
+
+    Raises:
+        ProfilerBusyError: 다른 프로파일링이 실행 중인 경우
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("다른 프로파일링이 실행 중입니다.")
+
+    try:
+        seconds = min(max(seconds, interval_seconds), PROFILE_MAX_SECONDS)
+        logger.info("샘플링 프로파일링 시작 - %.1f초, 간격 %.0fms", seconds, interval_seconds * 1000)
+        profiler = SamplingProfiler(interval_seconds, include_idle, (threading.get_ident(),)).start()
+        time.sleep(seconds)
+        profiler.stop()
+        logger.info("샘플링 프로파일링 완료 - 샘플 %s회, 상위 함수: %s", profiler.samples, profiler.top_functions(3))
+        return profiler
+    finally:
+        _profile_lock.release()
+
+
+def get_request_profile(profile_id: str) -> Optional[str]:
+    """
+    요청 단위 프로파일 결과 조회
+
+    Args:
+        profile_id: X-Profile-Id 응답 헤더 값
+
+    Returns:
+        str: collapsed-stack 결과 또는 None (없거나 보관 개수를 넘어 삭제됨)
+    """
+    with _request_profiles_lock:
+        return _request_profiles.get(profile_id)
+
+
+def _store_request_profile(profiler: SamplingProfiler) -> str:
+    profile_id = uuid.uuid4().hex[:16]
+    with _request_profiles_lock:
+        _request_profiles[profile_id] = profiler.collapsed()
+        while len(_request_profiles) > REQUEST_PROFILE_KEEP:
+            _request_profiles.popitem(last=False)
+    return profile_id
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestProfilingMiddleware:
+    """X-Profile 헤더가 있는 요청 하나를 샘플링하는 ASGI 미들웨어 (관리자 토큰 필요)"""
+
+    def __init__(self, app, paths: Tuple[str, ...] = (), interval_seconds: float = 0.002):
+        """
+        RequestProfilingMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 앱
+            paths: 프로파일링을 허용할 경로 정규식
+            interval_seconds: 샘플링 간격 (초, 요청 하나는 짧으므로 기본값보다 촘촘하게)
+        """
+        self.app = app
+        self.paths: List[Pattern] = [re.compile(path) for path in paths]
+        self.interval_seconds = interval_seconds
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or _header(scope, b"x-profile") is None
+            or not any(pattern.match(scope["path"]) for pattern in self.paths)
+            or not verify_admin_token(_header(scope, b"x-admin-token"))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # 동시에 하나만 실행 (이미 실행 중이면 프로파일링 없이 처리)
+        if not _profile_lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(self.interval_seconds).start()
+        stopped = False
+
+        async def send_with_profile(message):
+            nonlocal stopped
+            if message["type"] == "http.response.start" and not stopped:
+                stopped = True
+                profiler.stop()
+                _profile_lock.release()
+                profile_id = _store_request_profile(profiler)
+                logger.info("요청 프로파일 저장 - %s, ID: %s, 샘플 %s회", scope['path'], profile_id, profiler.samples)
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode("latin-1"))],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            if not stopped:
+                stopped = True
+                profiler.stop()
+                _profile_lock.release()
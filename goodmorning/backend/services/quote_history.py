@@ -0,0 +1,233 @@
+"""
+시세 이력 저장 서비스
+
+화제 종목 조회 때마다 받은 시세(심볼, 시각, 가격, 변동률, 거래량, 시가총액)를
+일자별 파티션 파일에 고정 길이 레코드로 추가 기록하고, NumPy 메모리 맵으로
+종목별 기간 조회를 제공합니다. 기록된 이력으로 장중 스파크라인, 상대 거래량,
+화제 지속 일수를 Yahoo 재호출 없이 계산할 수 있습니다.
+
+저장 구조:
+    output/quotes/{YYYY-MM-DD}.bin  (UTC 기준 일자, QUOTE_DTYPE 레코드 배열)
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+HISTORY_DIR = Path(__file__).parent.parent / "output" / "quotes"
+
+# 시세 레코드 형식 (레코드당 52바이트, 리틀 엔디언 고정)
+QUOTE_DTYPE = np.dtype([
+    ("symbol", "S12"),
+    ("ts", "<i8"),              # UTC epoch seconds
+    ("price", "<f8"),
+    ("change_percent", "<f8"),
+    ("volume", "<i8"),
+    ("market_cap", "<i8"),
+])
+
+
+def _to_epoch(value: datetime) -> int:
+    """datetime을 UTC epoch 초로 변환 (timezone 정보가 없으면 로컬 시각으로 간주)"""
+    return int(value.timestamp())
+
+
+def _partition_day(epoch: int) -> str:
+    """epoch 초가 속한 파티션 일자 (UTC, YYYY-MM-DD)"""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+class QuoteHistoryStore:
+    """일자별 파티션 기반 시세 이력 저장소"""
+
+    def __init__(self, root: Path = HISTORY_DIR):
+        """
+        QuoteHistoryStore 초기화
+
+        Args:
+            root: 파티션 파일 저장 디렉토리
+        """
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _partition_path(self, day: str) -> Path:
+        return self.root / f"{day}.bin"
+
+    def append(
+        self,
+        quotes: List[Dict[str, Any]],
+        timestamp: Optional[datetime] = None
+    ) -> int:
+        """
+        시세 스냅샷 추가 기록
+
+        Args:
+            quotes: 시세 리스트 (symbol, price, change_percent, volume, market_cap)
+            timestamp: 조회 시각 (기본값: 현재 시각)
+
+        Returns:
+            int: 기록한 레코드 수
+        """
+        records = [quote for quote in quotes if quote.get("symbol")]
+        if not records:
+            return 0
+
+        epoch = _to_epoch(timestamp or datetime.now(timezone.utc))
+        data = np.zeros(len(records), dtype=QUOTE_DTYPE)
+        data["symbol"] = [quote["symbol"].encode("ascii", "ignore")[:12] for quote in records]
+        data["ts"] = epoch
+        data["price"] = [quote.get("price") or 0 for quote in records]
+        data["change_percent"] = [quote.get("change_percent") or 0 for quote in records]
+        data["volume"] = [quote.get("volume") or 0 for quote in records]
+        data["market_cap"] = [quote.get("market_cap") or 0 for quote in records]
+
+        path = self._partition_path(_partition_day(epoch))
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f:
+                f.write(data.tobytes())
+
+        return len(records)
+
+    def _load_partition(self, day: str) -> np.ndarray:
+        """
+        파티션 파일을 읽기 전용 메모리 맵으로 로드
+
+        기록 도중의 불완전한 마지막 레코드는 제외합니다.
+        """
+        path = self._partition_path(day)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return np.empty(0, dtype=QUOTE_DTYPE)
+
+        count = size // QUOTE_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=QUOTE_DTYPE)
+
+        return np.memmap(path, dtype=QUOTE_DTYPE, mode="r", shape=(count,))
+
+    def scan(
+        self,
+        symbol: str,
+        start: datetime,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """
+        종목별 기간 조회
+
+        Args:
+            symbol: 종목 심볼
+            start: 시작 시각 (포함)
+            end: 종료 시각 (미포함, 기본값: 현재 시각)
+
+        Returns:
+            np.ndarray: QUOTE_DTYPE 레코드 배열 (시각 오름차순)
+        """
+        start_epoch = _to_epoch(start)
+        end_epoch = _to_epoch(end or datetime.now(timezone.utc))
+        symbol_key = symbol.upper().encode("ascii", "ignore")[:12]
+
+        day = datetime.fromtimestamp(start_epoch, tz=timezone.utc).date()
+        last_day = datetime.fromtimestamp(end_epoch, tz=timezone.utc).date()
+
+        chunks = []
+        while day <= last_day:
+            partition = self._load_partition(day.isoformat())
+            if len(partition):
+                mask = (
+                    (partition["symbol"] == symbol_key)
+                    & (partition["ts"] >= start_epoch)
+                    & (partition["ts"] < end_epoch)
+                )
+                if mask.any():
+                    chunks.append(np.array(partition[mask]))
+            day += timedelta(days=1)
+
+        if not chunks:
+            return np.empty(0, dtype=QUOTE_DTYPE)
+
+        result = np.concatenate(chunks)
+        return result[np.argsort(result["ts"], kind="stable")]
+
+    def relative_volume(self, symbol: str, lookback_days: int = 20) -> Optional[float]:
+        """
+        상대 거래량 (최근 거래량 / 이전 일자별 마지막 거래량 평균)
+
+        Args:
+            symbol: 종목 심볼
+            lookback_days: 평균 계산 기간 (일)
+
+        Returns:
+            float: 상대 거래량 또는 None (이전 이력이 없는 경우)
+        """
+        now = datetime.now(timezone.utc)
+        history = self.scan(symbol, now - timedelta(days=lookback_days + 1), now)
+        if len(history) == 0:
+            return None
+
+        days = (history["ts"] // 86400).astype(np.int64)
+        # 일자별 마지막 레코드 (시각 오름차순이므로 일자가 바뀌기 직전 인덱스)
+        last_of_day = np.flatnonzero(np.append(days[1:] != days[:-1], True))
+        daily_volume = history["volume"][last_of_day]
+
+        if len(daily_volume) < 2:
+            return None
+
+        baseline = daily_volume[:-1].mean()
+        if baseline <= 0:
+            return None
+
+        return float(daily_volume[-1] / baseline)
+
+    def trending_days(self, symbol: str, max_days: int = 30) -> int:
+        """
+        화제 지속 일수 (오늘부터 거꾸로 연속으로 기록된 일수)
+
+        Args:
+            symbol: 종목 심볼
+            max_days: 최대 조회 일수
+
+        Returns:
+            int: 연속 기록 일수
+        """
+        symbol_key = symbol.upper().encode("ascii", "ignore")[:12]
+        day = datetime.now(timezone.utc).date()
+
+        streak = 0
+        for _ in range(max_days):
+            partition = self._load_partition(day.isoformat())
+            if not len(partition) or not (partition["symbol"] == symbol_key).any():
+                break
+            streak += 1
+            day -= timedelta(days=1)
+
+        return streak
+
+
+def to_series(records: np.ndarray) -> Dict[str, List[Any]]:
+    """
+    시세 레코드 배열을 열 단위 리스트로 변환 (API 응답용)
+
+    Args:
+        records: QUOTE_DTYPE 레코드 배열
+
+    Returns:
+        Dict: 열 이름 → 값 리스트
+    """
+    return {
+        "ts": records["ts"].tolist(),
+        "price": records["price"].tolist(),
+        "change_percent": records["change_percent"].tolist(),
+        "volume": records["volume"].tolist(),
+        "market_cap": records["market_cap"].tolist(),
+    }
@@ -9,8 +9,19 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
+from .artifact_cache import (
+    StageArtifactCache,
+    RunManifest,
+    compute_content_hash,
+    touch_files,
+    ARTIFACT_REUSED,
+    ARTIFACT_RECOMPUTED,
+)
+from .quote_history import QuoteHistoryStore
+from .segment_store import get_segment_store, append_artifact
+from .output_store import get_output_store, KIND_SCREENING, STATUS_FAILED
 from .trending_stock_service import get_all_trending_stocks
 from .utils import LoggerFactory
 
@@ -25,6 +36,49 @@ def ensure_output_directory() -> Path:
     return output_dir
 
 
+def normalize_screening_stocks(stocks: Any) -> List[Dict[str, Any]]:
+    """
+    스크리너 타입별 TOP 종목 응답을 종목 리스트로 변환
+
+    get_all_trending_stocks()의 스크리너 타입별 응답(dict)을 스크리닝 결과와
+    브리핑에서 사용하는 {symbol, name, price, change_percent, ...} 리스트로
+    변환하고 중복 종목은 제거합니다. 이미 리스트 형식이면 그대로 반환합니다.
+    (이전 형식으로 저장된 screening_*.json 로드 시에도 사용)
+
+    Args:
+        stocks: 스크리닝 결과의 stocks 값 (list 또는 스크리너 타입별 dict)
+
+    Returns:
+        List[Dict]: 브리핑용 종목 리스트
+    """
+    if isinstance(stocks, list):
+        return stocks
+
+    if not isinstance(stocks, dict):
+        return []
+
+    normalized = []
+    seen_symbols = set()
+    for screener_type, result in stocks.items():
+        basic_info = (result or {}).get("basic_info") or {}
+        symbol = basic_info.get("symbol") or (result or {}).get("symbol")
+        if not symbol or symbol in seen_symbols:
+            continue
+
+        seen_symbols.add(symbol)
+        normalized.append({
+            "symbol": symbol,
+            "name": basic_info.get("shortName") or basic_info.get("longName") or symbol,
+            "price": basic_info.get("regularMarketPrice") or 0,
+            "change_percent": basic_info.get("regularMarketChangePercent") or 0,
+            "volume": basic_info.get("regularMarketVolume") or 0,
+            "market_cap": basic_info.get("marketCap") or 0,
+            "screener_type": screener_type,
+        })
+
+    return normalized
+
+
 def save_screening_result(data: Dict[str, Any], output_dir: Path) -> str:
     """
     스크리닝 결과를 JSON 파일로 저장
@@ -43,10 +97,75 @@ def save_screening_result(data: Dict[str, Any], output_dir: Path) -> str:
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-    logger.info(f"스크리닝 결과 저장 완료: {filepath}")
+    logger.info("스크리닝 결과 저장 완료: %s", filepath)
     return str(filepath)
 
 
+def screening_artifact_id(filepath: str) -> str:
+    """
+    스크리닝 파일 경로에서 산출물 ID 추출
+
+    Args:
+        filepath: screening_{YYYYmmdd_HHMMSS}.json 경로
+
+    Returns:
+        str: 산출물 ID (YYYYmmdd_HHMMSS)
+    """
+    return Path(filepath).stem[len("screening_"):]
+
+
+def save_screening_if_changed(
+    data: Dict[str, Any],
+    output_dir: Path,
+    cache: Optional[StageArtifactCache] = None
+) -> Tuple[str, bool]:
+    """
+    종목 내용이 바뀐 경우에만 스크리닝 결과를 새 파일로 저장
+
+    종목 리스트의 내용 해시가 이전 실행과 같으면 새 screening_*.json을 만들지 않고
+    기존 파일의 수정 시각만 갱신하여 재사용합니다. 내용 해시는 data["content_hash"]에 기록되며,
+    재사용/재계산 여부는 실행 매니페스트에 남습니다.
+
+    Args:
+        data: 저장할 스크리닝 결과
+        output_dir: 출력 디렉토리 경로
+        cache: 단계 결과 캐시 (기본값: output/artifacts)
+
+    Returns:
+        Tuple[str, bool]: (스크리닝 파일 경로, 재사용 여부)
+    """
+    cache = cache or StageArtifactCache()
+    manifest = RunManifest("screening")
+
+    content_hash = compute_content_hash(data["stocks"])
+    data["content_hash"] = content_hash
+
+    store = get_output_store()
+
+    cached = cache.get("screening", content_hash)
+    if cached and cached.get("id") and touch_files([cached.get("path")]):
+        logger.info("스크리닝 결과 변경 없음 - 기존 파일 재사용: %s", cached['path'])
+        store.set_latest(KIND_SCREENING, cached["id"])
+        manifest.record("screening", ARTIFACT_REUSED, content_hash, [cached["path"]])
+        manifest.save()
+        return cached["path"], True
+
+    filepath = save_screening_result(data, output_dir)
+    artifact_id = screening_artifact_id(filepath)
+    record = store.put(
+        KIND_SCREENING,
+        artifact_id,
+        {"json": filepath},
+        meta={"content_hash": content_hash, "count": data["count"]}
+    )
+    append_artifact(get_segment_store(KIND_SCREENING), record)
+    cache.put("screening", content_hash, {"id": artifact_id, "path": filepath})
+    manifest.record("screening", ARTIFACT_RECOMPUTED, content_hash, [filepath])
+    manifest.save()
+
+    return filepath, False
+
+
 def run_screening() -> Dict[str, Any]:
     """
     화제 종목 스크리닝 실행
@@ -63,8 +182,8 @@ def run_screening() -> Dict[str, Any]:
     logger.info("=" * 60)
 
     try:
-        # 화제 종목 조회
-        stocks = get_all_trending_stocks()
+        # 화제 종목 조회 (스크리너 타입별 결과를 종목 리스트로 변환)
+        stocks = normalize_screening_stocks(get_all_trending_stocks())
 
         # 결과 구성
         result = {
@@ -75,20 +194,26 @@ def run_screening() -> Dict[str, Any]:
             "message": f"{len(stocks)}개 화제 종목 조회 완료"
         }
 
-        # 결과 저장
+        # 시세 이력 기록
+        try:
+            QuoteHistoryStore().append(stocks)
+        except Exception as e:
+            logger.warning("시세 이력 기록 실패: %s", e)
+
+        # 결과 저장 (이전 실행과 종목 내용이 같으면 기존 파일 재사용)
         output_dir = ensure_output_directory()
-        filepath = save_screening_result(result, output_dir)
+        filepath, reused = save_screening_if_changed(result, output_dir)
 
         logger.info("=" * 60)
-        logger.info(f"스크리닝 완료: {len(stocks)}개 종목")
-        logger.info(f"저장 위치: {filepath}")
+        logger.info("스크리닝 완료: %s개 종목", len(stocks))
+        logger.info("저장 위치: %s%s", filepath, ' (재사용)' if reused else '')
         logger.info("=" * 60)
 
         # 화제 종목 목록 출력
         for i, stock in enumerate(stocks, 1):
             logger.info(
-                f"{i}. {stock['symbol']} - {stock['name']} "
-                f"({stock['change_percent']:+.2f}%)"
+                "%s. %s - %s (%+.2f%%)",
+                i, stock['symbol'], stock['name'], stock['change_percent']
             )
 
         return result
@@ -106,9 +231,17 @@ def run_screening() -> Dict[str, Any]:
             "message": error_msg
         }
 
-        # 에러 결과도 저장
+        # 에러 결과도 저장 (최신 스크리닝으로는 지정하지 않음)
         output_dir = ensure_output_directory()
-        save_screening_result(result, output_dir)
+        filepath = save_screening_result(result, output_dir)
+        get_output_store().put(
+            KIND_SCREENING,
+            screening_artifact_id(filepath),
+            {"json": filepath},
+            status=STATUS_FAILED,
+            meta={"error": str(e)},
+            set_latest=False
+        )
 
         raise
 
@@ -127,7 +260,7 @@ def main():
             exit(1)
 
     except Exception as e:
-        logger.error(f"프로그램 실행 중 오류 발생: {e}")
+        logger.error("프로그램 실행 중 오류 발생: %s", e)
         exit(1)
 
 
@@ -0,0 +1,454 @@
+"""
+세그먼트 저장소 (메모리 맵 읽기 경로)
+
+완료된 브리핑/스크리닝을 종류별 추가 전용 세그먼트 파일에 기록하고,
+고정 길이 오프셋 인덱스로 위치를 찾습니다. 읽을 때는 세그먼트 파일을
+메모리 맵으로 열어 요약/상세 JSON과 HTML을 복사 없이 잘라 반환하므로,
+API는 요청마다 파일을 열고 JSON을 파싱하지 않고 바이트 범위를 그대로 응답합니다.
+
+저장 구조:
+    output/segments/{kind}.seg  레코드 = 요약 JSON + 상세 JSON + HTML (UTF-8 바이트)
+    output/segments/{kind}.idx  INDEX_DTYPE 레코드 배열 (레코드별 ID, 시각, 오프셋, 길이)
+"""
+
+import json
+import mmap
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+SEGMENT_DIR = Path(__file__).parent.parent / "output" / "segments"
+
+# 오프셋 인덱스 레코드 형식
+INDEX_DTYPE = np.dtype([
+    ("id", "S32"),
+    ("created_ts", "<i8"),
+    ("offset", "<i8"),
+    ("summary_len", "<i4"),
+    ("detail_len", "<i4"),
+    ("html_len", "<i4"),
+])
+
+# 파일 교체 중 인덱스를 다시 읽는 최대 횟수
+REFRESH_ATTEMPTS = 3
+
+
+class SegmentStore:
+    """추가 전용 세그먼트 파일 + 오프셋 인덱스 저장소"""
+
+    def __init__(self, kind: str, root: Path = SEGMENT_DIR):
+        """
+        SegmentStore 초기화
+
+        Args:
+            kind: 레코드 종류 (briefing, screening)
+            root: 세그먼트 파일 저장 디렉토리
+        """
+        self.kind = kind
+        self.root = root
+        self.segment_path = root / f"{kind}.seg"
+        self.index_path = root / f"{kind}.idx"
+        self._write_lock = threading.Lock()
+        self._map_lock = threading.Lock()
+        self._segment_map: Optional[mmap.mmap] = None
+        self._segment_key: Optional[Tuple[int, int]] = None
+        self._index = np.empty(0, dtype=INDEX_DTYPE)
+        self._index_key: Optional[Tuple[int, int]] = None
+
+    def append(
+        self,
+        record_id: str,
+        created_at: datetime,
+        summary: Dict[str, Any],
+        detail: Dict[str, Any],
+        html: str = ""
+    ) -> None:
+        """
+        레코드 추가 (같은 ID를 다시 추가하면 마지막 레코드가 조회됨)
+
+        Args:
+            record_id: 레코드 ID
+            created_at: 생성 시각
+            summary: 목록 조회용 요약 문서
+            detail: 상세 조회용 문서
+            html: HTML 버전 (선택)
+        """
+        summary_bytes = json.dumps(summary, ensure_ascii=False, default=str).encode("utf-8")
+        detail_bytes = json.dumps(detail, ensure_ascii=False, default=str).encode("utf-8")
+        html_bytes = html.encode("utf-8")
+
+        with self._write_lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+            # 세그먼트를 먼저 기록한 뒤 인덱스를 추가하여, 인덱스가 가리키는 범위는 항상 완전함
+            with open(self.segment_path, "ab") as f:
+                offset = f.tell()
+                f.write(summary_bytes + detail_bytes + html_bytes)
+
+            entry = np.zeros(1, dtype=INDEX_DTYPE)
+            entry["id"] = record_id.encode("ascii", "ignore")[:32]
+            entry["created_ts"] = int(created_at.timestamp())
+            entry["offset"] = offset
+            entry["summary_len"] = len(summary_bytes)
+            entry["detail_len"] = len(detail_bytes)
+            entry["html_len"] = len(html_bytes)
+
+            with open(self.index_path, "ab") as f:
+                f.write(entry.tobytes())
+
+    def _refresh(self) -> Tuple[Optional[mmap.mmap], np.ndarray]:
+        """
+        파일이 커지거나 교체되었으면 메모리 맵 다시 열기
+
+        append()는 세그먼트 → 인덱스 순으로 기록하므로 인덱스를 먼저 확인한 뒤
+        세그먼트를 엽니다. 이렇게 하면 읽은 인덱스가 가리키는 범위는 항상
+        나중에 연 세그먼트에 포함됩니다. compact()가 파일을 교체하는 도중이면
+        인덱스 파일이 바뀌므로 다시 읽습니다.
+
+        이전 메모리 맵은 닫지 않습니다. 응답 중인 memoryview가 참조하는 동안 유지되고
+        참조가 사라지면 자동으로 해제됩니다.
+        """
+        for _ in range(REFRESH_ATTEMPTS):
+            try:
+                index_stat = os.stat(self.index_path)
+                segment_stat = os.stat(self.segment_path)
+            except OSError:
+                return None, np.empty(0, dtype=INDEX_DTYPE)
+
+            with self._map_lock:
+                index_key = (index_stat.st_ino, index_stat.st_size)
+                if index_key != self._index_key:
+                    count = index_stat.st_size // INDEX_DTYPE.itemsize
+                    self._index = np.memmap(
+                        self.index_path, dtype=INDEX_DTYPE, mode="r", shape=(count,)
+                    ) if count else np.empty(0, dtype=INDEX_DTYPE)
+                    self._index_key = index_key
+
+                segment_key = (segment_stat.st_ino, segment_stat.st_size)
+                if segment_key != self._segment_key:
+                    self._segment_map = None
+                    if segment_stat.st_size > 0:
+                        with open(self.segment_path, "rb") as f:
+                            self._segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._segment_key = segment_key
+
+                segment_map, index = self._segment_map, self._index
+
+            try:
+                if os.stat(self.index_path).st_ino == index_stat.st_ino:
+                    return segment_map, index
+            except OSError:
+                return None, np.empty(0, dtype=INDEX_DTYPE)
+
+        return None, np.empty(0, dtype=INDEX_DTYPE)
+
+    @staticmethod
+    def _in_bounds(segment_map: mmap.mmap, entries: np.ndarray) -> np.ndarray:
+        """레코드 범위가 메모리 맵 안에 있는지 여부 (기록 중인 레코드 제외)"""
+        ends = (
+            entries["offset"]
+            + entries["summary_len"]
+            + entries["detail_len"]
+            + entries["html_len"]
+        )
+        return ends <= len(segment_map)
+
+    def _latest_entries(self, index: np.ndarray) -> np.ndarray:
+        """ID별 마지막 레코드만 남긴 인덱스 위치 (오래된 순)"""
+        if len(index) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # 뒤에서부터 처음 나온 ID만 선택 후 원래 순서로 정렬
+        _, last_positions = np.unique(index["id"][::-1], return_index=True)
+        return np.sort(len(index) - 1 - last_positions)
+
+    def _find(self, record_id: str) -> Optional[Tuple[mmap.mmap, np.void]]:
+        """ID에 해당하는 마지막 인덱스 레코드 조회"""
+        segment_map, index = self._refresh()
+        if segment_map is None or len(index) == 0:
+            return None
+
+        positions = np.flatnonzero(index["id"] == record_id.encode("ascii", "ignore")[:32])
+        if len(positions) == 0:
+            return None
+
+        entry = index[positions[-1]]
+        if not self._in_bounds(segment_map, entry):
+            return None
+
+        return segment_map, entry
+
+    def summary_slices(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Tuple[List[memoryview], int]:
+        """
+        기간 내 요약 문서 바이트 범위 조회 (최신순)
+
+        Args:
+            start: 시작 시각 (포함)
+            end: 종료 시각 (미포함)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            Tuple[List[memoryview], int]: (요약 JSON 바이트 범위 리스트, 기간 내 전체 개수)
+        """
+        segment_map, index = self._refresh()
+        if segment_map is None:
+            return [], 0
+
+        positions = self._latest_entries(index)
+        entries = index[positions]
+
+        mask = self._in_bounds(segment_map, entries)
+        if start is not None:
+            mask &= entries["created_ts"] >= int(start.timestamp())
+        if end is not None:
+            mask &= entries["created_ts"] < int(end.timestamp())
+
+        selected = entries[mask]
+        order = np.argsort(-selected["created_ts"], kind="stable")
+        page = selected[order][offset:offset + limit]
+
+        view = memoryview(segment_map)
+        slices = [
+            view[int(entry["offset"]):int(entry["offset"]) + int(entry["summary_len"])]
+            for entry in page
+        ]
+        return slices, int(len(selected))
+
+    def detail_slice(self, record_id: str) -> Optional[memoryview]:
+        """
+        상세 문서 바이트 범위 조회
+
+        Args:
+            record_id: 레코드 ID
+
+        Returns:
+            memoryview: 상세 JSON 바이트 범위 또는 None
+        """
+        found = self._find(record_id)
+        if found is None:
+            return None
+
+        segment_map, entry = found
+        start = int(entry["offset"]) + int(entry["summary_len"])
+        return memoryview(segment_map)[start:start + int(entry["detail_len"])]
+
+    def html_slice(self, record_id: str) -> Optional[memoryview]:
+        """
+        HTML 바이트 범위 조회
+
+        Args:
+            record_id: 레코드 ID
+
+        Returns:
+            memoryview: HTML 바이트 범위 또는 None (HTML이 없는 경우 포함)
+        """
+        found = self._find(record_id)
+        if found is None or int(found[1]["html_len"]) == 0:
+            return None
+
+        segment_map, entry = found
+        start = int(entry["offset"]) + int(entry["summary_len"]) + int(entry["detail_len"])
+        return memoryview(segment_map)[start:start + int(entry["html_len"])]
+
+    def count(self) -> int:
+        """저장된 레코드 수 (ID 기준)"""
+        _, index = self._refresh()
+        return int(len(self._latest_entries(index)))
+
+    def compact(self, keep_ids: Iterable[str]) -> int:
+        """
+        보존할 ID의 마지막 레코드만 새 파일로 옮긴 뒤 기존 파일과 교체
+
+        다른 프로세스의 읽기가 이전 인덱스와 새 세그먼트를 짝짓지 않도록
+        빈 인덱스 → 새 세그먼트 → 새 인덱스 순으로 교체합니다.
+        (교체 중인 짧은 순간에는 빈 목록이 조회될 수 있음)
+        다른 프로세스의 append()와 동시에 실행하면 그 레코드는 유실될 수 있습니다.
+
+        Args:
+            keep_ids: 보존할 레코드 ID
+
+        Returns:
+            int: 제거된 인덱스 레코드 수 (이전 버전 레코드 포함)
+        """
+        keep = np.array(
+            sorted({record_id.encode("ascii", "ignore")[:32] for record_id in keep_ids}),
+            dtype=INDEX_DTYPE["id"]
+        )
+
+        with self._write_lock:
+            segment_map, index = self._refresh()
+            if segment_map is None or len(index) == 0:
+                return 0
+
+            entries = index[self._latest_entries(index)]
+            live = np.array(
+                entries[np.isin(entries["id"], keep) & self._in_bounds(segment_map, entries)]
+            )
+            removed = len(index) - len(live)
+            if removed == 0:
+                return 0
+
+            segment_tmp = self.segment_path.with_suffix(".seg.tmp")
+            index_tmp = self.index_path.with_suffix(".idx.tmp")
+            empty_tmp = self.index_path.with_suffix(".idx.empty")
+
+            with open(segment_tmp, "wb") as f:
+                for i in range(len(live)):
+                    start = int(live[i]["offset"])
+                    length = (
+                        int(live[i]["summary_len"])
+                        + int(live[i]["detail_len"])
+                        + int(live[i]["html_len"])
+                    )
+                    live["offset"][i] = f.tell()
+                    f.write(segment_map[start:start + length])
+
+            index_tmp.write_bytes(live.tobytes())
+            empty_tmp.write_bytes(b"")
+
+            empty_tmp.replace(self.index_path)
+            segment_tmp.replace(self.segment_path)
+            index_tmp.replace(self.index_path)
+
+        logger.info(
+            "세그먼트 정리 완료 (%s) - 레코드 %d개 제거, %d개 유지",
+            self.kind, removed, len(live)
+        )
+        return removed
+
+
+def build_briefing_documents(
+    record: Dict[str, Any],
+    data: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    브리핑 인덱스 레코드와 JSON 본문으로 요약/상세 문서 구성
+
+    Args:
+        record: 산출물 인덱스 레코드 (id, created_at, status, meta)
+        data: 브리핑 JSON 본문 (briefing, stocks)
+
+    Returns:
+        Tuple[Dict, Dict]: (BriefingSummary 형식, BriefingDetail 형식)
+    """
+    title = record["meta"].get("title", f"굿모닝 월가 - {record['id']}")
+    summary = {
+        "id": record["id"],
+        "created_at": record["created_at"],
+        "title": title,
+        "status": record["status"],
+        "symbols": record["meta"].get("symbols", []),
+    }
+    detail = {
+        "id": record["id"],
+        "created_at": record["created_at"],
+        "title": title,
+        "subtitle": None,
+        "status": record["status"],
+        "stocks": [
+            {
+                "symbol": stock.get("symbol", ""),
+                "name": stock.get("name", ""),
+                "price": stock.get("price") or 0,
+                "change_percent": stock.get("change_percent") or 0,
+                "summary": None,
+            }
+            for stock in data.get("stocks", [])
+        ],
+        "market_summary": None,
+        "text_version": data.get("briefing"),
+    }
+    return summary, detail
+
+
+def append_artifact(segments: "SegmentStore", record: Dict[str, Any]) -> bool:
+    """
+    산출물 인덱스 레코드의 파일을 읽어 세그먼트에 추가
+
+    Args:
+        segments: 세그먼트 저장소
+        record: 산출물 인덱스 레코드 (files.json 필수, files.html 선택)
+
+    Returns:
+        bool: 추가 여부 (파일을 읽을 수 없으면 False)
+    """
+    try:
+        with open(record["files"]["json"], "r", encoding="utf-8") as f:
+            data = json.load(f)
+        html = ""
+        if record["files"].get("html"):
+            with open(record["files"]["html"], "r", encoding="utf-8") as f:
+                html = f.read()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("세그먼트 추가 실패 (%s/%s): %s", segments.kind, record.get("id"), e)
+        return False
+
+    if segments.kind == "briefing":
+        summary, detail = build_briefing_documents(record, data)
+    else:
+        summary = {
+            "id": record["id"],
+            "created_at": record["created_at"],
+            "status": record["status"],
+            "count": len(data.get("stocks", [])),
+            "symbols": [stock.get("symbol") for stock in data.get("stocks", []) if isinstance(stock, dict)],
+        }
+        detail = data
+
+    segments.append(
+        record["id"],
+        datetime.fromisoformat(record["created_at"]),
+        summary,
+        detail,
+        html
+    )
+    return True
+
+
+_segment_stores: Dict[str, SegmentStore] = {}
+_segment_stores_lock = threading.Lock()
+
+
+def get_segment_store(kind: str) -> SegmentStore:
+    """
+    종류별 기본 세그먼트 저장소 반환
+
+    세그먼트가 비어 있으면 산출물 인덱스의 완료된 산출물로 한 번 채웁니다.
+
+    Args:
+        kind: 레코드 종류 (briefing, screening)
+
+    Returns:
+        SegmentStore: 세그먼트 저장소
+    """
+    with _segment_stores_lock:
+        if kind not in _segment_stores:
+            segments = SegmentStore(kind)
+            if segments.count() == 0:
+                from .output_store import get_output_store, STATUS_COMPLETED
+
+                store = get_output_store()
+                records = store.list(kind, limit=store.count(kind) or 1)
+                for record in reversed(records):
+                    if record["status"] == STATUS_COMPLETED:
+                        append_artifact(segments, record)
+
+            _segment_stores[kind] = segments
+
+        return _segment_stores[kind]
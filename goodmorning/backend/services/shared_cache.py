@@ -0,0 +1,641 @@
+"""
+워커 간 공유 캐시 서비스
+
+uvicorn / gunicorn을 여러 워커로 띄우면 워커마다 같은 종목/스크리너/뉴스를 따로 조회하므로
+업스트림(Yahoo, Exa) 호출이 워커 수만큼 늘어납니다. 같은 호스트의 워커들이 저장소 하나를 함께 쓰고,
+만료된 키는 프로세스 간 잠금을 얻은 워커 하나만 갱신합니다.
+
+저장소 (CACHE_BACKEND):
+    - none: 사용 안 함 (기본값, 매번 업스트림 호출)
+    - memory: 프로세스 내부 사전 (워커 간 공유되지 않음, 단일 워커용)
+    - sqlite: WAL 모드 SQLite 파일 (같은 호스트의 워커 간 공유, /dev/shm에 두면 메모리에서 동작)
+    - redis: Redis 호환 서버 (RESP 프로토콜, 여러 호스트 간 공유)
+
+갱신 흐름 (get_or_load):
+    1. 신선한 값이 있으면 반환
+    2. 갱신 잠금을 얻은 워커만 업스트림을 호출하고 저장
+    3. 잠금을 얻지 못한 워커는 만료된 값이 남아 있으면(CACHE_STALE_SECONDS 이내) 그 값으로 응답하고,
+       없으면 CACHE_WAIT_SECONDS 동안 다른 워커가 저장하기를 기다린 뒤 직접 호출
+
+저장소 오류는 요청을 실패시키지 않고 캐시 없이 업스트림을 호출합니다.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+import json
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 기본 설정 (환경 변수로 조정)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "none").lower()
+CACHE_NAMESPACE = os.getenv("CACHE_NAMESPACE", "goodmorning")
+CACHE_SQLITE_PATH = os.getenv(
+    "CACHE_SQLITE_PATH", os.path.join(tempfile.gettempdir(), "goodmorning-shared-cache.sqlite3")
+)
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/0")
+CACHE_MEMORY_MAX_ENTRIES = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "4096"))
+
+# 만료 후 갱신 중에 응답할 수 있는 시간, 갱신 잠금 유지 시간, 잠금 대기 시간 (초)
+CACHE_STALE_SECONDS = float(os.getenv("CACHE_STALE_SECONDS", "30"))
+CACHE_LOCK_SECONDS = float(os.getenv("CACHE_LOCK_SECONDS", "15"))
+CACHE_WAIT_SECONDS = float(os.getenv("CACHE_WAIT_SECONDS", "5"))
+
+CACHE_BACKENDS = ("none", "memory", "sqlite", "redis")
+
+
+class CacheBackendError(Exception):
+    """저장소 명령 실패 (연결 오류, 서버 에러 응답 등)"""
+
+
+class CacheBackend:
+    """
+    공유 캐시 저장소 인터페이스
+
+    값은 bytes이며 만료는 저장소가 처리합니다. 잠금은 여러 프로세스에서 동시에 호출해도
+    한 호출자만 토큰을 받아야 하고, 보유자가 죽어도 ttl_seconds 뒤에는 풀려야 합니다.
+    """
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        """
+        잠금 획득 시도 (대기하지 않음)
+
+        Args:
+            key: 잠금 키
+            ttl_seconds: 잠금 유지 시간 (보유자가 해제하지 못한 경우 자동 해제)
+
+        Returns:
+            str: 해제용 토큰 (이미 다른 호출자가 보유 중이면 None)
+        """
+        raise NotImplementedError
+
+    def release_lock(self, key: str, token: str) -> None:
+        """토큰이 일치할 때만 잠금 해제 (만료 후 다른 호출자가 얻은 잠금은 유지)"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내부 사전 저장소 (워커 간 공유되지 않음, 최대 크기 제한 LRU)"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = CACHE_MEMORY_MAX_ENTRIES):
+        """
+        MemoryCacheBackend 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._locks: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[0] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._locks[key] = (now + ttl_seconds, token)
+            return token
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[1] == token:
+                del self._locks[key]
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    WAL 모드 SQLite 파일 저장소 (같은 호스트의 워커 간 공유)
+
+    WAL 모드에서는 읽기가 쓰기를 막지 않으므로 워커가 많아도 조회는 잠금 경합이 거의 없습니다.
+    잠금은 locks 테이블의 조건부 upsert(만료된 행만 덮어씀)로 구현하며, SQLite 쓰기 잠금이
+    원자성을 보장합니다. 연결은 스레드/프로세스별로 만듭니다. (fork 이후 연결 공유 방지)
+    """
+
+    name = "sqlite"
+
+    # 만료 항목 정리 주기 (저장 횟수)
+    PURGE_EVERY = 256
+
+    def __init__(self, path: str = CACHE_SQLITE_PATH, busy_timeout: float = 5.0):
+        """
+        SQLiteCacheBackend 초기화
+
+        Args:
+            path: 데이터베이스 파일 경로 (모든 워커가 같은 경로를 사용)
+            busy_timeout: 쓰기 잠금 대기 시간 (초)
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._writes = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, sqlite3.Binary(value), now + ttl_seconds)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            connection.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            connection.execute("DELETE FROM locks WHERE expires_at <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        now = time.time()
+        token = uuid.uuid4().hex
+        cursor = self._connection().execute(
+            "INSERT INTO locks (key, token, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET token = excluded.token, expires_at = excluded.expires_at "
+            "WHERE locks.expires_at <= ?",
+            (key, token, now + ttl_seconds, now)
+        )
+        return token if cursor.rowcount == 1 else None
+
+    def release_lock(self, key: str, token: str) -> None:
+        self._connection().execute("DELETE FROM locks WHERE key = ? AND token = ?", (key, token))
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class RespConnection:
+    """Redis 호환 서버용 최소 RESP2 클라이언트 (명령 하나씩 요청-응답)"""
+
+    def __init__(self, host: str, port: int, timeout: float = 2.0):
+        """
+        RespConnection 초기화 (연결까지 수행)
+
+        Args:
+            host: 서버 주소
+            port: 서버 포트
+            timeout: 연결/응답 타임아웃 (초)
+        """
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+    def command(self, *args) -> Any:
+        """
+        명령 실행
+
+        Args:
+            *args: 명령과 인자 (str, bytes, int, float)
+
+        Returns:
+            Any: 응답 (simple string → str, bulk string → bytes 또는 None, 정수 → int, 배열 → list)
+
+        Raises:
+            CacheBackendError: 서버 에러 응답
+        """
+        parts = [arg if isinstance(arg, bytes) else str(arg).encode("utf-8") for arg in args]
+        payload = b"".join(
+            [b"*%d\r\n" % len(parts)] + [b"$%d\r\n%s\r\n" % (len(part), part) for part in parts]
+        )
+        self._sock.sendall(payload)
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Redis 연결이 끊어졌습니다.")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            raise CacheBackendError(body.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise CacheBackendError(f"알 수 없는 RESP 응답: {line[:50]!r}")
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 호환 서버 저장소 (Redis, Valkey, KeyDB 등 RESP 서버)
+
+    잠금은 SET NX PX로 얻고, 해제는 토큰 확인 후 DEL합니다.
+    (확인과 삭제 사이에 잠금이 만료되어 다른 워커가 얻으면 그 잠금을 지울 수 있으나,
+    잠금 유지 시간이 갱신 시간보다 충분히 길어 발생하더라도 중복 갱신 한 번으로 끝납니다)
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str = CACHE_REDIS_URL, timeout: float = 2.0):
+        """
+        RedisCacheBackend 초기화
+
+        Args:
+            url: redis://[:password@]host[:port][/db]
+            timeout: 연결/응답 타임아웃 (초)
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("redis", ""):
+            raise ValueError(f"지원하지 않는 Redis URL입니다: {url}")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 6379
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.password = unquote(parts.password) if parts.password else None
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> RespConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = RespConnection(self.host, self.port, self.timeout)
+            if self.password:
+                connection.command("AUTH", self.password)
+            if self.db:
+                connection.command("SELECT", self.db)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _command(self, *args) -> Any:
+        try:
+            return self._connection().command(*args)
+        except (OSError, ConnectionError):
+            # 끊어진 연결은 버리고 다음 명령에서 다시 연결
+            self.close()
+            raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._command("GET", key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._command("SET", key, value, "PX", max(1, int(ttl_seconds * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._command("DEL", key)
+
+    def acquire_lock(self, key: str, ttl_seconds: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        reply = self._command("SET", key, token, "NX", "PX", max(1, int(ttl_seconds * 1000)))
+        return token if reply == "OK" else None
+
+    def release_lock(self, key: str, token: str) -> None:
+        if self._command("GET", key) == token.encode("utf-8"):
+            self._command("DEL", key)
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            connection.close()
+
+
+def create_cache_backend(name: str = CACHE_BACKEND) -> Optional[CacheBackend]:
+    """
+    이름으로 저장소 생성
+
+    Args:
+        name: none, memory, sqlite, redis
+
+    Returns:
+        CacheBackend: 저장소 (none이면 None)
+
+    Raises:
+        ValueError: 알 수 없는 저장소 이름
+    """
+    if name in ("", "none", "off"):
+        return None
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "sqlite":
+        return SQLiteCacheBackend()
+    if name == "redis":
+        return RedisCacheBackend()
+    raise ValueError(f"알 수 없는 CACHE_BACKEND입니다: {name} (사용 가능: {', '.join(CACHE_BACKENDS)})")
+
+
+class SharedCache:
+    """만료된 키를 한 워커만 갱신하는 공유 캐시"""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend],
+        namespace: str = CACHE_NAMESPACE,
+        stale_seconds: float = CACHE_STALE_SECONDS,
+        lock_seconds: float = CACHE_LOCK_SECONDS,
+        wait_seconds: float = CACHE_WAIT_SECONDS,
+        poll_seconds: float = 0.05
+    ):
+        """
+        SharedCache 초기화
+
+        Args:
+            backend: 저장소 (None이면 캐시 없이 항상 loader 호출)
+            namespace: 키 접두어 (같은 저장소를 쓰는 다른 서비스와 구분)
+            stale_seconds: 만료 후에도 갱신 중인 동안 응답에 쓸 수 있는 시간 (초)
+            lock_seconds: 갱신 잠금 유지 시간 (초, 갱신 시간보다 길게)
+            wait_seconds: 값이 없을 때 다른 워커의 갱신을 기다리는 최대 시간 (초)
+            poll_seconds: 대기 중 조회 간격 (초)
+        """
+        self.backend = backend
+        self.namespace = namespace
+        self.stale_seconds = stale_seconds
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.poll_seconds = poll_seconds
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "lock_waits": 0,
+            "lock_timeouts": 0,
+            "backend_errors": 0,
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _backend_error(self, action: str, error: Exception) -> None:
+        self._count("backend_errors")
+        logger.warning("공유 캐시 %s 실패 (%s): %s", action, self.backend.name, error)
+
+    def _read(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """저장된 값과 신선 여부 (없거나 저장소 오류면 None)"""
+        try:
+            raw = self.backend.get(f"{self.namespace}:{key}")
+            if raw is None:
+                return None
+            entry = json.loads(raw)
+            return entry["value"], time.time() < entry["stored_at"] + entry["ttl"]
+        except Exception as e:
+            self._backend_error("조회", e)
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        신선한 값 조회 (갱신 잠금 없음)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Any: 저장된 값 또는 None (없거나 만료됨)
+        """
+        if not self.enabled:
+            return None
+        entry = self._read(key)
+        if entry is not None and entry[1]:
+            self._count("hits")
+            return entry[0]
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """
+        값 저장 (JSON 직렬화, 저장소에는 ttl_seconds + stale_seconds 동안 보관)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl_seconds: 신선하게 볼 시간 (초)
+        """
+        if not self.enabled:
+            return
+        payload = json.dumps(
+            {"stored_at": time.time(), "ttl": ttl_seconds, "value": value},
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        try:
+            self.backend.set(f"{self.namespace}:{key}", payload, ttl_seconds + self.stale_seconds)
+        except Exception as e:
+            self._backend_error("저장", e)
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        wait_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        캐시 조회, 없거나 만료되었으면 갱신 잠금을 얻은 워커 하나만 loader 호출
+
+        Args:
+            key: 캐시 키
+            loader: 업스트림 호출 함수 (예외는 그대로 전파되고 저장하지 않음)
+            ttl_seconds: 신선하게 볼 시간 (초)
+            cacheable: 저장 여부 판단 함수 (부분 응답/에러 응답 제외, 기본값: 항상 저장)
+            wait_seconds: 다른 워커의 갱신을 기다릴 최대 시간 (기본값: wait_seconds 설정, 응답 마감 시간 반영용)
+
+        Returns:
+            Any: 캐시 값 또는 loader 결과
+        """
+        if not self.enabled:
+            return loader()
+
+        entry = self._read(key)
+        if entry is not None and entry[1]:
+            self._count("hits")
+            return entry[0]
+        self._count("misses")
+
+        lock_key = f"{self.namespace}:lock:{key}"
+        try:
+            token = self.backend.acquire_lock(lock_key, self.lock_seconds)
+        except Exception as e:
+            self._backend_error("잠금", e)
+            return self._load(key, loader, ttl_seconds, cacheable)
+
+        if token is None:
+            # 다른 워커가 갱신 중 - 만료된 값이라도 있으면 바로 응답
+            if entry is not None:
+                self._count("stale_hits")
+                return entry[0]
+            waited = self._wait_for(key, self.wait_seconds if wait_seconds is None else wait_seconds)
+            if waited is not None:
+                self._count("lock_waits")
+                return waited
+            self._count("lock_timeouts")
+            logger.warning("공유 캐시 갱신 대기 시간 초과 - 직접 조회합니다: %s", key)
+            return self._load(key, loader, ttl_seconds, cacheable)
+
+        try:
+            # 잠금을 얻기 직전에 다른 워커가 갱신을 마쳤을 수 있으므로 다시 확인
+            latest = self._read(key)
+            if latest is not None and latest[1]:
+                return latest[0]
+            return self._load(key, loader, ttl_seconds, cacheable)
+        finally:
+            try:
+                self.backend.release_lock(lock_key, token)
+            except Exception as e:
+                self._backend_error("잠금 해제", e)
+
+    def _load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float,
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        value = loader()
+        self._count("refreshes")
+        if cacheable is None or cacheable(value):
+            self.set(key, value, ttl_seconds)
+        return value
+
+    def _wait_for(self, key: str, wait_seconds: float) -> Optional[Any]:
+        """다른 워커가 저장할 때까지 대기 (wait_seconds 초과 시 None)"""
+        deadline = time.monotonic() + wait_seconds
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_seconds)
+            entry = self._read(key)
+            if entry is not None:
+                return entry[0]
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: 저장소 이름, 적중/만료 적중/미스/갱신/잠금 대기 횟수, 적중률
+        """
+        with self._lock:
+            counters = dict(self._counters)
+
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "backend": self.backend.name if self.backend is not None else "none",
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+_default_cache: Optional[SharedCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache:
+    """
+    프로세스 공용 공유 캐시 반환 (CACHE_BACKEND 설정 사용)
+
+    저장소를 만들 수 없으면(경로 권한, 잘못된 설정 등) 경고 후 캐시 없이 동작합니다.
+
+    Returns:
+        SharedCache: 공용 캐시
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                backend = create_cache_backend()
+            except Exception as e:
+                logger.warning("공유 캐시 저장소(%s)를 만들 수 없어 캐시 없이 동작합니다: %s", CACHE_BACKEND, e)
+                backend = None
+            _default_cache = SharedCache(backend)
+            if backend is not None:
+                logger.info("공유 캐시 사용 - 저장소: %s", backend.name)
+        return _default_cache
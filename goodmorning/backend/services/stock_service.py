@@ -4,9 +4,15 @@
 기본적인 주식 데이터 조회 및 화제 종목 선정 기능을 제공합니다.
 단일 종목 조회가 필요한 경우 TrendingStockService를 사용하는 것을 권장합니다.
 """
-from yahooquery import Screener, Ticker
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 
+from .module_cache import TieredModuleCache, split_summary_detail, merge_summary_detail
+from .market_data import MarketDataClient, get_market_data
+from .negative_cache import NegativeCache
+from .quote_history import QuoteHistoryStore, to_series
+from .hedged_request import Deadline, DeadlineExceededError, HedgedExecutor
+from .upstream_guard import UpstreamUnavailableError
 from .utils import (
     LoggerFactory,
     StockConstants,
@@ -21,9 +27,29 @@ logger = LoggerFactory.get_logger(__name__)
 class StockService:
     """주식 데이터 조회 서비스"""
 
-    def __init__(self):
-        """StockService 초기화"""
-        self.screener = Screener()
+    def __init__(
+        self,
+        history: Optional[QuoteHistoryStore] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        module_cache: Optional[TieredModuleCache] = None,
+        executor: Optional[HedgedExecutor] = None,
+        market_data: Optional[MarketDataClient] = None
+    ):
+        """
+        StockService 초기화
+
+        Args:
+            history: 시세 이력 저장소 (기본값: output/quotes)
+            negative_cache: 존재하지 않는 종목 캐시 (기본값: 시장 데이터 접근 객체의 캐시 - /api 라우트와 공유)
+            module_cache: 종목 모듈 계층형 캐시 (기본값: output/cache/modules)
+            executor: 헤지 요청 실행기 (기본값: 프로세스 공용 실행기)
+            market_data: 시장 데이터 접근 객체 (기본값: 프로세스 공용 객체)
+        """
+        self.market_data = market_data or get_market_data()
+        self.history = history or QuoteHistoryStore()
+        self.negative_cache = negative_cache or self.market_data.negative_cache
+        self.module_cache = module_cache or TieredModuleCache(calendar=self.market_data.calendar)
+        self.executor = executor or self.market_data.executor
 
     def get_trending_stocks(self) -> dict:
         """
@@ -44,13 +70,13 @@ class StockService:
             logger.info("화제 종목 조회 시작")
 
             # 거래량 상위 종목 조회
-            actives_data = self.screener.get_screeners('most_actives')
+            actives_data = self.market_data.get_cached_screener('most_actives')
             most_actives = actives_data.get('most_actives', {}).get(
                 'quotes', []
             )[:StockConstants.DEFAULT_SCREENER_COUNT]
 
             # 상승률 상위 종목 조회
-            gainers_data = self.screener.get_screeners('day_gainers')
+            gainers_data = self.market_data.get_cached_screener('day_gainers')
             day_gainers = gainers_data.get('day_gainers', {}).get(
                 'quotes', []
             )[:StockConstants.DEFAULT_SCREENER_COUNT]
@@ -59,10 +85,13 @@ class StockService:
             trending = self._select_trending_stocks(most_actives, day_gainers)
 
             logger.info(
-                f"화제 종목 조회 완료 - "
-                f"Trending: {len(trending)}, "
-                f"Actives: {len(most_actives)}, "
-                f"Gainers: {len(day_gainers)}"
+                "화제 종목 조회 완료 - Trending: %s, Actives: %s, Gainers: %s",
+                len(trending), len(most_actives), len(day_gainers)
+            )
+
+            # 조회한 시세를 이력 저장소에 기록 (거래량/상승률 상위 전체)
+            self._record_quotes(
+                StockDataFormatter.format_stocks_list(most_actives + day_gainers)
             )
 
             return {
@@ -77,7 +106,7 @@ class StockService:
             }
 
         except Exception as e:
-            logger.error(f"화제 종목 조회 중 오류 발생: {e}", exc_info=True)
+            logger.error("화제 종목 조회 중 오류 발생: %s", e, exc_info=True)
             return {
                 "trending": [],
                 "most_actives": [],
@@ -86,6 +115,153 @@ class StockService:
                 "error": str(e)
             }
 
+    def _record_quotes(self, quotes: List[Dict[str, Any]]) -> None:
+        """
+        시세 스냅샷을 이력 저장소에 기록 (실패해도 조회는 계속)
+
+        Args:
+            quotes: 포맷팅된 시세 리스트
+        """
+        # 같은 종목이 두 스크리너에 모두 있으면 한 번만 기록
+        unique_quotes = list({quote["symbol"]: quote for quote in quotes}.values())
+        try:
+            self.history.append(unique_quotes)
+        except Exception as e:
+            logger.warning("시세 이력 기록 실패: %s", e)
+
+    def get_quote_history(self, symbol: str, days: int = 1) -> Dict[str, Any]:
+        """
+        기록된 시세 이력 조회 (Yahoo 호출 없음)
+
+        Args:
+            symbol: 종목 심볼
+            days: 조회 기간 (일)
+
+        Returns:
+            Dict: 시세 이력
+                - symbol: 종목 심볼
+                - series: 열 단위 시세 (ts, price, change_percent, volume, market_cap)
+                - count: 레코드 수
+                - relative_volume: 상대 거래량
+                - trending_days: 화제 지속 일수
+        """
+        now = datetime.now(timezone.utc)
+        records = self.history.scan(symbol, now - timedelta(days=days), now)
+
+        return {
+            "symbol": symbol,
+            "series": to_series(records),
+            "count": int(len(records)),
+            "relative_volume": self.history.relative_volume(symbol),
+            "trending_days": self.history.trending_days(symbol),
+        }
+
+    def _get_modules(self, symbol: str, requested: List[str]) -> Any:
+        """
+        quoteSummary 모듈 조회 (모듈 이름 → 데이터, 조회 실패 시 에러 문자열)
+
+        Args:
+            symbol: 종목 심볼
+            requested: Yahoo 모듈 이름 리스트
+
+        Returns:
+            Dict 또는 str: 모듈 이름 → 데이터, 또는 에러 메시지
+        """
+        data = self.market_data.get_modules(symbol, requested).get(symbol)
+
+        # 모듈을 하나만 요청하면 yahooquery는 모듈 이름 없이 본문만 반환
+        if len(requested) == 1 and isinstance(data, dict):
+            return {requested[0]: data}
+        return data
+
+    def _fetch_detail_modules(
+        self,
+        symbol: str,
+        stale: List[str],
+        modules: Dict[str, Optional[Dict[str, Any]]],
+        deadline: Deadline
+    ) -> Optional[List[str]]:
+        """
+        만료된 상세 모듈만 Yahoo에서 조회하여 캐시와 modules에 채움
+
+        필수 모듈(price)과 부가 모듈(summary_static, asset_profile)을 각각 한 번씩 동시에 조회하며,
+        부가 모듈이 마감 시간까지 응답하지 않으면 건너뛴 모듈로 보고합니다.
+
+        Args:
+            symbol: 종목 심볼
+            stale: 만료된 모듈 이름 리스트 (price, summary_static, asset_profile)
+            modules: 모듈 이름 → 데이터 (조회 결과로 갱신됨)
+            deadline: 응답 마감 시간
+
+        Returns:
+            List[str]: 마감 시간 초과로 건너뛴 모듈 이름 (존재하지 않는 종목이면 None)
+
+        Raises:
+            DeadlineExceededError: 마감 시간 안에 price를 받지 못한 경우
+            UpstreamUnavailableError: price 조회가 거절된 경우 (속도 제한, 서킷 브레이커)
+        """
+        yahoo_modules = {"summary_static": "summaryDetail", "asset_profile": "assetProfile"}
+        optional = [module for module in stale if module in yahoo_modules]
+
+        groups = {}
+        if "price" in stale:
+            groups["price"] = ["price"]
+        if optional:
+            groups["optional"] = [yahoo_modules[module] for module in optional]
+
+        logger.info("종목 모듈 조회 (%s): %s", symbol, ', '.join(sum(groups.values(), [])))
+        results, errors, skipped = self.executor.run_all(
+            {
+                group: (lambda requested=requested: self._get_modules(symbol, requested))
+                for group, requested in groups.items()
+            },
+            deadline
+        )
+
+        if "price" in errors:
+            raise errors["price"]
+        if "price" in skipped:
+            raise DeadlineExceededError("price")
+
+        fetched = {}
+        if "price" in groups:
+            data = results["price"]
+
+            # price 응답이 에러 문자열일 때만 존재하지 않는 종목으로 기록
+            if isinstance(data, str):
+                logger.warning("종목 정보를 찾을 수 없습니다: %s", symbol)
+                self.negative_cache.add(symbol, data)
+                return None
+            if not isinstance(data, dict) or not isinstance(data.get("price"), dict):
+                logger.warning("종목 정보를 찾을 수 없습니다: %s", symbol)
+                return None
+            fetched["price"] = data["price"]
+
+        # 부가 모듈의 에러 문자열은 일시적 오류일 수 있으므로 조회 실패로만 처리
+        data = results.get("optional")
+        optional_error = data if isinstance(data, str) else errors.get("optional")
+        if optional_error is not None:
+            logger.warning("부가 모듈 조회 실패 (%s): %s", symbol, optional_error)
+
+        if isinstance(data, dict):
+            def module_data(name: str) -> Dict[str, Any]:
+                # 응답에 없는 모듈(ETF의 assetProfile 등)은 빈 값으로 저장하여 TTL 동안 다시 조회하지 않음
+                value = data.get(name)
+                return value if isinstance(value, dict) else {}
+
+            if "asset_profile" in optional:
+                fetched["asset_profile"] = module_data("assetProfile")
+            if "summary_static" in optional:
+                # PER 역산에는 이번에 받은 price, 없으면 캐시된 price 사용
+                price_data = fetched.get("price") or modules.get("price")
+                fetched["summary_static"] = split_summary_detail(module_data("summaryDetail"), price_data)
+
+        for module, value in fetched.items():
+            self.module_cache.put(symbol, module, value)
+            modules[module] = value
+
+        return optional if "optional" in skipped else []
+
     def _select_trending_stocks(
         self,
         actives: List[Dict[str, Any]],
@@ -122,12 +298,13 @@ class StockService:
 
         return trending[:StockConstants.DEFAULT_TRENDING_COUNT]
 
-    def get_stock_detail(self, symbol: str) -> Optional[dict]:
+    def get_stock_detail(self, symbol: str, deadline: Optional[Deadline] = None) -> Optional[dict]:
         """
         종목 상세 정보 조회
 
         Args:
             symbol: 종목 심볼 (예: "AAPL")
+            deadline: 응답 마감 시간 (기본값: UPSTREAM_DEFAULT_DEADLINE_MS)
 
         Returns:
             Dict: 종목 상세 정보 또는 None
@@ -140,21 +317,36 @@ class StockService:
                 - sector, industry: 섹터, 산업
                 - description: 기업 설명
                 - source: 데이터 출처
+                - skipped_modules: 마감 시간 초과로 건너뛴 모듈 (summary_static, asset_profile)
+
+        Raises:
+            DeadlineExceededError: 마감 시간 안에 price를 받지 못한 경우
+            UpstreamUnavailableError: price 조회가 거절된 경우 (속도 제한, 서킷 브레이커)
         """
+        # 최근 조회에 실패한 심볼은 Yahoo를 다시 호출하지 않음
+        reason = self.negative_cache.get(symbol)
+        if reason is not None:
+            logger.info("존재하지 않는 종목 (캐시): %s - %s", symbol, reason)
+            return None
+
         try:
-            logger.info(f"종목 상세 정보 조회 시작: {symbol}")
+            logger.info("종목 상세 정보 조회 시작: %s", symbol)
 
-            ticker = Ticker(symbol)
+            # 모듈별 캐시 조회 후 만료된 모듈만 한 번에 조회
+            modules = self.module_cache.get_many(symbol, ["price", "summary_static", "asset_profile"])
+            stale = [module for module, data in modules.items() if data is None]
 
-            # 기본 정보 조회
-            summary = ticker.summary_detail.get(symbol, {})
-            profile = ticker.asset_profile.get(symbol, {})
-            price_data = ticker.price.get(symbol, {})
+            skipped: List[str] = []
+            if stale:
+                skipped = self._fetch_detail_modules(symbol, stale, modules, deadline or Deadline())
+                if skipped is None:
+                    return None
+            else:
+                logger.info("종목 상세 정보 캐시 적중: %s", symbol)
 
-            # 에러 응답 체크
-            if isinstance(summary, str) or isinstance(price_data, str):
-                logger.warning(f"종목 정보를 찾을 수 없습니다: {symbol}")
-                return None
+            price_data = modules["price"]
+            profile = modules["asset_profile"] or {}
+            summary = merge_summary_detail(modules["summary_static"] or {}, price_data)
 
             # 상세 정보 포맷팅
             detail_info = StockDataFormatter.format_stock_detail_info(
@@ -163,10 +355,13 @@ class StockService:
                 summary_data=summary,
                 profile_data=profile
             )
+            detail_info["skipped_modules"] = skipped
 
-            logger.info(f"종목 상세 정보 조회 완료: {symbol}")
+            logger.info("종목 상세 정보 조회 완료: %s", symbol)
             return detail_info
 
+        except (DeadlineExceededError, UpstreamUnavailableError):
+            raise
         except Exception as e:
-            logger.error(f"종목 상세 정보 조회 중 오류 발생 ({symbol}): {e}", exc_info=True)
+            logger.error("종목 상세 정보 조회 중 오류 발생 (%s): %s", symbol, e, exc_info=True)
             return None
@@ -0,0 +1,452 @@
+"""
+종목 심볼 인덱스 서비스
+
+심볼, 종목명(short/long), 섹터, 업종 메타데이터를 로컬 인덱스로 보관하여
+Yahoo 호출 없이 종목 검색(타입어헤드)을 제공합니다. 인덱스는 스크리너 종목만 담은
+일부 목록이므로 심볼 검증에는 사용하지 않습니다 (인덱스에 없는 심볼도 Yahoo로 조회).
+
+검색 구조:
+    - 심볼/종목명 단어 정렬 배열 + 이진 탐색 → 접두어 검색
+    - 편집 거리 1 삭제 이웃 사전(SymSpell 방식) → 오타 허용(퍼지) 검색
+
+인덱스 파일은 `python -m services.symbol_index` 로 생성합니다.
+(스크리너 종목 + asset_profile의 섹터/업종, 기본 경로: data/symbols.json)
+"""
+
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+import json
+import os
+import re
+import threading
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 인덱스 파일 경로
+SYMBOL_INDEX_PATH = Path(
+    os.getenv("SYMBOL_INDEX_PATH", Path(__file__).parent.parent / "data" / "symbols.json")
+)
+
+# 인덱스 생성 시 사용할 스크리너
+INDEX_SCREENERS = [
+    "most_actives",
+    "day_gainers",
+    "day_losers",
+    "growth_technology_stocks",
+    "undervalued_large_caps",
+    "aggressive_small_caps",
+    "small_cap_gainers",
+    "most_shorted_stocks",
+]
+
+# 퍼지 검색 대상 최소 단어 길이 (짧은 단어는 오타 허용 시 후보가 너무 많아짐)
+FUZZY_MIN_LENGTH = 3
+
+# 검색 결과 일치 유형 (정렬 우선순위 순)
+MATCH_EXACT = "exact"
+MATCH_PREFIX = "prefix"
+MATCH_NAME = "name"
+MATCH_FUZZY = "fuzzy"
+
+_MATCH_RANK = {MATCH_EXACT: 0, MATCH_PREFIX: 1, MATCH_NAME: 2, MATCH_FUZZY: 3}
+
+_WORD_PATTERN = re.compile(r"[A-Z0-9]+")
+
+
+def _deletes(word: str) -> List[str]:
+    """한 글자를 삭제한 변형 목록 (편집 거리 1 삭제 이웃)"""
+    return [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+def _name_words(record: Dict[str, Any]) -> List[str]:
+    """종목명의 검색용 단어 목록 (대문자)"""
+    text = f"{record.get('short_name') or ''} {record.get('long_name') or ''}".upper()
+    return sorted(set(_WORD_PATTERN.findall(text)))
+
+
+def _fuzzy_keys(symbol: str, words: List[str]) -> set:
+    """종목의 퍼지 사전 키 (심볼/종목명 단어와 각각의 삭제 이웃)"""
+    keys = {symbol, *_deletes(symbol)}
+    for word in words:
+        if len(word) >= FUZZY_MIN_LENGTH:
+            keys.add(word)
+            keys.update(_deletes(word))
+    return keys
+
+
+class SymbolIndex:
+    """종목 심볼 메타데이터 인덱스"""
+
+    def __init__(self, records: Optional[Iterable[Dict[str, Any]]] = None):
+        """
+        SymbolIndex 초기화
+
+        Args:
+            records: 종목 메타데이터 리스트 (symbol, short_name, long_name, sector, industry)
+        """
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._symbols: List[str] = []
+        self._words: List[Tuple[str, str]] = []
+        self._word_keys: List[str] = []
+        self._fuzzy: Dict[str, Tuple[str, ...]] = {}
+
+        if records:
+            self.add(records)
+
+    @classmethod
+    def from_file(cls, path: Path = SYMBOL_INDEX_PATH) -> "SymbolIndex":
+        """
+        인덱스 파일 로드 (파일이 없거나 읽을 수 없으면 빈 인덱스)
+
+        Args:
+            path: 인덱스 파일 경로
+
+        Returns:
+            SymbolIndex: 로드된 인덱스
+        """
+        if not Path(path).exists():
+            logger.warning("심볼 인덱스 파일이 없습니다: %s (python -m services.symbol_index 로 생성)", path)
+            return cls()
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error("심볼 인덱스 파일을 읽을 수 없습니다 (%s): %s", path, e)
+            return cls()
+
+        index = cls(data.get("symbols", []))
+        logger.info("심볼 인덱스 로드 완료 - %s개 종목", len(index))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def add(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        종목 추가 (이미 있는 종목은 비어 있지 않은 필드만 갱신)
+
+        검색 구조는 새로 만든 뒤 한 번에 교체하므로 검색 중에도 안전합니다.
+
+        Args:
+            records: 종목 메타데이터 리스트
+
+        Returns:
+            int: 새로 추가된 종목 수
+        """
+        with self._lock:
+            merged = dict(self._records)
+            added = []
+            updated = False
+
+            for record in records:
+                symbol = (record.get("symbol") or "").strip().upper()
+                if not symbol:
+                    continue
+
+                previous = merged.get(symbol)
+                entry = {
+                    "symbol": symbol,
+                    "short_name": record.get("short_name"),
+                    "long_name": record.get("long_name"),
+                    "sector": record.get("sector"),
+                    "industry": record.get("industry"),
+                }
+                if previous:
+                    entry = {key: entry[key] or previous.get(key) for key in entry}
+                    if entry == previous:
+                        continue
+                    updated = True
+                elif symbol not in added:
+                    added.append(symbol)
+
+                merged[symbol] = entry
+
+            # 기존 종목이 바뀌면 전체 재구성, 새 종목만 있으면 복사본에 삽입
+            if updated or (added and not self._symbols):
+                self._rebuild(merged)
+            elif added:
+                self._insert(merged, added)
+
+            return len(added)
+
+    def add_quotes(self, quotes: Iterable[Dict[str, Any]]) -> int:
+        """
+        스크리너/시세 응답(quote)의 종목 추가
+
+        Args:
+            quotes: yahooquery quote 리스트 (symbol, shortName, longName)
+
+        Returns:
+            int: 새로 추가된 종목 수
+        """
+        return self.add(
+            {
+                "symbol": quote.get("symbol"),
+                "short_name": quote.get("shortName"),
+                "long_name": quote.get("longName"),
+            }
+            for quote in quotes
+        )
+
+    def _rebuild(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """정렬 배열/퍼지 사전 재구성 후 교체"""
+        symbols = sorted(records)
+        words = []
+        fuzzy: Dict[str, List[str]] = {}
+
+        for symbol in symbols:
+            symbol_words = _name_words(records[symbol])
+            words.extend((word, symbol) for word in symbol_words)
+            for key in _fuzzy_keys(symbol, symbol_words):
+                fuzzy.setdefault(key, []).append(symbol)
+
+        words.sort()
+        self._swap(records, symbols, words, {key: tuple(value) for key, value in fuzzy.items()})
+
+    def _insert(self, records: Dict[str, Dict[str, Any]], new_symbols: List[str]) -> None:
+        """새 종목만 검색 구조 복사본에 삽입 후 교체 (화제 종목 추가 등 소량 갱신용)"""
+        symbols = list(self._symbols)
+        words = list(self._words)
+        fuzzy = dict(self._fuzzy)
+
+        for symbol in new_symbols:
+            insort(symbols, symbol)
+            symbol_words = _name_words(records[symbol])
+            for word in symbol_words:
+                insort(words, (word, symbol))
+            for key in _fuzzy_keys(symbol, symbol_words):
+                fuzzy[key] = fuzzy.get(key, ()) + (symbol,)
+
+        self._swap(records, symbols, words, fuzzy)
+
+    def _swap(
+        self,
+        records: Dict[str, Dict[str, Any]],
+        symbols: List[str],
+        words: List[Tuple[str, str]],
+        fuzzy: Dict[str, Tuple[str, ...]]
+    ) -> None:
+        """검색 구조 교체"""
+        self._records = records
+        self._symbols = symbols
+        self._words = words
+        self._word_keys = [word for word, _ in words]
+        self._fuzzy = fuzzy
+
+    def contains(self, symbol: str) -> bool:
+        """
+        심볼 존재 여부
+
+        Args:
+            symbol: 종목 심볼 (대소문자 무관)
+
+        Returns:
+            bool: 인덱스에 있으면 True
+        """
+        return symbol.strip().upper() in self._records
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        심볼 메타데이터 조회
+
+        Args:
+            symbol: 종목 심볼 (대소문자 무관)
+
+        Returns:
+            Dict: 종목 메타데이터 또는 None
+        """
+        return self._records.get(symbol.strip().upper())
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        종목 검색 (심볼 접두어 → 종목명 단어 접두어 → 오타 허용 순)
+
+        Args:
+            query: 검색어 (심볼 또는 종목명 일부)
+            limit: 최대 결과 수
+
+        Returns:
+            List[Dict]: 종목 메타데이터 + match_type (exact, prefix, name, fuzzy)
+        """
+        query = query.strip().upper()
+        if not query:
+            return []
+
+        # 검색 구조를 한 번에 참조하여 재구성과 섞이지 않도록 함
+        records, symbols, words, word_keys, fuzzy = (
+            self._records, self._symbols, self._words, self._word_keys, self._fuzzy
+        )
+
+        matches: Dict[str, str] = {}
+
+        def collect(symbol: str, match_type: str) -> None:
+            current = matches.get(symbol)
+            if current is None or _MATCH_RANK[match_type] < _MATCH_RANK[current]:
+                matches[symbol] = match_type
+
+        # 심볼 접두어 (정렬 배열 이진 탐색)
+        compact = query.replace(" ", "")
+        position = bisect_left(symbols, compact)
+        while position < len(symbols) and symbols[position].startswith(compact):
+            symbol = symbols[position]
+            collect(symbol, MATCH_EXACT if symbol == compact else MATCH_PREFIX)
+            position += 1
+            if len(matches) >= limit * 4:
+                break
+
+        # 종목명 단어 접두어 (검색어의 모든 단어가 종목명 단어의 접두어여야 함)
+        query_words = _WORD_PATTERN.findall(query)
+        if query_words:
+            candidates = None
+            for query_word in query_words:
+                found = set()
+                position = bisect_left(word_keys, query_word)
+                while position < len(words) and words[position][0].startswith(query_word):
+                    found.add(words[position][1])
+                    position += 1
+                candidates = found if candidates is None else candidates & found
+            for symbol in candidates or ():
+                collect(symbol, MATCH_NAME)
+
+        # 오타 허용 (편집 거리 1: 삽입/삭제/치환/인접 전치)
+        if len(matches) < limit and len(compact) >= FUZZY_MIN_LENGTH - 1:
+            for variant in [compact] + _deletes(compact):
+                for symbol in fuzzy.get(variant, ()):
+                    collect(symbol, MATCH_FUZZY)
+
+        ranked = sorted(
+            matches.items(),
+            key=lambda item: (_MATCH_RANK[item[1]], len(item[0]), item[0])
+        )
+
+        return [
+            dict(records[symbol], match_type=match_type)
+            for symbol, match_type in ranked[:limit]
+        ]
+
+    def save(self, path: Path = SYMBOL_INDEX_PATH) -> None:
+        """
+        인덱스 파일 저장
+
+        Args:
+            path: 인덱스 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"symbols": [self._records[symbol] for symbol in self._symbols]},
+                f,
+                ensure_ascii=False
+            )
+        tmp_path.replace(path)
+
+
+def fetch_symbol_records(
+    screeners: Optional[List[str]] = None,
+    count: int = 100,
+    batch_size: int = 50
+) -> List[Dict[str, Any]]:
+    """
+    스크리너 종목과 asset_profile로 인덱스용 메타데이터 수집
+
+    Args:
+        screeners: 스크리너 이름 리스트 (기본값: INDEX_SCREENERS)
+        count: 스크리너당 종목 수
+        batch_size: asset_profile 일괄 조회 단위
+
+    Returns:
+        List[Dict]: 종목 메타데이터 리스트
+    """
+    from .yahoo_session import yahoo_screener, yahoo_ticker
+
+    screeners = screeners or INDEX_SCREENERS
+    screener_data = yahoo_screener().get_screeners(screeners, count)
+
+    records: Dict[str, Dict[str, Any]] = {}
+    for name in screeners:
+        data = screener_data.get(name)
+        if not isinstance(data, dict):
+            logger.warning("스크리너 '%s' 데이터를 찾지 못했습니다.", name)
+            continue
+        for quote in data.get("quotes", []):
+            symbol = quote.get("symbol")
+            if symbol:
+                records[symbol] = {
+                    "symbol": symbol,
+                    "short_name": quote.get("shortName"),
+                    "long_name": quote.get("longName"),
+                    "sector": None,
+                    "industry": None,
+                }
+
+    symbols = sorted(records)
+    for start in range(0, len(symbols), batch_size):
+        batch = symbols[start:start + batch_size]
+        try:
+            profiles = yahoo_ticker(batch).asset_profile
+        except Exception as e:
+            logger.warning("asset_profile 조회 실패 (%s~): %s", batch[0], e)
+            continue
+
+        for symbol in batch:
+            profile = profiles.get(symbol) if isinstance(profiles, dict) else None
+            if isinstance(profile, dict):
+                records[symbol]["sector"] = profile.get("sector")
+                records[symbol]["industry"] = profile.get("industry")
+
+    logger.info("심볼 메타데이터 수집 완료 - %s개 종목", len(records))
+    return list(records.values())
+
+
+def build_symbol_index_file(
+    path: Path = SYMBOL_INDEX_PATH,
+    count: int = 100
+) -> SymbolIndex:
+    """
+    인덱스 파일 생성 (기존 파일의 종목은 유지하고 새 종목/메타데이터를 병합)
+
+    Args:
+        path: 인덱스 파일 경로
+        count: 스크리너당 종목 수
+
+    Returns:
+        SymbolIndex: 생성된 인덱스
+    """
+    index = SymbolIndex.from_file(path)
+    added = index.add(fetch_symbol_records(count=count))
+    index.save(path)
+
+    logger.info("심볼 인덱스 저장 완료: %s (전체 %s개, 신규 %s개)", path, len(index), added)
+    return index
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="종목 심볼 인덱스 생성")
+    parser.add_argument("--count", type=int, default=100, help="스크리너당 종목 수")
+    parser.add_argument("--path", type=Path, default=SYMBOL_INDEX_PATH, help="인덱스 파일 경로")
+    args = parser.parse_args()
+
+    try:
+        index = build_symbol_index_file(args.path, args.count)
+        print(f"✓ 심볼 인덱스 생성 완료: {len(index)}개 종목 ({args.path})")
+        exit(0)
+    except Exception as e:
+        logger.error("심볼 인덱스 생성 중 오류: %s", e)
+        print(f"✗ 오류: {e}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
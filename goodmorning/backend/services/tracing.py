@@ -0,0 +1,506 @@
+"""
+요청 추적(tracing) 서비스
+
+요청 하나를 trace로, 그 안의 업스트림 호출(Yahoo 모듈, Exa 검색)과 처리 단계를 span으로 기록합니다.
+현재 span은 contextvars로 전달되므로 서비스 메서드에 인자를 추가하지 않아도 되고,
+헤지 실행기 스레드로 넘어갈 때는 컨텍스트를 복사하여 이어 붙입니다.
+
+- Server-Timing 헤더: TRACE_SERVER_TIMING=on이면 모든 응답, request이면
+  X-Server-Timing 요청 헤더가 있는 응답에만 span별 소요 시간을 붙임
+- 내보내기: TRACE_EXPORT=json이면 trace마다 JSON 한 줄을 로그(또는 TRACE_JSON_PATH 파일)로,
+  otlp면 OTLP/HTTP JSON 형식으로 TRACE_OTLP_ENDPOINT에 전송 (별도 스레드에서 일괄 전송)
+- Server-Timing과 내보내기가 모두 꺼진 요청은 trace를 만들지 않으므로 span 호출 비용이 거의 없음
+"""
+
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+from fastapi.routing import APIRoute
+
+from .metrics import route_template
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# Server-Timing 헤더 (off, on, request)
+TRACE_SERVER_TIMING = os.getenv("TRACE_SERVER_TIMING", "off").lower()
+
+# 내보내기 대상 (쉼표 구분: json, otlp) 및 표본 비율
+TRACE_EXPORT = {name.strip() for name in os.getenv("TRACE_EXPORT", "").lower().split(",") if name.strip()}
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+
+TRACE_JSON_PATH = os.getenv("TRACE_JSON_PATH", "")
+TRACE_OTLP_ENDPOINT = os.getenv("TRACE_OTLP_ENDPOINT", "http://127.0.0.1:4318/v1/traces")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "goodmorning-api")
+
+# Server-Timing 헤더에 넣을 최대 span 수
+SERVER_TIMING_MAX_SPANS = 32
+
+# OTLP span 종류
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# W3C traceparent 헤더 (00-<trace id>-<parent span id>-<flags>)
+_TRACEPARENT_PATTERN = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_SERVER_TIMING_NAME = re.compile(r"[^A-Za-z0-9_.\-]")
+_SERVER_TIMING_DESC = re.compile(r'["\\\x00-\x1f\x7f-\uffff]')
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """trace 안의 작업 구간 하나"""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "kind", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: Optional[str],
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Span 초기화
+
+        Args:
+            trace: 소속 trace
+            name: span 이름 (예: yahoo, exa, screener, handler)
+            parent_id: 부모 span ID (루트면 None 또는 외부 traceparent의 span ID)
+            kind: OTLP span 종류
+            attributes: 속성
+        """
+        self.trace = trace
+        self.name = name
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """요청 하나의 span 모음"""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, parent_id: Optional[str] = None, export: bool = True):
+        """
+        Trace 초기화 (루트 span 생성)
+
+        Args:
+            name: 루트 span 이름 (예: GET /api/stocks/{ticker})
+            trace_id: 외부에서 전달받은 trace ID (없으면 새로 생성)
+            parent_id: 외부 부모 span ID
+            export: 종료 시 내보내기 여부
+        """
+        self.trace_id = trace_id or _new_id(128)
+        self.export = export
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self.root = self.add_span(name, parent_id, SPAN_KIND_SERVER)
+
+    def add_span(
+        self,
+        name: str,
+        parent_id: Optional[str],
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        span = Span(self, name, parent_id, kind, attributes)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def find(self, name: str) -> Optional[Span]:
+        with self._lock:
+            return next((span for span in self.spans if span.name == name), None)
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing 헤더 값 (span 이름별 소요 시간, 설명에는 operation 속성)
+
+        Returns:
+            str: 예) total;dur=412.3, screener;dur=88.1, yahoo;dur=80.2;desc="quoteSummary:price"
+        """
+        entries = [f"total;dur={self.root.duration_ms:.1f}"]
+        with self._lock:
+            spans = [span for span in self.spans if span is not self.root][:SERVER_TIMING_MAX_SPANS]
+
+        for span in spans:
+            entry = f"{_SERVER_TIMING_NAME.sub('_', span.name)};dur={span.duration_ms:.1f}"
+            description = span.attributes.get("operation")
+            if description:
+                entry += f';desc="{_SERVER_TIMING_DESC.sub("_", str(description))}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "duration_ms": round(self.root.duration_ms, 3),
+            "spans": [span.to_dict() for span in spans],
+        }
+
+
+def current_span() -> Optional[Span]:
+    """현재 컨텍스트의 span (추적 중이 아니면 None)"""
+    return _current_span.get()
+
+
+@contextmanager
+def trace_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes) -> Iterator[Optional[Span]]:
+    """
+    현재 span의 자식 span 기록
+
+    추적 중인 요청이 아니면 아무것도 기록하지 않습니다.
+    예외가 발생하면 span에 예외 이름을 남기고 다시 발생시킵니다.
+
+    Args:
+        name: span 이름
+        kind: OTLP span 종류 (업스트림 호출은 SPAN_KIND_CLIENT)
+        **attributes: span 속성
+
+    Yields:
+        Span: 생성된 span 또는 None
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    span = parent.trace.add_span(name, parent.span_id, kind, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+
+
+def _traced_endpoint(endpoint):
+    """엔드포인트 함수 실행 구간을 handler span으로 기록 (응답 직렬화와 구분)"""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def traced(*args, **kwargs):
+            with trace_span("handler"):
+                return await endpoint(*args, **kwargs)
+    else:
+        @functools.wraps(endpoint)
+        def traced(*args, **kwargs):
+            with trace_span("handler"):
+                return endpoint(*args, **kwargs)
+    return traced
+
+
+class TracedRoute(APIRoute):
+    """엔드포인트 실행을 handler span으로 감싸는 라우트 (app.router.route_class 또는 APIRouter(route_class=...))"""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _traced_endpoint(endpoint), **kwargs)
+
+
+class TraceExporter:
+    """완료된 trace를 별도 스레드에서 JSON 로그 / OTLP 수집기로 내보내는 전송기"""
+
+    def __init__(
+        self,
+        targets: set = TRACE_EXPORT,
+        json_path: str = TRACE_JSON_PATH,
+        otlp_endpoint: str = TRACE_OTLP_ENDPOINT,
+        service_name: str = TRACE_SERVICE_NAME,
+        max_queue: int = 1000,
+        batch_size: int = 64
+    ):
+        """
+        TraceExporter 초기화
+
+        Args:
+            targets: 내보내기 대상 (json, otlp)
+            json_path: JSON 줄 단위 기록 파일 (비어 있으면 로그로 출력)
+            otlp_endpoint: OTLP/HTTP trace 수신 주소
+            service_name: OTLP resource의 service.name
+            max_queue: 대기열 최대 trace 수 (가득 차면 버림)
+            batch_size: 한 번에 전송할 최대 trace 수
+        """
+        self.targets = set(targets)
+        self.json_path = json_path
+        self.otlp_endpoint = otlp_endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=max_queue)
+        self._counters = {"exported": 0, "dropped": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.targets)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def submit(self, trace: Trace) -> None:
+        """
+        trace 내보내기 예약 (요청 처리 스레드를 막지 않음)
+
+        Args:
+            trace: 완료된 trace
+        """
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self._thread.start()
+
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self._count("dropped")
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.export(batch)
+                self._count("exported", len(batch))
+            except Exception as e:
+                self._count("failed", len(batch))
+                logger.warning("trace 내보내기 실패 (%s건): %s", len(batch), e)
+
+    def export(self, traces: List[Trace]) -> None:
+        """
+        trace 목록을 설정된 대상으로 바로 내보내기
+
+        Args:
+            traces: 완료된 trace 목록
+        """
+        if "json" in self.targets:
+            lines = [json.dumps(trace.to_dict(), ensure_ascii=False, default=str) for trace in traces]
+            if self.json_path:
+                with open(self.json_path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+            else:
+                for line in lines:
+                    logger.info(line)
+
+        if "otlp" in self.targets:
+            body = json.dumps(to_otlp(traces, self.service_name), default=str).encode("utf-8")
+            request = urllib.request.Request(
+                self.otlp_endpoint, data=body, headers={"Content-Type": "application/json"}, method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                response.read()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        내보내기 통계
+
+        Returns:
+            Dict: 대상, 내보낸/버린/실패한 trace 수, 대기 중인 trace 수
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        return {"targets": sorted(self.targets), **counters, "queued": self._queue.qsize()}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(traces: List[Trace], service_name: str = TRACE_SERVICE_NAME) -> Dict[str, Any]:
+    """
+    trace 목록을 OTLP/HTTP JSON(ExportTraceServiceRequest) 형식으로 변환
+
+    Args:
+        traces: 완료된 trace 목록
+        service_name: resource의 service.name
+
+    Returns:
+        Dict: resourceSpans 요청 본문
+    """
+    spans = []
+    for trace in traces:
+        with trace._lock:
+            trace_spans = list(trace.spans)
+        for span in trace_spans:
+            spans.append({
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": span.kind,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            })
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+_default_exporter: Optional[TraceExporter] = None
+_default_exporter_lock = threading.Lock()
+
+
+def get_trace_exporter() -> TraceExporter:
+    """
+    프로세스 공용 trace 전송기 반환
+
+    Returns:
+        TraceExporter: 공용 전송기
+    """
+    global _default_exporter
+    if _default_exporter is None:
+        with _default_exporter_lock:
+            if _default_exporter is None:
+                _default_exporter = TraceExporter()
+    return _default_exporter
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class TracingMiddleware:
+    """요청마다 trace를 만들고 Server-Timing 헤더 추가 / 완료된 trace 내보내기 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app,
+        server_timing: str = TRACE_SERVER_TIMING,
+        sample_rate: float = TRACE_SAMPLE_RATE,
+        exporter: Optional[TraceExporter] = None
+    ):
+        """
+        TracingMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 앱
+            server_timing: Server-Timing 헤더 (off, on, request)
+            sample_rate: 내보낼 요청 비율 (0~1)
+            exporter: trace 전송기 (기본값: 프로세스 공용 전송기)
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.sample_rate = sample_rate
+        self.exporter = exporter or get_trace_exporter()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        add_header = self.server_timing == "on" or (
+            self.server_timing == "request" and _header(scope, b"x-server-timing") is not None
+        )
+        export = self.exporter.enabled and random.random() < self.sample_rate
+        if not add_header and not export:
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = parent_id = None
+        match = _TRACEPARENT_PATTERN.match(_header(scope, b"traceparent") or "")
+        if match:
+            trace_id, parent_id = match.groups()
+
+        trace = Trace(f"{scope['method']} {scope['path']}", trace_id, parent_id, export)
+        trace.root.set_attribute("http.method", scope["method"])
+        token = _current_span.set(trace.root)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                # 엔드포인트 종료부터 응답 시작까지는 응답 모델 검증 / JSON 직렬화 구간
+                handler = trace.find("handler")
+                if handler is not None and handler.end_ns is not None:
+                    serialize = trace.add_span("serialize", trace.root.span_id)
+                    serialize.start_ns = handler.end_ns
+                    serialize.end()
+
+                trace.root.set_attribute("http.status_code", message["status"])
+                if add_header:
+                    message = {
+                        **message,
+                        "headers": list(message.get("headers", [])) + [
+                            (b"server-timing", trace.server_timing().encode("latin-1"))
+                        ],
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_span.reset(token)
+            if scope.get("route") is not None:
+                trace.root.name = f"{scope['method']} {route_template(scope)}"
+            trace.root.end()
+            if export:
+                self.exporter.submit(trace)
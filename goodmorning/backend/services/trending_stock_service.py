@@ -5,9 +5,13 @@ yahooquery의 Screener를 사용하여 화제 종목을 수집하고,
 TOP 1 종목의 상세 정보를 조회하는 서비스
 """
 
-from typing import Dict, Any, Optional, Literal
-from yahooquery import Screener, Ticker
+from typing import TYPE_CHECKING, Dict, Any, Optional, Literal
+import os
 
+from .hedged_request import Deadline, DeadlineExceededError
+from .market_data import MarketDataClient, get_market_data
+from .tracing import trace_span
+from .upstream_guard import UpstreamUnavailableError, is_throttled_response
 from .utils import (
     LoggerFactory,
     StockConstants,
@@ -15,9 +19,22 @@ from .utils import (
     ErrorResponseBuilder
 )
 
+if TYPE_CHECKING:
+    from yahooquery import Ticker
+
 # 로깅 설정
 logger = LoggerFactory.get_logger(__name__)
 
+# 공유 캐시 유지 시간 (초, 정규장 기준) - CACHE_BACKEND 설정 시 워커 간 같은 화제 종목 결과 공유
+TRENDING_CACHE_SECONDS = int(os.getenv("TRENDING_CACHE_SECONDS", "60"))
+
+
+def _is_complete_result(result: Dict[str, Any]) -> bool:
+    """에러 응답, 마지막 성공 결과로 대신한 응답, 마감으로 모듈을 건너뛴 응답은 공유 캐시에 저장하지 않음"""
+    if "error" in result or result.get("stale"):
+        return False
+    return not (result.get("detail_info") or {}).get("skipped_modules")
+
 
 class TrendingStockService:
     """화제 종목 수집 및 상세 정보 조회 서비스"""
@@ -25,14 +42,27 @@ class TrendingStockService:
     # 사용 가능한 스크리너 타입
     SCREENER_TYPES = Literal["most_actives", "day_gainers", "day_losers"]
 
-    def __init__(self):
-        """TrendingStockService 초기화"""
-        self.screener = Screener()
+    # 상세 정보 조회 모듈
+    DETAIL_MODULES = ("price", "summary_detail", "financial_data")
+
+    def __init__(self, market_data: Optional[MarketDataClient] = None):
+        """
+        TrendingStockService 초기화
+
+        Args:
+            market_data: 시장 데이터 접근 객체 (기본값: 프로세스 공용 객체 - 세션, 호출 보호기, 헤지 실행기, 공유 캐시 포함)
+        """
+        self.market_data = market_data or get_market_data()
+        self.executor = self.market_data.executor
+        self.cache = self.market_data.cache
+        # Yahoo 호출이 거절될 때 응답할 스크리너별 마지막 성공 결과
+        self._last_results: Dict[str, Dict[str, Any]] = {}
 
     def get_trending_stock(
         self,
         screener_type: str = "most_actives",
-        count: int = 1
+        count: int = 1,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         화제 종목 TOP 1 조회
@@ -40,23 +70,36 @@ class TrendingStockService:
         Args:
             screener_type: 스크리너 타입 (most_actives, day_gainers, day_losers)
             count: 조회할 종목 수 (기본값: 1)
+            deadline: 응답 마감 시간 (기본값: UPSTREAM_DEFAULT_DEADLINE_MS)
 
         Returns:
             Dict: 화제 종목 정보
                 - symbol: 종목 심볼
                 - screener_type: 스크리너 타입
                 - basic_info: 기본 정보 (심볼, 이름, 가격, 변동률 등)
-                - detail_info: 상세 정보 (price, summary_detail, financial_data)
+                - detail_info: 상세 정보 (price, summary_detail, financial_data, skipped_modules)
+                - stale: Yahoo 호출이 거절되어 마지막 성공 결과로 응답한 경우 True
                 - error: 에러 메시지 (에러 발생 시)
 
         Raises:
             ValueError: 유효하지 않은 screener_type
         """
+        deadline = deadline or Deadline()
+        return self.cache.get_or_load(
+            f"trending:{screener_type}:{count}",
+            lambda: self._load_trending_stock(screener_type, count, deadline),
+            self.market_data.calendar.cache_ttl(TRENDING_CACHE_SECONDS),
+            cacheable=_is_complete_result,
+            wait_seconds=deadline.remaining()
+        )
+
+    def _load_trending_stock(self, screener_type: str, count: int, deadline: Deadline) -> Dict[str, Any]:
+        """스크리너 + TOP 1 상세 정보 조회 (get_trending_stock 참고)"""
         try:
             self._validate_screener_type(screener_type)
-            logger.info(f"화제 종목 조회 시작 - 스크리너: {screener_type}, 개수: {count}")
+            logger.info("화제 종목 조회 시작 - 스크리너: %s, 개수: %s", screener_type, count)
 
-            screener_data = self._fetch_screener_data(screener_type, count)
+            screener_data = self._fetch_screener_data(screener_type, count, deadline)
             top_stock = self._extract_top_stock(screener_data, screener_type)
 
             if not top_stock:
@@ -73,18 +116,35 @@ class TrendingStockService:
                     "종목 심볼을 찾을 수 없습니다."
                 )
 
-            logger.info(f"TOP 1 종목 선정: {symbol}")
+            logger.info("TOP 1 종목 선정: %s", symbol)
+
+            result = self._build_stock_response(top_stock, screener_type, deadline)
+            self._last_results[screener_type] = result
+            return result
+
+        except (UpstreamUnavailableError, DeadlineExceededError) as e:
+            # Yahoo 호출이 거절되거나 마감을 넘기면 마지막 성공 결과로 응답, 없으면 즉시 실패
+            if screener_type in self._last_results:
+                logger.warning("%s - 캐시된 화제 종목으로 응답합니다: %s", e, screener_type)
+                return {**self._last_results[screener_type], "stale": True}
 
-            return self._build_stock_response(top_stock, screener_type)
+            logger.warning("%s - 캐시된 결과가 없습니다: %s", e, screener_type)
+            response = ErrorResponseBuilder.build_stock_error_response(screener_type, str(e))
+            if isinstance(e, DeadlineExceededError):
+                response["error_code"] = "DEADLINE_EXCEEDED"
+            else:
+                response["error_code"] = "UPSTREAM_UNAVAILABLE"
+                response["retry_after"] = e.retry_after
+            return response
 
         except ValueError as e:
-            logger.error(f"입력 값 오류: {e}")
+            logger.error("입력 값 오류: %s", e)
             return ErrorResponseBuilder.build_stock_error_response(
                 screener_type,
                 str(e)
             )
         except Exception as e:
-            logger.error(f"화제 종목 조회 중 오류 발생: {e}", exc_info=True)
+            logger.error("화제 종목 조회 중 오류 발생: %s", e, exc_info=True)
             return ErrorResponseBuilder.build_stock_error_response(
                 screener_type,
                 f"종목 조회 중 오류가 발생했습니다: {str(e)}"
@@ -100,28 +160,35 @@ class TrendingStockService:
         Raises:
             ValueError: 유효하지 않은 스크리너 타입
         """
-        available_screeners = self.screener.available_screeners
+        available_screeners = self.market_data.screener.available_screeners
         if screener_type not in available_screeners:
             raise ValueError(
                 f"유효하지 않은 스크리너 타입: {screener_type}. "
                 f"사용 가능한 타입: {', '.join(StockConstants.SCREENER_TYPES)}"
             )
 
-    def _fetch_screener_data(self, screener_type: str, count: int) -> Dict[str, Any]:
+    def _fetch_screener_data(self, screener_type: str, count: int, deadline: Deadline) -> Dict[str, Any]:
         """
         스크리너 데이터 조회
 
         Args:
             screener_type: 스크리너 타입
             count: 조회할 종목 수
+            deadline: 응답 마감 시간
 
         Returns:
             Dict: 스크리너 데이터
 
         Raises:
             ValueError: 응답 형식이 올바르지 않은 경우
+            UpstreamUnavailableError: Yahoo 호출 거절
+            DeadlineExceededError: 마감 시간 초과
         """
-        screener_data = self.screener.get_screeners([screener_type], count)
+        screener_data = self.executor.call(
+            "screener",
+            lambda: self.market_data.get_screeners([screener_type], count),
+            deadline
+        )
 
         if not isinstance(screener_data, dict):
             raise ValueError(f"예상하지 못한 응답 타입: {type(screener_data)}")
@@ -142,16 +209,27 @@ class TrendingStockService:
 
         Returns:
             Dict: TOP 1 종목 데이터 또는 None
+
+        Raises:
+            UpstreamUnavailableError: 요청 제한 응답
         """
         if screener_type not in screener_data:
-            logger.warning(f"스크리너 '{screener_type}' 데이터를 찾지 못했습니다.")
+            logger.warning("스크리너 '%s' 데이터를 찾지 못했습니다.", screener_type)
             return None
 
         screener_result = screener_data[screener_type]
+
+        # 요청 제한 등 조회 실패 시 yahooquery는 에러 메시지 문자열을 반환
+        if isinstance(screener_result, str):
+            logger.warning("스크리너 '%s' 조회 실패: %s", screener_type, screener_result)
+            if is_throttled_response(screener_result):
+                raise UpstreamUnavailableError("throttled", self.market_data.guard.breaker.retry_after() or 1.0)
+            return None
+
         quotes = screener_result.get('quotes', [])
 
         if not quotes:
-            logger.warning(f"스크리너 '{screener_type}'에서 종목을 찾지 못했습니다.")
+            logger.warning("스크리너 '%s'에서 종목을 찾지 못했습니다.", screener_type)
             return None
 
         return quotes[0]
@@ -159,7 +237,8 @@ class TrendingStockService:
     def _build_stock_response(
         self,
         top_stock: Dict[str, Any],
-        screener_type: str
+        screener_type: str,
+        deadline: Deadline
     ) -> Dict[str, Any]:
         """
         주식 정보 응답 생성
@@ -167,6 +246,7 @@ class TrendingStockService:
         Args:
             top_stock: TOP 1 종목 데이터
             screener_type: 스크리너 타입
+            deadline: 응답 마감 시간
 
         Returns:
             Dict: 완전한 주식 정보 응답
@@ -177,9 +257,10 @@ class TrendingStockService:
         basic_info = self._format_basic_info(top_stock)
 
         # 상세 정보 조회
-        detail_info = self._get_stock_detail(symbol)
+        with trace_span("detail", symbol=symbol):
+            detail_info = self._get_stock_detail(symbol, deadline)
 
-        logger.info(f"화제 종목 조회 완료: {symbol}")
+        logger.info("화제 종목 조회 완료: %s", symbol)
 
         return {
             "symbol": symbol,
@@ -209,43 +290,53 @@ class TrendingStockService:
             "marketCap": stock.get('marketCap'),
         }
 
-    def _get_stock_detail(self, symbol: str) -> Dict[str, Any]:
+    def _get_stock_detail(self, symbol: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         종목 상세 정보 조회 (Ticker 사용)
 
+        주요 모듈을 동시에 조회하며, 마감 시간까지 응답하지 않은 모듈은 None으로 두고
+        skipped_modules에 기록합니다.
+
         Args:
             symbol: 종목 심볼
+            deadline: 응답 마감 시간 (기본값: UPSTREAM_DEFAULT_DEADLINE_MS)
 
         Returns:
             Dict: 종목 상세 정보
                 - price: 가격 정보
                 - summary_detail: 요약 정보
                 - financial_data: 재무 데이터
+                - skipped_modules: 마감 시간 초과로 건너뛴 모듈 이름
                 - error: 에러 메시지 (에러 발생 시)
         """
         try:
-            logger.info(f"종목 상세 정보 조회: {symbol}")
+            logger.info("종목 상세 정보 조회: %s", symbol)
 
-            ticker = Ticker(symbol)
+            ticker = self.market_data.ticker(symbol)
 
-            # 주요 모듈 조회
-            detail = {
-                "price": self._safe_get_module(ticker, 'price', symbol),
-                "summary_detail": self._safe_get_module(ticker, 'summary_detail', symbol),
-                "financial_data": self._safe_get_module(ticker, 'financial_data', symbol),
-            }
+            # 주요 모듈 동시 조회 (모듈별 헤지, 공통 마감 시간)
+            results, _, skipped = self.executor.run_all(
+                {
+                    module_name: (lambda module_name=module_name: self._safe_get_module(ticker, module_name, symbol))
+                    for module_name in self.DETAIL_MODULES
+                },
+                deadline or Deadline()
+            )
+
+            detail = {module_name: results.get(module_name) for module_name in self.DETAIL_MODULES}
+            detail["skipped_modules"] = skipped
 
             return detail
 
         except Exception as e:
-            logger.error(f"종목 상세 정보 조회 중 오류 발생 ({symbol}): {e}", exc_info=True)
+            logger.error("종목 상세 정보 조회 중 오류 발생 (%s): %s", symbol, e, exc_info=True)
             return {
                 "error": f"상세 정보 조회 중 오류가 발생했습니다: {str(e)}"
             }
 
     def _safe_get_module(
         self,
-        ticker: Ticker,
+        ticker: "Ticker",
         module_name: str,
         symbol: str
     ) -> Optional[Dict[str, Any]]:
@@ -261,7 +352,7 @@ class TrendingStockService:
             Dict: 모듈 데이터 또는 None
         """
         try:
-            data = getattr(ticker, module_name)
+            data = self.market_data.get_module(ticker, module_name)
 
             # 에러 응답 체크
             if isinstance(data, dict) and symbol in data:
@@ -272,7 +363,7 @@ class TrendingStockService:
                 return None
 
         except Exception as e:
-            logger.warning(f"모듈 '{module_name}' 조회 실패 ({symbol}): {e}")
+            logger.warning("모듈 '%s' 조회 실패 (%s): %s", module_name, symbol, e)
             return None
 
     def get_multiple_trending_stocks(
@@ -300,7 +391,7 @@ class TrendingStockService:
                 result = self.get_trending_stock(screener_type, count_per_screener)
                 results[screener_type] = result
             except Exception as e:
-                logger.error(f"스크리너 '{screener_type}' 조회 중 오류: {e}", exc_info=True)
+                logger.error("스크리너 '%s' 조회 중 오류: %s", screener_type, e, exc_info=True)
                 results[screener_type] = ErrorResponseBuilder.build_stock_error_response(
                     screener_type,
                     str(e)
@@ -0,0 +1,337 @@
+"""
+업스트림(Yahoo) 호출 보호 서비스
+
+Yahoo는 부하가 몰리면 요청을 제한하거나 차단합니다. 실패 후에도 다음 요청이
+곧바로 다시 호출하면 차단이 길어지므로, 프로세스 전체에서 공유하는
+토큰 버킷 속도 제한과 서킷 브레이커로 yahooquery 호출을 감쌉니다.
+
+서킷 브레이커 상태:
+    - closed: 정상 호출. 연속 실패가 임계값에 도달하면 open
+    - open: 호출하지 않고 즉시 거절(캐시가 있으면 캐시로 응답). reset_timeout 후 half_open
+    - half_open: 제한된 수의 시험 호출만 허용. 성공하면 closed, 실패하면 다시 open
+"""
+
+from typing import Dict, Any, Callable, Optional
+import os
+import threading
+import time
+
+from .utils import LoggerFactory
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 기본 설정 (환경 변수로 조정)
+RATE_LIMIT_PER_SECOND = float(os.getenv("YAHOO_RATE_LIMIT_PER_SECOND", "5"))
+RATE_LIMIT_BURST = int(os.getenv("YAHOO_RATE_LIMIT_BURST", "10"))
+RATE_LIMIT_WAIT_SECONDS = float(os.getenv("YAHOO_RATE_LIMIT_WAIT_SECONDS", "2"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("YAHOO_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("YAHOO_BREAKER_RESET_SECONDS", "30"))
+BREAKER_HALF_OPEN_CALLS = int(os.getenv("YAHOO_BREAKER_HALF_OPEN_CALLS", "1"))
+
+# 서킷 브레이커 상태
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 요청 제한/차단으로 판단하는 yahooquery 에러 메시지
+THROTTLE_MARKERS = ("too many requests", "429", "rate limit", "unauthorized", "invalid crumb")
+
+
+class UpstreamUnavailableError(Exception):
+    """업스트림 호출 거절 (속도 제한 또는 서킷 브레이커 open)"""
+
+    def __init__(self, reason: str, retry_after: float = 0.0):
+        """
+        UpstreamUnavailableError 초기화
+
+        Args:
+            reason: 거절 사유 (rate_limited, circuit_open, throttled)
+            retry_after: 다시 시도할 때까지 권장 대기 시간 (초)
+        """
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Yahoo 호출이 일시적으로 제한되었습니다 ({reason})")
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, capacity: int = RATE_LIMIT_BURST):
+        """
+        TokenBucket 초기화
+
+        Args:
+            rate: 초당 충전 토큰 수
+            capacity: 최대 토큰 수 (순간 허용량)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, timeout: float = 0.0) -> bool:
+        """
+        토큰 1개 획득 (없으면 timeout까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 획득 여부
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """현재 토큰 수"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (half-open 시험 호출 지원)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_SECONDS,
+        half_open_max_calls: int = BREAKER_HALF_OPEN_CALLS
+    ):
+        """
+        CircuitBreaker 초기화
+
+        Args:
+            failure_threshold: open으로 전환하는 연속 실패 횟수
+            reset_timeout: open 유지 시간 (초), 이후 half_open으로 전환
+            half_open_max_calls: half_open에서 동시에 허용하는 시험 호출 수
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _update_state(self, now: float) -> None:
+        if self._state == STATE_OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = STATE_HALF_OPEN
+            self._probes = 0
+            logger.info("서킷 브레이커 half_open 전환 - 시험 호출 허용")
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed, open, half_open)"""
+        with self._lock:
+            self._update_state(time.monotonic())
+            return self._state
+
+    def retry_after(self) -> float:
+        """open 상태가 끝날 때까지 남은 시간 (초)"""
+        with self._lock:
+            if self._state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (half_open에서는 허용 시 시험 호출 슬롯을 차지)
+
+        Returns:
+            bool: 호출 가능 여부
+        """
+        with self._lock:
+            self._update_state(time.monotonic())
+
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """allow() 후 호출하지 못한 경우 시험 호출 슬롯 반환"""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (half_open이면 closed로 복귀)"""
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("서킷 브레이커 closed 전환 - Yahoo 호출 정상화")
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (임계값 도달 또는 half_open 실패 시 open)"""
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    logger.warning(
+                        "서킷 브레이커 open 전환 - 연속 실패 %s회, %.0f초 동안 Yahoo 호출 중단",
+                        self._failures, self.reset_timeout
+                    )
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+
+def is_throttled_response(value: Any) -> bool:
+    """
+    yahooquery 응답이 요청 제한/차단 에러인지 확인
+
+    Args:
+        value: yahooquery 응답 (문자열 또는 심볼 → 값 dict)
+
+    Returns:
+        bool: 요청 제한/차단 에러 여부
+    """
+    if isinstance(value, str):
+        message = value.lower()
+        return any(marker in message for marker in THROTTLE_MARKERS)
+    if isinstance(value, dict) and value:
+        return all(isinstance(item, str) and is_throttled_response(item) for item in value.values())
+    return False
+
+
+class UpstreamGuard:
+    """속도 제한 + 서킷 브레이커로 업스트림 호출 보호"""
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        acquire_timeout: float = RATE_LIMIT_WAIT_SECONDS
+    ):
+        """
+        UpstreamGuard 초기화
+
+        Args:
+            bucket: 토큰 버킷 (기본값: 환경 변수 설정)
+            breaker: 서킷 브레이커 (기본값: 환경 변수 설정)
+            acquire_timeout: 토큰 대기 최대 시간 (초)
+        """
+        self.bucket = bucket or TokenBucket()
+        self.breaker = breaker or CircuitBreaker()
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._counters = {
+            "requests": 0,
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "rejected_circuit_open": 0,
+            "rejected_rate_limited": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        보호된 업스트림 호출
+
+        예외 또는 요청 제한 응답은 실패로 기록하고, 그 외에는 성공으로 기록합니다.
+
+        Args:
+            func: yahooquery 호출 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            UpstreamUnavailableError: 서킷 브레이커 open 또는 속도 제한으로 거절된 경우
+        """
+        self._count("requests")
+
+        if not self.breaker.allow():
+            self._count("rejected_circuit_open")
+            raise UpstreamUnavailableError("circuit_open", self.breaker.retry_after())
+
+        if not self.bucket.acquire(self.acquire_timeout):
+            self.breaker.release()
+            self._count("rejected_rate_limited")
+            raise UpstreamUnavailableError("rate_limited", 1.0 / self.bucket.rate)
+
+        self._count("calls")
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._count("failures")
+            self.breaker.record_failure()
+            raise
+
+        if is_throttled_response(result):
+            self._count("failures")
+            self.breaker.record_failure()
+        else:
+            self._count("successes")
+            self.breaker.record_success()
+
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호출 통계 및 상태
+
+        Returns:
+            Dict: 브레이커 상태, 호출/거절 횟수, 거절률, 현재 토큰 수 등
+        """
+        with self._lock:
+            counters = dict(self._counters)
+
+        rejected = counters["rejected_circuit_open"] + counters["rejected_rate_limited"]
+        return {
+            "breaker_state": self.breaker.state,
+            "retry_after_seconds": round(self.breaker.retry_after(), 1),
+            **counters,
+            "rejection_rate": round(rejected / counters["requests"], 4) if counters["requests"] else 0.0,
+            "tokens_available": round(self.bucket.available, 2),
+            "rate_per_second": self.bucket.rate,
+            "burst": self.bucket.capacity,
+        }
+
+
+_default_guard: Optional[UpstreamGuard] = None
+_default_guard_lock = threading.Lock()
+
+
+def get_upstream_guard() -> UpstreamGuard:
+    """
+    프로세스 공용 업스트림 보호기 반환 (모든 서비스 인스턴스가 공유)
+
+    Returns:
+        UpstreamGuard: 공용 보호기
+    """
+    global _default_guard
+    with _default_guard_lock:
+        if _default_guard is None:
+            _default_guard = UpstreamGuard()
+        return _default_guard
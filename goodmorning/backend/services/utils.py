@@ -5,8 +5,16 @@
 모든 서비스에서 공통으로 사용하는 유틸리티 함수 및 클래스
 """
 
+import atexit
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, IO, List, Optional
 from datetime import datetime, timedelta
 
 
@@ -28,10 +36,173 @@ class StockConstants:
     DEFAULT_VALUE_NUMERIC = 0
 
 
+# 로그 설정 (환경 변수로 조정)
+# - LOG_FORMAT: text(사람이 읽는 한 줄) 또는 json(한 줄에 JSON 객체 하나)
+# - LOG_ASYNC: 1이면 호출 스레드는 큐에 넣기만 하고 포맷/출력은 별도 스레드에서 처리
+# - LOG_SAMPLE_RATES: 로거별 INFO 이하 로그 표본 비율 (예: "main=0.1,services.news_service=0.5")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_ASYNC = os.getenv("LOG_ASYNC", "1").lower() not in ("0", "false", "no")
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+
+TEXT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+TEXT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# LogRecord 기본 속성 (나머지는 extra로 넘긴 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    로거별 표본 비율 설정 파싱
+
+    Args:
+        spec: "로거 이름=비율" 쉼표 구분 목록 (예: "main=0.1,services.news_service=0.5")
+
+    Returns:
+        Dict[str, float]: 로거 이름 → 비율 (0~1)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    rates = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, rate = item.partition("=")
+        if not rate:
+            raise ValueError(f"로그 표본 비율 형식이 올바르지 않습니다: {item} (예: main=0.1)")
+        rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 출력 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """로거별로 INFO 이하 로그 일부만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        SamplingFilter 초기화
+
+        Args:
+            rates: 로거 이름(접두사) → 표본 비율, 가장 긴 접두사 설정을 사용
+        """
+        super().__init__()
+        self.rates = rates
+        self._cache: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = 1.0
+            for prefix in sorted(self.rates, key=len, reverse=True):
+                if name == prefix or name.startswith(prefix + "."):
+                    rate = self.rates[prefix]
+                    break
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    메시지 포맷 없이 레코드를 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler는 큐에 넣기 전에 호출 스레드에서 메시지를 포맷하므로,
+    포맷(msg % args)과 예외 traceback 문자열 변환까지 출력 스레드로 미룹니다.
+    (같은 프로세스 안의 큐에만 사용, 인자는 로그 호출 이후 변경하지 않는 값이어야 함)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class LoggerFactory:
     """로거 생성 팩토리"""
 
     _configured = False
+    _listener: Optional[QueueListener] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(
+        cls,
+        level: str = LOG_LEVEL,
+        log_format: str = LOG_FORMAT,
+        use_async: bool = LOG_ASYNC,
+        sample_rates: Optional[Dict[str, float]] = None,
+        stream: Optional[IO] = None
+    ) -> None:
+        """
+        루트 로거 설정 (기존 핸들러 교체)
+
+        Args:
+            level: 로그 레벨
+            log_format: text 또는 json
+            use_async: True이면 큐 + 출력 스레드(QueueListener) 사용
+            sample_rates: 로거별 표본 비율 (기본값: LOG_SAMPLE_RATES)
+            stream: 출력 스트림 (기본값: stderr)
+        """
+        with cls._lock:
+            cls._stop_listener()
+
+            output = logging.StreamHandler(stream or sys.stderr)
+            if log_format == "json":
+                output.setFormatter(JsonFormatter())
+            else:
+                output.setFormatter(logging.Formatter(TEXT_LOG_FORMAT, TEXT_DATE_FORMAT))
+
+            handler: logging.Handler = output
+            if use_async:
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                handler = LazyQueueHandler(log_queue)
+                cls._listener = QueueListener(log_queue, output)
+                cls._listener.start()
+
+            rates = parse_sample_rates(LOG_SAMPLE_RATES) if sample_rates is None else sample_rates
+            if rates:
+                handler.addFilter(SamplingFilter(rates))
+
+            root = logging.getLogger()
+            for existing in list(root.handlers):
+                root.removeHandler(existing)
+            root.addHandler(handler)
+            root.setLevel(level)
+            cls._configured = True
+
+    @classmethod
+    def _stop_listener(cls) -> None:
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """출력 스레드에 남은 로그를 모두 출력하고 종료"""
+        with cls._lock:
+            cls._stop_listener()
 
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -45,16 +216,15 @@ class LoggerFactory:
             logging.Logger: 설정된 로거 인스턴스
         """
         if not cls._configured:
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            cls._configured = True
+            cls.configure()
 
         return logging.getLogger(name)
 
 
+# 프로세스 종료 시 큐에 남은 로그 출력
+atexit.register(LoggerFactory.shutdown)
+
+
 class StockDataFormatter:
     """주식 데이터 포맷팅 유틸리티"""
 
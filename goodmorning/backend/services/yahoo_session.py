@@ -0,0 +1,315 @@
+"""
+yahooquery 공용 세션 제공 서비스
+
+yahooquery는 Ticker/Screener 객체를 만들 때마다 새 HTTP 세션을 만들고
+쿠키 설정(finance.yahoo.com 접속, 동의 페이지 처리)과 crumb 발급 요청을 반복하며,
+TCP/TLS 연결도 새로 맺습니다. 상세 조회 한 번에 이 준비 비용이 본 요청보다 큰 경우가 많으므로,
+프로세스(워커)마다 쿠키와 crumb을 미리 받아 둔 세션 하나를 만들어 모든 yahooquery 객체에 주입합니다.
+
+- 연결 재사용: curl_cffi 세션은 스레드별 curl 핸들로 연결을 유지 (쿠키는 공유)
+- crumb 재사용: 객체 생성 시 yahooquery가 보내는 crumb 요청을 미리 받은 응답으로 대신함
+- 갱신: YAHOO_SESSION_MAX_AGE_SECONDS가 지나거나 invalidate() 호출 시 다음 요청에서 새로 준비
+- 대체 서버: YAHOO_BASE_URL을 설정하면 모든 *.yahoo.com 요청을 해당 서버로 보냄 (부하 테스트용 mock 서버)
+- 지연 import: curl_cffi / yahooquery(pandas 포함)는 세션을 처음 준비할 때 로드 (워커 기동 시간 단축)
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
+import functools
+import importlib
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+from .metrics import UPSTREAM_REQUEST_SECONDS, status_label
+from .tracing import SPAN_KIND_CLIENT, trace_span
+from .utils import LoggerFactory
+
+if TYPE_CHECKING:
+    from yahooquery import Screener, Ticker
+
+# 로깅 설정
+logger = LoggerFactory.get_logger(__name__)
+
+# 세션 최대 사용 시간 (초) - 쿠키/crumb 만료 전에 새로 준비
+SESSION_MAX_AGE_SECONDS = int(os.getenv("YAHOO_SESSION_MAX_AGE_SECONDS", "3600"))
+SESSION_TIMEOUT_SECONDS = float(os.getenv("YAHOO_SESSION_TIMEOUT_SECONDS", "10"))
+
+# Yahoo 대신 요청을 보낼 서버 (예: http://127.0.0.1:8900, 비어 있으면 실제 Yahoo 사용)
+YAHOO_BASE_URL = os.getenv("YAHOO_BASE_URL", "").rstrip("/")
+
+CRUMB_URL = "https://query2.finance.yahoo.com/v1/test/getcrumb"
+
+
+def rewrite_yahoo_url(url: str, base_url: str = YAHOO_BASE_URL) -> str:
+    """
+    *.yahoo.com URL의 scheme/host를 대체 서버로 변경 (경로와 쿼리는 유지)
+
+    Args:
+        url: 요청 URL
+        base_url: 대체 서버 주소 (비어 있으면 변경하지 않음)
+
+    Returns:
+        str: 요청을 보낼 URL
+    """
+    if not base_url:
+        return url
+
+    parts = urlsplit(url)
+    if not parts.hostname or not parts.hostname.endswith("yahoo.com"):
+        return url
+
+    base = urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, base.path + parts.path, parts.query, parts.fragment))
+
+
+def yahoo_operation(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    메트릭 라벨용 Yahoo 요청 종류 (quoteSummary는 요청한 모듈 이름 포함)
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+
+    Returns:
+        str: quoteSummary:<modules>, screener, chart, crumb, setup, other 중 하나
+    """
+    if "/quoteSummary/" in url:
+        modules = params.get("modules") if isinstance(params, dict) else None
+        return f"quoteSummary:{modules}" if modules else "quoteSummary"
+    if "/screener/" in url:
+        return "screener"
+    if "/chart/" in url:
+        return "chart"
+    if url.endswith("/getcrumb"):
+        return "crumb"
+    if url.rstrip("/").endswith("finance.yahoo.com"):
+        return "setup"
+    return "other"
+
+
+def _yahooquery(name: str):
+    """
+    yahooquery 클래스 반환 (처음 사용할 때 import)
+
+    모듈 속성(Ticker, Screener)으로 이미 지정된 값이 있으면 그대로 사용합니다. (벤치마크 재생 모드의 교체 지점)
+
+    Args:
+        name: 클래스 이름 (Ticker, Screener)
+
+    Returns:
+        type: yahooquery 클래스
+    """
+    value = globals().get(name)
+    if value is None:
+        value = getattr(importlib.import_module("yahooquery"), name)
+        globals()[name] = value
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def yahoo_session_class() -> type:
+    """
+    crumb 응답을 재사용하는 yahooquery용 HTTP 세션 클래스
+
+    curl_cffi 세션을 상속해야 하므로 curl_cffi / yahooquery를 처음 사용할 때 클래스를 만듭니다.
+
+    Returns:
+        type: curl_cffi Session 하위 클래스 YahooSession
+    """
+    from curl_cffi import requests as curl_requests
+    from yahooquery.constants import BROWSERS
+
+    class YahooSession(curl_requests.Session):
+        """crumb 응답을 재사용하는 yahooquery용 HTTP 세션"""
+
+        def __init__(self, base_url: str = YAHOO_BASE_URL, **kwargs):
+            impersonate = random.choice(list(BROWSERS.keys()))
+            super().__init__(headers=BROWSERS[impersonate], impersonate=impersonate, **kwargs)
+            self.base_url = base_url
+            self.crumb_response = None
+
+        def get(self, url: str, **kwargs):
+            # yahooquery 객체 생성마다 보내는 crumb 요청은 준비 단계에서 받은 응답으로 응답
+            if url == CRUMB_URL and self.crumb_response is not None:
+                return self.crumb_response
+            return super().get(url, **kwargs)
+
+        def request(self, method, url: str, *args, **kwargs):
+            operation = yahoo_operation(url, kwargs.get("params"))
+            status = "error"
+            started = time.perf_counter()
+            try:
+                with trace_span("yahoo", SPAN_KIND_CLIENT, operation=operation) as span:
+                    # yahooquery의 URL은 고정되어 있으므로 대체 서버 사용 시 여기서 주소를 바꿈
+                    response = super().request(method, rewrite_yahoo_url(url, self.base_url), *args, **kwargs)
+                    status = status_label(response.status_code)
+                    if span is not None:
+                        span.set_attribute("http.status_code", response.status_code)
+                return response
+            finally:
+                UPSTREAM_REQUEST_SECONDS.labels("yahoo", operation, status).observe(time.perf_counter() - started)
+
+    return YahooSession
+
+
+class YahooSessionProvider:
+    """프로세스 공용 yahooquery 세션 제공자"""
+
+    def __init__(
+        self,
+        max_age_seconds: int = SESSION_MAX_AGE_SECONDS,
+        timeout: float = SESSION_TIMEOUT_SECONDS
+    ):
+        """
+        YahooSessionProvider 초기화
+
+        Args:
+            max_age_seconds: 세션 최대 사용 시간 (초)
+            timeout: 요청 타임아웃 (초)
+        """
+        self.max_age_seconds = max_age_seconds
+        self.timeout = timeout
+        self._session = None
+        self._created_at = 0.0
+        self._invalidated = False
+        self._lock = threading.Lock()
+        self._counters = {"sessions_created": 0, "warm_failures": 0, "objects_created": 0}
+
+    def _create_session(self):
+        """쿠키 설정과 crumb 발급까지 마친 세션 생성"""
+        from yahooquery.session_management import get_crumb, setup_session
+
+        started = time.perf_counter()
+        session = yahoo_session_class()(timeout=self.timeout)
+        setup_session(session)
+
+        # 받은 응답을 먼저 등록하고 yahooquery 기준으로 유효한 crumb인지 확인
+        session.crumb_response = session.get(CRUMB_URL)
+        if get_crumb(session) is None:
+            session.crumb_response = None
+            self._counters["warm_failures"] += 1
+            logger.warning("crumb 발급 실패 - yahooquery 객체 생성 시 다시 요청합니다")
+
+        self._counters["sessions_created"] += 1
+        logger.info("Yahoo 세션 준비 완료 (%.0fms)", (time.perf_counter() - started) * 1000)
+        return session
+
+    def get_session(self):
+        """
+        준비된 세션 반환 (없거나 만료되었으면 새로 준비)
+
+        Returns:
+            YahooSession: 쿠키와 crumb이 준비된 세션 (yahoo_session_class() 인스턴스)
+        """
+        with self._lock:
+            expired = time.monotonic() - self._created_at >= self.max_age_seconds
+            if self._session is None or expired or self._invalidated:
+                previous = self._session
+                self._session = self._create_session()
+                self._created_at = time.monotonic()
+                self._invalidated = False
+                if previous is not None:
+                    previous.close()
+            return self._session
+
+    def warm(self) -> bool:
+        """
+        세션 미리 준비 (앱 시작 시 호출)
+
+        Returns:
+            bool: 준비 성공 여부
+        """
+        try:
+            self.get_session()
+            return True
+        except Exception as e:
+            logger.warning("Yahoo 세션 사전 준비 실패: %s", e)
+            return False
+
+    def invalidate(self) -> None:
+        """현재 세션 폐기 (crumb 만료 등, 다음 요청에서 새로 준비)"""
+        with self._lock:
+            self._invalidated = True
+
+    def _count_object(self) -> None:
+        with self._lock:
+            self._counters["objects_created"] += 1
+
+    def ticker(self, symbols: Union[str, List[str]], **kwargs) -> "Ticker":
+        """
+        공용 세션을 사용하는 Ticker 생성
+
+        Args:
+            symbols: 종목 심볼 또는 심볼 리스트
+            **kwargs: Ticker 추가 인자
+
+        Returns:
+            Ticker: yahooquery Ticker
+        """
+        session = self.get_session()
+        self._count_object()
+        return _yahooquery("Ticker")(symbols, session=session, **kwargs)
+
+    def screener(self, **kwargs) -> "Screener":
+        """
+        공용 세션을 사용하는 Screener 생성
+
+        Args:
+            **kwargs: Screener 추가 인자
+
+        Returns:
+            Screener: yahooquery Screener
+        """
+        session = self.get_session()
+        self._count_object()
+        return _yahooquery("Screener")(session=session, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        세션 상태
+
+        Returns:
+            Dict: 세션 생성 횟수, 현재 세션 사용 시간, crumb 준비 여부 등
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            session = self._session
+            age = time.monotonic() - self._created_at if session is not None else None
+
+        return {
+            **counters,
+            "session_age_seconds": round(age, 1) if age is not None else None,
+            "crumb_cached": session is not None and session.crumb_response is not None,
+            "max_age_seconds": self.max_age_seconds,
+            "base_url": YAHOO_BASE_URL or None,
+        }
+
+
+_default_provider: Optional[YahooSessionProvider] = None
+_default_provider_lock = threading.Lock()
+
+
+def get_session_provider() -> YahooSessionProvider:
+    """
+    프로세스 공용 세션 제공자 반환
+
+    Returns:
+        YahooSessionProvider: 공용 제공자
+    """
+    global _default_provider
+    with _default_provider_lock:
+        if _default_provider is None:
+            _default_provider = YahooSessionProvider()
+        return _default_provider
+
+
+def yahoo_ticker(symbols: Union[str, List[str]], **kwargs) -> "Ticker":
+    """공용 세션을 사용하는 Ticker 생성 (편의 함수)"""
+    return get_session_provider().ticker(symbols, **kwargs)
+
+
+def yahoo_screener(**kwargs) -> "Screener":
+    """공용 세션을 사용하는 Screener 생성 (편의 함수)"""
+    return get_session_provider().screener(**kwargs)
@@ -0,0 +1,239 @@
+"""
+시장 캘린더 테스트
+
+NYSE 휴장일/조기 폐장일, 서머타임 변환, 세션 판정, 캐시 유지 시간, 브리핑 실행 조건을 테스트
+"""
+
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+# backend 폴더를 Python 경로에 추가
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+import pytest
+
+from services import market_calendar
+from services.market_calendar import (
+    MarketCalendar,
+    EST,
+    EDT,
+    SESSION_PRE,
+    SESSION_REGULAR,
+    SESSION_POST,
+    SESSION_CLOSED,
+    nyse_holidays,
+    nyse_early_closes,
+    to_eastern,
+    eastern_datetime,
+)
+from services.pipeline import has_new_session
+
+HOUR = 3600
+BASE_TTL = 60
+
+
+def et(year: int, month: int, day: int, hour: int, minute: int = 0, second: int = 0) -> datetime:
+    """ET 벽시계 시각"""
+    return eastern_datetime(date(year, month, day), time(hour, minute, second))
+
+
+def utc(year: int, month: int, day: int, hour: int, minute: int = 0) -> datetime:
+    """UTC 시각"""
+    return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def calendar() -> MarketCalendar:
+    # 환경 변수와 무관하게 기본 설정으로 생성
+    return MarketCalendar(
+        extra_holidays=[],
+        ttl_enabled=True,
+        extended_ttl_multiplier=4,
+        closed_ttl_max_seconds=12 * HOUR
+    )
+
+
+@pytest.mark.parametrize("day, name", [
+    (date(2026, 1, 1), "New Year's Day"),
+    (date(2026, 1, 19), "Martin Luther King Jr. Day"),
+    (date(2026, 2, 16), "Washington's Birthday"),
+    (date(2026, 4, 3), "Good Friday"),
+    (date(2026, 5, 25), "Memorial Day"),
+    (date(2026, 6, 19), "Juneteenth"),
+    (date(2026, 7, 3), "Independence Day"),        # 7/4 토요일 → 금요일 대체
+    (date(2026, 9, 7), "Labor Day"),
+    (date(2026, 11, 26), "Thanksgiving Day"),
+    (date(2026, 12, 25), "Christmas Day"),
+    (date(2027, 3, 26), "Good Friday"),
+    (date(2027, 6, 18), "Juneteenth"),              # 6/19 토요일 → 금요일 대체
+    (date(2027, 12, 24), "Christmas Day"),          # 12/25 토요일 → 금요일 대체
+    (date(2022, 6, 20), "Juneteenth"),              # 6/19 일요일 → 월요일 대체
+    (date(2023, 1, 2), "New Year's Day"),           # 1/1 일요일 → 월요일 대체
+])
+def test_holidays(calendar: MarketCalendar, day: date, name: str):
+    """테스트 1: 정기 휴장일과 대체 휴장일"""
+    assert nyse_holidays(day.year)[day] == name
+    assert calendar.holiday_name(day) == name
+    assert not calendar.is_trading_day(day)
+
+
+@pytest.mark.parametrize("day", [
+    date(2026, 7, 4),      # 토요일인 실제 독립기념일
+    date(2027, 12, 25),    # 토요일인 실제 크리스마스
+    date(2021, 12, 31),    # 1/1 토요일이면 전년도 12/31은 대체하지 않음
+    date(2022, 1, 1),
+    date(2021, 6, 18),     # Juneteenth 도입(2022) 이전
+])
+def test_not_observed(calendar: MarketCalendar, day: date):
+    """테스트 2: 대체하지 않는 날은 휴장일이 아님"""
+    assert calendar.holiday_name(day) is None
+
+
+@pytest.mark.parametrize("day, half_day", [
+    (date(2026, 11, 27), True),    # 추수감사절 다음 날
+    (date(2026, 12, 24), True),    # 크리스마스 이브 (목요일)
+    (date(2025, 7, 3), True),      # 독립기념일 전날 (목요일)
+    (date(2026, 7, 3), False),     # 독립기념일 대체 휴장일
+    (date(2026, 7, 2), False),
+    (date(2027, 12, 24), False),   # 크리스마스 대체 휴장일
+    (date(2027, 12, 23), False),
+    (date(2027, 7, 3), False),     # 토요일
+    (date(2026, 11, 26), False),   # 추수감사절 당일
+])
+def test_early_closes(calendar: MarketCalendar, day: date, half_day: bool):
+    """테스트 3: 조기 폐장일"""
+    assert calendar.is_half_day(day) is half_day
+    assert (day in nyse_early_closes(day.year)) is half_day
+
+
+def test_half_day_hours(calendar: MarketCalendar):
+    """테스트 4: 조기 폐장일 세션 시각"""
+    hours = calendar.trading_hours(date(2026, 11, 27))
+    assert hours["open"] == et(2026, 11, 27, 9, 30)
+    assert hours["close"] == et(2026, 11, 27, 13)
+    assert hours["post_close"] == et(2026, 11, 27, 17)
+    assert calendar.trading_hours(date(2026, 11, 26)) is None
+    assert calendar.trading_hours(date(2026, 11, 28)) is None
+
+
+def test_extra_holidays():
+    """테스트 5: 임시 휴장일"""
+    calendar = MarketCalendar(extra_holidays=[date(2026, 1, 9)])
+    assert calendar.holiday_name(date(2026, 1, 9)) == "Unscheduled closure"
+    assert not calendar.is_trading_day(date(2026, 1, 9))
+
+
+@pytest.mark.parametrize("when, tz, wall", [
+    # 2026-03-08 (3월 둘째 일요일) 02:00 EST → 03:00 EDT
+    (utc(2026, 3, 8, 6, 59), EST, (3, 8, 1, 59)),
+    (utc(2026, 3, 8, 7, 0), EDT, (3, 8, 3, 0)),
+    # 2026-11-01 (11월 첫째 일요일) 02:00 EDT → 01:00 EST
+    (utc(2026, 11, 1, 5, 59), EDT, (11, 1, 1, 59)),
+    (utc(2026, 11, 1, 6, 0), EST, (11, 1, 1, 0)),
+    # 2027-03-14, 2027-11-07
+    (utc(2027, 3, 14, 7, 0), EDT, (3, 14, 3, 0)),
+    (utc(2027, 11, 7, 6, 0), EST, (11, 7, 1, 0)),
+])
+def test_dst_transitions(when: datetime, tz: timezone, wall: tuple):
+    """테스트 6: 서머타임 전환 일요일의 ET 변환"""
+    eastern = to_eastern(when)
+    assert eastern.tzinfo is tz
+    assert (eastern.month, eastern.day, eastern.hour, eastern.minute) == wall
+
+
+@pytest.mark.parametrize("day, open_utc", [
+    (date(2026, 3, 6), utc(2026, 3, 6, 14, 30)),    # 전환 전 금요일 (EST)
+    (date(2026, 3, 9), utc(2026, 3, 9, 13, 30)),    # 전환 후 월요일 (EDT)
+    (date(2026, 10, 30), utc(2026, 10, 30, 13, 30)),
+    (date(2026, 11, 2), utc(2026, 11, 2, 14, 30)),
+])
+def test_open_across_dst(calendar: MarketCalendar, day: date, open_utc: datetime):
+    """테스트 7: 서머타임 전후 정규장 시작 시각 (UTC)"""
+    assert calendar.trading_hours(day)["open"] == open_utc
+
+
+@pytest.mark.parametrize("when, extended, session", [
+    (et(2026, 1, 5, 3, 59), True, SESSION_CLOSED),
+    (et(2026, 1, 5, 4), True, SESSION_PRE),
+    (et(2026, 1, 5, 9, 30), True, SESSION_REGULAR),
+    (et(2026, 1, 5, 15, 59), True, SESSION_REGULAR),
+    (et(2026, 1, 5, 16), True, SESSION_POST),
+    (et(2026, 1, 5, 20), True, SESSION_CLOSED),
+    (et(2026, 1, 5, 8), False, SESSION_CLOSED),
+    (et(2026, 1, 5, 17), False, SESSION_CLOSED),
+    (et(2026, 11, 27, 14), True, SESSION_POST),      # 조기 폐장 후 애프터마켓
+    (et(2026, 11, 27, 17, 30), True, SESSION_CLOSED),
+    (et(2026, 11, 26, 12), True, SESSION_CLOSED),    # 추수감사절
+    (et(2026, 1, 10, 12), True, SESSION_CLOSED),     # 토요일
+])
+def test_sessions(calendar: MarketCalendar, when: datetime, extended: bool, session: str):
+    """테스트 8: 세션 판정"""
+    assert calendar.session_at(when, extended_hours=extended) == session
+
+
+@pytest.mark.parametrize("fetched, extended, ttl", [
+    # 정규장: 기본 TTL
+    (et(2026, 1, 5, 10), True, BASE_TTL),
+    # 프리마켓: 기본 TTL × 4
+    (et(2026, 1, 5, 8), True, BASE_TTL * 4),
+    # 정규장 시작 직전: 경계까지지만 기본 TTL보다 짧아지지 않음
+    (et(2026, 1, 5, 9, 29, 30), True, BASE_TTL),
+    # 시간외를 무시하는 데이터는 프리마켓에도 정규장 시작까지 유지
+    (et(2026, 1, 5, 8), False, 1.5 * HOUR),
+    # 평일 밤: 다음 날 프리마켓 시작까지
+    (et(2026, 1, 5, 21), True, 7 * HOUR),
+    # 금요일 장 마감 후: 주말을 넘기면 최대 12시간
+    (et(2026, 1, 9, 21), True, 12 * HOUR),
+    (et(2026, 1, 9, 21), False, 12 * HOUR),
+    # 일요일 밤: 월요일 프리마켓/정규장 시작까지
+    (et(2026, 1, 11, 20), True, 8 * HOUR),
+    (et(2026, 1, 11, 22), False, 11.5 * HOUR),
+    # 추수감사절 전날 밤: 금요일 프리마켓까지 최대 12시간
+    (et(2026, 11, 25, 20), True, 12 * HOUR),
+])
+def test_expires_at(calendar: MarketCalendar, fetched: datetime, extended: bool, ttl: float):
+    """테스트 9: 세션별 캐시 만료 시각"""
+    timestamp = fetched.timestamp()
+    assert calendar.expires_at(timestamp, BASE_TTL, extended_hours=extended) - timestamp == ttl
+
+
+def test_cache_ttl_over_weekend(calendar: MarketCalendar, monkeypatch: pytest.MonkeyPatch):
+    """테스트 10: 주말 동안 cache_ttl은 최대 유지 시간, 월요일 정규장에는 기본 TTL"""
+    monkeypatch.setattr(market_calendar.time, "time", lambda: et(2026, 1, 10, 12).timestamp())
+    assert calendar.cache_ttl(BASE_TTL) == 12 * HOUR
+
+    monkeypatch.setattr(market_calendar.time, "time", lambda: et(2026, 1, 12, 10).timestamp())
+    assert calendar.cache_ttl(BASE_TTL) == BASE_TTL
+
+
+def test_ttl_disabled():
+    """테스트 11: 시장 시간 기반 TTL을 끄면 기본 TTL 그대로"""
+    calendar = MarketCalendar(extra_holidays=[], ttl_enabled=False)
+    timestamp = et(2026, 1, 10, 12).timestamp()
+    assert calendar.expires_at(timestamp, BASE_TTL) == timestamp + BASE_TTL
+
+
+@pytest.mark.parametrize("now, expected", [
+    (utc(2026, 1, 5, 22), True),      # 월요일 장 마감 후 (KST 화요일 07:00)
+    (utc(2026, 1, 9, 22), True),      # 금요일 장 마감 후
+    (utc(2026, 1, 11, 22), False),    # 일요일 (마지막 마감은 금요일)
+    (utc(2026, 1, 19, 22), False),    # MLK 데이
+    (utc(2026, 11, 26, 22), False),   # 추수감사절
+    (utc(2026, 11, 27, 22), True),    # 추수감사절 다음 날 (13:00 조기 폐장)
+    (utc(2026, 12, 25, 22), False),   # 크리스마스
+    (utc(2027, 12, 24, 22), False),   # 크리스마스 대체 휴장일
+    (utc(2026, 3, 9, 22), True),      # 서머타임 전환 직후 월요일 (20:00 UTC 마감)
+])
+def test_has_new_session(calendar: MarketCalendar, now: datetime, expected: bool):
+    """테스트 12: 브리핑 실행 조건 (마지막 정규장 마감 후 20시간 이내)"""
+    assert has_new_session(calendar, now=now, max_age_hours=20) is expected
+
+
+def test_last_close_and_next_open(calendar: MarketCalendar):
+    """테스트 13: 연휴를 건너뛴 마지막 마감/다음 시작 시각"""
+    now = et(2026, 12, 26, 12)
+    assert calendar.last_close(now) == et(2026, 12, 24, 13)
+    assert calendar.next_open(now) == et(2026, 12, 28, 9, 30)
+    assert calendar.next_open(now) - calendar.last_close(now) == timedelta(days=3, hours=20, minutes=30)
@@ -0,0 +1,85 @@
+"""
+메트릭 미들웨어 테스트
+
+include_router로 포함한 라우트도 전체 경로 템플릿으로 라벨을 붙이는지 테스트
+"""
+
+import sys
+from pathlib import Path
+
+# backend 폴더를 Python 경로에 추가
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from services.metrics import HTTP_REQUEST_SECONDS, MetricsMiddleware
+
+
+def build_app() -> FastAPI:
+    """main.py와 같은 구조의 테스트 앱 (루트 라우트 + prefix로 포함한 라우터)"""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/")
+    def root():
+        return {}
+
+    briefings = APIRouter()
+
+    @briefings.get("/")
+    def list_briefings():
+        return {}
+
+    stocks = APIRouter()
+
+    @stocks.get("/{symbol}")
+    def stock_detail(symbol: str):
+        return {}
+
+    @stocks.get("/{symbol}/history")
+    def stock_history(symbol: str):
+        return {}
+
+    market = APIRouter()
+
+    @market.get("/stocks/search")
+    def search():
+        return {}
+
+    app.include_router(briefings, prefix="/briefings")
+    app.include_router(stocks, prefix="/stocks")
+    app.include_router(market, prefix="/api")
+    return app
+
+
+def request_counts() -> dict:
+    """(method, route, status) → 요청 수"""
+    return {
+        (labels["method"], labels["route"], labels["status"]): value
+        for name, labels, value in HTTP_REQUEST_SECONDS.collect()
+        if name.endswith("_count")
+    }
+
+
+def test_route_labels_include_router_prefix():
+    """테스트 1: / 와 /briefings/ 는 서로 다른 라벨, 포함된 라우터는 prefix 포함"""
+    before = request_counts()
+
+    client = TestClient(build_app())
+    for path in ["/", "/briefings/", "/briefings/", "/stocks/AAPL", "/stocks/MSFT/history",
+                 "/api/stocks/search", "/missing"]:
+        client.get(path)
+
+    after = request_counts()
+    delta = {key: after[key] - before.get(key, 0) for key in after if after[key] != before.get(key, 0)}
+
+    assert delta == {
+        ("GET", "/", "200"): 1,
+        ("GET", "/briefings/", "200"): 2,
+        ("GET", "/stocks/{symbol}", "200"): 1,
+        ("GET", "/stocks/{symbol}/history", "200"): 1,
+        ("GET", "/api/stocks/search", "200"): 1,
+        ("GET", "unmatched", "404"): 1,
+    }
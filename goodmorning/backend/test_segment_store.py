@@ -0,0 +1,212 @@
+"""
+세그먼트 저장소 테스트
+
+SegmentStore의 기록/조회, 같은 ID 재기록, 기간 조회, 정리(compact)를 테스트
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# backend 폴더를 Python 경로에 추가
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+import numpy as np
+import pytest
+
+from services.segment_store import SegmentStore, INDEX_DTYPE
+
+
+def load(view) -> dict:
+    """memoryview를 JSON으로 변환"""
+    return json.loads(bytes(view))
+
+
+def append_briefing(segments: SegmentStore, record_id: str, created_at: datetime, html: str = "") -> None:
+    """테스트용 브리핑 레코드 추가"""
+    segments.append(
+        record_id,
+        created_at,
+        {"id": record_id, "title": f"브리핑 {record_id}"},
+        {"id": record_id, "stocks": [{"symbol": "AAPL"}]},
+        html
+    )
+
+
+@pytest.fixture
+def segments(tmp_path: Path) -> SegmentStore:
+    return SegmentStore("briefing", tmp_path)
+
+
+def test_missing_files(segments: SegmentStore):
+    """테스트 1: 파일이 없으면 빈 결과"""
+    assert segments.summary_slices() == ([], 0)
+    assert segments.detail_slice("20260101_000000") is None
+    assert segments.html_slice("20260101_000000") is None
+    assert segments.count() == 0
+    assert segments.compact([]) == 0
+
+
+def test_empty_files(segments: SegmentStore, tmp_path: Path):
+    """테스트 2: 빈 파일이면 빈 결과"""
+    (tmp_path / "briefing.seg").write_bytes(b"")
+    (tmp_path / "briefing.idx").write_bytes(b"")
+
+    assert segments.summary_slices() == ([], 0)
+    assert segments.detail_slice("20260101_000000") is None
+    assert segments.count() == 0
+
+
+def test_round_trip(segments: SegmentStore):
+    """테스트 3: 기록한 요약/상세/HTML을 그대로 조회"""
+    append_briefing(segments, "20260105_070000", datetime(2026, 1, 5, 7), html="<p>월가</p>")
+
+    slices, total = segments.summary_slices()
+    assert total == 1
+    assert load(slices[0]) == {"id": "20260105_070000", "title": "브리핑 20260105_070000"}
+    assert load(segments.detail_slice("20260105_070000")) == {
+        "id": "20260105_070000",
+        "stocks": [{"symbol": "AAPL"}],
+    }
+    assert bytes(segments.html_slice("20260105_070000")).decode("utf-8") == "<p>월가</p>"
+
+
+def test_html_optional(segments: SegmentStore):
+    """테스트 4: HTML 없이 기록하면 HTML 조회는 None"""
+    append_briefing(segments, "20260105_070000", datetime(2026, 1, 5, 7))
+
+    assert segments.html_slice("20260105_070000") is None
+    assert segments.detail_slice("20260105_070000") is not None
+
+
+def test_last_write_wins(segments: SegmentStore):
+    """테스트 5: 같은 ID를 다시 기록하면 마지막 레코드만 조회"""
+    segments.append("20260105_070000", datetime(2026, 1, 5, 7), {"v": 1}, {"v": 1})
+    segments.append("20260106_070000", datetime(2026, 1, 6, 7), {"v": 2}, {"v": 2})
+    segments.append("20260105_070000", datetime(2026, 1, 5, 7), {"v": 3}, {"v": 3})
+
+    slices, total = segments.summary_slices()
+    assert total == 2
+    assert [load(view) for view in slices] == [{"v": 2}, {"v": 3}]
+    assert load(segments.detail_slice("20260105_070000")) == {"v": 3}
+    assert segments.count() == 2
+
+
+def test_date_range_paging(segments: SegmentStore):
+    """테스트 6: 기간 조회는 최신순이며 limit/offset을 적용하고 total은 기간 내 전체 개수"""
+    for day in range(1, 11):
+        append_briefing(segments, f"202601{day:02d}_070000", datetime(2026, 1, day, 7))
+
+    start, end = datetime(2026, 1, 3), datetime(2026, 1, 9)
+    first, total = segments.summary_slices(start=start, end=end, limit=4)
+    second, _ = segments.summary_slices(start=start, end=end, limit=4, offset=4)
+
+    assert total == 6
+    assert [load(view)["id"] for view in first] == [
+        "20260108_070000", "20260107_070000", "20260106_070000", "20260105_070000",
+    ]
+    assert [load(view)["id"] for view in second] == ["20260104_070000", "20260103_070000"]
+
+    beyond, total = segments.summary_slices(start=start, end=end, offset=10)
+    assert beyond == [] and total == 6
+
+
+def test_sees_later_appends(segments: SegmentStore, tmp_path: Path):
+    """테스트 7: 다른 인스턴스(프로세스)가 추가한 레코드도 조회"""
+    append_briefing(segments, "20260105_070000", datetime(2026, 1, 5, 7))
+    assert segments.count() == 1
+
+    writer = SegmentStore("briefing", tmp_path)
+    append_briefing(writer, "20260106_070000", datetime(2026, 1, 6, 7))
+
+    assert segments.count() == 2
+    assert segments.detail_slice("20260106_070000") is not None
+
+
+def test_skips_entry_past_segment(segments: SegmentStore, tmp_path: Path):
+    """테스트 8: 세그먼트보다 뒤를 가리키는 인덱스 레코드(기록 중)는 건너뜀"""
+    append_briefing(segments, "20260105_070000", datetime(2026, 1, 5, 7))
+
+    # 세그먼트 기록이 끝나기 전에 인덱스가 먼저 보이는 상황 재현
+    entry = np.zeros(1, dtype=INDEX_DTYPE)
+    entry["id"] = b"20260106_070000"
+    entry["created_ts"] = int(datetime(2026, 1, 6, 7).timestamp())
+    entry["offset"] = (tmp_path / "briefing.seg").stat().st_size
+    entry["summary_len"] = 10
+    entry["detail_len"] = 10
+    with open(tmp_path / "briefing.idx", "ab") as f:
+        f.write(entry.tobytes())
+
+    slices, total = segments.summary_slices()
+    assert total == 1
+    assert load(slices[0])["id"] == "20260105_070000"
+    assert segments.detail_slice("20260106_070000") is None
+
+
+def test_compact(segments: SegmentStore, tmp_path: Path):
+    """테스트 9: compact는 보존할 ID의 마지막 레코드만 남기고 파일을 줄임"""
+    for day in range(1, 6):
+        append_briefing(segments, f"202601{day:02d}_070000", datetime(2026, 1, day, 7), html="<p>x</p>")
+    segments.append("20260105_070000", datetime(2026, 1, 5, 7), {"v": "new"}, {"v": "new"})
+    size_before = (tmp_path / "briefing.seg").stat().st_size
+
+    removed = segments.compact(["20260102_070000", "20260105_070000", "20991231_000000"])
+
+    assert removed == 4
+    assert (tmp_path / "briefing.seg").stat().st_size < size_before
+    assert segments.count() == 2
+    assert segments.detail_slice("20260101_070000") is None
+    assert load(segments.detail_slice("20260105_070000")) == {"v": "new"}
+    assert bytes(segments.html_slice("20260102_070000")) == b"<p>x</p>"
+
+    # 정리 후 다른 인스턴스와 추가 기록도 정상 동작
+    reader = SegmentStore("briefing", tmp_path)
+    append_briefing(segments, "20260106_070000", datetime(2026, 1, 6, 7))
+    slices, total = reader.summary_slices()
+    assert total == 3
+    assert [load(view).get("id", "new") for view in slices] == [
+        "20260106_070000", "new", "20260102_070000",
+    ]
+    assert segments.compact(["20260102_070000", "20260105_070000", "20260106_070000"]) == 0
+
+
+def test_output_store_compact_prunes_segments(tmp_path: Path):
+    """테스트 10: 산출물 보존 정책이 세그먼트에서도 만료된 브리핑을 제거"""
+    from services.output_store import OutputStore, KIND_BRIEFING
+
+    store = OutputStore(tmp_path)
+    segments = SegmentStore(KIND_BRIEFING, tmp_path / "segments")
+    for record_id, created_at in (
+        ("20200101_070000", datetime(2020, 1, 1, 7)),
+        ("20200102_070000", datetime(2020, 1, 2, 7)),
+        (datetime.now().strftime("%Y%m%d_%H%M%S"), datetime.now()),
+    ):
+        json_path = tmp_path / f"briefing_{record_id}.json"
+        json_path.write_text("{}", encoding="utf-8")
+        store.put(KIND_BRIEFING, record_id, {"json": str(json_path)}, created_at=created_at)
+        append_briefing(segments, record_id, created_at)
+
+    result = store.compact(retention_days=30)
+
+    assert result["expired"] == 2
+    assert result["segment_records"] == 2
+    assert segments.count() == 1
+    assert segments.detail_slice("20200101_070000") is None
+
+
+def test_output_store_compact_vacuums_only_when_fragmented(tmp_path: Path):
+    """테스트 11: 인덱스 DB는 빈 페이지가 많을 때만 VACUUM"""
+    from services.output_store import OutputStore, KIND_SCREENING
+
+    store = OutputStore(tmp_path)
+    json_path = tmp_path / "screening.json"
+    json_path.write_text("{}", encoding="utf-8")
+    for day in range(1, 401):
+        created_at = datetime(2020, 1, 1) if day < 400 else datetime.now()
+        store.put(KIND_SCREENING, f"{day:04d}", {"json": str(json_path)},
+                  created_at=created_at, meta={"note": "x" * 200}, set_latest=day == 400)
+
+    assert store.compact(retention_days=30, delete_files=False)["vacuumed"] == 1
+    assert store.compact(retention_days=30, delete_files=False)["vacuumed"] == 0